@@ -0,0 +1 @@
+"""Performance benchmarks for soccer-info package."""
@@ -0,0 +1,112 @@
+"""
+Cold-start benchmark: import time and first-use cost of the package.
+
+Every scenario runs in a fresh interpreter, so nothing is cached between
+measurements. The setup statement (e.g. importing httpx) is excluded from
+the measured time; the reported value is the median over all runs.
+
+Usage:
+    python -m benchmarks.import_time [--runs N] [--output FILE]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Tuple
+
+# name -> (setup, measured statement)
+SCENARIOS: Dict[str, Tuple[str, str]] = {
+    "import soccer_info": (
+        "",
+        "import soccer_info",
+    ),
+    "import soccer_info (httpx preloaded)": (
+        "import httpx, pydantic",
+        "import soccer_info",
+    ),
+    "create sync client": (
+        "",
+        "import soccer_info\n"
+        "from soccer_info.settings import Settings\n"
+        "soccer_info.client.HTTPXClient(Settings(api_key='key'))",
+    ),
+    "create async client": (
+        "",
+        "import soccer_info\n"
+        "from soccer_info.settings import Settings\n"
+        "soccer_info.client.AsyncHTTPXClient(Settings(api_key='key'))",
+    ),
+    "import all response models": (
+        "",
+        "import soccer_info.responses as responses\n"
+        "for name in responses.__all__: getattr(responses, name)",
+    ),
+    "first parse (day basic)": (
+        "",
+        "from soccer_info.responses import MatchDayBasicResponse\n"
+        "MatchDayBasicResponse.model_validate_json("
+        "'{\"status\": 200, \"errors\": [], \"pagination\": [], \"result\": []}')",
+    ),
+}
+
+_RUNNER = """
+import time
+{setup}
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(setup: str, statement: str, runs: int) -> List[float]:
+    """Run a scenario in fresh interpreters and return the elapsed seconds of each run."""
+    code = _RUNNER.format(setup=setup, statement=statement)
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return timings
+
+
+def run(runs: int) -> Dict[str, Any]:
+    """Measure every scenario.
+
+    Returns:
+        Mapping of scenario name -> median/min/max milliseconds
+    """
+    results: Dict[str, Any] = {}
+    for name, (setup, statement) in SCENARIOS.items():
+        timings = measure(setup, statement, runs)
+        results[name] = {
+            "median_ms": statistics.median(timings) * 1000,
+            "min_ms": min(timings) * 1000,
+            "max_ms": max(timings) * 1000,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="soccer-info cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per scenario")
+    parser.add_argument("--output", help="write JSON results to this file (default: table on stdout)")
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        return
+
+    width = max(len(name) for name in results)
+    for name, metrics in results.items():
+        print(f"{name:<{width}}  {metrics['median_ms']:8.2f} ms  (min {metrics['min_ms']:.2f}, max {metrics['max_ms']:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Scaling benchmark of bulk ingestion with process-pool validation.
+
+Serves day-full pages from an in-memory transport and ingests them three
+ways: validated in the event loop (the async client as is), and through
+``BulkIngestor`` with a growing number of worker processes, both
+returning the rebuilt responses and with a transform reducing each page
+to match IDs in the worker. Pages per second should grow with the worker
+count up to the number of cores.
+
+Usage:
+    python -m benchmarks.ingest [--pages N] [--matches M] [--workers 1,2,4]
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from soccer_info.client import AsyncHTTPXClient, BulkIngestor, RequestSpec
+from soccer_info.requests_ import MATCH_DAY_FULL
+from soccer_info.responses import MatchDayFullResponse
+from soccer_info.settings import Settings
+from soccer_info.transports import InMemoryTransport
+from benchmarks.parallel_parse import default_thread_counts
+from benchmarks.payloads import PayloadFactory
+
+
+def match_ids(response: MatchDayFullResponse) -> List[str]:
+    """Transform run in the workers: keep only the match IDs of a page."""
+    return [match.id for match in response.result]
+
+
+def _client(body: bytes) -> AsyncHTTPXClient:
+    settings = Settings(api_key="benchmark-key", base_url="http://benchmark.local", request_throttle_seconds=0)
+    return AsyncHTTPXClient(settings, transport=InMemoryTransport({MATCH_DAY_FULL.endpoint: body}))
+
+
+def _specs(client: AsyncHTTPXClient, pages: int):
+    for page in range(1, pages + 1):
+        yield RequestSpec(
+            endpoint=MATCH_DAY_FULL.endpoint,
+            params=MATCH_DAY_FULL.build(date="20240120", page=page),
+            headers=client.auth_headers(),
+            response_model=MatchDayFullResponse,
+        )
+
+
+async def bench_in_loop(body: bytes, pages: int, concurrency: int = 16) -> float:
+    """Pages per second when every page is validated in the event loop."""
+    async with _client(body) as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(spec: RequestSpec) -> None:
+            async with semaphore:
+                await client.execute(spec)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(spec) for spec in _specs(client, pages)))
+        return pages / (time.perf_counter() - start)
+
+
+async def bench_ingestor(body: bytes, pages: int, workers: int, transform: Optional[Any]) -> float:
+    """Pages per second through a ``BulkIngestor`` with ``workers`` processes."""
+    async with _client(body) as client, BulkIngestor(client, workers=workers, transform=transform) as ingestor:
+        # Start the workers and build their validators outside the measurement
+        async for _ in ingestor.ingest(list(_specs(client, workers))):
+            pass
+        start = time.perf_counter()
+        async for _ in ingestor.ingest(_specs(client, pages)):
+            pass
+        return pages / (time.perf_counter() - start)
+
+
+def run(pages: int, matches: int, worker_counts: Optional[List[int]] = None) -> Dict[str, float]:
+    """Measure ingestion throughput in the loop and for each worker count.
+
+    Args:
+        pages: Pages ingested per measurement
+        matches: Matches per day-full page
+        worker_counts: Process counts to measure (default: powers of two up to the core count)
+
+    Returns:
+        Pages per second per configuration
+    """
+    body = PayloadFactory(seed=0).response_bytes(MatchDayFullResponse, matches)
+    MatchDayFullResponse.model_validate_json(body)
+
+    results = {"in-loop": asyncio.run(bench_in_loop(body, pages))}
+    for workers in worker_counts or default_thread_counts():
+        results[f"pool x{workers}"] = asyncio.run(bench_ingestor(body, pages, workers, None))
+        results[f"pool x{workers} + transform"] = asyncio.run(bench_ingestor(body, pages, workers, match_ids))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=200, help="pages per measurement")
+    parser.add_argument("--matches", type=int, default=200, help="matches per page")
+    parser.add_argument("--workers", help="comma-separated worker counts (default: up to the core count)")
+    args = parser.parse_args()
+
+    worker_counts = [int(count) for count in args.workers.split(",")] if args.workers else None
+    results = run(args.pages, args.matches, worker_counts)
+    baseline = results["in-loop"]
+    print(f"{'configuration':>24}  {'pages/s':>8}  {'speedup':>7}")
+    for name, pages_per_second in results.items():
+        print(f"{name:>24}  {pages_per_second:8.1f}  {pages_per_second / baseline:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Thread-scaling benchmark of response parsing.
+
+Parses large day-full responses in a thread pool of growing size and
+reports throughput, speedup and parallel efficiency per thread count. On
+the free-threaded build (``python3.13t``, or ``PYTHON_GIL=0``) parsing in
+threads runs on all cores and the speedup tracks the thread count; with
+the GIL it stays near 1x, which is the baseline to compare against.
+
+Every thread parses its own share of the same total work, so the numbers
+isolate parse scaling from payload generation and I/O.
+
+Usage:
+    python -m benchmarks.parallel_parse [--matches M] [--parses N] [--threads 1,2,4,8]
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Type
+
+from soccer_info.responses import MatchDayFullResponse, ResponseComponent
+from benchmarks.payloads import PayloadFactory
+
+
+def gil_enabled() -> bool:
+    """Whether the running interpreter holds a GIL (always True before Python 3.13)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def python_version() -> str:
+    """Interpreter version, suffixed with "t" on the free-threaded build with the GIL disabled."""
+    return sys.version.split()[0] + ("" if gil_enabled() else "t")
+
+
+def default_thread_counts() -> List[int]:
+    """Powers of two up to the number of usable cores, plus the core count itself."""
+    cores = os.process_cpu_count() if hasattr(os, "process_cpu_count") else os.cpu_count()
+    cores = cores or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def measure(body: bytes, model: Type[ResponseComponent], parses: int, threads: int) -> float:
+    """Seconds to parse ``body`` ``parses`` times, split evenly over ``threads`` threads."""
+    shares = [parses // threads + (index < parses % threads) for index in range(threads)]
+
+    def work(count: int) -> None:
+        for _ in range(count):
+            model.model_validate_json(body)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        for future in [executor.submit(work, share) for share in shares]:
+            future.result()
+        return time.perf_counter() - start
+
+
+def run(matches: int, parses: int, thread_counts: Optional[List[int]] = None) -> Dict[int, Dict[str, float]]:
+    """Measure parse throughput for each thread count.
+
+    Args:
+        matches: Matches in the parsed day-full response
+        parses: Total parses per measurement, shared by the threads
+        thread_counts: Thread pool sizes to measure (default: powers of two up to the core count)
+
+    Returns:
+        Metrics per thread count
+    """
+    body = PayloadFactory(seed=0).response_bytes(MatchDayFullResponse, matches)
+    # Build the validator and warm allocator caches outside the measurement
+    MatchDayFullResponse.model_validate_json(body)
+
+    results: Dict[int, Dict[str, float]] = {}
+    for threads in thread_counts or default_thread_counts():
+        seconds = measure(body, MatchDayFullResponse, parses, threads)
+        results[threads] = {
+            "parses_per_second": parses / seconds,
+            "mb_per_second": parses * len(body) / seconds / 1e6,
+        }
+    single = results[min(results)]["parses_per_second"]
+    for threads, metrics in results.items():
+        metrics["speedup"] = metrics["parses_per_second"] / single
+        metrics["efficiency"] = metrics["speedup"] / threads
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--matches", type=int, default=2000, help="matches in the day-full response")
+    parser.add_argument("--parses", type=int, default=32, help="parses per measurement")
+    parser.add_argument("--threads", help="comma-separated thread counts (default: up to the core count)")
+    args = parser.parse_args()
+
+    thread_counts = [int(count) for count in args.threads.split(",")] if args.threads else None
+    print(f"Python {python_version()} - GIL {'enabled' if gil_enabled() else 'disabled'}")
+    results = run(args.matches, args.parses, thread_counts)
+    print(f"{'threads':>7}  {'parses/s':>9}  {'MB/s':>7}  {'speedup':>7}  {'efficiency':>10}")
+    for threads, metrics in results.items():
+        print(
+            f"{threads:>7}  {metrics['parses_per_second']:9.1f}  {metrics['mb_per_second']:7.1f}  "
+            f"{metrics['speedup']:6.2f}x  {metrics['efficiency']:9.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
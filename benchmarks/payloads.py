@@ -0,0 +1,241 @@
+"""
+Synthetic API payloads for benchmarks.
+
+Payloads are generated by walking the Pydantic response models (so every
+field the SDK parses is populated, under its API alias) and filling leaf
+values from the examples in ``openapi_3_0_schema_RAPIDAPI.json``, with
+per-field rules for IDs, dates and numeric stats so large payloads are
+realistic rather than one example repeated thousands of times.
+
+Usage:
+    >>> from benchmarks.payloads import PayloadFactory
+    >>> factory = PayloadFactory(seed=1)
+    >>> body = factory.response_bytes(MatchDayFullResponse, items=5000)
+"""
+import json
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import NoneType, UnionType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from soccer_info.responses import (
+    APIResponse,
+    ChampionshipListResponse,
+    ChampionshipViewResponse,
+    CountryListResponse,
+    MatchByBasicResponse,
+    MatchByFullResponse,
+    MatchDayBasicResponse,
+    MatchDayFullResponse,
+    MatchEvent,
+    MatchOddsResponse,
+    MatchProgressiveResponse,
+    MatchScore,
+    MatchViewBasicResponse,
+    MatchViewFullResponse,
+    ProgressiveDataPoint,
+    Season,
+    Group,
+    TableEntry,
+)
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent / "openapi_3_0_schema_RAPIDAPI.json"
+
+ALL_RESPONSE_MODELS: List[Type[APIResponse]] = [
+    ChampionshipListResponse,
+    ChampionshipViewResponse,
+    CountryListResponse,
+    MatchViewBasicResponse,
+    MatchViewFullResponse,
+    MatchOddsResponse,
+    MatchProgressiveResponse,
+    MatchDayBasicResponse,
+    MatchDayFullResponse,
+    MatchByBasicResponse,
+    MatchByFullResponse,
+]
+
+# Sizes of nested lists, chosen to resemble real responses
+LIST_SIZES: Dict[Any, int] = {
+    MatchEvent: 8,
+    ProgressiveDataPoint: 190,  # one point every 30 seconds over a full match
+    Season: 3,
+    Group: 1,
+    TableEntry: 20,
+    Any: 0,  # untyped lists such as lineups are usually empty
+}
+
+STATUSES = ["ENDED", "ENDED", "ENDED", "NOT STARTED", "1st HALF", "2nd HALF", "HALF TIME"]
+EVENT_TYPES = ["goal", "yellow_card", "red_card", "substitution", "penalty"]
+NUMERIC_STRING_FIELDS = {"penalties", "substitutions", "throwins", "injuries"}
+
+
+def load_schema_examples(schema_path: Path = SCHEMA_PATH) -> Dict[str, List[Any]]:
+    """Collect example values from the OpenAPI schema, keyed by property name.
+
+    Args:
+        schema_path: Path to the OpenAPI schema file
+
+    Returns:
+        Mapping of property name to the distinct scalar examples found for it
+    """
+    examples: Dict[str, List[Any]] = defaultdict(list)
+
+    def walk(node: Any) -> None:
+        if isinstance(node, dict):
+            for name, prop in (node.get("properties") or {}).items():
+                if isinstance(prop, dict) and "example" in prop:
+                    example = prop["example"]
+                    if not isinstance(example, (dict, list)) and example not in examples[name]:
+                        examples[name].append(example)
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    with open(schema_path, encoding="utf-8") as f:
+        walk(json.load(f))
+    return dict(examples)
+
+
+class PayloadFactory:
+    """Generates synthetic JSON payloads for any response model.
+
+    Attributes:
+        rng: Random generator; seeded for reproducible payloads
+        examples: Schema example values by property name
+    """
+
+    def __init__(self, seed: int = 0, schema_path: Path = SCHEMA_PATH):
+        """Initialize the factory.
+
+        Args:
+            seed: Random seed for reproducible payloads
+            schema_path: Path to the OpenAPI schema file
+        """
+        self.rng = random.Random(seed)
+        self.examples = load_schema_examples(schema_path)
+        self._base_date = datetime(2024, 8, 1, 12, 0, 0)
+        self._generators: Dict[Tuple[Any, ...], Callable[[], Dict]] = {}
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def response(
+        self,
+        response_model: Type[APIResponse],
+        items: int,
+        list_sizes: Optional[Dict[Any, int]] = None,
+    ) -> Dict[str, Any]:
+        """Generate a full API response envelope.
+
+        Args:
+            response_model: Response model to generate a payload for
+            items: Number of result items
+            list_sizes: Overrides for nested list sizes, keyed by item model
+
+        Returns:
+            JSON-compatible response payload
+        """
+        sizes = {**LIST_SIZES, **(list_sizes or {})}
+        item_model = get_args(response_model.model_fields["result"].annotation)[0]
+        return {
+            "status": 200,
+            "errors": [],
+            "pagination": [{"page": 1, "per_page": max(items, 1), "items": items}],
+            "result": [self.model(item_model, sizes) for _ in range(items)],
+        }
+
+    def response_bytes(
+        self,
+        response_model: Type[APIResponse],
+        items: int,
+        list_sizes: Optional[Dict[Any, int]] = None,
+    ) -> bytes:
+        """Generate a full API response as compact JSON bytes, as sent by the API."""
+        payload = self.response(response_model, items, list_sizes)
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    def model(self, model: Type[BaseModel], list_sizes: Optional[Dict[Any, int]] = None) -> Dict[str, Any]:
+        """Generate a payload dictionary for a single model, keyed by API aliases."""
+        sizes = list_sizes if list_sizes is not None else LIST_SIZES
+        return self._model_generator(model, tuple(sizes.items()))()
+
+    # =========================================================================
+    # Value generation
+    # =========================================================================
+
+    def _model_generator(self, model: Type[BaseModel], sizes: Tuple[Tuple[Any, int], ...]) -> Callable[[], Dict]:
+        """Compile (and cache) a generator function for a model and list-size configuration."""
+        cache_key = (model, sizes)
+        generator = self._generators.get(cache_key)
+        if generator is None:
+            fields = [
+                (field.alias or name, self._compile(model, field.alias or name, field.annotation, sizes))
+                for name, field in model.model_fields.items()
+                if not field.exclude
+            ]
+            generator = lambda: {key: value() for key, value in fields}
+            self._generators[cache_key] = generator
+        return generator
+
+    def _compile(self, model: Type[BaseModel], key: str, annotation: Any, sizes: Tuple[Tuple[Any, int], ...]) -> Callable[[], Any]:
+        origin = get_origin(annotation)
+        if origin in (Union, UnionType):
+            args = [arg for arg in get_args(annotation) if arg is not NoneType]
+            return self._compile(model, key, args[0], sizes) if args else (lambda: None)
+        if origin in (list, List):
+            (item,) = get_args(annotation)
+            count = dict(sizes).get(item, 3)
+            item_generator = self._compile(model, key, item, sizes)
+            return lambda: [item_generator() for _ in range(count)]
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return self._model_generator(annotation, sizes)
+        if annotation is int:
+            return lambda: self.rng.randint(0, 60)
+        if annotation is bool:
+            return lambda: self.rng.random() < 0.5
+        if annotation is str:
+            return self._string_generator(model, key)
+        return lambda: None
+
+    def _string_generator(self, model: Type[BaseModel], key: str) -> Callable[[], str]:
+        rng = self.rng
+        if model is MatchScore:
+            return lambda: str(rng.choice([0, 0, 1, 1, 1, 2, 2, 3, 4]))
+        if key == "id":
+            return lambda: f"{rng.getrandbits(64):016x}"
+        if key in ("date", "from", "to"):
+            base = self._base_date
+            return lambda: (base + timedelta(minutes=15 * rng.randint(0, 35000))).strftime("%Y-%m-%d %H:%M:%S")
+        if key == "status":
+            return lambda: rng.choice(STATUSES)
+        if key == "type":
+            return lambda: rng.choice(EVENT_TYPES)
+        if key in ("timer", "est_e_timer"):
+            return lambda: f"{rng.randint(0, 90)}:{rng.randint(0, 59):02d}"
+        if key == "team":
+            return lambda: rng.choice("AB")
+        is_odds = model.__name__.startswith("Odds")
+        if is_odds and key in ("1", "X", "2", "o", "u") or key.startswith("odd_") and not key.endswith("_v"):
+            return lambda: f"{rng.uniform(1.05, 12.0):.2f}"
+        if is_odds and key == "v" or key.startswith("odd_"):
+            return lambda: str(rng.choice([-1.5, -0.5, 0.0, 0.5, 1.5, 2.5]))
+        if "possession" in key:
+            return lambda: str(rng.randint(25, 75))
+        examples = [example for example in self.examples.get(key, []) if isinstance(example, str)]
+        numeric = [int(example) for example in examples if example.isdigit()]
+        if numeric or len(key) <= 3 or key.startswith(("teamA_", "teamB_")) or key in NUMERIC_STRING_FIELDS:
+            # Stats are numeric strings in the API; vary them around the schema example
+            upper = max(max(numeric, default=0) * 2, 5)
+            return lambda: str(rng.randint(0, upper))
+        if examples:
+            return lambda: rng.choice(examples)
+        label = key.replace("_", " ").title()
+        return lambda: f"{label} {rng.randint(1, 999)}"
@@ -0,0 +1,74 @@
+"""
+Micro-benchmark of per-call request build cost.
+
+Compares the legacy path (a Header model and a Parameters model built and
+dumped on every call) with the cached client auth headers and precompiled
+request templates used by the domain clients.
+
+Usage:
+    python -m benchmarks.request_build [--number N]
+"""
+import argparse
+import timeit
+from typing import Callable, Dict
+
+from soccer_info.client import HTTPXClient
+from soccer_info.requests_ import Header, MatchDayParameters, MATCH_DAY_BASIC
+from soccer_info.settings import Settings
+
+
+def legacy_build(settings: Settings) -> Callable[[], object]:
+    """Build headers and params the way domain clients did before templates."""
+    def build():
+        headers = Header(
+            x_rapidapi_key=settings.api_key,
+            x_rapidapi_host=settings.api_host,
+        ).to_dict()
+        params = MatchDayParameters(date="20240120", page=2, language="en_US", format=None).to_dict()
+        return headers, params
+    return build
+
+
+def template_build(client: HTTPXClient) -> Callable[[], object]:
+    """Build headers and params through cached auth headers and a request template."""
+    def build():
+        headers = client.auth_headers()
+        params = MATCH_DAY_BASIC.build(date="20240120", page=2, language="en_US", format=None)
+        return headers, params
+    return build
+
+
+def run(number: int) -> Dict[str, float]:
+    """Measure per-call build cost of both paths.
+
+    Args:
+        number: Calls per measurement (best of 5 measurements is reported)
+
+    Returns:
+        Mapping of path name to microseconds per call
+    """
+    settings = Settings(api_key="benchmark-key")
+    client = HTTPXClient(settings)
+    results = {}
+    for name, build in (
+        ("legacy", legacy_build(settings)),
+        ("template", template_build(client)),
+    ):
+        best = min(timeit.repeat(build, number=number, repeat=5))
+        results[name] = best / number * 1e6
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000, help="calls per measurement")
+    args = parser.parse_args()
+
+    results = run(args.number)
+    for name, micros in results.items():
+        print(f"{name:>10}: {micros:8.2f} us/call")
+    print(f"{'speedup':>10}: {results['legacy'] / results['template']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
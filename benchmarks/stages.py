@@ -0,0 +1,129 @@
+"""
+Constant-memory crawl benchmark of the staged fetch/parse/transform/sink pipeline.
+
+Crawls paginated day-basic lists from an in-memory transport through a
+``StagedPipeline`` with the client throttled to a fixed request rate, and
+writes every match to a sink that sleeps per page like a slow disk or
+database. Reports pages per second against the throttle ceiling, per-stage
+throughput and how long each stage was held back by the one after it, and
+peak traced memory per quarter of the crawl: with backpressure working,
+memory levels off once the queues between the stages are full (at about
+``queue_size`` parsed pages per queue) however many matches are crawled.
+
+Usage:
+    python -m benchmarks.stages [--matches N] [--per-page M] [--throttle-ms T] [--sink-ms S]
+"""
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator, List
+
+from soccer_info.client import AsyncHTTPXClient, RequestSpec, StagedPipeline
+from soccer_info.requests_ import MATCH_DAY_BASIC
+from soccer_info.responses import MatchDayBasicResponse
+from soccer_info.settings import Settings
+from soccer_info.transports import InMemoryTransport
+from benchmarks.payloads import PayloadFactory
+
+DAY_PAGES = 10
+
+
+def day_body(per_page: int) -> bytes:
+    """One page of a day listing ``DAY_PAGES`` pages of ``per_page`` matches."""
+    payload = PayloadFactory(seed=0).response(MatchDayBasicResponse, per_page)
+    payload["pagination"] = [{"page": 1, "per_page": per_page, "items": per_page * DAY_PAGES}]
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _specs(client: AsyncHTTPXClient, days: int) -> Iterator[RequestSpec]:
+    for day in range(days):
+        yield RequestSpec(
+            endpoint=MATCH_DAY_BASIC.endpoint,
+            params=MATCH_DAY_BASIC.build(date=f"day{day:05d}"),
+            headers=client.auth_headers(),
+            response_model=MatchDayBasicResponse,
+        )
+
+
+async def crawl(body: bytes, days: int, throttle: float, sink_delay: float, trace: bool = False) -> Dict[str, Any]:
+    """Crawl ``days`` days of ``DAY_PAGES`` pages each and return pipeline metrics.
+
+    With ``trace``, tracemalloc must be running; the peak of each quarter of
+    the crawl is recorded under ``"peaks"``.
+    """
+    settings = Settings(api_key="benchmark-key", base_url="http://benchmark.local", request_throttle_seconds=throttle)
+    quarter = max(1, days * DAY_PAGES // 4)
+    pages = 0
+    written = 0
+    peaks: List[int] = []
+
+    def sink(items: List[Any]) -> None:
+        nonlocal pages, written
+        time.sleep(sink_delay)
+        pages += 1
+        written += len(items)
+        if trace and pages % quarter == 0:
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+    async with AsyncHTTPXClient(settings, transport=InMemoryTransport({MATCH_DAY_BASIC.endpoint: body})) as client:
+        pipeline = StagedPipeline(client, sink, queue_size=8, fetch_concurrency=8)
+        await pipeline.run(_specs(client, days))
+    return {"elapsed": pipeline.elapsed, "written": written, "stages": pipeline.report(), "peaks": peaks}
+
+
+def run(matches: int, per_page: int, throttle: float, sink_delay: float) -> Dict[str, Any]:
+    """Crawl ``matches`` matches for throughput, then again traced for peak memory.
+
+    Args:
+        matches: Matches crawled
+        per_page: Matches per page
+        throttle: Seconds between requests, i.e. the rate-limit ceiling
+        sink_delay: Seconds the sink spends per page
+
+    Returns:
+        Metrics of the untraced crawl, with the peak memory per quarter of the traced one
+    """
+    body = day_body(per_page)
+    MatchDayBasicResponse.model_validate_json(body)
+    days = max(1, matches // (per_page * DAY_PAGES))
+
+    # Throughput is measured untraced; tracing slows parsing several times
+    result = asyncio.run(crawl(body, days, throttle, sink_delay))
+    result["pages_per_second"] = days * DAY_PAGES / result["elapsed"]
+    result["ceiling"] = 1 / throttle if throttle > 0 else float("inf")
+
+    tracemalloc.start()
+    try:
+        result["peaks"] = asyncio.run(crawl(body, days, throttle, sink_delay, trace=True))["peaks"]
+    finally:
+        tracemalloc.stop()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--matches", type=int, default=100_000, help="matches crawled")
+    parser.add_argument("--per-page", type=int, default=100, help="matches per page")
+    parser.add_argument("--throttle-ms", type=float, default=5.0, help="milliseconds between requests")
+    parser.add_argument("--sink-ms", type=float, default=2.0, help="milliseconds the sink spends per page")
+    args = parser.parse_args()
+
+    result = run(args.matches, args.per_page, args.throttle_ms / 1000, args.sink_ms / 1000)
+    print(
+        f"{result['written']} matches in {result['elapsed']:.1f}s - "
+        f"{result['pages_per_second']:.1f} pages/s of {result['ceiling']:.1f} allowed"
+    )
+    print("peak memory per quarter of the crawl: " + ", ".join(f"{peak / 1e6:.1f} MB" for peak in result["peaks"]))
+    print(f"{'stage':>9}  {'in':>7}  {'out':>8}  {'out/s':>9}  {'busy s':>7}  {'blocked s':>9}  {'idle s':>7}")
+    for name, stage in result["stages"].items():
+        print(
+            f"{name:>9}  {stage['items_in']:7d}  {stage['items_out']:8d}  {stage['per_second']:9.1f}  "
+            f"{stage['busy_seconds']:7.2f}  {stage['blocked_seconds']:9.2f}  {stage['idle_seconds']:7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+Benchmark suite for response parsing, request building and end-to-end calls.
+
+Measures, over synthetic payloads generated from the OpenAPI schema and the
+response models (see ``benchmarks/payloads.py``):
+
+- parse throughput of every response model, from a 5-match day up to a
+  5,000-match day-full page and a full season of progressive data
+- peak memory while parsing each payload
+- per-call request build cost
+- DataFrame/Arrow conversion of a 10,000-match season (when pandas/pyarrow
+  are installed)
+- binary reload of a saved 2,000-match day-full response against
+  re-validating its JSON
+- end-to-end latency of sync and async clients against a local mock transport
+
+Results are written as JSON so runs can be compared between releases:
+
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --baseline bench.json --tolerance 0.15
+
+With ``--baseline`` the process exits with status 1 if any timing regressed
+by more than the tolerance.
+"""
+import argparse
+import asyncio
+import gc
+import importlib.util
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Type
+
+import httpx
+
+import soccer_info
+from soccer_info.client import AsyncHTTPXClient, HTTPXClient
+from soccer_info.responses import (
+    APIResponse,
+    MatchDayBasicResponse,
+    MatchDayFullResponse,
+    MatchProgressiveResponse,
+)
+from soccer_info.responses.binary import dumps_binary, loads_binary
+from soccer_info.settings import Settings
+from benchmarks import request_build
+from benchmarks.payloads import ALL_RESPONSE_MODELS, PayloadFactory
+
+# Metrics where a larger value is a regression
+LOWER_IS_BETTER = ("seconds", "us_per_call", "peak_memory_mb", "mean_ms", "p50_ms", "p95_ms", "p99_ms")
+
+
+@dataclass
+class ParseScenario:
+    """A response model parsed from a payload with a given number of result items."""
+    name: str
+    response_model: Type[APIResponse]
+    items: int
+
+
+@dataclass
+class Result:
+    """Single benchmark measurement."""
+    name: str
+    kind: str
+    metrics: Dict[str, float] = field(default_factory=dict)
+
+
+def parse_scenarios(season_matches: int) -> List[ParseScenario]:
+    """Build the list of parse scenarios.
+
+    Args:
+        season_matches: Number of matches in the full-season progressive scenario
+
+    Returns:
+        One small scenario per response model plus the match-day scaling scenarios
+    """
+    scenarios = [ParseScenario(f"{model.__name__}[5]", model, 5) for model in ALL_RESPONSE_MODELS]
+    for items in (500, 5000):
+        scenarios.append(ParseScenario(f"MatchDayBasicResponse[{items}]", MatchDayBasicResponse, items))
+        scenarios.append(ParseScenario(f"MatchDayFullResponse[{items}]", MatchDayFullResponse, items))
+    scenarios.append(
+        ParseScenario(f"MatchProgressiveResponse[season:{season_matches}]", MatchProgressiveResponse, season_matches)
+    )
+    return scenarios
+
+
+def _best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_parse(factory: PayloadFactory, scenario: ParseScenario, repeat: int) -> Result:
+    """Measure parse time, throughput and peak memory for one scenario."""
+    body = factory.response_bytes(scenario.response_model, scenario.items)
+    validate = scenario.response_model.model_validate_json
+    validate(body)  # warm up schema/validator construction
+
+    seconds = _best_of(repeat, lambda: validate(body))
+
+    gc.collect()
+    tracemalloc.start()
+    parsed = validate(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+
+    return Result(scenario.name, "parse", {
+        "payload_mb": len(body) / 1e6,
+        "seconds": seconds,
+        "items_per_second": scenario.items / seconds,
+        "mb_per_second": len(body) / 1e6 / seconds,
+        "peak_memory_mb": peak / 1e6,
+    })
+
+
+def bench_request_build(number: int) -> List[Result]:
+    """Measure per-call request build cost."""
+    return [
+        Result(f"request_build[{name}]", "request_build", {"us_per_call": micros})
+        for name, micros in request_build.run(number).items()
+    ]
+
+
+def bench_convert(factory: PayloadFactory, repeat: int, items: int = 10000) -> List[Result]:
+    """Measure ``to_frame``/``to_arrow`` on a season of basic and full matches."""
+    results = []
+    for model in (MatchDayBasicResponse, MatchDayFullResponse):
+        response = model.model_validate_json(factory.response_bytes(model, items))
+        for method, module in (("to_frame", "pandas"), ("to_arrow", "pyarrow")):
+            if importlib.util.find_spec(module) is None:
+                continue
+            convert = getattr(response, method)
+            convert()  # warm up row reader compilation and library imports
+            seconds = _best_of(repeat, convert)
+            results.append(Result(f"{method}[{model.__name__}[{items}]]", "convert", {
+                "seconds": seconds,
+                "items_per_second": items / seconds,
+            }))
+    return results
+
+
+def bench_reload(factory: PayloadFactory, repeat: int, items: int = 2000) -> List[Result]:
+    """Measure reloading a saved response from JSON and from the binary format."""
+    model = MatchDayFullResponse
+    response = model.model_validate_json(factory.response_bytes(model, items))
+    json_data = response.model_dump_json()
+    binary_data = dumps_binary(response)
+    results = []
+    for name, data, load in (
+        ("json", json_data, model.model_validate_json),
+        ("binary", binary_data, lambda data: loads_binary(data, model)),
+    ):
+        load(data)  # warm up validator and codec compilation
+        seconds = _best_of(repeat, lambda: load(data))
+        results.append(Result(f"reload_{name}[{model.__name__}[{items}]]", "reload", {
+            "seconds": seconds,
+            "items_per_second": items / seconds,
+            "bytes": len(data),
+        }))
+    return results
+
+
+def _latency_metrics(latencies: List[float]) -> Dict[str, float]:
+    latencies = sorted(latencies)
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "mean_ms": statistics.fmean(latencies) * 1e3,
+        "p50_ms": quantiles[49] * 1e3,
+        "p95_ms": quantiles[94] * 1e3,
+        "p99_ms": quantiles[98] * 1e3,
+    }
+
+
+def _settings() -> Settings:
+    return Settings(api_key="benchmark-key", base_url="http://benchmark.local", request_throttle_seconds=0)
+
+
+def bench_end_to_end_sync(body: bytes, name: str, requests: int) -> Result:
+    """Measure sync client latency against a mock transport serving a fixed body."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=body, headers={"content-type": "application/json"})
+    )
+    latencies = []
+    with HTTPXClient(_settings(), transport=transport) as client:
+        client.matches.get_by_day_basic("20240120")  # open the client outside the measurement
+        for _ in range(requests):
+            start = time.perf_counter()
+            client.matches.get_by_day_basic("20240120")
+            latencies.append(time.perf_counter() - start)
+    return Result(name, "end_to_end", _latency_metrics(latencies))
+
+
+def bench_end_to_end_async(body: bytes, name: str, requests: int, concurrency: int) -> Result:
+    """Measure async client latency and throughput with concurrent requests."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=body, headers={"content-type": "application/json"})
+    )
+
+    async def run() -> Result:
+        latencies = []
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(client: AsyncHTTPXClient):
+            async with semaphore:
+                start = time.perf_counter()
+                await client.matches.get_by_day_basic("20240120")
+                latencies.append(time.perf_counter() - start)
+
+        async with AsyncHTTPXClient(_settings(), transport=transport) as client:
+            await client.matches.get_by_day_basic("20240120")
+            start = time.perf_counter()
+            await asyncio.gather(*(one(client) for _ in range(requests)))
+            elapsed = time.perf_counter() - start
+        metrics = _latency_metrics(latencies)
+        metrics["requests_per_second"] = requests / elapsed
+        return Result(name, "end_to_end", metrics)
+
+    return asyncio.run(run())
+
+
+def compare(results: List[Result], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Compare results with a previous run.
+
+    Args:
+        results: Current results
+        baseline: Parsed JSON of a previous run
+        tolerance: Allowed relative slowdown (0.15 = 15%)
+
+    Returns:
+        Human-readable descriptions of regressed metrics
+    """
+    previous = {(item["kind"], item["name"]): item["metrics"] for item in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        old = previous.get((result.kind, result.name))
+        if old is None:
+            continue
+        for metric, value in result.metrics.items():
+            if metric in LOWER_IS_BETTER and old.get(metric):
+                change = value / old[metric] - 1
+                if change > tolerance:
+                    regressions.append(f"{result.name} {metric}: {old[metric]:.4g} -> {value:.4g} (+{change:.0%})")
+    return regressions
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the full suite and return the JSON-serializable report."""
+    factory = PayloadFactory(seed=args.seed)
+    results: List[Result] = []
+
+    for scenario in parse_scenarios(args.season_matches):
+        if args.filter and args.filter not in scenario.name:
+            continue
+        results.append(bench_parse(factory, scenario, args.repeat))
+        print(f"parse {scenario.name}: {results[-1].metrics['seconds'] * 1e3:.2f} ms", file=sys.stderr)
+
+    results.extend(bench_request_build(args.build_calls))
+    results.extend(bench_convert(factory, args.repeat))
+    results.extend(bench_reload(factory, args.repeat))
+
+    small = factory.response_bytes(MatchDayBasicResponse, 5)
+    large = factory.response_bytes(MatchDayBasicResponse, 500)
+    results.append(bench_end_to_end_sync(small, "sync[MatchDayBasicResponse[5]]", args.requests))
+    results.append(bench_end_to_end_sync(large, "sync[MatchDayBasicResponse[500]]", max(args.requests // 10, 10)))
+    results.append(bench_end_to_end_async(small, "async[MatchDayBasicResponse[5]]", args.requests, args.concurrency))
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "soccer_info_version": soccer_info.__version__,
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="soccer-info benchmark suite")
+    parser.add_argument("--output", help="write JSON results to this file (default: stdout)")
+    parser.add_argument("--baseline", help="previous results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed relative slowdown")
+    parser.add_argument("--filter", help="only run parse scenarios whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="parse repetitions (best is reported)")
+    parser.add_argument("--season-matches", type=int, default=380, help="matches in the progressive season")
+    parser.add_argument("--build-calls", type=int, default=20000, help="calls per request-build measurement")
+    parser.add_argument("--requests", type=int, default=500, help="requests per end-to-end measurement")
+    parser.add_argument("--concurrency", type=int, default=50, help="concurrent async requests")
+    parser.add_argument("--seed", type=int, default=0, help="payload random seed")
+    args = parser.parse_args()
+
+    report = run(args)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(
+                [Result(**item) for item in report["results"]], json.load(f), args.tolerance
+            )
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Throughput benchmark of the HTTP stacks the clients can run on.
+
+Starts a local stand-in for the API in a separate process (a minimal
+HTTP/1.1 keep-alive server answering every request with the same JSON
+body, optionally after a fixed delay) and drives the sync and async
+clients against it through each transport:
+
+- sync: httpx's own transport and ``Urllib3Transport``
+- async: httpx's own transport and ``AiohttpTransport``
+- ``InMemoryTransport`` for each client, as the zero-network baseline
+
+For every stack it reports requests per second with concurrent requests
+(threads for the sync client, tasks for the async one) and the mean
+latency of sequential requests. The per-request overhead is the
+sequential latency above the in-memory baseline of the same client, i.e.
+what the stack and the loopback round trip add to a call.
+
+Stacks whose library is not installed are skipped.
+
+Usage:
+    python -m benchmarks.transports [--requests N] [--concurrency C] [--delay-ms D] [--matches M]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from soccer_info.client import AsyncHTTPXClient, HTTPXClient
+from soccer_info.requests_ import MATCH_DAY_BASIC
+from soccer_info.responses import MatchDayBasicResponse
+from soccer_info.settings import Settings
+from soccer_info.transports import AiohttpTransport, InMemoryTransport, Urllib3Transport
+from benchmarks.payloads import PayloadFactory
+
+
+# =============================================================================
+# Stand-in server
+# =============================================================================
+
+class _StandInProtocol(asyncio.Protocol):
+    """Answers every HTTP/1.1 request on a connection with the same prebuilt response."""
+
+    def __init__(self, response: bytes, delay: float):
+        self.response = response
+        self.delay = delay
+        self.transport: Optional[asyncio.Transport] = None
+        self.buffer = b""
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        while b"\r\n\r\n" in self.buffer:
+            # Requests carry no body, so the header block ends the request
+            _, self.buffer = self.buffer.split(b"\r\n\r\n", 1)
+            if self.delay > 0:
+                asyncio.get_running_loop().call_later(self.delay, self._reply)
+            else:
+                self._reply()
+
+    def _reply(self) -> None:
+        if not self.transport.is_closing():
+            self.transport.write(self.response)
+
+
+def _serve(body: bytes, delay: float, port_sender: Any) -> None:
+    response = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: " + str(len(body)).encode() + b"\r\n"
+        b"\r\n" + body
+    )
+
+    async def main() -> None:
+        server = await asyncio.get_running_loop().create_server(
+            lambda: _StandInProtocol(response, delay), "127.0.0.1", 0, backlog=1024
+        )
+        port_sender.send(server.sockets[0].getsockname()[1])
+        port_sender.close()
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+class StandInServer:
+    """Local stand-in API server running in a child process (context manager)."""
+
+    def __init__(self, body: bytes, delay: float = 0.0):
+        self.body = body
+        self.delay = delay
+        self.port: Optional[int] = None
+        self._process: Optional[multiprocessing.Process] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> 'StandInServer':
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        self._process = multiprocessing.Process(target=_serve, args=(self.body, self.delay, sender), daemon=True)
+        self._process.start()
+        sender.close()
+        self.port = receiver.recv()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._process.terminate()
+        self._process.join()
+
+
+# =============================================================================
+# Measurements
+# =============================================================================
+
+def _settings(base_url: str, concurrency: int) -> Settings:
+    return Settings(
+        api_key="benchmark-key",
+        base_url=base_url,
+        request_throttle_seconds=0,
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency,
+    )
+
+
+def _metrics(sequential: List[float], requests: int, elapsed: float) -> Dict[str, float]:
+    return {
+        "requests_per_second": requests / elapsed,
+        "mean_us": statistics.fmean(sequential) * 1e6,
+    }
+
+
+def bench_sync(
+    settings: Settings,
+    transport: Optional[httpx.BaseTransport],
+    requests: int,
+    concurrency: int,
+) -> Dict[str, float]:
+    """Sequential latency and concurrent throughput of the sync client on one transport."""
+    with HTTPXClient(settings, transport=transport) as client:
+        call = lambda: client.matches.get_by_day_basic("20240120")
+        call()  # open a connection outside the measurement
+        sequential = []
+        for _ in range(min(requests, 200)):
+            start = time.perf_counter()
+            call()
+            sequential.append(time.perf_counter() - start)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            start = time.perf_counter()
+            for future in [executor.submit(call) for _ in range(requests)]:
+                future.result()
+            elapsed = time.perf_counter() - start
+    return _metrics(sequential, requests, elapsed)
+
+
+def bench_async(
+    settings: Settings,
+    make_transport: Callable[[], Optional[httpx.AsyncBaseTransport]],
+    requests: int,
+    concurrency: int,
+) -> Dict[str, float]:
+    """Sequential latency and concurrent throughput of the async client on one transport."""
+    async def run() -> Dict[str, float]:
+        async with AsyncHTTPXClient(settings, transport=make_transport()) as client:
+            call = lambda: client.matches.get_by_day_basic("20240120")
+            await call()
+            sequential = []
+            for _ in range(min(requests, 200)):
+                start = time.perf_counter()
+                await call()
+                sequential.append(time.perf_counter() - start)
+
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one() -> None:
+                async with semaphore:
+                    await call()
+
+            start = time.perf_counter()
+            await asyncio.gather(*(one() for _ in range(requests)))
+            elapsed = time.perf_counter() - start
+        return _metrics(sequential, requests, elapsed)
+
+    return asyncio.run(run())
+
+
+def _available(factory: Callable[[], Any]) -> bool:
+    try:
+        factory()
+    except ImportError:
+        return False
+    return True
+
+
+def run(requests: int, concurrency: int, delay: float, matches: int) -> Dict[str, Dict[str, float]]:
+    """Benchmark every installed stack against one stand-in server.
+
+    Args:
+        requests: Concurrent requests per throughput measurement
+        concurrency: Threads (sync) or tasks (async) sending at once
+        delay: Seconds the stand-in server waits before each response
+        matches: Matches in the served day response
+
+    Returns:
+        Metrics per stack name
+    """
+    body = PayloadFactory(seed=0).response_bytes(MatchDayBasicResponse, matches)
+    memory = lambda: InMemoryTransport({MATCH_DAY_BASIC.endpoint: body})
+
+    results: Dict[str, Dict[str, float]] = {}
+    with StandInServer(body, delay) as server:
+        settings = _settings(server.base_url, concurrency)
+        sync_stacks: List[Tuple[str, Callable[[], Optional[httpx.BaseTransport]]]] = [
+            ("sync/memory", memory),
+            ("sync/httpx", lambda: None),
+            ("sync/urllib3", lambda: Urllib3Transport.from_settings(settings)),
+        ]
+        async_stacks: List[Tuple[str, Callable[[], Optional[httpx.AsyncBaseTransport]]]] = [
+            ("async/memory", memory),
+            ("async/httpx", lambda: None),
+            ("async/aiohttp", lambda: AiohttpTransport.from_settings(settings)),
+        ]
+        for name, make_transport in sync_stacks:
+            if _available(make_transport):
+                results[name] = bench_sync(settings, make_transport(), requests, concurrency)
+        for name, make_transport in async_stacks:
+            if _available(make_transport):
+                results[name] = bench_async(settings, make_transport, requests, concurrency)
+
+    for name, metrics in results.items():
+        baseline = results.get(f"{name.split('/')[0]}/memory")
+        metrics["overhead_us"] = metrics["mean_us"] - baseline["mean_us"]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000, help="requests per throughput measurement")
+    parser.add_argument("--concurrency", type=int, default=50, help="concurrent threads or tasks")
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="stand-in server delay per response")
+    parser.add_argument("--matches", type=int, default=5, help="matches in the served response")
+    args = parser.parse_args()
+
+    results = run(args.requests, args.concurrency, args.delay_ms / 1000, args.matches)
+    print(f"{'stack':>14}  {'req/s':>9}  {'mean us':>9}  {'overhead us':>11}")
+    for name, metrics in results.items():
+        print(
+            f"{name:>14}  {metrics['requests_per_second']:9.0f}  "
+            f"{metrics['mean_us']:9.1f}  {metrics['overhead_us']:11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -23,19 +23,25 @@ Modules:
     requests_: Request building components (headers, parameters, enums)
     responses: Pydantic models for parsing and validating API responses
 """
-from . import client
-from . import requests_
-from . import responses
-from . import settings
+from typing import TYPE_CHECKING, Optional
 
-from typing import Optional
+from .lazy_import import attach
+
+if TYPE_CHECKING:
+    from . import client
+    from . import requests_
+    from . import responses
+    from . import settings
 
 __version__ = "0.1.0"
 
+# Submodules are imported on first attribute access to keep `import soccer_info` cheap
+__getattr__, __dir__ = attach(__name__, submodules=('client', 'requests_', 'responses', 'settings'))
+
 
 def quick_client(
-        setting: Optional[settings.Settings] = None,
-) -> client.HTTPXClient:
+        setting: Optional['settings.Settings'] = None,
+) -> 'client.HTTPXClient':
     """Create a Soccer Football Info API client with sensible defaults.
     
     Convenience function that eliminates the need to manually construct 
@@ -48,14 +54,17 @@ def quick_client(
     Returns:
         HTTPXClient: Configured sync client ready for API calls.
     """
-    return client.HTTPXClient(
-        settings.SettingsBuilder().with_api_key().build() if setting is None else setting,
+    from .client import HTTPXClient
+    from .settings import SettingsBuilder
+
+    return HTTPXClient(
+        SettingsBuilder().with_api_key().build() if setting is None else setting,
     )
 
 
 def quick_async_client(
-        setting: Optional[settings.Settings] = None,
-) -> client.AsyncHTTPXClient:
+        setting: Optional['settings.Settings'] = None,
+) -> 'client.AsyncHTTPXClient':
     """Create an async_ Soccer Football Info API client with sensible defaults.
     
     Convenience function that eliminates the need to manually construct 
@@ -68,6 +77,9 @@ def quick_async_client(
     Returns:
         AsyncHTTPClient: Configured async_ client ready for API calls.
     """
-    return client.AsyncHTTPXClient(
-        settings.SettingsBuilder().with_api_key().build() if setting is None else setting,
+    from .client import AsyncHTTPXClient
+    from .settings import SettingsBuilder
+
+    return AsyncHTTPXClient(
+        SettingsBuilder().with_api_key().build() if setting is None else setting,
     )
@@ -0,0 +1,5 @@
+import sys
+
+from soccer_info.cli import main
+
+sys.exit(main())
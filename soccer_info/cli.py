@@ -0,0 +1,366 @@
+"""
+Command-line tool for bulk downloads from the Soccer Football Info API.
+
+Usage:
+    soccer-info countries
+    soccer-info championships [--country CODE] [--details]
+    soccer-info matches --championship ID [--full]
+    soccer-info days --from YYYYMMDD --to YYYYMMDD [--full]
+
+Every command accepts --concurrency, --rate, --format (ndjson/csv/parquet),
+--output, --max-file-items and --resume. Items are buffered and flushed in
+batches, so memory stays constant on long crawls; file outputs ending in
+.gz or .zst are compressed. Pages are fetched concurrently, so their order
+is not preserved.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, TextIO, Tuple
+
+from soccer_info.client import AsyncHTTPXClient
+from soccer_info.export import CSVSink, NDJSONSink, ParquetSink, Sink
+from soccer_info.responses import APIResponse
+from soccer_info.settings import Settings, SettingsBuilder
+
+logger = logging.getLogger(__name__)
+
+DATE_FORMAT = "%Y%m%d"
+PROGRESS_SUFFIX = ".progress"
+
+
+# =============================================================================
+# Output
+# =============================================================================
+
+def open_sink(args: argparse.Namespace, stream: Optional[TextIO], on_flush: Callable[[], None]) -> Sink:
+    """Create the sink for the selected format; file outputs are compressed by suffix (.gz, .zst)."""
+    target = stream if args.output is None else args.output
+    options = dict(max_file_items=args.max_file_items, append=args.resume, on_flush=on_flush)
+    if args.format == "parquet":
+        return ParquetSink(target, **options)
+    if args.format == "csv":
+        return CSVSink(target, **options)
+    return NDJSONSink(target, **options)
+
+
+# =============================================================================
+# Resume state
+# =============================================================================
+
+class Progress:
+    """Completed pages of a crawl, appended to a file next to the output for --resume.
+
+    Each line records one written page as ``{"key": ..., "page": ..., "pages": ...}``.
+    Pages handed to the sink are only recorded by ``commit``, which runs
+    after the sink flushed them, so a page is never marked done before its
+    items are in the output.
+    """
+
+    def __init__(self, path: Optional[Path], resume: bool):
+        self.path = path
+        self._done: Dict[str, Set[int]] = {}
+        self._pages: Dict[str, int] = {}
+        self._written: List[Tuple[str, int, int]] = []
+        self._file: Optional[TextIO] = None
+
+        if path is None:
+            return
+        if resume and path.exists():
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._mark(entry["key"], entry["page"], entry["pages"])
+        self._file = open(path, 'a' if resume else 'w', encoding='utf-8')
+
+    def _mark(self, key: str, page: int, pages: int) -> None:
+        self._done.setdefault(key, set()).add(page)
+        self._pages[key] = pages
+
+    def pending(self, key: str) -> Optional[List[int]]:
+        """Pages of a job still to fetch, or None if its page count is unknown."""
+        if key not in self._pages:
+            return None
+        return [page for page in range(1, self._pages[key] + 1) if page not in self._done[key]]
+
+    def written(self, key: str, page: int, pages: int) -> None:
+        """Note a page whose items were handed to the sink."""
+        self._written.append((key, page, pages))
+
+    def commit(self) -> None:
+        """Record every page noted by ``written``; called after the sink flushed."""
+        written, self._written = self._written, []
+        for key, page, pages in written:
+            self._mark(key, page, pages)
+            if self._file is not None:
+                self._file.write(json.dumps({"key": key, "page": page, "pages": pages}) + "\n")
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# =============================================================================
+# Crawling
+# =============================================================================
+
+PageFetcher = Callable[[int], Awaitable[APIResponse]]
+
+
+@dataclass(frozen=True)
+class Job:
+    """A request to crawl; ``fetch`` receives the page number to load.
+
+    Jobs for endpoints without a page parameter set ``paginated=False`` so
+    that only their first page is fetched.
+    """
+    key: str
+    fetch: PageFetcher
+    paginated: bool = True
+
+
+@dataclass
+class CrawlStats:
+    pages: int = 0
+    items: int = 0
+    failures: int = 0
+
+
+class Crawler:
+    """Fetches every page of a set of jobs with bounded concurrency.
+
+    The first page of each job reveals its page count; the remaining pages
+    are then queued and fetched concurrently. Each page's items are handed
+    to the sink as it arrives, and the page is recorded in the progress
+    file once the sink flushed them. Failed pages are logged and counted,
+    and are retried by a later --resume run.
+    """
+
+    def __init__(self, sink: Sink, progress: Progress, concurrency: int):
+        self.sink = sink
+        self.progress = progress
+        self.concurrency = concurrency
+        self.stats = CrawlStats()
+        self._queue: asyncio.Queue[Tuple[Job, int]] = asyncio.Queue()
+
+    async def run(self, jobs: Iterable[Job]) -> CrawlStats:
+        for job in jobs:
+            pending = self.progress.pending(job.key)
+            for page in ([1] if pending is None else pending):
+                self._queue.put_nowait((job, page))
+
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        try:
+            await self._queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return self.stats
+
+    async def _worker(self) -> None:
+        while True:
+            job, page = await self._queue.get()
+            try:
+                await self._fetch(job, page)
+            except Exception as error:
+                self.stats.failures += 1
+                logger.error("Failed to fetch %s page %d: %s", job.key, page, error)
+            finally:
+                self._queue.task_done()
+
+    async def _fetch(self, job: Job, page: int) -> None:
+        response = await job.fetch(page)
+        pages = response.page_count if job.paginated else 1
+        if page == 1:
+            for next_page in range(2, pages + 1):
+                self._queue.put_nowait((job, next_page))
+
+        self.progress.written(job.key, page, pages)
+        self.sink.write_many(response.result)
+        self.stats.pages += 1
+        self.stats.items += len(response.result)
+
+
+async def collect(fetch: PageFetcher) -> List[Any]:
+    """Fetch every page sequentially and return all result items."""
+    first = await fetch(1)
+    items = list(first.result)
+    for page in range(2, first.page_count + 1):
+        items.extend((await fetch(page)).result)
+    return items
+
+
+# =============================================================================
+# Commands
+# =============================================================================
+
+def parse_date(value: str) -> date:
+    try:
+        return datetime.strptime(value, DATE_FORMAT).date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date {value!r}, expected YYYYMMDD")
+
+
+async def countries_jobs(client: AsyncHTTPXClient, args: argparse.Namespace) -> List[Job]:
+    return [Job("countries", lambda page: client.countries.get_list(), paginated=False)]
+
+
+async def championships_jobs(client: AsyncHTTPXClient, args: argparse.Namespace) -> List[Job]:
+    def list_page(page: int):
+        return client.championships.get_list(page=page, country=args.country, language=args.language)
+
+    if not args.details:
+        return [Job(f"championships/{args.country or 'all'}", list_page)]
+
+    championships = await collect(list_page)
+    return [
+        Job(
+            f"championship/{championship.id}",
+            lambda page, championship_id=championship.id: client.championships.get_by_id(
+                championship_id, language=args.language,
+            ),
+            paginated=False,
+        )
+        for championship in championships
+    ]
+
+
+async def matches_jobs(client: AsyncHTTPXClient, args: argparse.Namespace) -> List[Job]:
+    get_page = client.matches.get_by_filter_full if args.full else client.matches.get_by_filter_basic
+    return [Job(
+        f"matches/{args.championship}",
+        lambda page: get_page(championship_id=args.championship, page=page, language=args.language),
+    )]
+
+
+async def days_jobs(client: AsyncHTTPXClient, args: argparse.Namespace) -> List[Job]:
+    if args.date_to < args.date_from:
+        raise SystemExit("--to must not be earlier than --from")
+    get_page = client.matches.get_by_day_full if args.full else client.matches.get_by_day_basic
+
+    jobs = []
+    day = args.date_from
+    while day <= args.date_to:
+        key = day.strftime(DATE_FORMAT)
+        jobs.append(Job(
+            f"day/{key}",
+            lambda page, key=key: get_page(key, page=page, language=args.language),
+        ))
+        day += timedelta(days=1)
+    return jobs
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--api-key-env", help="environment variable holding the API key "
+                                              "(default: RAPIDAPI_SOCCER_INFO_KEY)")
+    common.add_argument("--concurrency", type=int, default=4, help="requests in flight (default: 4)")
+    common.add_argument("--rate", type=float, help="maximum requests per second "
+                                                   "(default: the client throttle, ~3.3/s)")
+    common.add_argument("--format", choices=("ndjson", "csv", "parquet"), default="ndjson",
+                        help="output format (parquet requires --output and pyarrow)")
+    common.add_argument("--output", "-o", type=Path,
+                        help="output file, compressed when ending in .gz or .zst (default: stdout)")
+    common.add_argument("--max-file-items", type=int,
+                        help="roll over to a new numbered output file after this many items")
+    common.add_argument("--resume", action="store_true",
+                        help="append to --output, skipping pages recorded in its .progress file")
+    common.add_argument("--language", help="response language, e.g. en_US")
+    common.add_argument("--verbose", "-v", action="store_true", help="log progress to stderr")
+
+    parser = argparse.ArgumentParser(prog="soccer-info", description="Bulk downloads from the Soccer Football Info API")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    countries = commands.add_parser("countries", parents=[common], help="dump all countries")
+    countries.set_defaults(jobs=countries_jobs)
+
+    championships = commands.add_parser("championships", parents=[common], help="crawl championships")
+    championships.add_argument("--country", help="only championships of this country code")
+    championships.add_argument("--details", action="store_true",
+                               help="fetch each championship's detail (seasons, tables) instead of the list")
+    championships.set_defaults(jobs=championships_jobs)
+
+    matches = commands.add_parser("matches", parents=[common], help="a championship's full match history")
+    matches.add_argument("--championship", required=True, help="championship id")
+    matches.add_argument("--full", action="store_true", help="full match data instead of basic")
+    matches.set_defaults(jobs=matches_jobs)
+
+    days = commands.add_parser("days", parents=[common], help="matches of every day in a date range")
+    days.add_argument("--from", dest="date_from", type=parse_date, required=True, help="first day (YYYYMMDD)")
+    days.add_argument("--to", dest="date_to", type=parse_date, required=True, help="last day (YYYYMMDD)")
+    days.add_argument("--full", action="store_true", help="full match data instead of basic")
+    days.set_defaults(jobs=days_jobs)
+
+    return parser
+
+
+def build_settings(args: argparse.Namespace) -> Settings:
+    """Settings for the crawl; --rate replaces the client's default throttle."""
+    builder = SettingsBuilder().with_api_key(environment=args.api_key_env)
+    if args.rate:
+        builder.with_request_throttle(1 / args.rate)
+    return builder.build()
+
+
+async def run(args: argparse.Namespace, settings: Settings, stream: Optional[TextIO] = None) -> CrawlStats:
+    """Run the selected command, writing its items to --output or ``stream``."""
+    progress_path = args.output.with_name(args.output.name + PROGRESS_SUFFIX) if args.output else None
+
+    progress = Progress(progress_path, args.resume)
+    sink = None
+    try:
+        sink = open_sink(args, stream, progress.commit)
+        async with AsyncHTTPXClient(settings) as client:
+            jobs = await args.jobs(client, args)
+            return await Crawler(sink, progress, args.concurrency).run(jobs)
+    finally:
+        try:
+            if sink is not None:
+                sink.close()
+        finally:
+            progress.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the ``soccer-info`` command."""
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+    if args.resume and args.output is None:
+        raise SystemExit("--resume requires --output")
+    if args.format == "parquet" and args.output is None:
+        raise SystemExit("--format parquet requires --output")
+    if args.format == "parquet" and args.resume:
+        # An interrupted Parquet file has no footer, so its recorded pages are unreadable
+        raise SystemExit("--resume is not supported with --format parquet")
+    if args.max_file_items is not None and (args.output is None or args.max_file_items < 1):
+        raise SystemExit("--max-file-items requires --output and must be at least 1")
+    if args.concurrency < 1:
+        raise SystemExit("--concurrency must be at least 1")
+    if args.rate is not None and args.rate <= 0:
+        raise SystemExit("--rate must be positive")
+    try:
+        settings = build_settings(args)
+    except ValueError as error:
+        raise SystemExit(str(error))
+
+    try:
+        stats = asyncio.run(run(args, settings, sys.stdout if args.output is None else None))
+    except ImportError as error:
+        raise SystemExit(str(error))
+
+    logger.info("Fetched %d pages, wrote %d items, %d failed pages", stats.pages, stats.items, stats.failures)
+    return 1 if stats.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
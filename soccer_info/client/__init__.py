@@ -1,7 +1,74 @@
-"""Client module for Soccer Football Info API."""
-from soccer_info.client.sync.httpclient import HTTPXClient
-from soccer_info.client.async_.async_httpclient import AsyncHTTPXClient
-from soccer_info.client.sync.client import Client
-from soccer_info.client.async_.async_client import AsyncClient
+"""Client module for Soccer Football Info API.
 
-__all__ = ['HTTPXClient', 'AsyncHTTPXClient', 'Client', 'AsyncClient']
+Clients are imported on first access, so using the sync client does not
+import the async one (and vice versa).
+"""
+from typing import TYPE_CHECKING
+
+from soccer_info.lazy_import import attach
+
+if TYPE_CHECKING:
+    from soccer_info.client.sync.httpclient import HTTPXClient
+    from soccer_info.client.async_.async_httpclient import AsyncHTTPXClient
+    from soccer_info.client.sync.client import Client
+    from soccer_info.client.async_.async_client import AsyncClient
+    from soccer_info.client.async_.scheduler import Priority, RequestShedError, request_priority
+    from soccer_info.client.async_.quota import QuotaReserveError
+    from soccer_info.client.key_pool import QuotaExhaustedError
+    from soccer_info.client.async_.loader import LoaderStats, MatchLoader
+    from soccer_info.client.async_.ingest import BulkIngestor, IngestStats, RawPage
+    from soccer_info.client.async_.stages import StagedPipeline, StageMetrics
+    from soccer_info.client.planner import DataNeed, FetchPlan, FetchPlanner, FetchResult
+    from soccer_info.client.parse_cache import ParseCache, ParseCacheStats
+    from soccer_info.client.pipeline import Call, Middleware, Pipeline, RequestSpec, Send, Shared, Sleep
+    from soccer_info.client.middleware import (
+        CoalescingMiddleware,
+        EndpointMetrics,
+        MetricsMiddleware,
+        ParseCacheMiddleware,
+        RetryMiddleware,
+        ThrottleMiddleware,
+    )
+
+# Exported name -> module defining it
+_EXPORTS = {
+    'HTTPXClient': 'soccer_info.client.sync.httpclient',
+    'AsyncHTTPXClient': 'soccer_info.client.async_.async_httpclient',
+    'Client': 'soccer_info.client.sync.client',
+    'AsyncClient': 'soccer_info.client.async_.async_client',
+    'Priority': 'soccer_info.client.async_.scheduler',
+    'RequestShedError': 'soccer_info.client.async_.scheduler',
+    'request_priority': 'soccer_info.client.async_.scheduler',
+    'QuotaReserveError': 'soccer_info.client.async_.quota',
+    'QuotaExhaustedError': 'soccer_info.client.key_pool',
+    'MatchLoader': 'soccer_info.client.async_.loader',
+    'LoaderStats': 'soccer_info.client.async_.loader',
+    'BulkIngestor': 'soccer_info.client.async_.ingest',
+    'IngestStats': 'soccer_info.client.async_.ingest',
+    'RawPage': 'soccer_info.client.async_.ingest',
+    'StagedPipeline': 'soccer_info.client.async_.stages',
+    'StageMetrics': 'soccer_info.client.async_.stages',
+    'FetchPlanner': 'soccer_info.client.planner',
+    'DataNeed': 'soccer_info.client.planner',
+    'FetchPlan': 'soccer_info.client.planner',
+    'FetchResult': 'soccer_info.client.planner',
+    'ParseCache': 'soccer_info.client.parse_cache',
+    'ParseCacheStats': 'soccer_info.client.parse_cache',
+    'RequestSpec': 'soccer_info.client.pipeline',
+    'Call': 'soccer_info.client.pipeline',
+    'Middleware': 'soccer_info.client.pipeline',
+    'Pipeline': 'soccer_info.client.pipeline',
+    'Send': 'soccer_info.client.pipeline',
+    'Sleep': 'soccer_info.client.pipeline',
+    'Shared': 'soccer_info.client.pipeline',
+    'ParseCacheMiddleware': 'soccer_info.client.middleware',
+    'RetryMiddleware': 'soccer_info.client.middleware',
+    'CoalescingMiddleware': 'soccer_info.client.middleware',
+    'ThrottleMiddleware': 'soccer_info.client.middleware',
+    'MetricsMiddleware': 'soccer_info.client.middleware',
+    'EndpointMetrics': 'soccer_info.client.middleware',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = attach(__name__, exports=_EXPORTS)
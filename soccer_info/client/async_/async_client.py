@@ -1,18 +1,24 @@
 from abc import ABC, abstractmethod
-import asyncio
-import time
-from typing import Type, Optional
+from typing import Mapping, Type, Optional
 
-from soccer_info.requests_.parameters import BaseParameters
-from soccer_info.requests_.headers import Header
-from soccer_info.client.base_client import BaseClient, T
+from soccer_info.client.base_client import BaseClient, RequestHeaders, RequestParams, T
+from soccer_info.client.pipeline import Parser, RequestSpec
+from soccer_info.client.async_.quota import QuotaGuard
+from soccer_info.client.async_.scheduler import PriorityScheduler
+from soccer_info.responses.base import ResponseHeaders
 from soccer_info.settings import Settings
 
 
 class AsyncClient(BaseClient, ABC):
     """Asynchronous client with request throttling, domain client aggregation, and async context manager support.
+
+    Requests are throttled by a priority scheduler: wrap calls in
+    ``request_priority("live" | "interactive" | "bulk")`` to keep
+    latency-sensitive calls ahead of batch work on the same client.
     
     Attributes:
+        scheduler: Priority-aware request throttle
+        quota_guard: Reserve-floor guard, when ``settings.quota_reserve`` is set
         championships: Domain client for championship-related endpoints
         matches: Domain client for match-related endpoints
         countries: Domain client for country-related endpoints
@@ -31,9 +37,18 @@ class AsyncClient(BaseClient, ABC):
         """
         super().__init__(settings, default_language)
         
-        # Initialize throttling mechanism
-        self._throttle_lock = asyncio.Lock()
-        self._last_request_time: Optional[float] = None
+        # Send slots are handed out by priority; pooled keys share the budget of all keys
+        interval = settings.request_throttle_seconds
+        if self.key_pool is not None:
+            interval /= len(self.key_pool)
+        self.scheduler = PriorityScheduler(interval, bulk_deadline=settings.bulk_deadline_seconds)
+        self.quota_guard: Optional[QuotaGuard] = None
+        if settings.quota_reserve is not None:
+            self.quota_guard = QuotaGuard(
+                self.scheduler,
+                reserve=settings.quota_reserve,
+                auto_resume=settings.quota_auto_resume,
+            )
         
         # Import here to avoid circular dependency
         from soccer_info.client.async_.domain.championships import AsyncChampionships
@@ -43,6 +58,15 @@ class AsyncClient(BaseClient, ABC):
         self.matches = AsyncMatches(self)
         self.countries = AsyncCountries(self)
 
+    def _observe_quota(self, headers: Mapping[str, str]) -> None:
+        """Feed the quota reported by a response (or by all pooled keys) to the quota guard."""
+        if self.key_pool is not None:
+            remaining, reset_seconds = self.key_pool.quota()
+        else:
+            rate = ResponseHeaders.model_validate(dict(headers))
+            remaining, reset_seconds = rate.rate_limit_remaining, rate.rate_limit_reset
+        self.quota_guard.observe(remaining, reset_seconds)
+
     async def __aenter__(self) -> 'AsyncClient':
         """Enter async context manager."""
         return self
@@ -56,23 +80,39 @@ class AsyncClient(BaseClient, ABC):
         """Close the HTTP client and release resources."""
         ...
 
-    @abstractmethod
     async def do_request(
         self,
         endpoint: str,
-        params: BaseParameters,
-        headers: Header,
+        params: RequestParams,
+        headers: RequestHeaders,
         response_model: Type[T],
     ) -> T:
         """Execute async HTTP request to API endpoint.
         
         Args:
             endpoint: API endpoint path (e.g., "/championships/list/")
-            params: Request parameters to include in the API call
-            headers: HTTP headers including RapidAPI authentication
+            params: Request parameters to include in the API call, as a
+                parameters model or an already serialized mapping
+            headers: HTTP headers including RapidAPI authentication, as a
+                Header model or an already serialized mapping
             response_model: Pydantic model class for response validation
             
         Returns:
             Validated response object of the specified model type
         """
+        return await self.execute(self._request_spec(endpoint, params, headers, response_model))
+
+    @abstractmethod
+    async def execute(self, spec: RequestSpec[T], parser: Optional[Parser] = None) -> T:
+        """Send a request through the middleware pipeline and validate its response.
+
+        Args:
+            spec: Request to send and the model to validate the response with
+            parser: Turns the raw response into the result instead of
+                validating it with the spec's model (e.g. to defer validation)
+
+        Returns:
+            Validated response object of the spec's model type, or what
+            ``parser`` returned
+        """
         ...
@@ -1,13 +1,28 @@
 import asyncio
+import threading
+from dataclasses import dataclass
+
 import httpx
-import time
-from typing import Optional, Type
+from typing import Any, Dict, Hashable, List, Mapping, Optional
 
-from soccer_info.requests_.headers import Header
-from soccer_info.requests_.parameters import BaseParameters
-from soccer_info.responses.base import ResponseHeaders
 from soccer_info.settings import Settings
+from soccer_info.client.connection import (
+    WARMUP_METHOD,
+    WARMUP_PATH,
+    httpx_client_options,
+    warmup_connection_count,
+)
+from soccer_info.client.pipeline import Call, Effect, Parser, RequestSpec, Send, Shared, Sleep, adrive
+from soccer_info.client.timing import TimingCollector
 from soccer_info.client.async_.async_client import AsyncClient, T
+from soccer_info.client.async_.scheduler import current_request_options
+
+
+@dataclass
+class _SharedFlow:
+    """A coalesced flow running in its own task, and the number of calls waiting for it."""
+    task: asyncio.Task
+    waiters: int = 0
 
 
 class AsyncHTTPXClient(AsyncClient):
@@ -28,79 +43,236 @@ class AsyncHTTPXClient(AsyncClient):
         self,
         settings: Settings,
         default_language: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         """Initialize the httpx-based async client.
         
         Args:
             settings: API configuration including authentication credentials
             default_language: Preferred language for API responses
+            transport: Custom httpx transport (e.g. ``httpx.MockTransport`` for
+                tests and benchmarks). Defaults to httpx's network transport.
         """
         super().__init__(settings, default_language)
+        self._transport = transport
         self._async_http_client: Optional[httpx.AsyncClient] = None
+        self._async_http_client_lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _SharedFlow] = {}
 
     @property
     def async_http_client(self) -> httpx.AsyncClient:
         """Lazily initialize and return the httpx async client.
         
         The client is created on first access and reused for subsequent requests.
+        Creation is locked so event loops in several threads sharing the
+        client do not each create a connection pool.
+        """
+        async_http_client = self._async_http_client
+        if async_http_client is None:
+            with self._async_http_client_lock:
+                if self._async_http_client is None:
+                    self._async_http_client = httpx.AsyncClient(
+                        transport=self._transport,
+                        **httpx_client_options(self.settings),
+                    )
+                async_http_client = self._async_http_client
+        return async_http_client
+
+    async def warmup(self, connections: Optional[int] = None) -> int:
+        """Pre-open pooled connections so the first requests skip TCP and TLS setup.
+
+        Sends concurrent unauthenticated ``HEAD /`` requests and keeps each
+        response open until all are established, forcing every request onto
+        its own connection. The connections are then returned to the pool.
+
+        Args:
+            connections: Number of connections to open. Defaults to one for
+                HTTP/2 and to ``settings.max_keepalive_connections`` otherwise.
+
+        Returns:
+            Number of connections opened
+
+        Raises:
+            httpx.HTTPError: If no connection could be opened
         """
-        if self._async_http_client is None:
-            self._async_http_client = httpx.AsyncClient(
-                base_url=self.settings.base_url,
-                timeout=self.settings.request_timeout,
-            )
-        return self._async_http_client
+        count = warmup_connection_count(self.settings, connections)
+        if count <= 0:
+            return 0
+
+        client = self.async_http_client
+        results = await asyncio.gather(
+            *(
+                client.send(client.build_request(WARMUP_METHOD, WARMUP_PATH), stream=True)
+                for _ in range(count)
+            ),
+            return_exceptions=True,
+        )
+
+        opened: List[httpx.Response] = [result for result in results if isinstance(result, httpx.Response)]
+        for response in opened:
+            # Reading the (empty) body completes the exchange so the connection stays pooled
+            await response.aread()
+            await response.aclose()
+
+        if not opened:
+            raise results[0]
+        return len(opened)
 
     async def close(self) -> None:
         """Close the httpx async client and release resources."""
-        if self._async_http_client is not None:
-            await self._async_http_client.aclose()
-            self._async_http_client = None
+        with self._async_http_client_lock:
+            async_http_client, self._async_http_client = self._async_http_client, None
+        if async_http_client is not None:
+            await async_http_client.aclose()
 
-    async def do_request(
-        self,
-        endpoint: str,
-        params: BaseParameters,
-        headers: Header,
-        response_model: Type[T],
-    ) -> T:
+    async def execute(self, spec: RequestSpec[T], parser: Optional[Parser] = None) -> T:
         """Implements request throttling to ensure minimum time between requests.
         
         Requests are throttled according to settings.request_throttle_seconds. 
         If requests come in faster than the throttle limit, they will be queued 
-        and processed sequentially with the appropriate delay.
+        and released by priority (see ``request_priority``), first in first out
+        within a priority class.
         
         Raises:
             httpx.HTTPStatusError: If the request fails with non-2xx status
             RuntimeError: If the response indicates an API error
+            RequestShedError: If the request waited past its deadline
+            QuotaReserveError: If the quota guard stopped this request
         """
-        # Acquire lock to ensure proper spacing between request sends
-        async with self._throttle_lock:
-            # Calculate time to wait based on throttle setting
-            if self._last_request_time is not None:
-                elapsed = time.time() - self._last_request_time
-                wait_time = self.settings.request_throttle_seconds - elapsed
-                
-                if wait_time > 0:
-                    # Wait to respect the throttle limit
-                    await asyncio.sleep(wait_time)
-            
-            # Update last request time before sending
-            self._last_request_time = time.time()
-        
-        # Execute the HTTP request outside the lock so responses can overlap
-        response = await self.async_http_client.get(
-            endpoint,
-            params=params.to_dict(),
-            headers=headers.to_dict(),
+        call = Call(spec) if parser is None else Call(spec, parser=parser)
+        trace = self.instrumentation.trace(spec.endpoint)
+        if trace is not None:
+            call.extensions["trace"] = trace
+        try:
+            parsed = await adrive(self.pipeline.flow(call), self._perform)
+            timings: Optional[TimingCollector] = call.extensions.get("timings")
+            # A coalesced call shares the model of the call it waited for; its timings are that call's
+            if timings is not None and call.response is not None and not call.extensions.get("coalesced"):
+                parsed.response_timings = timings.build(
+                    http_version=call.response.http_version,
+                    validation=call.validation_seconds,
+                )
+        except BaseException as error:
+            if trace is not None:
+                trace.error(error)
+            raise
+
+        if trace is not None:
+            trace.parse_end()
+        return parsed
+
+    async def _perform(self, effect: Effect) -> Any:
+        """Perform one effect of a pipeline flow."""
+        if isinstance(effect, Send):
+            return await self._perform_send(effect.call)
+        if isinstance(effect, Sleep):
+            await asyncio.sleep(effect.seconds)
+            return None
+        if isinstance(effect, Shared):
+            return await self._perform_shared(effect)
+        raise TypeError(f"Unsupported pipeline effect: {effect!r}")
+
+    async def _perform_send(self, call: Call) -> httpx.Response:
+        trace = call.extensions.get("trace")
+        if trace is not None:
+            trace.attempt_start()
+
+        # Wait for a send slot according to the priority of the calling task
+        await self.scheduler.acquire()
+        if trace is not None:
+            trace.throttle_end()
+
+        # Execute the HTTP request after the slot is granted so responses can overlap
+        # Resolve the lazily created client first so its setup is not timed as pool wait
+        async_http_client = self.async_http_client
+        timings = TimingCollector() if self.settings.collect_timings else None
+        call.extensions["timings"] = timings
+        response = await self._send(
+            async_http_client,
+            call.spec.endpoint,
+            params=call.spec.params,
+            headers=call.spec.headers,
+            extensions={"trace": timings.arecord} if timings is not None else None,
         )
+        if timings is not None:
+            timings.response_read()
+        if self.quota_guard is not None:
+            self._observe_quota(response.headers)
 
-        response.raise_for_status()
+        if trace is not None:
+            trace.response(response.status_code, len(response.content))
+        return response
 
-        # Parse JSON response
-        parsed = response_model.model_validate_json(response.text)
+    async def _perform_shared(self, effect: Shared) -> Any:
+        """Run ``effect.start()`` unless a flow with the same key is in flight, then wait for that one.
 
-        # Parse and attach response headers (Pydantic handles normalization and type conversion)
-        parsed.response_headers = ResponseHeaders.model_validate(dict(response.headers))
+        The shared flow runs in its own task, so cancelling any caller, the
+        one that started it included, leaves the others waiting; the flow is
+        cancelled only once no caller waits for it any more. Flows are shared
+        only between callers with the same ``request_priority`` options, so a
+        live caller never waits behind a bulk request.
+        """
+        key = (effect.key, current_request_options())
+        shared = self._in_flight.get(key)
+        if shared is None:
+            shared = _SharedFlow(asyncio.create_task(adrive(effect.start(), self._perform)))
+            self._in_flight[key] = shared
+            shared.task.add_done_callback(lambda _: self._forget_shared(key, shared))
+        elif effect.call is not None:
+            effect.call.mark_coalesced()
 
-        return parsed
+        shared.waiters += 1
+        try:
+            return await asyncio.shield(shared.task)
+        finally:
+            shared.waiters -= 1
+            if shared.waiters == 0 and not shared.task.done():
+                self._forget_shared(key, shared)
+                shared.task.cancel()
+
+    def _forget_shared(self, key: Hashable, shared: '_SharedFlow') -> None:
+        if self._in_flight.get(key) is shared:
+            del self._in_flight[key]
+
+    async def _send(
+        self,
+        async_http_client: httpx.AsyncClient,
+        endpoint: str,
+        params: Mapping[str, Any],
+        headers: Mapping[str, str],
+        extensions: Optional[Dict[str, Any]],
+    ) -> httpx.Response:
+        """Send a GET request, routing it through the key pool when one is configured.
+
+        Pooled keys are throttled individually. A request answered with 429
+        drains its key and is retried on another one until the pool raises
+        ``QuotaExhaustedError``.
+        """
+        if self.key_pool is None:
+            return await async_http_client.get(endpoint, params=params, headers=headers, extensions=extensions)
+
+        while True:
+            key_state, wait_time = self.key_pool.reserve()
+            if wait_time > 0:
+                try:
+                    await asyncio.sleep(wait_time)
+                except BaseException:
+                    self.key_pool.release(key_state)
+                    raise
+            if self.key_pool.is_drained(key_state):
+                self.key_pool.release(key_state)
+                continue
+
+            try:
+                response = await async_http_client.get(
+                    endpoint,
+                    params=params,
+                    headers={**headers, **key_state.headers},
+                    extensions=extensions,
+                )
+            except BaseException:
+                self.key_pool.release(key_state)
+                raise
+            self.key_pool.release(key_state, response.status_code, response.headers)
+            if response.status_code != 429:
+                return response
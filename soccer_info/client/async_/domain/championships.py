@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from soccer_info.requests_ import ChampionshipListParameters, ChampionshipViewParameters
 from soccer_info.responses import ChampionshipListResponse, ChampionshipViewResponse
 from ..async_client import AsyncClient
 from ...common.domain.championships import Championships as CommonChampionships
@@ -19,28 +18,11 @@ class AsyncChampionships(CommonChampionships):
         country: Optional[str] = None,
         language: Optional[str] = None,
     ) -> ChampionshipListResponse:
-        return await self.client.do_request(
-            endpoint="/championships/list/",
-            params=ChampionshipListParameters(
-                page=page,
-                country=country,
-                language=self._get_language(language),
-            ),
-            headers=self._header_provider(),
-            response_model=ChampionshipListResponse,
-        )
+        return await self.client.execute(self._get_list_spec(page, country, language))
 
     async def get_by_id(
         self,
         championship_id: str,
         language: Optional[str] = None,
     ) -> ChampionshipViewResponse:
-        return await self.client.do_request(
-            endpoint="/championships/view/",
-            params=ChampionshipViewParameters(
-                id=championship_id,
-                language=self._get_language(language),
-            ),
-            headers=self._header_provider(),
-            response_model=ChampionshipViewResponse,
-        )
+        return await self.client.execute(self._get_by_id_spec(championship_id, language))
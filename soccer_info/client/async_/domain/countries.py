@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from soccer_info.requests_ import CountryListParameters
 from soccer_info.responses import CountryListResponse
 from ..async_client import AsyncClient
 from ...common.domain.countries import Countries as CommonCountries
@@ -17,11 +16,4 @@ class AsyncCountries(CommonCountries):
         self,
         format: Optional[str] = None,
     ) -> CountryListResponse:
-        return await self.client.do_request(
-            endpoint="/countries/list/",
-            params=CountryListParameters(
-                format=format,
-            ),
-            headers=self._header_provider(),
-            response_model=CountryListResponse,
-        )
+        return await self.client.execute(self._get_list_spec(format))
@@ -1,13 +1,6 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from soccer_info.requests_ import (
-    MatchViewParameters,
-    MatchOddsParameters,
-    MatchProgressiveParameters,
-    MatchDayParameters,
-    MatchByParameters,
-)
 from soccer_info.responses import (
     MatchViewBasicResponse,
     MatchViewFullResponse,
@@ -37,43 +30,20 @@ class AsyncMatches(CommonMatches):
         match_id: str,
         language: Optional[str] = None,
     ) -> MatchViewBasicResponse:
-        return await self.client.do_request(
-            endpoint="/matches/view/basic/",
-            params=MatchViewParameters(
-                id=match_id,
-                language=self._get_language(language),
-            ),
-            headers=self._header_provider(),
-            response_model=MatchViewBasicResponse,
-        )
+        return await self.client.execute(self._get_view_basic_spec(match_id, language))
 
     async def get_view_full(
         self,
         match_id: str,
         language: Optional[str] = None,
     ) -> MatchViewFullResponse:
-        return await self.client.do_request(
-            endpoint="/matches/view/full/",
-            params=MatchViewParameters(
-                id=match_id,
-                language=self._get_language(language),
-            ),
-            headers=self._header_provider(),
-            response_model=MatchViewFullResponse,
-        )
+        return await self.client.execute(self._get_view_full_spec(match_id, language))
 
     async def get_odds(
         self,
         match_id: str,
     ) -> MatchOddsResponse:
-        return await self.client.do_request(
-            endpoint="/matches/odds/",
-            params=MatchOddsParameters(
-                id=match_id,
-            ),
-            headers=self._header_provider(),
-            response_model=MatchOddsResponse,
-        )
+        return await self.client.execute(self._get_odds_spec(match_id))
 
     async def get_progressive(
         self,
@@ -81,16 +51,7 @@ class AsyncMatches(CommonMatches):
         language: Optional[str] = None,
         format: Optional[str] = None,
     ) -> MatchProgressiveResponse:
-        return await self.client.do_request(
-            endpoint="/matches/view/progressive/",
-            params=MatchProgressiveParameters(
-                id=match_id,
-                language=self._get_language(language),
-                format=format,
-            ),
-            headers=self._header_provider(),
-            response_model=MatchProgressiveResponse,
-        )
+        return await self.client.execute(self._get_progressive_spec(match_id, language, format))
 
     # =========================================================================
     # Day-Based Endpoints
@@ -103,17 +64,7 @@ class AsyncMatches(CommonMatches):
         language: Optional[str] = None,
         format: Optional[str] = None,
     ) -> MatchDayBasicResponse:
-        return await self.client.do_request(
-            endpoint="/matches/day/basic/",
-            params=MatchDayParameters(
-                date=date,
-                page=page,
-                language=self._get_language(language),
-                format=format,
-            ),
-            headers=self._header_provider(),
-            response_model=MatchDayBasicResponse,
-        )
+        return await self.client.execute(self._get_by_day_basic_spec(date, page, language, format))
 
     async def get_by_day_full(
         self,
@@ -122,17 +73,7 @@ class AsyncMatches(CommonMatches):
         language: Optional[str] = None,
         format: Optional[str] = None,
     ) -> MatchDayFullResponse:
-        return await self.client.do_request(
-            endpoint="/matches/day/full/",
-            params=MatchDayParameters(
-                date=date,
-                page=page,
-                language=self._get_language(language),
-                format=format,
-            ),
-            headers=self._header_provider(),
-            response_model=MatchDayFullResponse,
-        )
+        return await self.client.execute(self._get_by_day_full_spec(date, page, language, format))
 
     # =========================================================================
     # Filter-Based Endpoints
@@ -146,18 +87,7 @@ class AsyncMatches(CommonMatches):
         page: Optional[int] = None,
         language: Optional[str] = None,
     ) -> MatchByBasicResponse:
-        return await self.client.do_request(
-            endpoint="/matches/by/basic/",
-            params=MatchByParameters(
-                championship_id=championship_id,
-                manager_id=manager_id,
-                stadium_id=stadium_id,
-                page=page,
-                language=self._get_language(language),
-            ),
-            headers=self._header_provider(),
-            response_model=MatchByBasicResponse,
-        )
+        return await self.client.execute(self._get_by_filter_basic_spec(championship_id, manager_id, stadium_id, page, language))
 
     async def get_by_filter_full(
         self,
@@ -167,15 +97,4 @@ class AsyncMatches(CommonMatches):
         page: Optional[int] = None,
         language: Optional[str] = None,
     ) -> MatchByFullResponse:
-        return await self.client.do_request(
-            endpoint="/matches/by/full/",
-            params=MatchByParameters(
-                championship_id=championship_id,
-                manager_id=manager_id,
-                stadium_id=stadium_id,
-                page=page,
-                language=self._get_language(language),
-            ),
-            headers=self._header_provider(),
-            response_model=MatchByFullResponse,
-        )
+        return await self.client.execute(self._get_by_filter_full_spec(championship_id, manager_id, stadium_id, page, language))
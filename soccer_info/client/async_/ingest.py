@@ -0,0 +1,234 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Optional,
+    Type,
+    Union,
+)
+
+from soccer_info.client.pipeline import RawResponse, RequestSpec
+from soccer_info.responses.base import ResponseComponent, ResponseHeaders
+from soccer_info.responses.binary import dumps_binary, loads_binary
+
+if TYPE_CHECKING:
+    from .async_client import AsyncClient
+
+Transform = Callable[[ResponseComponent], Any]
+
+
+@dataclass
+class RawPage:
+    """Unvalidated response body, as fetched for bulk ingestion.
+
+    Attributes:
+        content: Raw response body
+        response_headers: Parsed response headers, attached by the client
+        response_timings: Network timing breakdown, when timings are collected
+    """
+    content: bytes
+    response_headers: Optional[ResponseHeaders] = None
+    response_timings: Optional[Any] = None
+
+
+def _raw_page(spec: RequestSpec, raw: RawResponse) -> RawPage:
+    """Parser handing the body on without validating it."""
+    return RawPage(raw.content)
+
+
+def _validate(model: Type[ResponseComponent], content: bytes, transform: Optional[Transform]) -> Any:
+    """Worker: validate one body and transform it, or encode it for a cheap rebuild in the parent."""
+    parsed = model.model_validate_json(content)
+    if transform is None:
+        return dumps_binary(parsed, compress=False)
+    return transform(parsed)
+
+
+@dataclass
+class IngestStats:
+    """Counters of a ``BulkIngestor``.
+
+    Attributes:
+        pages: Responses fetched
+        bytes: Response body bytes fetched
+        results: Results yielded, in order
+    """
+    pages: int = 0
+    bytes: int = 0
+    results: int = 0
+
+
+class BulkIngestor:
+    """Fetches pages in the event loop and validates them in a process pool.
+
+    Validating large responses (``MatchFull``, ``ProgressiveMatch``) is
+    CPU-bound and caps a single process well below the rate pages can be
+    fetched at. The ingestor keeps fetching in the calling event loop,
+    through the client's scheduler, pipeline and key pool, but skips
+    validation there: raw bodies are sent to worker processes, which
+    validate them and apply ``transform``. Throughput then grows with the
+    number of workers until fetching or the API limit becomes the bottleneck.
+
+    Results are yielded in the order of the requests. At most
+    ``max_pending`` requests are in flight, in the pool or waiting to be
+    yielded at any time, which bounds memory however many requests are
+    ingested; a slow consumer pauses fetching.
+
+    Without ``transform``, workers send the validated response back in the
+    compact binary form of ``dumps_binary`` and the parent rebuilds it
+    without validation (several times cheaper than validating). With a
+    ``transform``, only its result crosses the process boundary, so
+    reducing responses to what is stored (rows, tuples, bytes) in the
+    workers scales best. ``transform`` must be picklable, i.e. a module-level
+    function.
+
+    Example:
+        >>> specs = (
+        ...     RequestSpec(
+        ...         endpoint=MATCH_DAY_FULL.endpoint,
+        ...         params=MATCH_DAY_FULL.build(date=day),
+        ...         headers=client.auth_headers(),
+        ...         response_model=MatchDayFullResponse,
+        ...     )
+        ...     for day in days
+        ... )
+        >>> async with BulkIngestor(client, workers=8) as ingestor:
+        ...     async for response in ingestor.ingest(specs):
+        ...         store.add_many(response.result)
+    """
+
+    def __init__(
+        self,
+        client: 'AsyncClient',
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        fetch_concurrency: int = 16,
+        transform: Optional[Transform] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """Initialize the ingestor.
+
+        Args:
+            client: Async client to fetch with
+            workers: Validating processes (default: CPU count)
+            max_pending: Requests in flight or awaiting their turn to be
+                yielded (default: four per worker plus ``fetch_concurrency``)
+            fetch_concurrency: Requests being fetched at once
+            transform: Applied to every validated response in the worker;
+                its result is yielded instead of the response
+            executor: Executor to validate in instead of a new process pool
+        """
+        if fetch_concurrency < 1:
+            raise ValueError("fetch_concurrency must be at least 1")
+        self.client = client
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = 4 * self.workers + fetch_concurrency if max_pending is None else max_pending
+        if self.max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.fetch_concurrency = fetch_concurrency
+        self.transform = transform
+        self.stats = IngestStats()
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    async def __aenter__(self) -> 'BulkIngestor':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def executor(self) -> Executor:
+        """The validating executor, a process pool created on first use unless one was given."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the process pool created by the ingestor."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def ingest(
+        self,
+        specs: Union[Iterable[RequestSpec], AsyncIterable[RequestSpec]],
+    ) -> AsyncIterator[Any]:
+        """Fetch and validate every request, yielding results in request order.
+
+        Args:
+            specs: Requests to ingest; consumed lazily as the window allows
+
+        Yields:
+            Validated responses (with ``response_headers`` attached), or the
+            results of ``transform``
+
+        Raises:
+            Exception: The first failure of a fetch or validation, in request
+                order; requests after it are cancelled
+        """
+        fetching = asyncio.Semaphore(self.fetch_concurrency)
+        # A slot is taken before a request starts and freed once its result is yielded
+        window = asyncio.Semaphore(self.max_pending)
+        # Tasks in request order, then None
+        queue: asyncio.Queue[Optional[asyncio.Future]] = asyncio.Queue()
+
+        async def start(spec: RequestSpec) -> None:
+            await window.acquire()
+            queue.put_nowait(asyncio.create_task(self._process(spec, fetching)))
+
+        async def produce() -> None:
+            try:
+                if isinstance(specs, AsyncIterable):
+                    async for spec in specs:
+                        await start(spec)
+                else:
+                    for spec in specs:
+                        await start(spec)
+            except Exception as error:
+                # Surface a failing spec iterator to the consumer in its place in the order
+                failed = asyncio.get_running_loop().create_future()
+                failed.set_exception(error)
+                queue.put_nowait(failed)
+            queue.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (task := await queue.get()) is not None:
+                try:
+                    result = await task
+                finally:
+                    window.release()
+                self.stats.results += 1
+                yield result
+        finally:
+            producer.cancel()
+            abandoned = [producer]
+            while not queue.empty():
+                task = queue.get_nowait()
+                if task is not None:
+                    task.cancel()
+                    abandoned.append(task)
+            await asyncio.gather(*abandoned, return_exceptions=True)
+
+    async def _process(self, spec: RequestSpec, fetching: asyncio.Semaphore) -> Any:
+        async with fetching:
+            page: RawPage = await self.client.execute(spec, parser=_raw_page)
+        self.stats.pages += 1
+        self.stats.bytes += len(page.content)
+
+        result = await asyncio.get_running_loop().run_in_executor(
+            self.executor, _validate, spec.response_model, page.content, self.transform
+        )
+        if self.transform is not None:
+            return result
+        response = loads_binary(result, spec.response_model)
+        response.response_headers = page.response_headers
+        return response
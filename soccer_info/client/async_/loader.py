@@ -0,0 +1,252 @@
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
+
+from soccer_info.responses import APIResponse, MatchBasic, MatchViewBasicResponse
+
+if TYPE_CHECKING:
+    from .async_client import AsyncClient
+
+DateHint = Union[str, date, datetime]
+
+# Batch key: ("date", "YYYYMMDD") or ("championship", championship ID)
+_BatchKey = Tuple[str, str]
+
+
+def normalize_date_hint(value: DateHint) -> str:
+    """Convert a date hint to the ``YYYYMMDD`` form of the day endpoints.
+
+    Accepts ``date``/``datetime`` objects and strings in ``YYYYMMDD``,
+    ``YYYY-MM-DD`` or the API's ``YYYY-MM-DD HH:MM:SS`` format.
+    """
+    if isinstance(value, (date, datetime)):
+        return value.strftime('%Y%m%d')
+    return value[:10].replace('-', '')
+
+
+@dataclass
+class LoaderStats:
+    """Counters of a ``MatchLoader``.
+
+    Attributes:
+        loads: Matches requested through ``load``
+        cache_hits: Loads answered from matches fetched earlier
+        batched: Loads answered from a list page fetch
+        individual: Loads answered by a single-match call
+        api_calls: API requests sent (list pages and single-match calls)
+    """
+    loads: int = 0
+    cache_hits: int = 0
+    batched: int = 0
+    individual: int = 0
+    api_calls: int = 0
+
+
+@dataclass
+class _PendingLoad:
+    future: asyncio.Future
+    keys: Tuple[_BatchKey, ...]
+
+
+class MatchLoader:
+    """Batches per-match lookups of an async client into list page fetches.
+
+    Loads requested within ``window`` seconds of each other are collected.
+    When at least ``min_batch`` of them share a date or championship hint,
+    they are served from ``get_by_day_basic`` (or ``get_by_filter_basic``)
+    pages instead of one ``get_view_basic`` call each; the largest groups
+    are formed first and dates are preferred over championships. Everything
+    else falls back to individual calls.
+
+    The first page of a list reveals its page count. Further pages are only
+    fetched while they cost no more calls than looking up the still missing
+    matches one by one, so with correct hints a batch never costs more than
+    one request over individual calls. Matches a hint did not cover (e.g. a
+    wrong date) are looked up individually afterwards.
+
+    Every match seen on a fetched page is kept, so later loads of matches
+    from the same day or championship cost nothing. Create one loader per
+    unit of work (e.g. a UI request) or call ``clear`` to drop stale scores.
+
+    Example:
+        >>> loader = MatchLoader(client)
+        >>> matches = await asyncio.gather(
+        ...     *(loader.load(match_id, date="20240120") for match_id in match_ids)
+        ... )
+    """
+
+    def __init__(
+        self,
+        client: 'AsyncClient',
+        window: float = 0.005,
+        min_batch: int = 2,
+        language: Optional[str] = None,
+    ):
+        """Initialize the loader.
+
+        Args:
+            client: Async client whose ``matches`` domain is used
+            window: Seconds to collect loads before dispatching them
+            min_batch: Loads sharing a hint needed to fetch a list instead
+            language: Language of the fetched matches
+        """
+        if min_batch < 1:
+            raise ValueError("min_batch must be at least 1")
+        self.client = client
+        self.window = window
+        self.min_batch = min_batch
+        self.language = language
+        self.stats = LoaderStats()
+        self._cache: Dict[str, MatchBasic] = {}
+        self._pending: Dict[str, _PendingLoad] = {}
+        self._dispatch: Optional[asyncio.Task] = None
+
+    async def load(
+        self,
+        match_id: str,
+        date: Optional[DateHint] = None,
+        championship_id: Optional[str] = None,
+    ) -> Optional[MatchBasic]:
+        """Load a match, batching it with other loads of the current window.
+
+        Args:
+            match_id: Match ID
+            date: Day the match is played on, if known
+            championship_id: Championship the match belongs to, if known
+
+        Returns:
+            The match, or None if the API does not know it
+        """
+        self.stats.loads += 1
+        match = self._cache.get(match_id)
+        if match is not None:
+            self.stats.cache_hits += 1
+            return match
+
+        pending = self._pending.get(match_id)
+        if pending is None:
+            keys = []
+            if date is not None:
+                keys.append(("date", normalize_date_hint(date)))
+            if championship_id is not None:
+                keys.append(("championship", championship_id))
+            pending = _PendingLoad(asyncio.get_running_loop().create_future(), tuple(keys))
+            self._pending[match_id] = pending
+            if self._dispatch is None:
+                self._dispatch = asyncio.create_task(self._dispatch_after_window())
+        return await asyncio.shield(pending.future)
+
+    async def get_view_basic(
+        self,
+        match_id: str,
+        date: Optional[DateHint] = None,
+        championship_id: Optional[str] = None,
+    ) -> MatchViewBasicResponse:
+        """Drop-in replacement for ``matches.get_view_basic`` served through ``load``.
+
+        Args:
+            match_id: Match ID
+            date: Day the match is played on, if known
+            championship_id: Championship the match belongs to, if known
+
+        Returns:
+            A view response holding the match (no result if it is unknown)
+        """
+        match = await self.load(match_id, date=date, championship_id=championship_id)
+        return MatchViewBasicResponse(
+            status=200,
+            errors=[],
+            pagination=[],
+            result=[match] if match is not None else [],
+        )
+
+    def prime(self, match: MatchBasic) -> None:
+        """Add an already known match so that loading it costs no request."""
+        if match.id is not None:
+            self._cache[match.id] = match
+
+    def clear(self) -> None:
+        """Forget every fetched match."""
+        self._cache.clear()
+
+    # =========================================================================
+    # Dispatch
+    # =========================================================================
+
+    async def _dispatch_after_window(self) -> None:
+        await asyncio.sleep(self.window)
+        pending, self._pending, self._dispatch = self._pending, {}, None
+
+        batches, individual = self._plan(pending)
+        jobs = [self._load_batch(key, ids, pending) for key, ids in batches.items()]
+        jobs += [self._load_individual(match_id, pending[match_id]) for match_id in individual]
+        await asyncio.gather(*jobs)
+
+    def _plan(self, pending: Dict[str, _PendingLoad]) -> Tuple[Dict[_BatchKey, Set[str]], List[str]]:
+        """Group pending loads by shared hint, largest groups first."""
+        unassigned = set(pending)
+        batches: Dict[_BatchKey, Set[str]] = {}
+        while unassigned:
+            groups: Dict[_BatchKey, Set[str]] = defaultdict(set)
+            for match_id in unassigned:
+                for key in pending[match_id].keys:
+                    groups[key].add(match_id)
+            if not groups:
+                break
+            key, ids = max(groups.items(), key=lambda item: (len(item[1]), item[0][0] == "date"))
+            if len(ids) < self.min_batch:
+                break
+            batches[key] = ids
+            unassigned -= ids
+        return batches, sorted(unassigned)
+
+    async def _fetch_page(self, key: _BatchKey, page: int) -> APIResponse:
+        self.stats.api_calls += 1
+        kind, value = key
+        if kind == "date":
+            response = await self.client.matches.get_by_day_basic(value, page=page, language=self.language)
+        else:
+            response = await self.client.matches.get_by_filter_basic(
+                championship_id=value, page=page, language=self.language,
+            )
+        for match in response.result:
+            self.prime(match)
+        return response
+
+    async def _load_batch(self, key: _BatchKey, ids: Set[str], pending: Dict[str, _PendingLoad]) -> None:
+        try:
+            pages = (await self._fetch_page(key, 1)).page_count
+            missing = ids - self._cache.keys()
+            if missing and 1 < pages <= len(missing) + 1:
+                # The remaining pages cost no more than the missing single-match calls
+                await asyncio.gather(*(self._fetch_page(key, page) for page in range(2, pages + 1)))
+        except Exception as error:
+            for match_id in ids:
+                if not pending[match_id].future.done():
+                    pending[match_id].future.set_exception(error)
+            return
+
+        missing = []
+        for match_id in ids:
+            match = self._cache.get(match_id)
+            if match is None:
+                missing.append(match_id)
+                continue
+            self.stats.batched += 1
+            pending[match_id].future.set_result(match)
+        await asyncio.gather(*(self._load_individual(match_id, pending[match_id]) for match_id in missing))
+
+    async def _load_individual(self, match_id: str, pending: _PendingLoad) -> None:
+        self.stats.api_calls += 1
+        try:
+            response = await self.client.matches.get_view_basic(match_id, language=self.language)
+        except Exception as error:
+            pending.future.set_exception(error)
+            return
+        self.stats.individual += 1
+        match = response.first_result
+        if match is not None:
+            self.prime(match)
+        pending.future.set_result(match)
@@ -0,0 +1,137 @@
+import logging
+import time
+from typing import Iterable, Optional, Tuple
+
+from soccer_info.client.key_pool import QuotaExhaustedError
+from .scheduler import PRIORITIES, Priority, PriorityScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class QuotaReserveError(QuotaExhaustedError):
+    """Raised for low-priority requests once the remaining quota reaches the reserve floor.
+
+    Attributes:
+        remaining: Requests left in the quota period when the guard tripped
+        reserve: Configured reserve floor
+        reset_seconds: Seconds until the quota resets, if known
+    """
+
+    def __init__(self, remaining: int, reserve: int, reset_seconds: Optional[float]):
+        hours = f"{reset_seconds / 3600:.2f}h" if reset_seconds is not None else "an unknown time"
+        super().__init__(
+            f"Quota reserve reached ({remaining} requests left, reserve {reserve}); resets in {hours}",
+            reset_seconds=reset_seconds,
+        )
+        self.remaining = remaining
+        self.reserve = reserve
+
+
+class QuotaGuard:
+    """Stops low-priority requests before the quota is exhausted.
+
+    Watches the remaining quota reported by every response. Once it drops
+    to the reserve floor, only protected priority classes (live traffic by
+    default) may still send. Unprotected requests are then either:
+
+    - cancelled (default): queued ones fail with ``QuotaReserveError`` and
+      new ones raise it immediately, so a ``TaskGroup`` running the crawl
+      cancels its remaining work
+    - paused (``auto_resume=True``): they stay queued and are released once
+      the quota period resets
+
+    Example:
+        >>> settings = SettingsBuilder().with_api_key().with_quota_guard(reserve=50).build()
+        >>> async with AsyncHTTPXClient(settings) as client:
+        ...     with request_priority("bulk"):
+        ...         async with asyncio.TaskGroup() as group:
+        ...             for day in days:
+        ...                 group.create_task(client.matches.get_by_day_basic(day))
+    """
+
+    def __init__(
+        self,
+        scheduler: PriorityScheduler,
+        reserve: int,
+        auto_resume: bool = False,
+        protected: Iterable[Priority] = ("live",),
+        retry_seconds: float = 60.0,
+    ):
+        """Initialize the quota guard and attach it to a scheduler.
+
+        Args:
+            scheduler: Scheduler of the client to guard
+            reserve: Remaining-quota floor kept for protected traffic
+            auto_resume: Pause unprotected requests until the quota resets
+                instead of cancelling them
+            protected: Priority classes allowed to use the reserve
+            retry_seconds: Pause length when the API does not report a reset time
+        """
+        self.scheduler = scheduler
+        self.reserve = reserve
+        self.auto_resume = auto_resume
+        self.protected = frozenset(protected)
+        self.retry_seconds = retry_seconds
+        self.remaining: Optional[int] = None
+        self._tripped_until: Optional[float] = None
+        self._reset_known = False
+        scheduler.admission = self.admit
+
+    @property
+    def unprotected(self) -> Tuple[Priority, ...]:
+        """Priority classes stopped once the reserve is reached."""
+        return tuple(priority for priority in PRIORITIES if priority not in self.protected)
+
+    @property
+    def tripped(self) -> bool:
+        """Whether unprotected requests are currently cancelled or paused."""
+        if self._tripped_until is not None and time.monotonic() >= self._tripped_until:
+            self._tripped_until = None
+        return self._tripped_until is not None
+
+    def admit(self, priority: Priority) -> None:
+        """Reject an unprotected request while the guard is tripped in cancel mode."""
+        if priority in self.protected or self.auto_resume or not self.tripped:
+            return
+        raise self._error()
+
+    def observe(self, remaining: Optional[int], reset_seconds: Optional[float]) -> None:
+        """Update the guard with the quota reported by a response.
+
+        Args:
+            remaining: Requests left in the quota period, None if not reported
+            reset_seconds: Seconds until the quota resets, None if not reported
+        """
+        if remaining is None:
+            return
+        self.remaining = remaining
+        if remaining > self.reserve:
+            if self.tripped and not self._reset_known:
+                # The quota recovered before the assumed retry time
+                self.reset()
+            return
+        if self.tripped:
+            return
+
+        self._reset_known = reset_seconds is not None
+        until = time.monotonic() + (reset_seconds if reset_seconds is not None else self.retry_seconds)
+        self._tripped_until = until
+        logger.warning(
+            "Quota reserve reached (%d left, reserve %d); %s %s requests",
+            remaining, self.reserve, "pausing" if self.auto_resume else "cancelling", "/".join(self.unprotected),
+        )
+        if self.auto_resume:
+            self.scheduler.hold(self.unprotected, until)
+        else:
+            self.scheduler.fail_pending(self.unprotected, self._error)
+
+    def reset(self) -> None:
+        """Clear the tripped state, e.g. after the plan was upgraded."""
+        self._tripped_until = None
+        self.scheduler.release_holds()
+
+    def _error(self) -> QuotaReserveError:
+        reset_seconds = None
+        if self._tripped_until is not None and self._reset_known:
+            reset_seconds = max(self._tripped_until - time.monotonic(), 0.0)
+        return QuotaReserveError(self.remaining if self.remaining is not None else 0, self.reserve, reset_seconds)
@@ -0,0 +1,269 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, Iterator, Literal, Mapping, Optional, Tuple
+
+Priority = Literal["live", "interactive", "bulk"]
+
+PRIORITIES: Tuple[Priority, ...] = ("live", "interactive", "bulk")
+
+# Share of the rate budget each class gets while all classes have requests waiting
+DEFAULT_WEIGHTS: Dict[Priority, float] = {"live": 8.0, "interactive": 4.0, "bulk": 1.0}
+
+
+class RequestShedError(RuntimeError):
+    """Raised when a queued request passed its deadline before it could be sent.
+
+    Attributes:
+        priority: Priority class of the shed request
+        waited: Seconds the request spent queued
+    """
+
+    def __init__(self, priority: Priority, waited: float):
+        super().__init__(f"{priority} request shed after waiting {waited:.2f}s for a send slot")
+        self.priority = priority
+        self.waited = waited
+
+
+@dataclass(frozen=True)
+class RequestOptions:
+    """Scheduling options of the requests made inside a ``request_priority`` block."""
+    priority: Priority = "interactive"
+    deadline: Optional[float] = None
+
+
+_request_options: ContextVar[RequestOptions] = ContextVar("soccer_info_request_options", default=RequestOptions())
+
+
+@contextmanager
+def request_priority(priority: Priority, deadline: Optional[float] = None) -> Iterator[RequestOptions]:
+    """Set the priority class of the async client requests made inside the block.
+
+    The setting is scoped to the current task (and tasks it creates), so
+    concurrent tasks can use different priorities on the same client.
+
+    Args:
+        priority: "live", "interactive" (the default outside any block) or "bulk"
+        deadline: Seconds a request may wait for a send slot before it is
+            shed with ``RequestShedError``; None waits indefinitely
+
+    Example:
+        >>> with request_priority("live"):
+        ...     match = await client.matches.get_view_basic(match_id)
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority {priority!r}, expected one of {PRIORITIES}")
+    token = _request_options.set(RequestOptions(priority, deadline))
+    try:
+        yield _request_options.get()
+    finally:
+        _request_options.reset(token)
+
+
+def current_request_options() -> RequestOptions:
+    """Scheduling options in effect for the current task."""
+    return _request_options.get()
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future
+    enqueued: float
+    expires: Optional[float]
+
+
+class PriorityScheduler:
+    """Hands out request send slots, spaced ``interval`` seconds apart, by priority.
+
+    While requests are waiting, slots are shared between the priority
+    classes in proportion to their weights (stride scheduling): with the
+    default weights live traffic gets 8 of every 13 slots, interactive 4 and
+    bulk 1, and an idle class does not bank credit for later. Within a class
+    requests are served first in, first out. A request that arrives while
+    nothing is queued and a slot is free is sent immediately.
+
+    Queued requests whose deadline passes are shed with ``RequestShedError``
+    instead of consuming a slot. Bulk requests without an explicit deadline
+    use ``bulk_deadline`` when it is set.
+
+    Priority classes can be put on hold until a point in time (their
+    requests stay queued) and their queued requests can be failed, which is
+    how the quota guard pauses or cancels low-priority work. ``admission``,
+    when set, is called with the priority of every new request and may
+    raise to reject it.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        weights: Optional[Mapping[Priority, float]] = None,
+        bulk_deadline: Optional[float] = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            interval: Minimum seconds between request sends
+            weights: Relative share of slots per priority class
+            bulk_deadline: Default deadline in seconds for bulk requests
+        """
+        self.interval = interval
+        self.weights: Dict[Priority, float] = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.bulk_deadline = bulk_deadline
+        self._queues: Dict[Priority, Deque[_Waiter]] = {priority: deque() for priority in PRIORITIES}
+        self._passes: Dict[Priority, float] = {priority: 0.0 for priority in PRIORITIES}
+        self._virtual_time = 0.0
+        self._next_slot = 0.0
+        self._holds: Dict[Priority, float] = {}
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.admission: Optional[Callable[[Priority], None]] = None
+
+    def pending(self) -> Dict[Priority, int]:
+        """Number of requests waiting per priority class."""
+        return {priority: len(queue) for priority, queue in self._queues.items()}
+
+    def hold(self, priorities: Iterable[Priority], until: float) -> None:
+        """Keep requests of the given classes queued until a ``time.monotonic()`` value."""
+        for priority in priorities:
+            self._holds[priority] = until
+        self._wake()
+
+    def release_holds(self) -> None:
+        """Lift all holds; queued requests are dispatched again."""
+        self._holds.clear()
+        self._wake()
+
+    def fail_pending(self, priorities: Iterable[Priority], error: Callable[[], BaseException]) -> int:
+        """Fail every queued request of the given classes.
+
+        Args:
+            priorities: Classes whose queued requests to fail
+            error: Factory of the exception raised in each failed request
+
+        Returns:
+            Number of requests failed
+        """
+        failed = 0
+        for priority in priorities:
+            queue = self._queues[priority]
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.future.done():
+                    waiter.future.set_exception(error())
+                    failed += 1
+        return failed
+
+    def _held(self, priority: Priority, now: float) -> bool:
+        until = self._holds.get(priority)
+        if until is None:
+            return False
+        if now >= until:
+            del self._holds[priority]
+            return False
+        return True
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def acquire(self, priority: Optional[Priority] = None, deadline: Optional[float] = None) -> float:
+        """Wait for a send slot.
+
+        Args:
+            priority: Priority class; defaults to the ``request_priority`` in effect
+            deadline: Maximum seconds to wait; defaults to the ``request_priority``
+                deadline, or ``bulk_deadline`` for bulk requests
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RequestShedError: If the deadline passed before a slot was free
+        """
+        if priority is None:
+            options = _request_options.get()
+            priority, deadline = options.priority, options.deadline if deadline is None else deadline
+        if deadline is None and priority == "bulk":
+            deadline = self.bulk_deadline
+
+        if self.admission is not None:
+            self.admission(priority)
+
+        now = time.monotonic()
+        if now >= self._next_slot and not any(self._queues.values()) and not self._held(priority, now):
+            self._next_slot = now + self.interval
+            return 0.0
+
+        queue = self._queues[priority]
+        if not queue:
+            # A class that was idle rejoins at the current virtual time instead of using banked credit
+            self._passes[priority] = max(self._passes[priority], self._virtual_time)
+        waiter = _Waiter(
+            future=asyncio.get_running_loop().create_future(),
+            enqueued=now,
+            expires=now + deadline if deadline is not None else None,
+        )
+        queue.append(waiter)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._wakeup = asyncio.Event()
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        else:
+            # The dispatcher may be sleeping through a hold of other classes
+            self._wake()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self._queues[priority]:
+                self._queues[priority].remove(waiter)
+            raise
+        return time.monotonic() - now
+
+    async def _dispatch(self) -> None:
+        while any(self._queues.values()):
+            now = time.monotonic()
+            self._shed_expired(now)
+            candidates = [p for p in PRIORITIES if self._queues[p] and not self._held(p, now)]
+            if now < self._next_slot or not candidates:
+                # Sleep until the next slot, the end of a hold, or a queued request's expiry
+                wake = [self._next_slot] if candidates else []
+                wake += [self._holds[p] for p in PRIORITIES if self._queues[p] and p in self._holds]
+                wake += [w.expires for q in self._queues.values() for w in q if w.expires is not None]
+                if not wake:
+                    continue
+                await self._sleep(min(wake) - now)
+                continue
+
+            priority = min(candidates, key=lambda p: (self._passes[p], PRIORITIES.index(p)))
+            waiter = self._queues[priority].popleft()
+            if waiter.future.done():
+                continue
+
+            waiter.future.set_result(None)
+            self._virtual_time = self._passes[priority]
+            self._passes[priority] += 1.0 / self.weights[priority]
+            self._next_slot = time.monotonic() + self.interval
+
+    async def _sleep(self, seconds: float) -> None:
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), max(seconds, 0.0))
+        except asyncio.TimeoutError:
+            pass
+
+    def _shed_expired(self, now: float) -> None:
+        for priority, queue in self._queues.items():
+            if not any(waiter.expires is not None and waiter.expires <= now for waiter in queue):
+                continue
+            kept = []
+            for waiter in queue:
+                if waiter.expires is not None and waiter.expires <= now:
+                    if not waiter.future.done():
+                        waiter.future.set_exception(RequestShedError(priority, now - waiter.enqueued))
+                else:
+                    kept.append(waiter)
+            queue.clear()
+            queue.extend(kept)
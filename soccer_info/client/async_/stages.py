@@ -0,0 +1,362 @@
+import asyncio
+import inspect
+import time
+from collections import deque
+from concurrent.futures import Executor
+from dataclasses import dataclass, replace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from soccer_info.client.pipeline import RequestSpec
+from soccer_info.export.base import Sink
+from soccer_info.responses.base import APIResponse, ResponseComponent
+from soccer_info.responses.binary import loads_binary
+from .ingest import RawPage, _raw_page, _validate
+
+if TYPE_CHECKING:
+    from .async_client import AsyncClient
+
+# Query alias of the page parameter of every paginated endpoint
+PAGE_PARAMETER = "p"
+
+Transform = Callable[[ResponseComponent], Union[Iterable[Any], Awaitable[Iterable[Any]]]]
+SinkTarget = Union[Sink, Callable[[List[Any]], Any]]
+
+STAGE_NAMES = ("fetch", "parse", "transform", "sink")
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+def result_items(response: ResponseComponent) -> Iterable[Any]:
+    """Default transform: the ``result`` items of a response."""
+    return response.result
+
+
+@dataclass
+class StageMetrics:
+    """Counters of one stage of a ``StagedPipeline``.
+
+    Attributes:
+        items_in: Items the stage took from its input
+        items_out: Items the stage handed on (for ``transform``, the
+            flattened items; for ``sink``, the items written)
+        busy_seconds: Time workers spent processing, summed over workers
+        blocked_seconds: Time workers waited for room in the next stage's
+            queue, i.e. backpressure from downstream
+        idle_seconds: Time workers waited for input from upstream
+    """
+    items_in: int = 0
+    items_out: int = 0
+    busy_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+    idle_seconds: float = 0.0
+
+
+class _SpecFeed:
+    """Hands requests to fetch workers: pages found by parsing first, then the source.
+
+    A request is open from the moment it is handed out until parsing it
+    finished; the feed ends once the source is exhausted and nothing is
+    open, because only open requests can still add pages.
+    """
+
+    def __init__(self, specs: Union[Iterable[RequestSpec], AsyncIterable[RequestSpec]]):
+        self._source: Union[AsyncIterator[RequestSpec], Iterable[RequestSpec]]
+        if isinstance(specs, AsyncIterable):
+            self._source = aiter(specs)
+        else:
+            self._source = iter(specs)
+        self._follow_ups: Deque[RequestSpec] = deque()
+        self._open = 0
+        self._exhausted = False
+        self._changed = asyncio.Condition()
+
+    async def _pull(self) -> Optional[RequestSpec]:
+        try:
+            if isinstance(self._source, AsyncIterator):
+                return await anext(self._source)
+            return next(self._source)
+        except (StopIteration, StopAsyncIteration):
+            self._exhausted = True
+            return None
+
+    async def next(self) -> Optional[RequestSpec]:
+        """The next request to fetch, or None once every request was parsed."""
+        async with self._changed:
+            while True:
+                if self._follow_ups:
+                    spec = self._follow_ups.popleft()
+                elif not self._exhausted:
+                    spec = await self._pull()
+                    if spec is None:
+                        self._changed.notify_all()
+                        continue
+                elif self._open == 0:
+                    return None
+                else:
+                    await self._changed.wait()
+                    continue
+                self._open += 1
+                return spec
+
+    async def done(self, follow_ups: Iterable[RequestSpec] = ()) -> None:
+        """Close a parsed request, queueing the further pages it revealed."""
+        async with self._changed:
+            self._follow_ups.extend(follow_ups)
+            self._open -= 1
+            self._changed.notify_all()
+
+
+class StagedPipeline:
+    """Runs fetch -> parse -> transform -> sink with bounded queues between the stages.
+
+    Each stage has its own number of concurrent workers and hands its
+    output to the next stage through a queue holding at most
+    ``queue_size`` entries. A slow sink fills the queues behind it, which
+    stops parsing, then fetching: fetch workers only ask the client's
+    scheduler for a send slot once their previous page was accepted. Memory
+    use is bounded by the queue sizes and worker counts, not by the number
+    of requests, and requests are read from ``specs`` only as fetch workers
+    become free.
+
+    - fetch: sends each request through the client (scheduler, pipeline
+      middleware, key pool) without validating the body
+    - parse: validates bodies in the event loop, or in ``parse_executor``
+      (e.g. a ``ProcessPoolExecutor``); with ``follow_pages`` the first
+      page of a paginated request queues its remaining pages for fetching
+    - transform: turns a response into items, ``response.result`` by
+      default; may be a coroutine function
+    - sink: writes each page's items, e.g. to an export ``Sink``; sync sinks
+      run in a worker thread so file writes do not stall fetching
+
+    Items reach the sink in completion order, not request order. The first
+    error in any stage stops the pipeline and is raised by ``run``; add a
+    ``RetryMiddleware`` to the client to ride out transient failures.
+
+    Example:
+        >>> with NDJSONSink("matches.ndjson.gz") as sink:
+        ...     pipeline = StagedPipeline(client, sink, fetch_concurrency=8)
+        ...     await pipeline.run(day_specs)
+        >>> pipeline.report()["parse"]["per_second"]
+    """
+
+    def __init__(
+        self,
+        client: 'AsyncClient',
+        sink: SinkTarget,
+        transform: Transform = result_items,
+        follow_pages: bool = True,
+        queue_size: int = 16,
+        fetch_concurrency: int = 8,
+        parse_concurrency: int = 1,
+        transform_concurrency: int = 1,
+        parse_executor: Optional[Executor] = None,
+        offload_sink: bool = True,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            client: Async client to fetch with
+            sink: Export sink, or a (coroutine) function receiving each
+                page's items as a list
+            transform: Turns a validated response into the items to write
+            follow_pages: Fetch every page of paginated requests given for
+                their first page
+            queue_size: Entries each queue between two stages holds
+            fetch_concurrency: Requests fetched at once
+            parse_concurrency: Bodies validated at once; above 1 only useful
+                with ``parse_executor``
+            transform_concurrency: Responses transformed at once
+            parse_executor: Executor to validate in instead of the event loop
+            offload_sink: Run sync sinks in a worker thread
+        """
+        for name, value in (
+            ("queue_size", queue_size),
+            ("fetch_concurrency", fetch_concurrency),
+            ("parse_concurrency", parse_concurrency),
+            ("transform_concurrency", transform_concurrency),
+        ):
+            if value < 1:
+                raise ValueError(f"{name} must be at least 1")
+        self.client = client
+        self.sink = sink
+        self.transform = transform
+        self.follow_pages = follow_pages
+        self.queue_size = queue_size
+        self.concurrency = {
+            "fetch": fetch_concurrency,
+            "parse": parse_concurrency,
+            "transform": transform_concurrency,
+            "sink": 1,
+        }
+        self.parse_executor = parse_executor
+        self.offload_sink = offload_sink
+        self.metrics: Dict[str, StageMetrics] = {name: StageMetrics() for name in STAGE_NAMES}
+        self.elapsed = 0.0
+        self._started: Optional[float] = None
+
+    async def run(self, specs: Union[Iterable[RequestSpec], AsyncIterable[RequestSpec]]) -> Dict[str, StageMetrics]:
+        """Fetch, parse, transform and write every request.
+
+        Args:
+            specs: Requests to run; consumed lazily
+
+        Returns:
+            Metrics per stage
+
+        Raises:
+            Exception: The first error raised in any stage
+        """
+        self.metrics = {name: StageMetrics() for name in STAGE_NAMES}
+        self._started = time.perf_counter()
+        feed = _SpecFeed(specs)
+        parsed: asyncio.Queue = asyncio.Queue(self.queue_size)
+        transformed: asyncio.Queue = asyncio.Queue(self.queue_size)
+        batches: asyncio.Queue = asyncio.Queue(self.queue_size)
+
+        stages = [
+            self._workers("fetch", lambda: self._fetch_worker(feed, parsed), parsed, "parse"),
+            self._workers("parse", lambda: self._stage_worker("parse", parsed, transformed, self._parse, feed), transformed, "transform"),
+            self._workers("transform", lambda: self._stage_worker("transform", transformed, batches, self._transform), batches, "sink"),
+            self._workers("sink", lambda: self._stage_worker("sink", batches, None, self._write), None, None),
+        ]
+        tasks = [asyncio.create_task(stage) for stage in stages]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.elapsed = time.perf_counter() - self._started
+        return self.metrics
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage counters with throughput (items out per second) of the current or last run."""
+        elapsed = time.perf_counter() - self._started if self._started is not None and not self.elapsed else self.elapsed
+        return {
+            name: {
+                "items_in": metrics.items_in,
+                "items_out": metrics.items_out,
+                "per_second": metrics.items_out / elapsed if elapsed > 0 else 0.0,
+                "busy_seconds": metrics.busy_seconds,
+                "blocked_seconds": metrics.blocked_seconds,
+                "idle_seconds": metrics.idle_seconds,
+            }
+            for name, metrics in self.metrics.items()
+        }
+
+    # =========================================================================
+    # Stages
+    # =========================================================================
+
+    async def _workers(
+        self,
+        name: str,
+        worker: Callable[[], Awaitable[None]],
+        output: Optional[asyncio.Queue],
+        next_stage: Optional[str],
+    ) -> None:
+        """Run a stage's workers, then tell each worker of the next stage that input ended."""
+        await asyncio.gather(*(worker() for _ in range(self.concurrency[name])))
+        if output is not None:
+            for _ in range(self.concurrency[next_stage]):
+                await output.put(_DONE)
+
+    async def _put(self, metrics: StageMetrics, output: asyncio.Queue, item: Any) -> None:
+        started = time.perf_counter()
+        await output.put(item)
+        metrics.blocked_seconds += time.perf_counter() - started
+
+    async def _fetch_worker(self, feed: _SpecFeed, output: asyncio.Queue) -> None:
+        metrics = self.metrics["fetch"]
+        while True:
+            started = time.perf_counter()
+            spec = await feed.next()
+            metrics.idle_seconds += time.perf_counter() - started
+            if spec is None:
+                return
+            metrics.items_in += 1
+
+            started = time.perf_counter()
+            page: RawPage = await self.client.execute(spec, parser=_raw_page)
+            metrics.busy_seconds += time.perf_counter() - started
+            metrics.items_out += 1
+            await self._put(metrics, output, (spec, page))
+
+    async def _stage_worker(
+        self,
+        name: str,
+        source: asyncio.Queue,
+        output: Optional[asyncio.Queue],
+        handle: Callable[..., Awaitable[Tuple[Any, int]]],
+        *args: Any,
+    ) -> None:
+        metrics = self.metrics[name]
+        while True:
+            started = time.perf_counter()
+            item = await source.get()
+            metrics.idle_seconds += time.perf_counter() - started
+            if item is _DONE:
+                return
+            metrics.items_in += 1
+
+            started = time.perf_counter()
+            result, count = await handle(item, *args)
+            metrics.busy_seconds += time.perf_counter() - started
+            metrics.items_out += count
+            if output is not None:
+                await self._put(metrics, output, result)
+
+    async def _parse(self, item: Tuple[RequestSpec, RawPage], feed: _SpecFeed) -> Tuple[ResponseComponent, int]:
+        spec, page = item
+        follow_ups: List[RequestSpec] = []
+        try:
+            if self.parse_executor is None:
+                response = spec.response_model.model_validate_json(page.content)
+            else:
+                payload = await asyncio.get_running_loop().run_in_executor(
+                    self.parse_executor, _validate, spec.response_model, page.content, None
+                )
+                response = loads_binary(payload, spec.response_model)
+            response.response_headers = page.response_headers
+            if self.follow_pages and isinstance(response, APIResponse) and spec.params.get(PAGE_PARAMETER, 1) == 1:
+                follow_ups = [
+                    replace(spec, params={**spec.params, PAGE_PARAMETER: number})
+                    for number in range(2, response.page_count + 1)
+                ]
+        finally:
+            await feed.done(follow_ups)
+        return response, 1
+
+    async def _transform(self, response: ResponseComponent) -> Tuple[List[Any], int]:
+        items = self.transform(response)
+        if inspect.isawaitable(items):
+            items = await items
+        items = list(items)
+        return items, len(items)
+
+    async def _write(self, items: List[Any]) -> Tuple[None, int]:
+        write = self.sink.write_many if isinstance(self.sink, Sink) else self.sink
+        if inspect.iscoroutinefunction(write):
+            await write(items)
+        elif self.offload_sink:
+            await asyncio.to_thread(write, items)
+        else:
+            write(items)
+        return None, len(items)
@@ -1,21 +1,97 @@
-from dataclasses import dataclass
-from typing import Optional, TypeVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional, Tuple, Type, TypeVar, Union
 
+from soccer_info.client.instrumentation import Instrumentation
+from soccer_info.client.key_pool import KeyPool
+from soccer_info.client.middleware import ParseCacheMiddleware
+from soccer_info.client.parse_cache import ParseCache
+from soccer_info.client.pipeline import Pipeline, RequestSpec
+from soccer_info.requests_.headers import Header
+from soccer_info.requests_.parameters import BaseParameters
 from soccer_info.responses.base import ResponseComponent
 from soccer_info.settings import Settings
 
 T = TypeVar('T', bound=ResponseComponent)
 
+RequestParams = Union[BaseParameters, Mapping[str, Any]]
+RequestHeaders = Union[Header, Mapping[str, str]]
+
 
 @dataclass
 class BaseClient:
     """Base client for Soccer Football Info API.
-    
+
     Provides common configuration and settings shared by all client implementations.
-    
+
     Attributes:
         settings: API configuration including authentication credentials
         default_language: Preferred language for API responses
+        instrumentation: Request lifecycle hooks and latency histograms
+        key_pool: Per-key limiters and quota routing, when ``settings.api_keys`` is set
+        parse_cache: Reuse of parsed responses for unchanged bodies, when
+            ``settings.parse_cache_entries`` is set
+        pipeline: Middleware every request passes through; see ``Pipeline.use``
     """
     settings: Settings
     default_language: Optional[str] = None
+    instrumentation: Instrumentation = field(default_factory=Instrumentation, init=False, repr=False)
+    key_pool: Optional[KeyPool] = field(default=None, init=False, repr=False)
+    parse_cache: Optional[ParseCache] = field(default=None, init=False, repr=False)
+    pipeline: Pipeline = field(default_factory=Pipeline, init=False, repr=False)
+    # (api key, api host) and the headers built from them, replaced as one tuple so threads never see a mix
+    _auth_headers: Optional[Tuple[Tuple[str, str], Dict[str, str]]] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.settings.api_keys:
+            self.key_pool = KeyPool(
+                self.settings.api_keys,
+                api_host=self.settings.api_host,
+                throttle_seconds=self.settings.request_throttle_seconds,
+            )
+        if self.settings.parse_cache_entries is not None:
+            self.parse_cache = ParseCache(self.settings.parse_cache_entries)
+            self.pipeline.use(ParseCacheMiddleware(self.parse_cache))
+
+    def auth_headers(self) -> Dict[str, str]:
+        """Get the RapidAPI authentication headers for this client.
+
+        Headers are serialized once and cached; they are rebuilt only when
+        the API key or host in ``settings`` changes. The returned dictionary
+        is shared between requests and must not be mutated.
+
+        Returns:
+            Dictionary with properly formatted HTTP headers
+        """
+        source = (self.settings.api_key, self.settings.api_host)
+        cached = self._auth_headers
+        if cached is None or cached[0] != source:
+            cached = self._auth_headers = (source, Header(
+                x_rapidapi_key=source[0],
+                x_rapidapi_host=source[1],
+            ).to_dict())
+        return cached[1]
+
+    def _request_spec(
+        self,
+        endpoint: str,
+        params: RequestParams,
+        headers: RequestHeaders,
+        response_model: Type[T],
+    ) -> RequestSpec[T]:
+        """Build the spec of a ``do_request`` call."""
+        return RequestSpec(
+            endpoint=endpoint,
+            params=self._params_to_dict(params),
+            headers=self._headers_to_dict(headers),
+            response_model=response_model,
+        )
+
+    @staticmethod
+    def _params_to_dict(params: RequestParams) -> Mapping[str, Any]:
+        """Serialize request parameters given either as a model or a prebuilt mapping."""
+        return params.to_dict() if isinstance(params, BaseParameters) else params
+
+    @staticmethod
+    def _headers_to_dict(headers: RequestHeaders) -> Mapping[str, str]:
+        """Serialize request headers given either as a model or a prebuilt mapping."""
+        return headers.to_dict() if isinstance(headers, Header) else headers
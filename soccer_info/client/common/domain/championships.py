@@ -2,9 +2,10 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
 
-from soccer_info.requests_ import Header
 from soccer_info.responses import ChampionshipListResponse, ChampionshipViewResponse
+from soccer_info.requests_ import CHAMPIONSHIP_LIST, CHAMPIONSHIP_VIEW
 from soccer_info.client.base_client import BaseClient
+from soccer_info.client.pipeline import RequestSpec
 
 
 @dataclass
@@ -20,11 +21,12 @@ class Championships(ABC):
     client: BaseClient
 
     def __post_init__(self):
-        """Initialize the default header provider after dataclass initialization."""
-        self._header_provider = lambda: Header(
-            x_rapidapi_key=self.client.settings.api_key,
-            x_rapidapi_host=self.client.settings.api_host,
-        )
+        """Initialize the default header provider after dataclass initialization.
+
+        Uses the client's cached authentication headers, which are rebuilt
+        only when the API key or host changes.
+        """
+        self._header_provider = self.client.auth_headers
 
     def _get_language(self, language: Optional[str]) -> str:
         """Get language code, falling back to client default."""
@@ -71,3 +73,39 @@ class Championships(ABC):
             ChampionshipViewResponse containing detailed championship data
         """
         pass
+
+    # =========================================================================
+    # Request specs
+    # =========================================================================
+
+    def _get_list_spec(
+        self,
+        page: Optional[int] = None,
+        country: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> RequestSpec[ChampionshipListResponse]:
+        return RequestSpec(
+            endpoint=CHAMPIONSHIP_LIST.endpoint,
+            params=CHAMPIONSHIP_LIST.build(
+                page=page,
+                country=country,
+                language=self._get_language(language),
+            ),
+            headers=self._header_provider(),
+            response_model=ChampionshipListResponse,
+        )
+
+    def _get_by_id_spec(
+        self,
+        championship_id: str,
+        language: Optional[str] = None,
+    ) -> RequestSpec[ChampionshipViewResponse]:
+        return RequestSpec(
+            endpoint=CHAMPIONSHIP_VIEW.endpoint,
+            params=CHAMPIONSHIP_VIEW.build(
+                id=championship_id,
+                language=self._get_language(language),
+            ),
+            headers=self._header_provider(),
+            response_model=ChampionshipViewResponse,
+        )
@@ -2,9 +2,10 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
 
-from soccer_info.requests_ import Header
 from soccer_info.responses import CountryListResponse
+from soccer_info.requests_ import COUNTRY_LIST
 from soccer_info.client.base_client import BaseClient
+from soccer_info.client.pipeline import RequestSpec
 
 
 @dataclass
@@ -19,11 +20,12 @@ class Countries(ABC):
     client: BaseClient
 
     def __post_init__(self):
-        """Initialize the default header provider after dataclass initialization."""
-        self._header_provider = lambda: Header(
-            x_rapidapi_key=self.client.settings.api_key,
-            x_rapidapi_host=self.client.settings.api_host,
-        )
+        """Initialize the default header provider after dataclass initialization.
+
+        Uses the client's cached authentication headers, which are rebuilt
+        only when the API key or host changes.
+        """
+        self._header_provider = self.client.auth_headers
 
     @abstractmethod
     def get_list(
@@ -42,3 +44,20 @@ class Countries(ABC):
             CountryListResponse containing list of countries
         """
         pass
+
+    # =========================================================================
+    # Request specs
+    # =========================================================================
+
+    def _get_list_spec(
+        self,
+        format: Optional[str] = None,
+    ) -> RequestSpec[CountryListResponse]:
+        return RequestSpec(
+            endpoint=COUNTRY_LIST.endpoint,
+            params=COUNTRY_LIST.build(
+                format=format,
+            ),
+            headers=self._header_provider(),
+            response_model=CountryListResponse,
+        )
@@ -2,7 +2,6 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
 
-from soccer_info.requests_ import Header
 from soccer_info.responses import (
     MatchViewBasicResponse,
     MatchViewFullResponse,
@@ -13,7 +12,18 @@ from soccer_info.responses import (
     MatchByBasicResponse,
     MatchByFullResponse,
 )
+from soccer_info.requests_ import (
+    MATCH_VIEW_BASIC,
+    MATCH_VIEW_FULL,
+    MATCH_ODDS,
+    MATCH_PROGRESSIVE,
+    MATCH_DAY_BASIC,
+    MATCH_DAY_FULL,
+    MATCH_BY_BASIC,
+    MATCH_BY_FULL,
+)
 from soccer_info.client.base_client import BaseClient
+from soccer_info.client.pipeline import RequestSpec
 
 
 @dataclass
@@ -29,11 +39,12 @@ class Matches(ABC):
     client: BaseClient
 
     def __post_init__(self):
-        """Initialize the default header provider after dataclass initialization."""
-        self._header_provider = lambda: Header(
-            x_rapidapi_key=self.client.settings.api_key,
-            x_rapidapi_host=self.client.settings.api_host,
-        )
+        """Initialize the default header provider after dataclass initialization.
+
+        Uses the client's cached authentication headers, which are rebuilt
+        only when the API key or host changes.
+        """
+        self._header_provider = self.client.auth_headers
 
     def _get_language(self, language: Optional[str]) -> str:
         """Get language code, falling back to client default."""
@@ -227,3 +238,147 @@ class Matches(ABC):
             MatchByFullResponse containing filtered matches with odds
         """
         pass
+
+    # =========================================================================
+    # Request specs
+    # =========================================================================
+
+    def _get_view_basic_spec(
+        self,
+        match_id: str,
+        language: Optional[str] = None,
+    ) -> RequestSpec[MatchViewBasicResponse]:
+        return RequestSpec(
+            endpoint=MATCH_VIEW_BASIC.endpoint,
+            params=MATCH_VIEW_BASIC.build(
+                id=match_id,
+                language=self._get_language(language),
+            ),
+            headers=self._header_provider(),
+            response_model=MatchViewBasicResponse,
+        )
+
+    def _get_view_full_spec(
+        self,
+        match_id: str,
+        language: Optional[str] = None,
+    ) -> RequestSpec[MatchViewFullResponse]:
+        return RequestSpec(
+            endpoint=MATCH_VIEW_FULL.endpoint,
+            params=MATCH_VIEW_FULL.build(
+                id=match_id,
+                language=self._get_language(language),
+            ),
+            headers=self._header_provider(),
+            response_model=MatchViewFullResponse,
+        )
+
+    def _get_odds_spec(
+        self,
+        match_id: str,
+    ) -> RequestSpec[MatchOddsResponse]:
+        return RequestSpec(
+            endpoint=MATCH_ODDS.endpoint,
+            params=MATCH_ODDS.build(
+                id=match_id,
+            ),
+            headers=self._header_provider(),
+            response_model=MatchOddsResponse,
+        )
+
+    def _get_progressive_spec(
+        self,
+        match_id: str,
+        language: Optional[str] = None,
+        format: Optional[str] = None,
+    ) -> RequestSpec[MatchProgressiveResponse]:
+        return RequestSpec(
+            endpoint=MATCH_PROGRESSIVE.endpoint,
+            params=MATCH_PROGRESSIVE.build(
+                id=match_id,
+                language=self._get_language(language),
+                format=format,
+            ),
+            headers=self._header_provider(),
+            response_model=MatchProgressiveResponse,
+        )
+
+    def _get_by_day_basic_spec(
+        self,
+        date: str,
+        page: Optional[int] = None,
+        language: Optional[str] = None,
+        format: Optional[str] = None,
+    ) -> RequestSpec[MatchDayBasicResponse]:
+        return RequestSpec(
+            endpoint=MATCH_DAY_BASIC.endpoint,
+            params=MATCH_DAY_BASIC.build(
+                date=date,
+                page=page,
+                language=self._get_language(language),
+                format=format,
+            ),
+            headers=self._header_provider(),
+            response_model=MatchDayBasicResponse,
+        )
+
+    def _get_by_day_full_spec(
+        self,
+        date: str,
+        page: Optional[int] = None,
+        language: Optional[str] = None,
+        format: Optional[str] = None,
+    ) -> RequestSpec[MatchDayFullResponse]:
+        return RequestSpec(
+            endpoint=MATCH_DAY_FULL.endpoint,
+            params=MATCH_DAY_FULL.build(
+                date=date,
+                page=page,
+                language=self._get_language(language),
+                format=format,
+            ),
+            headers=self._header_provider(),
+            response_model=MatchDayFullResponse,
+        )
+
+    def _get_by_filter_basic_spec(
+        self,
+        championship_id: Optional[str] = None,
+        manager_id: Optional[str] = None,
+        stadium_id: Optional[str] = None,
+        page: Optional[int] = None,
+        language: Optional[str] = None,
+    ) -> RequestSpec[MatchByBasicResponse]:
+        return RequestSpec(
+            endpoint=MATCH_BY_BASIC.endpoint,
+            params=MATCH_BY_BASIC.build(
+                championship_id=championship_id,
+                manager_id=manager_id,
+                stadium_id=stadium_id,
+                page=page,
+                language=self._get_language(language),
+            ),
+            headers=self._header_provider(),
+            response_model=MatchByBasicResponse,
+        )
+
+    def _get_by_filter_full_spec(
+        self,
+        championship_id: Optional[str] = None,
+        manager_id: Optional[str] = None,
+        stadium_id: Optional[str] = None,
+        page: Optional[int] = None,
+        language: Optional[str] = None,
+    ) -> RequestSpec[MatchByFullResponse]:
+        return RequestSpec(
+            endpoint=MATCH_BY_FULL.endpoint,
+            params=MATCH_BY_FULL.build(
+                championship_id=championship_id,
+                manager_id=manager_id,
+                stadium_id=stadium_id,
+                page=page,
+                language=self._get_language(language),
+            ),
+            headers=self._header_provider(),
+            response_model=MatchByFullResponse,
+        )
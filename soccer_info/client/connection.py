@@ -0,0 +1,67 @@
+from typing import Any, Dict, Optional
+
+import httpx
+
+from soccer_info.settings import Settings
+
+# Unauthenticated request used to open connections; its response is discarded
+WARMUP_METHOD = "HEAD"
+WARMUP_PATH = "/"
+
+
+def httpx_client_options(settings: Settings) -> Dict[str, Any]:
+    """Translate settings into keyword arguments for ``httpx.Client``/``httpx.AsyncClient``.
+
+    Args:
+        settings: API configuration
+
+    Returns:
+        Keyword arguments with base URL, timeouts, pool limits, HTTP/2 and
+        compression headers
+    """
+    default = settings.request_timeout
+
+    def phase(value: Optional[float]) -> float:
+        return default if value is None else value
+
+    return {
+        "base_url": settings.base_url,
+        "timeout": httpx.Timeout(
+            default,
+            connect=phase(settings.connect_timeout),
+            read=phase(settings.read_timeout),
+            write=phase(settings.write_timeout),
+            pool=phase(settings.pool_timeout),
+        ),
+        "limits": httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        ),
+        "http2": settings.http2,
+        # httpx advertises every decoder it has installed; "identity" opts out
+        "headers": {} if settings.compression else {"Accept-Encoding": "identity"},
+    }
+
+
+def warmup_connection_count(settings: Settings, connections: Optional[int] = None) -> int:
+    """Number of connections a warmup should open.
+
+    Defaults to one connection for HTTP/2 (requests are multiplexed) and to
+    the keep-alive limit otherwise. Never exceeds the number of connections
+    the pool can keep open, so warmed connections are not discarded.
+
+    Args:
+        settings: API configuration
+        connections: Requested number of connections, or None for the default
+
+    Returns:
+        Number of connections to open
+    """
+    limit = settings.max_keepalive_connections
+    if settings.max_connections is not None:
+        limit = settings.max_connections if limit is None else min(limit, settings.max_connections)
+
+    if connections is None:
+        connections = 1 if settings.http2 or limit is None else limit
+    return connections if limit is None else min(connections, limit)
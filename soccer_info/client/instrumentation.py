@@ -0,0 +1,319 @@
+import logging
+import math
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Literal, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EventName = Literal["request_start", "throttle_end", "response", "parse_end", "error"]
+Phase = Literal["throttle", "network", "parse", "total", "retry", "coalesced"]
+
+EVENT_NAMES: Tuple[EventName, ...] = ("request_start", "throttle_end", "response", "parse_end", "error")
+PHASES: Tuple[Phase, ...] = ("throttle", "network", "parse", "total", "retry", "coalesced")
+
+
+@dataclass
+class RequestEvent:
+    """Lifecycle event emitted while a client executes a request.
+
+    Attributes:
+        name: Event type (request_start, throttle_end, response, parse_end, error)
+        endpoint: API endpoint path of the request
+        timestamp: ``time.perf_counter()`` value when the event fired
+        elapsed: Seconds since the request started
+        status: HTTP status code, once a response was received
+        bytes: Response body size in bytes, once a response was received
+        error: Exception that failed the request (error events only)
+    """
+    name: EventName
+    endpoint: str
+    timestamp: float
+    elapsed: float
+    status: Optional[int] = None
+    bytes: Optional[int] = None
+    error: Optional[BaseException] = None
+
+
+Hook = Callable[[RequestEvent], None]
+
+
+class LatencyHistogram:
+    """Low-overhead log-linear latency histogram.
+
+    Each power of two is split into ``SUB_BUCKETS`` linear buckets, giving
+    quantiles with a relative error below ``1 / SUB_BUCKETS`` at the cost
+    of one ``math.frexp`` and a dictionary increment per recorded value.
+    """
+
+    SUB_BUCKETS = 16
+    RESOLUTION = 1e-6  # values are bucketed in microseconds
+
+    __slots__ = ('count', 'total', 'min', 'max', '_buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._buckets: Dict[int, int] = defaultdict(int)
+
+    def record(self, seconds: float) -> None:
+        """Record one latency value in seconds."""
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self._buckets[self._index(seconds)] += 1
+
+    @classmethod
+    def _index(cls, seconds: float) -> int:
+        units = seconds / cls.RESOLUTION
+        if units < 1:
+            return 0
+        mantissa, exponent = math.frexp(units)  # units = mantissa * 2**exponent, 0.5 <= mantissa < 1
+        return exponent * cls.SUB_BUCKETS + int((mantissa - 0.5) * 2 * cls.SUB_BUCKETS)
+
+    @classmethod
+    def _upper_bound(cls, index: int) -> float:
+        if index == 0:
+            return cls.RESOLUTION
+        exponent, sub = divmod(index, cls.SUB_BUCKETS)
+        return math.ldexp(0.5 + (sub + 1) / (2 * cls.SUB_BUCKETS), exponent) * cls.RESOLUTION
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean of the recorded values, or None if empty."""
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile (0-1) of the recorded values.
+
+        Returns:
+            Upper bound of the bucket containing the quantile, clamped to the
+            observed min/max, or None if empty.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(max(self._upper_bound(index), self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Count, mean, min, max and p50/p90/p99 in seconds."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": self.quantile(0.50),
+            "p90": self.quantile(0.90),
+            "p99": self.quantile(0.99),
+        }
+
+
+class Instrumentation:
+    """Request lifecycle hooks and per-endpoint latency histograms for a client.
+
+    Hooks are called synchronously with a ``RequestEvent`` as a request
+    starts, finishes waiting for the throttle, receives its response,
+    finishes parsing, or fails. Histograms, once enabled, record throttle
+    wait, network time, parse time and total time per endpoint, once per
+    successful request. Throttle and network time are those of the final
+    attempt; requests that were retried also record the time spent on
+    earlier attempts and backoff as ``retry``. A request that waited for an
+    identical in-flight request (see ``CoalescingMiddleware``) records only
+    its wait, as ``coalesced``.
+
+    When no hooks are registered and histograms are disabled, clients skip
+    all timing work, so instrumentation costs a single attribute check.
+
+    Example:
+        >>> client.instrumentation.enable_histograms()
+        >>> client.instrumentation.add_hook("error", lambda event: print(event.endpoint, event.error))
+        >>> ...
+        >>> client.instrumentation.report()["/matches/day/basic/"]["network"]["p99"]
+    """
+
+    def __init__(self):
+        # Hook tuples are replaced, never mutated, so requests iterate them without locking
+        self._hooks: Dict[str, Tuple[Hook, ...]] = {}
+        self._histograms: Optional[Dict[Tuple[str, str], LatencyHistogram]] = None
+        self._lock = threading.Lock()
+        self.active = False
+
+    def add_hook(self, event: EventName, hook: Hook) -> None:
+        """Register a hook for a lifecycle event.
+
+        Args:
+            event: Event name to listen for
+            hook: Callable receiving the event; exceptions it raises are
+                logged and do not fail the request
+
+        Raises:
+            ValueError: If the event name is unknown
+        """
+        if event not in EVENT_NAMES:
+            raise ValueError(f"Unknown event {event!r}, expected one of {EVENT_NAMES}")
+        with self._lock:
+            self._hooks[event] = (*self._hooks.get(event, ()), hook)
+            self._update_active()
+
+    def remove_hook(self, event: EventName, hook: Hook) -> None:
+        """Unregister a previously added hook."""
+        with self._lock:
+            hooks = list(self._hooks.get(event, ()))
+            if hook in hooks:
+                hooks.remove(hook)
+                if hooks:
+                    self._hooks[event] = tuple(hooks)
+                else:
+                    del self._hooks[event]
+            self._update_active()
+
+    def enable_histograms(self) -> None:
+        """Start recording per-endpoint phase latencies."""
+        with self._lock:
+            if self._histograms is None:
+                self._histograms = {}
+            self._update_active()
+
+    def disable_histograms(self) -> None:
+        """Stop recording latencies and discard recorded data."""
+        with self._lock:
+            self._histograms = None
+            self._update_active()
+
+    def reset_histograms(self) -> None:
+        """Discard recorded latencies, keeping histograms enabled."""
+        with self._lock:
+            if self._histograms is not None:
+                self._histograms.clear()
+
+    def histogram(self, endpoint: str, phase: Phase) -> Optional[LatencyHistogram]:
+        """Get the histogram of a phase for an endpoint, if any values were recorded."""
+        if self._histograms is None:
+            return None
+        return self._histograms.get((endpoint, phase))
+
+    def report(self) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+        """Summarize recorded latencies.
+
+        Returns:
+            Mapping of endpoint -> phase -> summary statistics in seconds
+        """
+        result: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {}
+        with self._lock:
+            for (endpoint, phase), histogram in sorted((self._histograms or {}).items()):
+                result.setdefault(endpoint, {})[phase] = histogram.summary()
+        return result
+
+    def trace(self, endpoint: str) -> Optional['RequestTrace']:
+        """Start tracing a request, or return None when instrumentation is inactive."""
+        if not self.active:
+            return None
+        return RequestTrace(self, endpoint)
+
+    def _update_active(self) -> None:
+        self.active = bool(self._hooks) or self._histograms is not None
+
+    def _emit(self, event: RequestEvent) -> None:
+        for hook in self._hooks.get(event.name, ()):
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Request hook %r failed on %s event", hook, event.name)
+
+    def _record(self, endpoint: str, phase: Phase, seconds: float) -> None:
+        histograms = self._histograms
+        if histograms is None:
+            return
+        # Histogram updates are read-modify-write; without the GIL concurrent requests would lose counts
+        with self._lock:
+            histogram = histograms.get((endpoint, phase))
+            if histogram is None:
+                histogram = histograms[(endpoint, phase)] = LatencyHistogram()
+            histogram.record(seconds)
+
+
+class RequestTrace:
+    """Timing state of one in-flight request, feeding hooks and histograms."""
+
+    __slots__ = (
+        '_instrumentation', 'endpoint', 'started', '_attempt_started', '_throttled', '_responded',
+        'attempts', 'status', 'bytes', '_coalesced',
+    )
+
+    def __init__(self, instrumentation: Instrumentation, endpoint: str):
+        self._instrumentation = instrumentation
+        self.endpoint = endpoint
+        self.started = time.perf_counter()
+        self._attempt_started = self.started
+        self._throttled = self.started
+        self._responded = self.started
+        self.attempts = 0
+        self.status: Optional[int] = None
+        self.bytes: Optional[int] = None
+        self._coalesced = False
+        self._event("request_start", self.started)
+
+    def attempt_start(self) -> None:
+        """Mark the start of an attempt to send the request, before its throttle wait."""
+        self.attempts += 1
+        if self.attempts > 1:
+            self._attempt_started = time.perf_counter()
+
+    def coalesced(self) -> None:
+        """Mark the request as waiting for an identical in-flight request instead of being sent."""
+        self._coalesced = True
+
+    def throttle_end(self) -> None:
+        """Mark the end of the throttle wait."""
+        self._throttled = now = time.perf_counter()
+        self._event("throttle_end", now)
+
+    def response(self, status: int, size: int) -> None:
+        """Mark the arrival of the full response body."""
+        self._responded = now = time.perf_counter()
+        self.status, self.bytes = status, size
+        self._event("response", now)
+
+    def parse_end(self) -> None:
+        """Mark the end of response validation and record the phases of the final attempt."""
+        now = time.perf_counter()
+        record = self._instrumentation._record
+        if self._coalesced:
+            record(self.endpoint, "coalesced", now - self.started)
+            self._event("parse_end", now)
+            return
+        record(self.endpoint, "throttle", self._throttled - self._attempt_started)
+        record(self.endpoint, "network", self._responded - self._throttled)
+        record(self.endpoint, "parse", now - self._responded)
+        record(self.endpoint, "total", now - self.started)
+        if self.attempts > 1:
+            record(self.endpoint, "retry", self._attempt_started - self.started)
+        self._event("parse_end", now)
+
+    def error(self, error: BaseException) -> None:
+        """Mark the request as failed."""
+        self._event("error", time.perf_counter(), error)
+
+    def _event(self, name: EventName, now: float, error: Optional[BaseException] = None) -> None:
+        if name in self._instrumentation._hooks:
+            self._instrumentation._emit(RequestEvent(
+                name=name,
+                endpoint=self.endpoint,
+                timestamp=now,
+                elapsed=now - self.started,
+                status=self.status,
+                bytes=self.bytes,
+                error=error,
+            ))
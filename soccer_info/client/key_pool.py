@@ -0,0 +1,227 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from soccer_info.requests_.headers import Header, mask_api_key
+from soccer_info.responses.base import ResponseHeaders
+
+
+class QuotaExhaustedError(RuntimeError):
+    """Raised when no API key has quota left for a request.
+
+    Attributes:
+        reset_seconds: Seconds until the earliest quota reset, if known
+    """
+
+    def __init__(self, message: str, reset_seconds: Optional[float] = None):
+        super().__init__(message)
+        self.reset_seconds = reset_seconds
+
+    @property
+    def hours_to_reset(self) -> Optional[float]:
+        """Hours (with 2 decimal places) until the earliest quota reset, or None if unknown."""
+        if self.reset_seconds is not None:
+            return round(self.reset_seconds / 3600, 2)
+        return None
+
+
+@dataclass
+class KeyState:
+    """Rate limiter and quota state of one pooled API key.
+
+    Attributes:
+        key: The API key
+        headers: Authentication headers sent with this key
+        next_slot: ``time.monotonic()`` value from which the key may send again
+        limit: Request quota per period, as last reported by the API
+        remaining: Requests left in the period, as last reported by the API
+        reset_at: ``time.monotonic()`` value at which the quota resets
+        exhausted_until: ``time.monotonic()`` value until which the key is drained
+        in_flight: Requests currently sent with this key
+        requests: Total requests sent with this key
+    """
+    key: str
+    headers: Dict[str, str] = field(repr=False)
+    next_slot: float = 0.0
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_at: Optional[float] = None
+    exhausted_until: Optional[float] = None
+    in_flight: int = 0
+    requests: int = 0
+
+    @property
+    def headroom(self) -> float:
+        """Requests left after those in flight; unknown quotas count as unlimited."""
+        if self.remaining is None:
+            return float('inf')
+        return self.remaining - self.in_flight
+
+
+class KeyPool:
+    """Routes requests across several API keys, each with its own limiter and quota.
+
+    Every key is throttled independently to one request per
+    ``throttle_seconds``, so aggregate throughput grows with the number of
+    keys. Each request goes to the key that can send soonest; ties go to the
+    key with the most quota headroom reported by the rate-limit headers.
+    Keys that report an exhausted quota (or answer 429) are drained until
+    their reset and put back into rotation afterwards; clients retry a
+    request that hit a drained key on another key.
+
+    Thread-safe; ``reserve`` never blocks, it returns how long the caller
+    must wait so sync and async clients can sleep in their own way.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        api_host: str,
+        throttle_seconds: float = 0.0,
+        cooldown_seconds: float = 60.0,
+    ):
+        """Initialize the key pool.
+
+        Args:
+            keys: API keys to pool
+            api_host: RapidAPI host sent with every key
+            throttle_seconds: Minimum seconds between requests of a single key
+            cooldown_seconds: How long to drain a key that answered 429
+                without reporting when its quota resets
+
+        Raises:
+            ValueError: If no keys are given
+        """
+        if not keys:
+            raise ValueError("At least one API key is required")
+        self.throttle_seconds = throttle_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._states = [
+            KeyState(key=key, headers=Header(x_rapidapi_key=key, x_rapidapi_host=api_host).to_dict())
+            for key in dict.fromkeys(keys)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def reserve(self) -> Tuple[KeyState, float]:
+        """Pick a key for the next request and book its send slot.
+
+        Returns:
+            The chosen key and the seconds to wait before sending
+
+        Raises:
+            QuotaExhaustedError: If every key is drained
+        """
+        with self._lock:
+            now = time.monotonic()
+            available = [state for state in self._states if not self._drained(state, now)]
+            if not available:
+                reset = min(state.exhausted_until for state in self._states)
+                raise QuotaExhaustedError(
+                    f"All {len(self._states)} API keys have exhausted their quota",
+                    reset_seconds=reset - now,
+                )
+
+            # Keys whose known quota is already covered by requests in flight go last
+            state = min(available, key=lambda s: (s.headroom <= 0, max(s.next_slot, now), -s.headroom))
+            start = max(state.next_slot, now)
+            state.next_slot = start + self.throttle_seconds
+            state.in_flight += 1
+            state.requests += 1
+            return state, start - now
+
+    def release(
+        self,
+        state: KeyState,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Record the outcome of a request sent with a reserved key.
+
+        Args:
+            state: Key returned by ``reserve``
+            status_code: HTTP status of the response, None if no response arrived
+            headers: Response headers carrying the rate-limit information
+        """
+        rate = ResponseHeaders.model_validate(dict(headers)) if headers is not None else None
+        with self._lock:
+            now = time.monotonic()
+            state.in_flight -= 1
+            if rate is not None:
+                if rate.rate_limit_limit is not None:
+                    state.limit = rate.rate_limit_limit
+                if rate.rate_limit_remaining is not None:
+                    state.remaining = rate.rate_limit_remaining
+                if rate.rate_limit_reset is not None:
+                    state.reset_at = now + rate.rate_limit_reset
+
+            if state.remaining == 0 or status_code == 429:
+                retry_after = _retry_after(headers)
+                if retry_after is not None:
+                    state.exhausted_until = now + retry_after
+                elif state.remaining == 0 and state.reset_at is not None:
+                    state.exhausted_until = state.reset_at
+                else:
+                    state.exhausted_until = now + self.cooldown_seconds
+
+    def quota(self) -> Tuple[Optional[int], Optional[float]]:
+        """Combined remaining quota of all keys and seconds until the earliest reset.
+
+        Returns:
+            Total remaining requests (None until every key reported its quota)
+            and seconds until the first key resets (None if unknown)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if any(state.remaining is None for state in self._states):
+                return None, None
+            resets = [state.reset_at - now for state in self._states if state.reset_at is not None]
+            return sum(state.remaining for state in self._states), (max(min(resets), 0.0) if resets else None)
+
+    def is_drained(self, state: KeyState) -> bool:
+        """Whether a key was drained, e.g. while a request waited for its slot."""
+        with self._lock:
+            return self._drained(state, time.monotonic())
+
+    def _drained(self, state: KeyState, now: float) -> bool:
+        if state.exhausted_until is None:
+            return False
+        if now < state.exhausted_until:
+            return True
+        # Drain period is over: assume a fresh quota until the API reports otherwise
+        state.exhausted_until = None
+        state.remaining = state.limit if state.reset_at is not None and now >= state.reset_at else None
+        return False
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Snapshot of every key's quota and usage, in pool order and with keys masked."""
+        with self._lock:
+            now = time.monotonic()
+            return [
+                {
+                    "index": index,
+                    "key": mask_api_key(state.key),
+                    "limit": state.limit,
+                    "remaining": state.remaining,
+                    "in_flight": state.in_flight,
+                    "requests": state.requests,
+                    "drained_seconds": (
+                        max(state.exhausted_until - now, 0.0) if state.exhausted_until is not None else None
+                    ),
+                }
+                for index, state in enumerate(self._states)
+            ]
+
+
+def _retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """Seconds from a numeric ``Retry-After`` header, if present."""
+    if headers is None:
+        return None
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
@@ -0,0 +1,191 @@
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Collection, Dict, Optional, Tuple, Type
+
+import httpx
+
+from soccer_info.client.instrumentation import LatencyHistogram
+from soccer_info.client.key_pool import _retry_after
+from soccer_info.client.parse_cache import ParseCache
+from soccer_info.client.pipeline import Call, Flow, Handler, Middleware, RawResponse, RequestSpec, Shared, Sleep, T, parse_body
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class ParseCacheMiddleware(Middleware):
+    """Parses responses through a ``ParseCache``, skipping validation of unchanged bodies.
+
+    Installed automatically when ``settings.parse_cache_entries`` is set.
+    Calls with a custom parser are left alone.
+    """
+
+    def __init__(self, cache: ParseCache):
+        self.cache = cache
+
+    def _parse(self, spec: RequestSpec[T], raw: RawResponse) -> T:
+        return self.cache.parse(spec.endpoint, spec.params, raw.content, spec.response_model)
+
+    def handle(self, call: Call[T], forward: Handler) -> Flow[T]:
+        if call.parser is parse_body:
+            call.parser = self._parse
+        return (yield from forward(call))
+
+
+class RetryMiddleware(Middleware):
+    """Retries requests failing with a transient status or transport error.
+
+    Waits ``backoff`` seconds before the first retry and doubles the wait
+    for each further one, up to ``max_backoff``. A numeric ``Retry-After``
+    header of the failed response takes precedence over the backoff.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 10.0,
+        statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        exceptions: Tuple[Type[BaseException], ...] = (httpx.TransportError,),
+    ):
+        """Initialize the retry policy.
+
+        Args:
+            attempts: Requests sent per call at most, including the first
+            backoff: Seconds to wait before the first retry
+            max_backoff: Longest wait between two attempts
+            statuses: Response statuses worth retrying
+            exceptions: Exceptions (raised while sending) worth retrying
+        """
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.exceptions = exceptions
+
+    def handle(self, call: Call[T], forward: Handler) -> Flow[T]:
+        delay = self.backoff
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return (yield from forward(call))
+            except httpx.HTTPStatusError as error:
+                if error.response.status_code not in self.statuses or attempt == self.attempts:
+                    raise
+                wait = _retry_after(error.response.headers)
+            except self.exceptions:
+                if attempt == self.attempts:
+                    raise
+                wait = None
+            yield Sleep(min(wait if wait is not None else delay, self.max_backoff))
+            delay *= 2
+
+
+class CoalescingMiddleware(Middleware):
+    """Sends identical concurrent requests once.
+
+    Calls with the same endpoint, response model and parameters that are
+    made while one of them is in flight wait for it and receive the same
+    response object instead of sending their own request; treat coalesced
+    responses as read-only. Install it outside ``RetryMiddleware`` so
+    waiting calls share the retries too. Calls with different parsers are
+    never coalesced, and the async client does not coalesce calls made
+    with different ``request_priority`` options. Waiting calls are traced
+    as ``coalesced`` rather than with network and parse phases, and get no
+    ``response_timings`` of their own.
+    """
+
+    def handle(self, call: Call[T], forward: Handler) -> Flow[T]:
+        return (yield Shared((call.spec.key, call.parser), lambda: forward(call), call))
+
+
+class ThrottleMiddleware(Middleware):
+    """Spaces requests passing through it at least ``interval`` seconds apart.
+
+    Slots are handed out first come first served and shared by every
+    thread or task using the client. The async client already throttles by
+    priority (see ``request_priority``); use this for the sync client or for
+    an additional, stricter limit.
+    """
+
+    def __init__(self, interval: float):
+        """Initialize the throttle.
+
+        Args:
+            interval: Minimum seconds between two requests
+        """
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def handle(self, call: Call[T], forward: Handler) -> Flow[T]:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            yield Sleep(slot - now)
+        return (yield from forward(call))
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters and latency of one endpoint.
+
+    Attributes:
+        calls: Calls completed, successfully or not
+        failures: Calls that raised
+        retries: Requests sent beyond the first one per call
+        latency: Seconds per call, including retries and waits of inner layers
+    """
+    calls: int = 0
+    failures: int = 0
+    retries: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram, repr=False)
+
+
+class MetricsMiddleware(Middleware):
+    """Counts calls, failures and retries per endpoint and records call latency.
+
+    Install it as the outermost layer to measure whole calls, retries
+    included.
+    """
+
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointMetrics] = defaultdict(EndpointMetrics)
+        self._lock = threading.Lock()
+
+    def handle(self, call: Call[T], forward: Handler) -> Flow[T]:
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = yield from forward(call)
+            failed = False
+            return result
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                metrics = self.endpoints[call.spec.endpoint]
+                metrics.calls += 1
+                metrics.failures += failed
+                metrics.retries += max(call.attempts - 1, 0)
+                metrics.latency.record(elapsed)
+
+    def report(self, endpoint: Optional[str] = None) -> Dict[str, Dict[str, object]]:
+        """Counters and latency summary per endpoint (or of one endpoint)."""
+        with self._lock:
+            selected = {
+                name: metrics for name, metrics in self.endpoints.items()
+                if endpoint is None or name == endpoint
+            }
+            return {
+                name: {
+                    "calls": metrics.calls,
+                    "failures": metrics.failures,
+                    "retries": metrics.retries,
+                    "latency": metrics.latency.summary(),
+                }
+                for name, metrics in selected.items()
+            }
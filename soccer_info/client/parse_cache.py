@@ -0,0 +1,105 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Mapping, Tuple, Type, TypeVar
+
+from soccer_info.responses.base import ResponseComponent
+
+T = TypeVar('T', bound=ResponseComponent)
+
+# Request identity: endpoint, response model and sorted query parameters
+_RequestKey = Tuple[str, Type[ResponseComponent], Tuple[Tuple[str, Any], ...]]
+
+
+@dataclass
+class ParseCacheStats:
+    """Counters of a ``ParseCache``.
+
+    Attributes:
+        hits: Responses whose body matched the previous one and were not parsed again
+        misses: Responses parsed because the body changed or was not seen before
+    """
+    hits: int = 0
+    misses: int = 0
+
+
+class ParseCache:
+    """Reuses the parsed response when a request returns a byte-identical body.
+
+    For every request (endpoint, response model and parameters) the cache
+    keeps a digest of the last raw body and the model parsed from it. When
+    the next body has the same digest, validation is skipped and a shallow
+    copy of the earlier response is returned with
+    ``response_unchanged=True``; the client then attaches the fresh
+    response headers to the copy.
+
+    Every response of a request, the first one included, is a shallow copy
+    of the cached model: replacing attributes of a response (e.g.
+    ``response.result = sorted(...)``) affects only that response, but
+    ``result`` and every nested model are shared by all responses of the
+    request, so they must not be mutated in place. Sort into a new list, or
+    take ``response.model_copy(deep=True)`` before editing matches.
+
+    The least recently used requests are evicted once ``max_entries`` are
+    cached.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Distinct requests whose last response is kept
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.stats = ParseCacheStats()
+        self._entries: 'OrderedDict[_RequestKey, Tuple[bytes, ResponseComponent]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def parse(self, endpoint: str, params: Mapping[str, Hashable], body: bytes, response_model: Type[T]) -> T:
+        """Parse a response body, reusing the previous result of the same request if the body is unchanged.
+
+        Args:
+            endpoint: API endpoint path
+            params: Serialized query parameters of the request
+            body: Raw response body
+            response_model: Model to validate the body with
+
+        Returns:
+            A copy of the freshly parsed response, or of the cached one with
+            ``response_unchanged`` set
+        """
+        key = (endpoint, response_model, tuple(sorted(params.items())))
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == digest:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                reused = cached[1].model_copy()
+            else:
+                reused = None
+        if reused is not None:
+            if "response_unchanged" in type(reused).model_fields:
+                reused.response_unchanged = True
+            return reused
+
+        parsed = response_model.model_validate_json(body)
+        with self._lock:
+            self.stats.misses += 1
+            self._entries[key] = (digest, parsed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        # The cached model itself is never handed out, so callers cannot rebind its attributes
+        return parsed.model_copy()
+
+    def clear(self) -> None:
+        """Forget every cached response."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,254 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from soccer_info.responses.base import ResponseComponent, ResponseHeaders
+
+T = TypeVar('T', bound=ResponseComponent)
+R = TypeVar('R')
+
+
+@dataclass(frozen=True)
+class RequestSpec(Generic[T]):
+    """Everything needed to send one API request and validate its response.
+
+    Attributes:
+        endpoint: API endpoint path (e.g. "/matches/view/basic/")
+        params: Serialized query parameters
+        headers: Serialized request headers, including authentication
+        response_model: Model the response body is validated with
+    """
+    endpoint: str
+    params: Mapping[str, Any]
+    headers: Mapping[str, str]
+    response_model: Type[T]
+
+    @property
+    def key(self) -> Hashable:
+        """Identity of the request for caching and coalescing (headers are not part of it)."""
+        return self.endpoint, self.response_model, tuple(sorted(self.params.items()))
+
+
+class RawResponse(Protocol):
+    """Response as returned by a driver's transport, e.g. ``httpx.Response``."""
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+    http_version: str
+
+    def raise_for_status(self) -> Any:
+        ...
+
+
+# =============================================================================
+# Effects
+# =============================================================================
+
+@dataclass(frozen=True)
+class Send:
+    """Ask the driver to send a request; resumes with the ``RawResponse``."""
+    call: 'Call'
+
+
+@dataclass(frozen=True)
+class Sleep:
+    """Ask the driver to wait; resumes with None."""
+    seconds: float
+
+
+@dataclass(frozen=True)
+class Shared:
+    """Ask the driver to run ``start()`` once per in-flight ``key``.
+
+    Concurrent calls with the same key resume with the result (or
+    exception) of the single flow that is running. When ``call`` is given,
+    the driver marks it with the ``"coalesced"`` extension if it joined a
+    flow started by another call.
+    """
+    key: Hashable
+    start: Callable[[], 'Flow[Any]']
+    call: Optional['Call'] = None
+
+
+Effect = Union[Send, Sleep, Shared]
+Flow = Generator[Effect, Any, R]
+
+
+def parse_body(spec: RequestSpec[T], raw: RawResponse) -> T:
+    """Default parser: validate the JSON body with the response model."""
+    return spec.response_model.model_validate_json(raw.content)
+
+
+Parser = Callable[[RequestSpec[T], RawResponse], T]
+
+
+@dataclass
+class Call(Generic[T]):
+    """One request travelling through the pipeline.
+
+    Attributes:
+        spec: Request to send; middleware may replace it
+        parser: Turns the raw response into the model; middleware may wrap it
+        attempts: Requests sent for this call so far
+        response: Last raw response received
+        validation_seconds: Time spent parsing the last response
+        extensions: Per-call state of drivers and middleware
+    """
+    spec: RequestSpec[T]
+    parser: Parser[T] = parse_body
+    attempts: int = 0
+    response: Optional[RawResponse] = None
+    validation_seconds: Optional[float] = None
+    extensions: Dict[str, Any] = field(default_factory=dict)
+
+    def mark_coalesced(self) -> None:
+        """Record that this call is waiting for another call's identical request instead of sending its own."""
+        self.extensions["coalesced"] = True
+        trace = self.extensions.get("trace")
+        if trace is not None:
+            trace.coalesced()
+
+
+Handler = Callable[[Call[T]], Flow[T]]
+
+
+def exchange(call: Call[T]) -> Flow[T]:
+    """Innermost handler: send the request, check its status and parse the response."""
+    call.attempts += 1
+    raw = yield Send(call)
+    call.response = raw
+    raw.raise_for_status()
+
+    started = time.perf_counter()
+    parsed = call.parser(call.spec, raw)
+    # Parse and attach response headers (Pydantic handles normalization and type conversion)
+    parsed.response_headers = ResponseHeaders.model_validate(dict(raw.headers))
+    call.validation_seconds = time.perf_counter() - started
+    return parsed
+
+
+# =============================================================================
+# Middleware
+# =============================================================================
+
+class Middleware:
+    """A layer of the request pipeline, shared by sync and async clients.
+
+    ``handle`` is a generator: it may inspect or replace ``call``, delegate
+    to the next layer with ``yield from forward(call)``, catch its errors,
+    and yield ``Sleep`` or ``Shared`` effects. It never performs I/O
+    itself, so one implementation serves both drivers.
+    """
+
+    def handle(self, call: Call[T], forward: Handler) -> Flow[T]:
+        return (yield from forward(call))
+
+
+class Pipeline:
+    """Ordered middleware chain around ``exchange``; the first middleware is the outermost.
+
+    The chain is rebuilt when middleware are added or removed, under a
+    lock, and swapped in as a whole; requests in flight keep the chain
+    they started with.
+    """
+
+    def __init__(self, middleware: Iterable[Middleware] = ()):
+        self._middleware: List[Middleware] = list(middleware)
+        self._lock = threading.Lock()
+        self._handler: Handler = self._chain()
+
+    @property
+    def middleware(self) -> List[Middleware]:
+        """Installed middleware, outermost first (a copy)."""
+        return list(self._middleware)
+
+    def use(self, middleware: Middleware, outermost: bool = False) -> None:
+        """Install a middleware.
+
+        Args:
+            middleware: Layer to add
+            outermost: Add it in front of every other layer instead of
+                closest to the network
+        """
+        with self._lock:
+            if outermost:
+                self._middleware.insert(0, middleware)
+            else:
+                self._middleware.append(middleware)
+            self._handler = self._chain()
+
+    def remove(self, middleware: Middleware) -> None:
+        """Uninstall a middleware."""
+        with self._lock:
+            self._middleware.remove(middleware)
+            self._handler = self._chain()
+
+    def _chain(self) -> Handler:
+        handler: Handler = exchange
+        for middleware in reversed(self._middleware):
+            handler = partial(middleware.handle, forward=handler)
+        return handler
+
+    def flow(self, call: Call[T]) -> Flow[T]:
+        """Flow running ``call`` through every layer."""
+        return self._handler(call)
+
+
+# =============================================================================
+# Drivers
+# =============================================================================
+
+def drive(flow: Flow[R], perform: Callable[[Effect], Any]) -> R:
+    """Run a flow to completion, performing its effects synchronously.
+
+    Args:
+        flow: Flow from ``Pipeline.flow``
+        perform: Performs one effect and returns the value the flow resumes with
+
+    Returns:
+        The flow's result
+    """
+    value: Any = None
+    error: Optional[BaseException] = None
+    while True:
+        try:
+            effect = flow.send(value) if error is None else flow.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            value, error = perform(effect), None
+        except BaseException as exception:
+            value, error = None, exception
+
+
+async def adrive(flow: Flow[R], perform: Callable[[Effect], Awaitable[Any]]) -> R:
+    """Async counterpart of ``drive``; ``perform`` is a coroutine function."""
+    value: Any = None
+    error: Optional[BaseException] = None
+    while True:
+        try:
+            effect = flow.send(value) if error is None else flow.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            value, error = await perform(effect), None
+        except BaseException as exception:
+            value, error = None, exception
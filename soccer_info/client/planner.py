@@ -0,0 +1,426 @@
+import asyncio
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Literal, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from soccer_info.client.async_.loader import DateHint, normalize_date_hint
+from soccer_info.responses import APIResponse, MatchBasic, MatchFull
+
+logger = logging.getLogger(__name__)
+
+Source = Literal["match", "day", "championship"]
+Match = Union[MatchBasic, MatchFull]
+
+# Page size of the list endpoints until a response reports it
+DEFAULT_PER_PAGE = 100
+
+# Page counts assumed for days and championships whose size was not observed yet
+DEFAULT_PAGES: Dict[Source, int] = {"match": 1, "day": 3, "championship": 10}
+
+
+@dataclass
+class DataNeed:
+    """Declarative description of the matches a job needs.
+
+    Attributes:
+        match_ids: Individual matches to fetch
+        dates: Days whose every match is needed
+        championship_ids: Championships whose every match is needed
+        full: Fetch full match data instead of basic
+        odds: Odds are needed; only full responses carry them
+        match_dates: Known day of some of ``match_ids``, used to cluster them
+        match_championships: Known championship of some of ``match_ids``
+    """
+    match_ids: Sequence[str] = ()
+    dates: Sequence[DateHint] = ()
+    championship_ids: Sequence[str] = ()
+    full: bool = False
+    odds: bool = False
+    match_dates: Mapping[str, DateHint] = field(default_factory=dict)
+    match_championships: Mapping[str, str] = field(default_factory=dict)
+
+    @property
+    def detail(self) -> str:
+        """Endpoint detail to fetch: "full" when full data or odds are needed, else "basic"."""
+        return "full" if self.full or self.odds else "basic"
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """One endpoint call (or paginated list) of a plan.
+
+    Attributes:
+        source: "match" (view endpoint), "day" or "championship" (list endpoints)
+        value: Match ID, ``YYYYMMDD`` day or championship ID
+        calls: Estimated requests for this step
+        known: Whether the page count was observed rather than assumed
+        covers: Requested match IDs this step is expected to return
+        complete: Every page is needed (a requested day or championship)
+    """
+    source: Source
+    value: str
+    calls: int
+    known: bool = True
+    covers: Tuple[str, ...] = ()
+    complete: bool = False
+
+
+@dataclass
+class FetchPlan:
+    """Steps of the cheapest strategy for a need, with the estimates of the alternatives.
+
+    Attributes:
+        need: The planned need
+        strategy: Name of the chosen strategy
+        steps: Steps of the chosen strategy
+        alternatives: Estimated calls of every strategy considered
+    """
+    need: DataNeed
+    strategy: str
+    steps: List[PlanStep]
+    alternatives: Dict[str, int]
+
+    @property
+    def estimated_calls(self) -> int:
+        """Estimated requests of the chosen strategy."""
+        return sum(step.calls for step in self.steps)
+
+    @property
+    def assumed_pages(self) -> int:
+        """Steps whose page count is a default guess rather than observed."""
+        return sum(1 for step in self.steps if not step.known)
+
+    def summary(self) -> str:
+        """One-line description of the estimate, e.g. for logs and dry runs."""
+        counts: Dict[str, int] = {}
+        for step in self.steps:
+            counts[step.source] = counts.get(step.source, 0) + 1
+        parts = [f"{counts[source]} {source}" for source in ("day", "championship", "match") if source in counts]
+        alternatives = ", ".join(f"{name} {calls}" for name, calls in self.alternatives.items())
+        text = (
+            f"{self.strategy}: ~{self.estimated_calls} {self.need.detail} calls "
+            f"({', '.join(parts) or 'nothing to fetch'}); alternatives: {alternatives}"
+        )
+        if self.assumed_pages:
+            text += f"; {self.assumed_pages} page counts assumed"
+        return text
+
+
+@dataclass
+class FetchResult:
+    """Outcome of executing a plan.
+
+    Attributes:
+        plan: The executed plan
+        matches: Every fetched match by ID, including other matches on fetched pages
+        calls: Requests actually sent
+        missing: Requested match IDs the API did not return
+    """
+    plan: FetchPlan
+    matches: Dict[str, Match] = field(default_factory=dict)
+    calls: int = 0
+    missing: List[str] = field(default_factory=list)
+
+
+class FetchPlanner:
+    """Chooses the cheapest mix of view, day and championship endpoints for a need.
+
+    Match IDs can be fetched one call each (``get_view_*``), or from the
+    pages of their day (``get_by_day_*``) or championship
+    (``get_by_filter_*``) when the need says which day or championship they
+    belong to. The planner estimates the call count of each strategy - one
+    call per match, by day, by championship and a greedy mix of both -
+    from the page counts it knows, and picks the cheapest. A list is only
+    used for a group of matches when its pages cost fewer calls than the
+    matches it covers.
+
+    Page counts are learned from the pagination of every list response the
+    planner executes (or is shown via ``observe``), so estimates improve as
+    a planner instance is reused; unseen lists use ``default_pages``.
+
+    Execution adapts to the real page counts: when the first page of a list
+    reveals more pages than the matches still missing from it, the rest of
+    the list is skipped and those matches are fetched individually, as are
+    matches a list did not contain (e.g. a wrong date).
+
+    Example:
+        >>> planner = FetchPlanner()
+        >>> need = DataNeed(match_ids=ids, match_dates=dates, odds=True)
+        >>> planner.run(client, need, dry_run=True).plan.summary()
+        'mixed: ~6 full calls (4 day, 2 match); alternatives: per-match 40, ...'
+        >>> result = planner.run(client, need)
+    """
+
+    def __init__(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+        default_pages: Optional[Mapping[Source, int]] = None,
+        known_items: Optional[Mapping[Tuple[Source, str], int]] = None,
+    ):
+        """Initialize the planner.
+
+        Args:
+            per_page: Page size assumed until a response reports it
+            default_pages: Page counts assumed for unseen days and championships
+            known_items: Item counts per (source, value) from earlier runs,
+                e.g. a saved ``known_items`` of another planner
+        """
+        self.per_page = per_page
+        self.default_pages: Dict[Source, int] = {**DEFAULT_PAGES, **(default_pages or {})}
+        self.known_items: Dict[Tuple[Source, str], int] = dict(known_items or {})
+        self._page_sizes: Dict[Tuple[Source, str], int] = {}
+
+    # =========================================================================
+    # Estimation
+    # =========================================================================
+
+    def observe(self, source: Source, value: str, response: APIResponse, detail: str = "basic") -> None:
+        """Learn the size of a day or championship list from one of its responses.
+
+        Args:
+            source: "day" or "championship"
+            value: ``YYYYMMDD`` day or championship ID
+            response: Any page of the list
+            detail: "basic" or "full" endpoint that answered
+        """
+        pagination = response.pagination_info
+        if source == "match" or pagination is None:
+            return
+        self.known_items[(source, value)] = pagination.items
+        if pagination.per_page > 0:
+            self._page_sizes[(source, detail)] = pagination.per_page
+
+    def estimate(self, source: Source, value: str, detail: str = "basic") -> Tuple[int, bool]:
+        """Estimated calls to fetch a match, or every page of a list.
+
+        Returns:
+            Call count and whether it is based on an observed list size
+        """
+        if source == "match":
+            return 1, True
+        items = self.known_items.get((source, value))
+        if items is None:
+            return self.default_pages[source], False
+        per_page = self._page_sizes.get((source, detail), self.per_page)
+        return max(1, math.ceil(items / per_page)), True
+
+    # =========================================================================
+    # Planning
+    # =========================================================================
+
+    def plan(self, need: DataNeed) -> FetchPlan:
+        """Estimate every strategy for a need and pick the cheapest.
+
+        Ties go to the strategy listed first (one call per match), which
+        relies least on assumed page counts.
+
+        Args:
+            need: Matches, days and championships to fetch
+
+        Returns:
+            The cheapest plan, with the estimates of all strategies
+        """
+        detail = need.detail
+        day_of = {match_id: normalize_date_hint(day) for match_id, day in need.match_dates.items()}
+        championship_of = dict(need.match_championships)
+        match_ids = list(dict.fromkeys(need.match_ids))
+
+        # Requested days and championships are fetched completely and cover their matches for free
+        required: List[PlanStep] = []
+        covered: Set[str] = set()
+        for source, values, hints in (
+            ("day", dict.fromkeys(normalize_date_hint(day) for day in need.dates), day_of),
+            ("championship", dict.fromkeys(need.championship_ids), championship_of),
+        ):
+            for value in values:
+                calls, known = self.estimate(source, value, detail)
+                covers = tuple(match_id for match_id in match_ids if hints.get(match_id) == value)
+                required.append(PlanStep(source, value, calls, known, covers, complete=True))
+                covered.update(covers)
+        remaining = [match_id for match_id in match_ids if match_id not in covered]
+
+        day_groups = self._groups("day", remaining, day_of)
+        championship_groups = self._groups("championship", remaining, championship_of)
+        strategies = {
+            "per-match": {},
+            "by-day": day_groups,
+            "by-championship": championship_groups,
+            "mixed": {**day_groups, **championship_groups},
+        }
+        plans = {
+            name: required + self._cover(remaining, groups, detail)
+            for name, groups in strategies.items()
+        }
+        alternatives = {name: sum(step.calls for step in steps) for name, steps in plans.items()}
+        strategy = min(alternatives, key=alternatives.get)
+        return FetchPlan(need, strategy, plans[strategy], alternatives)
+
+    @staticmethod
+    def _groups(
+        source: Source, match_ids: Sequence[str], hints: Mapping[str, str],
+    ) -> Dict[Tuple[Source, str], Set[str]]:
+        groups: Dict[Tuple[Source, str], Set[str]] = {}
+        for match_id in match_ids:
+            if match_id in hints:
+                groups.setdefault((source, hints[match_id]), set()).add(match_id)
+        return groups
+
+    def _cover(
+        self, match_ids: Sequence[str], groups: Mapping[Tuple[Source, str], Set[str]], detail: str,
+    ) -> List[PlanStep]:
+        """Greedily cover match IDs with the lists of lowest cost per match, then single calls."""
+        left = set(match_ids)
+        steps: List[PlanStep] = []
+        while left:
+            best: Optional[Tuple[Tuple[float, bool], PlanStep]] = None
+            for (source, value), members in groups.items():
+                members = members & left
+                if not members:
+                    continue
+                calls, known = self.estimate(source, value, detail)
+                # Days are preferred on equal cost: they are smaller and their size is less volatile
+                rank = (calls / len(members), source != "day")
+                if rank[0] < 1 and (best is None or rank < best[0]):
+                    best = rank, PlanStep(source, value, calls, known, tuple(sorted(members)))
+            if best is None:
+                break
+            steps.append(best[1])
+            left -= set(best[1].covers)
+        steps.extend(PlanStep("match", match_id, 1, covers=(match_id,)) for match_id in match_ids if match_id in left)
+        return steps
+
+    # =========================================================================
+    # Execution
+    # =========================================================================
+
+    def run(self, client: Any, need: DataNeed, dry_run: bool = False, language: Optional[str] = None) -> FetchResult:
+        """Plan a need, log the estimate and execute it with a sync client.
+
+        Args:
+            client: Sync client (``HTTPXClient``)
+            need: Matches, days and championships to fetch
+            dry_run: Only plan; no request is sent
+            language: Language of the fetched matches
+
+        Returns:
+            The fetched matches with the plan (no matches on a dry run)
+        """
+        plan = self.plan(need)
+        logger.info("Fetch plan %s", plan.summary())
+        if dry_run:
+            return FetchResult(plan)
+        return self.execute(client, plan, language)
+
+    async def arun(
+        self,
+        client: Any,
+        need: DataNeed,
+        dry_run: bool = False,
+        language: Optional[str] = None,
+        concurrency: int = 8,
+    ) -> FetchResult:
+        """Plan a need, log the estimate and execute it with an async client.
+
+        Args:
+            client: Async client (``AsyncHTTPXClient``)
+            need: Matches, days and championships to fetch
+            dry_run: Only plan; no request is sent
+            language: Language of the fetched matches
+            concurrency: Maximum requests in flight
+
+        Returns:
+            The fetched matches with the plan (no matches on a dry run)
+        """
+        plan = self.plan(need)
+        logger.info("Fetch plan %s", plan.summary())
+        if dry_run:
+            return FetchResult(plan)
+        return await self.aexecute(client, plan, language, concurrency)
+
+    def execute(self, client: Any, plan: FetchPlan, language: Optional[str] = None) -> FetchResult:
+        """Execute a plan with a sync client, one request at a time."""
+        result = FetchResult(plan)
+        detail = plan.need.detail
+        for step in plan.steps:
+            fetch = self._fetcher(client, step, detail, language)
+            pages = self._collect(step, detail, fetch(1), result)
+            for page in self._remaining_pages(step, pages, result):
+                self._collect(step, detail, fetch(page), result)
+
+        for match_id in self._fallback(plan, result):
+            step = PlanStep("match", match_id, 1)
+            self._collect(step, detail, self._fetcher(client, step, detail, language)(1), result)
+        result.missing = [match_id for match_id in dict.fromkeys(plan.need.match_ids) if match_id not in result.matches]
+        return result
+
+    async def aexecute(
+        self,
+        client: Any,
+        plan: FetchPlan,
+        language: Optional[str] = None,
+        concurrency: int = 8,
+    ) -> FetchResult:
+        """Execute a plan with an async client, fetching steps and pages concurrently."""
+        result = FetchResult(plan)
+        detail = plan.need.detail
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(step: PlanStep, page: int) -> int:
+            async with semaphore:
+                response = await self._fetcher(client, step, detail, language)(page)
+            return self._collect(step, detail, response, result)
+
+        async def run_step(step: PlanStep) -> None:
+            pages = await fetch_page(step, 1)
+            await asyncio.gather(*(fetch_page(step, page) for page in self._remaining_pages(step, pages, result)))
+
+        await asyncio.gather(*(run_step(step) for step in plan.steps))
+        await asyncio.gather(*(
+            run_step(PlanStep("match", match_id, 1)) for match_id in self._fallback(plan, result)
+        ))
+        result.missing = [match_id for match_id in dict.fromkeys(plan.need.match_ids) if match_id not in result.matches]
+        return result
+
+    @staticmethod
+    def _fetcher(client: Any, step: PlanStep, detail: str, language: Optional[str]) -> Callable[[int], Any]:
+        """Page fetcher of a step; returns responses for sync clients and awaitables for async ones."""
+        matches = client.matches
+        full = detail == "full"
+        if step.source == "match":
+            view = matches.get_view_full if full else matches.get_view_basic
+            return lambda page: view(step.value, language=language)
+        if step.source == "day":
+            by_day = matches.get_by_day_full if full else matches.get_by_day_basic
+            return lambda page: by_day(step.value, page=page, language=language)
+        by_filter = matches.get_by_filter_full if full else matches.get_by_filter_basic
+        return lambda page: by_filter(championship_id=step.value, page=page, language=language)
+
+    def _collect(self, step: PlanStep, detail: str, response: APIResponse, result: FetchResult) -> int:
+        """Record a response in the result and return its page count."""
+        result.calls += 1
+        self.observe(step.source, step.value, response, detail)
+        for match in response.result:
+            if match.id is not None:
+                result.matches[match.id] = match
+        return response.page_count if step.source != "match" else 1
+
+    @staticmethod
+    def _remaining_pages(step: PlanStep, pages: int, result: FetchResult) -> range:
+        """Pages after the first still worth fetching for a step."""
+        if step.complete:
+            return range(2, pages + 1)
+        missing = sum(1 for match_id in step.covers if match_id not in result.matches)
+        if not missing or pages - 1 > missing:
+            # Cheaper to fetch the missing matches individually
+            return range(0)
+        return range(2, pages + 1)
+
+    @staticmethod
+    def _fallback(plan: FetchPlan, result: FetchResult) -> List[str]:
+        """Requested matches a list step was expected to return but did not."""
+        return list(dict.fromkeys(
+            match_id
+            for step in plan.steps if step.source != "match"
+            for match_id in step.covers if match_id not in result.matches
+        ))
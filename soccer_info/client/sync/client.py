@@ -1,9 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Type, Optional
 
-from soccer_info.requests_.parameters import BaseParameters
-from soccer_info.requests_.headers import Header
-from soccer_info.client.base_client import BaseClient, T
+from soccer_info.client.base_client import BaseClient, RequestHeaders, RequestParams, T
+from soccer_info.client.pipeline import Parser, RequestSpec
 from soccer_info.settings import Settings
 
 
@@ -50,23 +49,39 @@ class Client(BaseClient, ABC):
         """Close the HTTP client and release resources."""
         ...
 
-    @abstractmethod
     def do_request(
         self,
         endpoint: str,
-        params: BaseParameters,
-        headers: Header,
+        params: RequestParams,
+        headers: RequestHeaders,
         response_model: Type[T],
     ) -> T:
         """Execute HTTP request to API endpoint.
         
         Args:
             endpoint: API endpoint path (e.g., "/championships/list/")
-            params: Request parameters to include in the API call
-            headers: HTTP headers including RapidAPI authentication
+            params: Request parameters to include in the API call, as a
+                parameters model or an already serialized mapping
+            headers: HTTP headers including RapidAPI authentication, as a
+                Header model or an already serialized mapping
             response_model: Pydantic model class for response validation
             
         Returns:
             Validated response object of the specified model type
         """
+        return self.execute(self._request_spec(endpoint, params, headers, response_model))
+
+    @abstractmethod
+    def execute(self, spec: RequestSpec[T], parser: Optional[Parser] = None) -> T:
+        """Send a request through the middleware pipeline and validate its response.
+
+        Args:
+            spec: Request to send and the model to validate the response with
+            parser: Turns the raw response into the result instead of
+                validating it with the spec's model (e.g. to defer validation)
+
+        Returns:
+            Validated response object of the spec's model type, or what
+            ``parser`` returned
+        """
         ...
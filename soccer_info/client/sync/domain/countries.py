@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from soccer_info.requests_ import CountryListParameters
 from soccer_info.responses import CountryListResponse
 from ..client import Client
 from ...common.domain.countries import Countries as CommonCountries
@@ -17,11 +16,4 @@ class Countries(CommonCountries):
         self,
         format_: Optional[str] = None,
     ) -> CountryListResponse:
-        return self.client.do_request(
-            endpoint="/countries/list/",
-            params=CountryListParameters(
-                format=format_,
-            ),
-            headers=self._header_provider(),
-            response_model=CountryListResponse,
-        )
+        return self.client.execute(self._get_list_spec(format_))
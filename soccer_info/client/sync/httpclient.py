@@ -1,10 +1,19 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import httpx
-from typing import Optional, Type
+from typing import Any, Dict, Hashable, List, Mapping, Optional
 
-from soccer_info.requests_.headers import Header
-from soccer_info.requests_.parameters import BaseParameters
-from soccer_info.responses.base import ResponseHeaders
 from soccer_info.settings import Settings
+from soccer_info.client.connection import (
+    WARMUP_METHOD,
+    WARMUP_PATH,
+    httpx_client_options,
+    warmup_connection_count,
+)
+from soccer_info.client.pipeline import Call, Effect, Parser, RequestSpec, Send, Shared, Sleep, drive
+from soccer_info.client.timing import TimingCollector
 from .client import Client, T
 
 
@@ -23,58 +32,220 @@ class HTTPXClient(Client):
         self,
         settings: Settings,
         default_language: Optional[str] = None,
+        transport: Optional[httpx.BaseTransport] = None,
     ):
         """Initialize the httpx-based client.
         
         Args:
             settings: API configuration including authentication credentials
             default_language: Preferred language for API responses
+            transport: Custom httpx transport (e.g. ``httpx.MockTransport`` for
+                tests and benchmarks). Defaults to httpx's network transport.
         """
         super().__init__(settings, default_language)
+        self._transport = transport
         self._http_client: Optional[httpx.Client] = None
+        self._http_client_lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._in_flight_lock = threading.Lock()
 
     @property
     def http_client(self) -> httpx.Client:
         """Lazily initialize and return the httpx client.
         
         The client is created on first access and reused for subsequent requests.
+        Creation is locked so threads racing on the first request share one
+        connection pool.
         """
-        if self._http_client is None:
-            self._http_client = httpx.Client(
-                base_url=self.settings.base_url,
-                timeout=self.settings.request_timeout,
-            )
-        return self._http_client
+        http_client = self._http_client
+        if http_client is None:
+            with self._http_client_lock:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(
+                        transport=self._transport,
+                        **httpx_client_options(self.settings),
+                    )
+                http_client = self._http_client
+        return http_client
+
+    def warmup(self, connections: Optional[int] = None) -> int:
+        """Pre-open pooled connections so the first requests skip TCP and TLS setup.
+
+        Sends concurrent unauthenticated ``HEAD /`` requests and keeps each
+        response open until all are established, forcing every request onto
+        its own connection. The connections are then returned to the pool.
+
+        Args:
+            connections: Number of connections to open. Defaults to one for
+                HTTP/2 and to ``settings.max_keepalive_connections`` otherwise.
+
+        Returns:
+            Number of connections opened
+
+        Raises:
+            httpx.HTTPError: If no connection could be opened
+        """
+        count = warmup_connection_count(self.settings, connections)
+        if count <= 0:
+            return 0
+
+        client = self.http_client
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [
+                executor.submit(client.send, client.build_request(WARMUP_METHOD, WARMUP_PATH), stream=True)
+                for _ in range(count)
+            ]
+
+        opened: List[httpx.Response] = []
+        errors: List[BaseException] = []
+        for future in futures:
+            error = future.exception()
+            if error is None:
+                opened.append(future.result())
+            else:
+                errors.append(error)
+        for response in opened:
+            # Reading the (empty) body completes the exchange so the connection stays pooled
+            response.read()
+            response.close()
+
+        if errors and not opened:
+            raise errors[0]
+        return len(opened)
 
     def close(self) -> None:
         """Close the httpx client and release resources."""
-        if self._http_client is not None:
-            self._http_client.close()
-            self._http_client = None
+        with self._http_client_lock:
+            http_client, self._http_client = self._http_client, None
+        if http_client is not None:
+            http_client.close()
 
-    def do_request(
-        self,
-        endpoint: str,
-        params: BaseParameters,
-        headers: Header,
-        response_model: Type[T],
-    ) -> T:
+    def execute(self, spec: RequestSpec[T], parser: Optional[Parser] = None) -> T:
         """Raises:
             httpx.HTTPStatusError: If the request fails with non-2xx status
             RuntimeError: If the response indicates an API error
         """
-        response = self.http_client.get(
-            endpoint,
-            params=params.to_dict(),
-            headers=headers.to_dict(),
+        call = Call(spec) if parser is None else Call(spec, parser=parser)
+        trace = self.instrumentation.trace(spec.endpoint)
+        if trace is not None:
+            call.extensions["trace"] = trace
+        try:
+            parsed = drive(self.pipeline.flow(call), self._perform)
+            timings: Optional[TimingCollector] = call.extensions.get("timings")
+            # A coalesced call shares the model of the call it waited for; its timings are that call's
+            if timings is not None and call.response is not None and not call.extensions.get("coalesced"):
+                parsed.response_timings = timings.build(
+                    http_version=call.response.http_version,
+                    validation=call.validation_seconds,
+                )
+        except BaseException as error:
+            if trace is not None:
+                trace.error(error)
+            raise
+
+        if trace is not None:
+            trace.parse_end()
+        return parsed
+
+    def _perform(self, effect: Effect) -> Any:
+        """Perform one effect of a pipeline flow."""
+        if isinstance(effect, Send):
+            return self._perform_send(effect.call)
+        if isinstance(effect, Sleep):
+            time.sleep(effect.seconds)
+            return None
+        if isinstance(effect, Shared):
+            return self._perform_shared(effect)
+        raise TypeError(f"Unsupported pipeline effect: {effect!r}")
+
+    def _perform_send(self, call: Call) -> httpx.Response:
+        trace = call.extensions.get("trace")
+        if trace is not None:
+            trace.attempt_start()
+            # The sync client only throttles pooled keys (in _send); report an immediate throttle end
+            trace.throttle_end()
+
+        # Resolve the lazily created client first so its setup is not timed as pool wait
+        http_client = self.http_client
+        timings = TimingCollector() if self.settings.collect_timings else None
+        call.extensions["timings"] = timings
+        response = self._send(
+            http_client,
+            call.spec.endpoint,
+            params=call.spec.params,
+            headers=call.spec.headers,
+            extensions={"trace": timings.record} if timings is not None else None,
         )
+        if timings is not None:
+            timings.response_read()
 
-        response.raise_for_status()
+        if trace is not None:
+            trace.response(response.status_code, len(response.content))
+        return response
 
-        # Parse JSON response
-        parsed = response_model.model_validate_json(response.text)
+    def _perform_shared(self, effect: Shared) -> Any:
+        """Run ``effect.start()`` unless a flow with the same key is in flight, then wait for that one."""
+        with self._in_flight_lock:
+            future = self._in_flight.get(effect.key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[effect.key] = Future()
+        if not leader:
+            if effect.call is not None:
+                effect.call.mark_coalesced()
+            return future.result()
 
-        # Parse and attach response headers (Pydantic handles normalization and type conversion)
-        parsed.response_headers = ResponseHeaders.model_validate(dict(response.headers))
+        try:
+            result = drive(effect.start(), self._perform)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[effect.key]
 
-        return parsed
+    def _send(
+        self,
+        http_client: httpx.Client,
+        endpoint: str,
+        params: Mapping[str, Any],
+        headers: Mapping[str, str],
+        extensions: Optional[Dict[str, Any]],
+    ) -> httpx.Response:
+        """Send a GET request, routing it through the key pool when one is configured.
+
+        Pooled keys are throttled individually. A request answered with 429
+        drains its key and is retried on another one until the pool raises
+        ``QuotaExhaustedError``.
+        """
+        if self.key_pool is None:
+            return http_client.get(endpoint, params=params, headers=headers, extensions=extensions)
+
+        while True:
+            key_state, wait_time = self.key_pool.reserve()
+            if wait_time > 0:
+                try:
+                    time.sleep(wait_time)
+                except BaseException:
+                    self.key_pool.release(key_state)
+                    raise
+            if self.key_pool.is_drained(key_state):
+                self.key_pool.release(key_state)
+                continue
+
+            try:
+                response = http_client.get(
+                    endpoint,
+                    params=params,
+                    headers={**headers, **key_state.headers},
+                    extensions=extensions,
+                )
+            except BaseException:
+                self.key_pool.release(key_state)
+                raise
+            self.key_pool.release(key_state, response.status_code, response.headers)
+            if response.status_code != 429:
+                return response
@@ -0,0 +1,73 @@
+import time
+from typing import Any, Dict, Optional
+
+from soccer_info.responses.base import RequestTimings
+
+
+class TimingCollector:
+    """Collects httpx/httpcore trace events for a single request.
+
+    Pass ``record`` (sync clients) or ``arecord`` (async clients) as the
+    ``trace`` request extension; httpcore then reports connection, TLS,
+    send and receive phases as ``<layer>.<phase>.started/complete`` events.
+
+    Pool acquisition has no event of its own. It is derived as the time
+    between issuing the request and the first connection activity (a new
+    TCP connect, or sending headers on a reused connection).
+    """
+
+    __slots__ = ('started', 'finished', '_events')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self._events: Dict[str, float] = {}
+
+    def record(self, name: str, info: Dict[str, Any]) -> None:
+        """Trace callback for sync transports."""
+        # Drop the layer prefix ("connection.", "http11.", "http2.") so HTTP/1.1 and HTTP/2 share names
+        self._events.setdefault(name.partition('.')[2], time.perf_counter())
+
+    async def arecord(self, name: str, info: Dict[str, Any]) -> None:
+        """Trace callback for async transports."""
+        self.record(name, info)
+
+    def response_read(self) -> None:
+        """Mark the moment the full response body was read."""
+        self.finished = time.perf_counter()
+
+    def _span(self, start: str, end: str) -> Optional[float]:
+        if start in self._events and end in self._events:
+            return self._events[end] - self._events[start]
+        return None
+
+    def build(self, http_version: Optional[str] = None, validation: Optional[float] = None) -> RequestTimings:
+        """Compute the timing breakdown from the recorded events.
+
+        Args:
+            http_version: Negotiated HTTP version of the response
+            validation: Seconds spent parsing and validating the body
+
+        Returns:
+            Timing breakdown for the request
+        """
+        events = self._events
+        reused = None
+        first_activity = None
+        if 'connect_tcp.started' in events:
+            reused, first_activity = False, events['connect_tcp.started']
+        elif 'send_request_headers.started' in events:
+            reused, first_activity = True, events['send_request_headers.started']
+
+        return RequestTimings(
+            pool_acquire=first_activity - self.started if first_activity is not None else None,
+            connect=self._span('connect_tcp.started', 'connect_tcp.complete'),
+            tls_handshake=self._span('start_tls.started', 'start_tls.complete'),
+            request_send=self._span('send_request_headers.started', 'send_request_body.complete'),
+            time_to_first_byte=self._span('send_request_body.complete', 'receive_response_headers.complete'),
+            body_download=self._span('receive_response_body.started', 'receive_response_body.complete'),
+            validation=validation,
+            network_total=self.finished - self.started if self.finished is not None else None,
+            connection_reused=reused,
+            http_version=http_version,
+        )
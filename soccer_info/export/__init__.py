@@ -0,0 +1,20 @@
+"""Streaming export of parsed items to NDJSON, CSV and Parquet files."""
+from .base import FileSink, Sink, TextFileSink, compression_for, open_text, part_path
+from .csv_ import CSVSink, csv_columns, flatten, read_csv_header
+from .ndjson import NDJSONSink
+from .parquet import ParquetSink
+
+__all__ = [
+    'Sink',
+    'FileSink',
+    'TextFileSink',
+    'NDJSONSink',
+    'CSVSink',
+    'ParquetSink',
+    'open_text',
+    'compression_for',
+    'part_path',
+    'flatten',
+    'csv_columns',
+    'read_csv_header',
+]
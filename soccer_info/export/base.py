@@ -0,0 +1,294 @@
+import gzip
+import io
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, IO, Iterable, List, Literal, Optional, TextIO, Union
+
+from soccer_info.responses import ResponseComponent
+
+Compression = Literal["gzip", "zstd"]
+Target = Union[str, Path, TextIO]
+
+_COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+
+def compression_for(path: Path) -> Optional[Compression]:
+    """Compression implied by a file suffix (``.gz`` or ``.zst``), if any."""
+    return _COMPRESSION_SUFFIXES.get(path.suffix)
+
+
+def open_text(path: Path, mode: str = "w", compression: Optional[Compression] = None) -> TextIO:
+    """Open a UTF-8 text file, optionally gzip or zstd compressed.
+
+    Appending to a compressed file adds a new compressed frame, which
+    standard readers decompress as one stream.
+
+    Args:
+        path: File to open
+        mode: "r", "w" or "a"
+        compression: None, "gzip" or "zstd"
+
+    Raises:
+        ImportError: If zstd is requested and neither ``compression.zstd``
+            (Python 3.14+) nor the ``zstandard`` package is available
+    """
+    if compression is None:
+        return open(path, mode, encoding="utf-8", newline="")
+    if compression == "gzip":
+        return gzip.open(path, f"{mode}t", encoding="utf-8", newline="")
+    try:
+        from compression import zstd
+        return zstd.open(path, f"{mode}t", encoding="utf-8", newline="")
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError as error:
+        raise ImportError(
+            "zstd compression requires Python 3.14+ or the zstandard package; "
+            "install it with `pip install soccer-info[compression]`"
+        ) from error
+    return zstandard.open(path, f"{mode}t", encoding="utf-8", newline="")
+
+
+def part_path(path: Path, index: int) -> Path:
+    """Path of one rolled part, e.g. ``matches.ndjson.gz`` -> ``matches-00003.ndjson.gz``."""
+    stem, dot, suffixes = path.name.partition(".")
+    return path.with_name(f"{stem}-{index:05d}{dot}{suffixes}")
+
+
+class Sink(ABC):
+    """Writes a stream of parsed items with bounded buffering.
+
+    Items are buffered and written in batches once ``buffer_items`` are
+    waiting or ``flush_seconds`` passed since the last flush, so memory use
+    stays constant however long the stream is. ``write_many`` buffers a
+    whole batch (e.g. one result page) before checking, so a batch is never
+    split across flushes.
+
+    Sinks are context managers; leaving the block flushes and closes them.
+    """
+
+    def __init__(
+        self,
+        buffer_items: int = 1000,
+        flush_seconds: Optional[float] = 5.0,
+        on_flush: Optional[Callable[[], None]] = None,
+    ):
+        """Initialize the sink.
+
+        Args:
+            buffer_items: Items buffered before they are written
+            flush_seconds: Maximum seconds between flushes while items arrive;
+                None flushes on buffer size only
+            on_flush: Called after every flush that wrote items, e.g. to
+                record crawl progress only once items are durable
+        """
+        if buffer_items < 1:
+            raise ValueError("buffer_items must be at least 1")
+        self.buffer_items = buffer_items
+        self.flush_seconds = flush_seconds
+        self.on_flush = on_flush
+        self.items_written = 0
+        self._buffer: List[ResponseComponent] = []
+        self._last_flush = time.monotonic()
+        self._closed = False
+
+    def __enter__(self) -> 'Sink':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def write(self, item: ResponseComponent) -> None:
+        """Buffer one item, flushing if the buffer is full or the flush interval passed."""
+        self._buffer.append(item)
+        self._maybe_flush()
+
+    def write_many(self, items: Iterable[ResponseComponent]) -> None:
+        """Buffer a batch of items, then flush if the buffer is full or the flush interval passed."""
+        self._buffer.extend(items)
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if len(self._buffer) >= self.buffer_items or (
+            self.flush_seconds is not None and time.monotonic() - self._last_flush >= self.flush_seconds
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered items and flush them to the output."""
+        if self._closed:
+            raise ValueError("Sink is closed")
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        items, self._buffer = self._buffer, []
+        self._write_batch(items)
+        self.items_written += len(items)
+        if self.on_flush is not None:
+            self.on_flush()
+
+    def close(self) -> None:
+        """Flush the remaining items and release the output."""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._close()
+
+    @abstractmethod
+    def _write_batch(self, items: List[ResponseComponent]) -> None:
+        """Write and flush a batch of items."""
+        ...
+
+    def _close(self) -> None:
+        pass
+
+
+class FileSink(Sink):
+    """Sink writing to one file, a series of rolled files, or an open stream.
+
+    With ``max_file_items`` the output rolls over to a new part file
+    (``name-00000.ext``, ``name-00001.ext``, ...) once a part holds that
+    many items. Appending to rolled output starts a new part after the
+    existing ones.
+
+    Attributes:
+        paths: Files written so far, in order
+    """
+
+    def __init__(
+        self,
+        target: Target,
+        max_file_items: Optional[int] = None,
+        append: bool = False,
+        buffer_items: int = 1000,
+        flush_seconds: Optional[float] = 5.0,
+        on_flush: Optional[Callable[[], None]] = None,
+    ):
+        """Initialize the file sink.
+
+        Args:
+            target: Output path, or an open stream (no rolling, never closed by the sink)
+            max_file_items: Items per part file; None writes a single file
+            append: Append to an existing file instead of replacing it
+            buffer_items: Items buffered before they are written
+            flush_seconds: Maximum seconds between flushes while items arrive
+            on_flush: Called after every flush that wrote items
+        """
+        super().__init__(buffer_items, flush_seconds, on_flush)
+        if max_file_items is not None and max_file_items < 1:
+            raise ValueError("max_file_items must be at least 1")
+        self.stream: Optional[IO] = None if isinstance(target, (str, Path)) else target
+        self.path: Optional[Path] = Path(target) if isinstance(target, (str, Path)) else None
+        if self.stream is not None and max_file_items is not None:
+            raise ValueError("Rolling output requires a file path")
+        self.max_file_items = max_file_items
+        self.append = append
+        self.paths: List[Path] = []
+        self._part = 0
+        self._file_items = 0
+        self._is_open = False
+
+    def _next_path(self) -> Path:
+        if self.max_file_items is None:
+            return self.path
+        path = part_path(self.path, self._part)
+        while self.append and path.exists():
+            self._part += 1
+            path = part_path(self.path, self._part)
+        self._part += 1
+        return path
+
+    def _write_batch(self, items: List[ResponseComponent]) -> None:
+        start = 0
+        while start < len(items):
+            if not self._is_open:
+                if self.stream is None:
+                    path = self._next_path()
+                    self.paths.append(path)
+                    self._open_file(path)
+                else:
+                    self._open_file(None)
+                self._is_open = True
+                self._file_items = 0
+            end = len(items) if self.max_file_items is None else start + self.max_file_items - self._file_items
+            chunk = items[start:end]
+            self._write_chunk(chunk)
+            self._file_items += len(chunk)
+            start += len(chunk)
+            if self.max_file_items is not None and self._file_items >= self.max_file_items:
+                self._close_file()
+                self._is_open = False
+        if self._is_open:
+            self._flush_file()
+
+    def _close(self) -> None:
+        if self._is_open:
+            self._close_file()
+            self._is_open = False
+
+    @abstractmethod
+    def _open_file(self, path: Optional[Path]) -> None:
+        """Open the output for ``path``, or wrap ``self.stream`` when path is None."""
+        ...
+
+    @abstractmethod
+    def _write_chunk(self, items: List[ResponseComponent]) -> None:
+        ...
+
+    def _flush_file(self) -> None:
+        pass
+
+    @abstractmethod
+    def _close_file(self) -> None:
+        ...
+
+
+class TextFileSink(FileSink):
+    """File sink for line-oriented text formats, compressed by suffix or explicitly.
+
+    Attributes:
+        compression: None, "gzip" or "zstd"; defaults to the one implied by the
+            path suffix (``.gz``, ``.zst``)
+    """
+
+    def __init__(self, target: Target, compression: Optional[Compression] = None, **options: Any):
+        """Initialize the text sink.
+
+        Args:
+            target: Output path or open text stream
+            compression: Compression of path outputs; inferred from the suffix when None
+            **options: ``FileSink`` options (max_file_items, append, buffer_items, ...)
+        """
+        super().__init__(target, **options)
+        if compression is None and self.path is not None:
+            compression = compression_for(self.path)
+        self.compression = compression
+        self._file: Optional[TextIO] = None
+
+    def _open_file(self, path: Optional[Path]) -> None:
+        if path is None:
+            self._file = self.stream
+            return
+        self._file = open_text(path, "a" if self.append else "w", self.compression)
+
+    def _flush_file(self) -> None:
+        self._file.flush()
+
+    def _close_file(self) -> None:
+        if self._file is not self.stream:
+            self._file.close()
+        else:
+            self._file.flush()
+        self._file = None
+
+    def _has_content(self, path: Optional[Path]) -> bool:
+        """Whether output is appended after existing content (e.g. a CSV header)."""
+        if path is None:
+            return isinstance(self.stream, io.TextIOBase) and self.stream.seekable() and self.stream.tell() > 0
+        return self.append and path.exists() and path.stat().st_size > 0
@@ -0,0 +1,85 @@
+import csv
+import json
+import typing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
+
+from soccer_info.responses import ResponseComponent
+from .base import Target, TextFileSink, compression_for, open_text
+
+
+def flatten(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested dictionaries into dotted keys; lists are kept as JSON text."""
+    row: Dict[str, Any] = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            row.update(flatten(value, f"{name}."))
+        elif isinstance(value, list):
+            row[name] = json.dumps(value, ensure_ascii=False)
+        else:
+            row[name] = value
+    return row
+
+
+def csv_columns(model: Type[ResponseComponent], prefix: str = "") -> List[str]:
+    """Flattened CSV columns of a model: dotted nested fields, lists as one JSON column."""
+    columns: List[str] = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if typing.get_origin(annotation) is Union:
+            args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+            annotation = args[0] if len(args) == 1 else annotation
+        if isinstance(annotation, type) and issubclass(annotation, ResponseComponent):
+            columns.extend(csv_columns(annotation, f"{prefix}{name}."))
+        else:
+            columns.append(f"{prefix}{name}")
+    return columns
+
+
+def read_csv_header(path: Path) -> Optional[List[str]]:
+    """Column names of an existing CSV file (compression inferred from its suffix)."""
+    if not path.exists() or path.stat().st_size == 0:
+        return None
+    with open_text(path, "r", compression_for(path)) as f:
+        line = f.readline().rstrip("\r\n")
+    return next(csv.reader([line])) if line else None
+
+
+class CSVSink(TextFileSink):
+    """Writes items as flattened CSV rows, optionally compressed and rolled over.
+
+    Columns come from the item model, so every row and every part file has
+    the same header even when nested objects (e.g. odds) are missing.
+    Appending to an existing file keeps its header; fields not in it are
+    dropped and missing fields are left empty.
+    """
+
+    def __init__(self, target: Target, fieldnames: Optional[Sequence[str]] = None, **options: Any):
+        """Initialize the CSV sink.
+
+        Args:
+            target: Output path or open text stream
+            fieldnames: Columns to write; defaults to the columns of the first item's model
+            **options: ``TextFileSink`` options (compression, max_file_items, append, ...)
+        """
+        super().__init__(target, **options)
+        self.fieldnames: Optional[List[str]] = list(fieldnames) if fieldnames else None
+        self._writer: Optional[csv.DictWriter] = None
+
+    def _open_file(self, path: Optional[Path]) -> None:
+        existing = self._has_content(path)
+        if existing and path is not None and self.fieldnames is None:
+            self.fieldnames = read_csv_header(path)
+        super()._open_file(path)
+        self._writer = None
+        self._write_header = not existing
+
+    def _write_chunk(self, items: List[ResponseComponent]) -> None:
+        if self._writer is None:
+            if self.fieldnames is None:
+                self.fieldnames = csv_columns(type(items[0]))
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction='ignore')
+            if self._write_header:
+                self._writer.writeheader()
+        self._writer.writerows(flatten(item.model_dump(mode='json')) for item in items)
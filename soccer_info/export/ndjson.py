@@ -0,0 +1,17 @@
+from typing import List
+
+from soccer_info.responses import ResponseComponent
+from .base import TextFileSink
+
+
+class NDJSONSink(TextFileSink):
+    """Writes one JSON object per line, optionally compressed and rolled over.
+
+    Example:
+        >>> with NDJSONSink("matches.ndjson.gz", max_file_items=100_000) as sink:
+        ...     for page in pages:
+        ...         sink.write_many(page.result)
+    """
+
+    def _write_chunk(self, items: List[ResponseComponent]) -> None:
+        self._file.write("".join(item.model_dump_json() + "\n" for item in items))
@@ -0,0 +1,99 @@
+from pathlib import Path
+from typing import Any, List, Optional
+
+from soccer_info.responses import ResponseComponent
+from soccer_info.responses.frames import to_arrow
+from .base import FileSink
+
+
+class ParquetSink(FileSink):
+    """Writes items to Parquet, one row group per flush. Requires pyarrow.
+
+    Columns and types are those of ``to_arrow``: flattened dotted fields
+    with parsed numbers and timestamps. A file has one schema, taken from
+    its first row group: an integer column typed ``int64`` there stays so,
+    and non-integral values later rows hold in it are written as null.
+    Each flush writes the buffered
+    items as a row group, so ``buffer_items`` is the row group size; the
+    file footer is written on close, so a Parquet file is only readable
+    once the sink is closed (or has rolled to the next part).
+
+    Example:
+        >>> with ParquetSink("season.parquet", buffer_items=50_000) as sink:
+        ...     for page in pages:
+        ...         sink.write_many(page.result)
+    """
+
+    def __init__(
+        self,
+        target: Any,
+        compression: str = "zstd",
+        buffer_items: int = 10000,
+        flush_seconds: Optional[float] = None,
+        **options: Any,
+    ):
+        """Initialize the Parquet sink.
+
+        Args:
+            target: Output path
+            compression: Parquet column compression (e.g. "zstd", "snappy", "none")
+            buffer_items: Items per row group
+            flush_seconds: Maximum seconds between row groups while items arrive
+            **options: ``FileSink`` options (max_file_items, append, on_flush);
+                appending requires rolled output and starts a new part
+
+        Raises:
+            ImportError: If pyarrow is not installed
+            ValueError: If target is a stream, or append is requested without rolling
+        """
+        if not isinstance(target, (str, Path)):
+            raise ValueError("ParquetSink requires a file path")
+        if options.get("append") and options.get("max_file_items") is None:
+            raise ValueError("Parquet files cannot be appended to; use max_file_items to append new parts")
+        try:
+            import pyarrow
+            import pyarrow.compute
+            import pyarrow.parquet
+        except ImportError as error:
+            raise ImportError(
+                "ParquetSink requires pyarrow; install it with `pip install soccer-info[arrow]`"
+            ) from error
+        self._arrow = pyarrow
+        self._compute = pyarrow.compute
+        self._parquet = pyarrow.parquet
+        super().__init__(target, buffer_items=buffer_items, flush_seconds=flush_seconds, **options)
+        self.compression = compression
+        self._writer = None
+        self._model = None
+        self._current: Optional[Path] = None
+
+    def _open_file(self, path: Optional[Path]) -> None:
+        self._current = path
+        self._writer = None
+
+    def _write_chunk(self, items: List[ResponseComponent]) -> None:
+        if self._model is None:
+            self._model = type(items[0])
+        table = to_arrow(items, self._model)
+        if self._writer is None:
+            self._writer = self._parquet.ParquetWriter(self._current, table.schema, compression=self.compression)
+        elif table.schema != self._writer.schema:
+            table = self._conform(table)
+        self._writer.write_table(table, row_group_size=len(items))
+
+    def _conform(self, table):
+        """Cast a row group to the file schema; ``to_arrow`` types integer columns per batch."""
+        pa, pc = self._arrow, self._compute
+        schema = self._writer.schema
+        columns = []
+        for field, column in zip(schema, table.columns):
+            if column.type != field.type and pa.types.is_integer(field.type):
+                # Non-integral values cannot be stored in an int64 column without truncation
+                column = pc.if_else(pc.equal(column, pc.floor(column)), column, pa.scalar(None, column.type))
+            columns.append(pc.cast(column, field.type))
+        return pa.Table.from_arrays(columns, schema=schema)
+
+    def _close_file(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
@@ -0,0 +1,41 @@
+import importlib
+import sys
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
+
+
+def attach(
+    package: str,
+    submodules: Iterable[str] = (),
+    exports: Optional[Mapping[str, str]] = None,
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Create module-level ``__getattr__``/``__dir__`` that import on first access (PEP 562).
+
+    Submodules and re-exported names are imported the first time they are
+    accessed, either as attributes or through ``from package import name``,
+    and then cached on the package so later lookups are plain attribute reads.
+
+    Args:
+        package: ``__name__`` of the package
+        submodules: Submodule names to expose as attributes
+        exports: Mapping of exported name -> relative module defining it
+
+    Returns:
+        ``__getattr__`` and ``__dir__`` functions to assign in the package
+    """
+    submodules = frozenset(submodules)
+    exports = dict(exports or {})
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            value = importlib.import_module(f'{package}.{name}')
+        elif name in exports:
+            value = getattr(importlib.import_module(exports[name], package), name)
+        else:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | submodules | set(exports))
+
+    return __getattr__, __dir__
@@ -1,29 +1,69 @@
-"""Request building components for Soccer Football Info API."""
-from .headers import Header
-from .parameters import (
-    BaseParameters,
-    ChampionshipListParameters,
-    ChampionshipViewParameters,
-    MatchViewParameters,
-    MatchOddsParameters,
-    MatchProgressiveParameters,
-    MatchDayParameters,
-    MatchByParameters,
-    CountryListParameters,
-)
+"""Request building components for Soccer Football Info API.
 
-__all__ = [
-    'Header',
-    'BaseParameters',
+Components are imported on first access to keep package import cheap.
+"""
+from typing import TYPE_CHECKING
+
+from soccer_info.lazy_import import attach
+
+if TYPE_CHECKING:
+    from .headers import Header
+    from .parameters import (
+        BaseParameters,
+        ChampionshipListParameters,
+        ChampionshipViewParameters,
+        MatchViewParameters,
+        MatchOddsParameters,
+        MatchProgressiveParameters,
+        MatchDayParameters,
+        MatchByParameters,
+        CountryListParameters,
+    )
+    from .templates import (
+        RequestTemplate,
+        CHAMPIONSHIP_LIST,
+        CHAMPIONSHIP_VIEW,
+        MATCH_VIEW_BASIC,
+        MATCH_VIEW_FULL,
+        MATCH_ODDS,
+        MATCH_PROGRESSIVE,
+        MATCH_DAY_BASIC,
+        MATCH_DAY_FULL,
+        MATCH_BY_BASIC,
+        MATCH_BY_FULL,
+        COUNTRY_LIST,
+    )
+
+# Exported name -> module defining it
+_EXPORTS = {
+    'Header': '.headers',
+    'BaseParameters': '.parameters',
     # Championships
-    'ChampionshipListParameters',
-    'ChampionshipViewParameters',
+    'ChampionshipListParameters': '.parameters',
+    'ChampionshipViewParameters': '.parameters',
     # Matches
-    'MatchViewParameters',
-    'MatchOddsParameters',
-    'MatchProgressiveParameters',
-    'MatchDayParameters',
-    'MatchByParameters',
+    'MatchViewParameters': '.parameters',
+    'MatchOddsParameters': '.parameters',
+    'MatchProgressiveParameters': '.parameters',
+    'MatchDayParameters': '.parameters',
+    'MatchByParameters': '.parameters',
     # Countries
-    'CountryListParameters',
-]
+    'CountryListParameters': '.parameters',
+    # Templates
+    'RequestTemplate': '.templates',
+    'CHAMPIONSHIP_LIST': '.templates',
+    'CHAMPIONSHIP_VIEW': '.templates',
+    'MATCH_VIEW_BASIC': '.templates',
+    'MATCH_VIEW_FULL': '.templates',
+    'MATCH_ODDS': '.templates',
+    'MATCH_PROGRESSIVE': '.templates',
+    'MATCH_DAY_BASIC': '.templates',
+    'MATCH_DAY_FULL': '.templates',
+    'MATCH_BY_BASIC': '.templates',
+    'MATCH_BY_FULL': '.templates',
+    'COUNTRY_LIST': '.templates',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = attach(__name__, exports=_EXPORTS)
@@ -1,5 +1,12 @@
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+API_KEY_HEADER = "X-RapidAPI-Key"
+
+
+def mask_api_key(value: str) -> str:
+    """Replace an API key with asterisks of the same length for secure logging."""
+    return "*" * len(value)
+
 
 class Header(BaseModel):
     """HTTP header model for RapidAPI Soccer Football Info requests.
@@ -10,6 +17,7 @@ class Header(BaseModel):
 
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,  # Build validators on first use to keep imports cheap
     )
 
     x_rapidapi_key: str = Field(alias="X-RapidAPI-Key")
@@ -37,5 +45,5 @@ class Header(BaseModel):
         """
         data = self.model_dump(by_alias=True)
         if mask:
-            data['X-RapidAPI-Key'] = "*" * len(data['X-RapidAPI-Key'])
+            data[API_KEY_HEADER] = mask_api_key(data[API_KEY_HEADER])
         return data
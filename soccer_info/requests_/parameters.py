@@ -11,6 +11,7 @@ class BaseParameters(BaseModel):
     
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,  # Build validators on first use to keep imports cheap
     )
 
     @model_validator(mode='before')
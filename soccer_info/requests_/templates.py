@@ -0,0 +1,117 @@
+from types import NoneType, UnionType
+from typing import Any, Dict, Optional, Tuple, Type, Union, get_args, get_origin
+
+from .parameters import (
+    BaseParameters,
+    ChampionshipListParameters,
+    ChampionshipViewParameters,
+    MatchViewParameters,
+    MatchOddsParameters,
+    MatchProgressiveParameters,
+    MatchDayParameters,
+    MatchByParameters,
+    CountryListParameters,
+)
+
+# Annotation types whose values can be passed through unchanged when they already have that exact type
+_PASSTHROUGH_TYPES = (str, int, float)
+
+
+def _passthrough_type(annotation: Any) -> Optional[type]:
+    """Return the scalar type a field accepts as-is, or None if values always need validation."""
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    return annotation if annotation in _PASSTHROUGH_TYPES else None
+
+
+class RequestTemplate:
+    """Precompiled request builder for a single API endpoint.
+
+    Produces the final query parameter mapping directly from keyword
+    arguments, without constructing and dumping a parameters model per call.
+    Values that already have the field's exact type are copied under their
+    API alias; anything else (missing required fields, values needing
+    coercion, unexpected types) falls back to full model validation, so
+    results and errors are identical to ``Parameters(...).to_dict()``.
+
+    Example:
+        >>> CHAMPIONSHIP_VIEW.build(id="5778d8e65b65c7f9", language=None)
+        {'i': '5778d8e65b65c7f9'}
+    """
+
+    __slots__ = ('endpoint', 'parameters', '_fields')
+
+    def __init__(self, endpoint: str, parameters: Type[BaseParameters]):
+        """Compile the template from a parameters model.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/championships/list/")
+            parameters: Parameters model describing the endpoint's query
+        """
+        self.endpoint = endpoint
+        self.parameters = parameters
+        self._fields: Tuple[Tuple[str, str, Optional[type], bool], ...] = tuple(
+            (name, field.alias or name, _passthrough_type(field.annotation), field.is_required())
+            for name, field in parameters.model_fields.items()
+        )
+
+    def build(self, **values: Any) -> Dict[str, Any]:
+        """Build the query parameters for a request.
+
+        Args:
+            **values: Parameter values by field name; None values are omitted
+
+        Returns:
+            Dictionary with parameter names suitable for API requests
+
+        Raises:
+            pydantic.ValidationError: If the values fail model validation
+        """
+        params: Dict[str, Any] = {}
+        for name, alias, expected, required in self._fields:
+            value = values.get(name)
+            if value is None:
+                if required:
+                    return self.validate(**values)
+                continue
+            if type(value) is not expected:
+                return self.validate(**values)
+            params[alias] = value
+        return params
+
+    def validate(self, **values: Any) -> Dict[str, Any]:
+        """Build the query parameters through full model validation."""
+        return self.parameters(**values).to_dict()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.endpoint!r}, {self.parameters.__name__})'
+
+
+# =============================================================================
+# Championships Templates
+# =============================================================================
+
+CHAMPIONSHIP_LIST = RequestTemplate("/championships/list/", ChampionshipListParameters)
+CHAMPIONSHIP_VIEW = RequestTemplate("/championships/view/", ChampionshipViewParameters)
+
+# =============================================================================
+# Matches Templates
+# =============================================================================
+
+MATCH_VIEW_BASIC = RequestTemplate("/matches/view/basic/", MatchViewParameters)
+MATCH_VIEW_FULL = RequestTemplate("/matches/view/full/", MatchViewParameters)
+MATCH_ODDS = RequestTemplate("/matches/odds/", MatchOddsParameters)
+MATCH_PROGRESSIVE = RequestTemplate("/matches/view/progressive/", MatchProgressiveParameters)
+MATCH_DAY_BASIC = RequestTemplate("/matches/day/basic/", MatchDayParameters)
+MATCH_DAY_FULL = RequestTemplate("/matches/day/full/", MatchDayParameters)
+MATCH_BY_BASIC = RequestTemplate("/matches/by/basic/", MatchByParameters)
+MATCH_BY_FULL = RequestTemplate("/matches/by/full/", MatchByParameters)
+
+# =============================================================================
+# Countries Templates
+# =============================================================================
+
+COUNTRY_LIST = RequestTemplate("/countries/list/", CountryListParameters)
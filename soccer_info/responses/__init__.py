@@ -1,112 +1,140 @@
-"""Response models for Soccer Football Info API."""
-from .base import ResponseComponent, APIResponse, Pagination, ResponseHeaders
-from .championships import (
-    ChampionshipListItem,
-    ChampionshipListResponse,
-    ChampionshipDetail,
-    ChampionshipViewResponse,
-    Season,
-    Group,
-    TableEntry,
-    Team,
-)
-from .matches import (
-    # Basic components
-    MatchChampionship,
-    MatchScore,
-    MatchAttacks,
-    MatchShoots,
-    MatchCorners,
-    MatchFouls,
-    MatchStats,
-    MatchManager,
-    MatchTeam,
-    MatchEvent,
-    MatchReferee,
-    MatchStadium,
-    # Odds components
-    Odds1X2,
-    OddsHandicap,
-    OddsOverUnder,
-    BookmakerOdds1X2,
-    BookmakerOddsHandicap,
-    BookmakerOddsOverUnder,
-    MatchOddsSet,
-    MatchOdds,
-    # Progressive data
-    ProgressiveDataPoint,
-    ProgressiveMatch,
-    # Match types
-    MatchBasic,
-    MatchFull,
-    # Response types
-    MatchViewBasicResponse,
-    MatchViewFullResponse,
-    MatchOddsResponse,
-    MatchProgressiveResponse,
-    MatchDayBasicResponse,
-    MatchDayFullResponse,
-    MatchByBasicResponse,
-    MatchByFullResponse,
-)
-from .countries import (
-    CountryItem,
-    CountryListResponse,
-)
+"""Response models for Soccer Football Info API.
 
-__all__ = [
+Models are imported on first access, so ``import soccer_info.responses`` does
+not build every response model up front.
+"""
+from typing import TYPE_CHECKING
+
+from soccer_info.lazy_import import attach
+
+if TYPE_CHECKING:
+    from .base import ResponseComponent, APIResponse, Pagination, ResponseHeaders, RequestTimings
+    from .championships import (
+        ChampionshipListItem,
+        ChampionshipListResponse,
+        ChampionshipDetail,
+        ChampionshipViewResponse,
+        Season,
+        Group,
+        TableEntry,
+        Team,
+    )
+    from .matches import (
+        # Basic components
+        MatchChampionship,
+        MatchScore,
+        MatchAttacks,
+        MatchShoots,
+        MatchCorners,
+        MatchFouls,
+        MatchStats,
+        MatchManager,
+        MatchTeam,
+        MatchEvent,
+        MatchReferee,
+        MatchStadium,
+        # Odds components
+        Odds1X2,
+        OddsHandicap,
+        OddsOverUnder,
+        BookmakerOdds1X2,
+        BookmakerOddsHandicap,
+        BookmakerOddsOverUnder,
+        MatchOddsSet,
+        MatchOdds,
+        # Progressive data
+        ProgressiveDataPoint,
+        ProgressiveMatch,
+        # Match types
+        MatchBasic,
+        MatchFull,
+        # Response types
+        MatchViewBasicResponse,
+        MatchViewFullResponse,
+        MatchOddsResponse,
+        MatchProgressiveResponse,
+        MatchDayBasicResponse,
+        MatchDayFullResponse,
+        MatchByBasicResponse,
+        MatchByFullResponse,
+    )
+    from .countries import (
+        CountryItem,
+        CountryListResponse,
+    )
+    from .binary import dumps_binary, load_binary, load_directory, loads_binary, save_binary
+    from .frames import FrameColumn, frame_columns, to_arrow, to_frame
+
+# Exported name -> module defining it
+_EXPORTS = {
     # Base
-    'ResponseComponent',
-    'APIResponse',
-    'Pagination',
-    'ResponseHeaders',
+    'ResponseComponent': '.base',
+    'APIResponse': '.base',
+    'Pagination': '.base',
+    'ResponseHeaders': '.base',
+    'RequestTimings': '.base',
     # Championships
-    'ChampionshipListItem',
-    'ChampionshipListResponse',
-    'ChampionshipDetail',
-    'ChampionshipViewResponse',
-    'Season',
-    'Group',
-    'TableEntry',
-    'Team',
+    'ChampionshipListItem': '.championships',
+    'ChampionshipListResponse': '.championships',
+    'ChampionshipDetail': '.championships',
+    'ChampionshipViewResponse': '.championships',
+    'Season': '.championships',
+    'Group': '.championships',
+    'TableEntry': '.championships',
+    'Team': '.championships',
     # Matches - Basic components
-    'MatchChampionship',
-    'MatchScore',
-    'MatchAttacks',
-    'MatchShoots',
-    'MatchCorners',
-    'MatchFouls',
-    'MatchStats',
-    'MatchManager',
-    'MatchTeam',
-    'MatchEvent',
-    'MatchReferee',
-    'MatchStadium',
+    'MatchChampionship': '.matches',
+    'MatchScore': '.matches',
+    'MatchAttacks': '.matches',
+    'MatchShoots': '.matches',
+    'MatchCorners': '.matches',
+    'MatchFouls': '.matches',
+    'MatchStats': '.matches',
+    'MatchManager': '.matches',
+    'MatchTeam': '.matches',
+    'MatchEvent': '.matches',
+    'MatchReferee': '.matches',
+    'MatchStadium': '.matches',
     # Matches - Odds components
-    'Odds1X2',
-    'OddsHandicap',
-    'OddsOverUnder',
-    'BookmakerOdds1X2',
-    'BookmakerOddsHandicap',
-    'BookmakerOddsOverUnder',
-    'MatchOddsSet',
-    'MatchOdds',
+    'Odds1X2': '.matches',
+    'OddsHandicap': '.matches',
+    'OddsOverUnder': '.matches',
+    'BookmakerOdds1X2': '.matches',
+    'BookmakerOddsHandicap': '.matches',
+    'BookmakerOddsOverUnder': '.matches',
+    'MatchOddsSet': '.matches',
+    'MatchOdds': '.matches',
     # Matches - Progressive data
-    'ProgressiveDataPoint',
-    'ProgressiveMatch',
+    'ProgressiveDataPoint': '.matches',
+    'ProgressiveMatch': '.matches',
     # Matches - Match types
-    'MatchBasic',
-    'MatchFull',
+    'MatchBasic': '.matches',
+    'MatchFull': '.matches',
     # Matches - Response types
-    'MatchViewBasicResponse',
-    'MatchViewFullResponse',
-    'MatchOddsResponse',
-    'MatchProgressiveResponse',
-    'MatchDayBasicResponse',
-    'MatchDayFullResponse',
-    'MatchByBasicResponse',
-    'MatchByFullResponse',
+    'MatchViewBasicResponse': '.matches',
+    'MatchViewFullResponse': '.matches',
+    'MatchOddsResponse': '.matches',
+    'MatchProgressiveResponse': '.matches',
+    'MatchDayBasicResponse': '.matches',
+    'MatchDayFullResponse': '.matches',
+    'MatchByBasicResponse': '.matches',
+    'MatchByFullResponse': '.matches',
     # Countries
-    'CountryItem',
-    'CountryListResponse',
-]
+    'CountryItem': '.countries',
+    'CountryListResponse': '.countries',
+    # DataFrame / Arrow conversion
+    'FrameColumn': '.frames',
+    'frame_columns': '.frames',
+    'to_frame': '.frames',
+    'to_arrow': '.frames',
+    # Binary serialization
+    'dumps_binary': '.binary',
+    'loads_binary': '.binary',
+    'save_binary': '.binary',
+    'load_binary': '.binary',
+    'load_directory': '.binary',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = attach(__name__, exports=_EXPORTS)
@@ -1,6 +1,8 @@
+import math
+import typing
 from pathlib import Path
 from pydantic import BaseModel, ConfigDict, Field, model_validator, AliasChoices
-from typing import TypeVar, List, Generic, Optional
+from typing import TypeVar, List, Generic, Optional, Self, Type
 
 
 class ResponseHeaders(BaseModel):
@@ -11,7 +13,8 @@ class ResponseHeaders(BaseModel):
     """
     model_config = ConfigDict(
         populate_by_name=True,
-        extra='ignore'  # Ignore unknown headers
+        extra='ignore',  # Ignore unknown headers
+        defer_build=True,  # Build validators on first use to keep imports cheap
     )
     
     @model_validator(mode='before')
@@ -61,6 +64,35 @@ class ResponseHeaders(BaseModel):
         return None
 
 
+class RequestTimings(BaseModel):
+    """Per-request network timing breakdown collected from httpx trace events.
+
+    All durations are in seconds. Phases that did not happen for a request
+    (e.g. connect and TLS on a reused connection) or that the transport does
+    not report are None.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    pool_acquire: Optional[float] = Field(
+        default=None, description="Waiting for a pooled connection or a free slot to open one"
+    )
+    connect: Optional[float] = Field(
+        default=None, description="TCP connect, including DNS resolution (httpcore does not separate them)"
+    )
+    tls_handshake: Optional[float] = None
+    request_send: Optional[float] = Field(default=None, description="Sending request headers and body")
+    time_to_first_byte: Optional[float] = Field(
+        default=None, description="From request sent to response headers received"
+    )
+    body_download: Optional[float] = None
+    validation: Optional[float] = Field(default=None, description="JSON parsing and Pydantic validation")
+    network_total: Optional[float] = Field(
+        default=None, description="From issuing the request to the full body being read"
+    )
+    connection_reused: Optional[bool] = None
+    http_version: Optional[str] = None
+
+
 class ResponseComponent(BaseModel):
     """Base model for Soccer Football Info API response parsing.
     
@@ -69,7 +101,8 @@ class ResponseComponent(BaseModel):
     """
     model_config = ConfigDict(
         populate_by_name=True,
-        extra='ignore'  # API may return additional fields
+        extra='ignore',  # API may return additional fields
+        defer_build=True,  # Build validators on first use to keep imports cheap
     )
 
     def save_pretty_json(self, target_file_path: Path) -> None:
@@ -77,6 +110,33 @@ class ResponseComponent(BaseModel):
         with open(target_file_path, 'w', encoding='utf-8') as f:
             f.write(self.model_dump_json(indent=4))
 
+    @classmethod
+    def load_json(cls, source_file_path: Path) -> Self:
+        """Load a response saved by ``save_pretty_json``, validating it.
+
+        ``response_headers`` and ``response_timings`` are not part of the JSON
+        and are left at their defaults.
+        """
+        with open(source_file_path, 'rb') as f:
+            return cls.model_validate_json(f.read())
+
+    def save_binary(self, target_file_path: Path, compress: bool = True) -> None:
+        """Save the response in the compact binary format, including its response headers.
+
+        See ``soccer_info.responses.binary.save_binary``.
+        """
+        from .binary import save_binary
+        save_binary(self, target_file_path, compress)
+
+    @classmethod
+    def load_binary(cls, source_file_path: Path) -> Self:
+        """Load a response saved by ``save_binary`` without re-validating it.
+
+        See ``soccer_info.responses.binary.load_binary``.
+        """
+        from .binary import load_binary
+        return load_binary(source_file_path, cls)
+
 
 class Pagination(ResponseComponent):
     """Pagination information from API response."""
@@ -105,6 +165,19 @@ class APIResponse(ResponseComponent, Generic[T]):
         description="HTTP response headers from the API"
     )
 
+    response_timings: Optional[RequestTimings] = Field(
+        default=None,
+        exclude=True,  # Don't include in JSON serialization
+        description="Network timing breakdown, when enabled in Settings"
+    )
+
+    response_unchanged: bool = Field(
+        default=False,
+        exclude=True,  # Don't include in JSON serialization
+        description="Body was byte-identical to the previous response of the same request "
+                    "and the earlier parsed result was reused (requires the parse cache)"
+    )
+
     @property
     def is_success(self) -> bool:
         """Check if the response indicates success."""
@@ -120,6 +193,35 @@ class APIResponse(ResponseComponent, Generic[T]):
         """Get pagination info if available."""
         return self.pagination[0] if self.pagination else None
 
+    @classmethod
+    def item_model(cls) -> Type[ResponseComponent]:
+        """Model of the items in ``result``."""
+        return typing.get_args(cls.model_fields['result'].annotation)[0]
+
+    def to_frame(self):
+        """Convert ``result`` to a pandas DataFrame with flattened, typed columns.
+
+        See ``soccer_info.responses.frames.to_frame``. Requires pandas.
+        """
+        from .frames import to_frame
+        return to_frame(self.result, self.item_model())
+
+    def to_arrow(self):
+        """Convert ``result`` to a pyarrow Table with flattened, typed columns.
+
+        See ``soccer_info.responses.frames.to_arrow``. Requires pyarrow.
+        """
+        from .frames import to_arrow
+        return to_arrow(self.result, self.item_model())
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages of a paginated result (1 when the response is not paginated)."""
+        pagination = self.pagination_info
+        if pagination is None or pagination.per_page <= 0:
+            return 1
+        return max(1, math.ceil(pagination.items / pagination.per_page))
+
 
 class ForgivingResponse(ResponseComponent):
     """Unvalidated response model for development and debugging.
@@ -0,0 +1,334 @@
+import gc
+import importlib
+import marshal
+import os
+import struct
+import sys
+import typing
+import zlib
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+BINARY_SUFFIX = ".sib"
+
+# File header: magic, format version, flags, schema fingerprint, model path length; the model path follows
+_HEADER = struct.Struct("<4sBBIH")
+_MAGIC = b"SIB\x00"
+_VERSION = 1
+_COMPRESSED = 0x01
+
+# marshal format 4 is supported by every Python this package runs on
+_MARSHAL_VERSION = 4
+# Folded into the fingerprint: marshal data is only guaranteed to load on the Python that wrote it
+_PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}".encode()
+# Only models of this package are resolved from the path recorded in the data
+_MODEL_PACKAGE = "soccer_info.responses"
+
+M = TypeVar('M', bound=BaseModel)
+
+# Encoder and decoder of one model, and the fingerprint of the field layout they use
+_Codec = Tuple[Callable[[Any], Any], Callable[[Any], Any], int]
+
+# Setters of the instance slots pydantic models carry besides __dict__
+_set_fields_set = BaseModel.__dict__['__pydantic_fields_set__'].__set__
+_set_extra = BaseModel.__dict__['__pydantic_extra__'].__set__
+_set_private = BaseModel.__dict__['__pydantic_private__'].__set__
+
+
+class _FieldSets(dict):
+    """Field-set bitmask -> field names, computed once per distinct mask."""
+
+    def __init__(self, names: Tuple[str, ...]):
+        super().__init__()
+        self._names = names
+
+    def __missing__(self, mask: int) -> FrozenSet[str]:
+        names = frozenset(name for bit, name in enumerate(self._names) if mask >> bit & 1)
+        self[mask] = names
+        return names
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if typing.get_origin(annotation) is Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _mentions_model(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_mentions_model(arg) for arg in typing.get_args(annotation))
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _validating_codec(model: Type[BaseModel]) -> _Codec:
+    """Codec for models the fast path cannot rebuild (extra fields, private attributes, unions)."""
+    def encode(value: BaseModel) -> Any:
+        return value.model_dump(round_trip=True)
+
+    return encode, model.model_validate, zlib.crc32(f"validate:{model.__qualname__}".encode())
+
+
+@lru_cache(maxsize=None)
+def _codec(model: Type[BaseModel]) -> _Codec:
+    """Compile an encoder to positional tuples and a decoder rebuilding the model without validation.
+
+    An encoded model is ``(field-set bitmask, value, value, ...)`` in field
+    order, so field names are not repeated per object. Nested models and
+    lists of models are encoded recursively; every other value is stored
+    as is. Decoding fills the instance dictionary directly, which is what
+    ``model_construct`` does without its per-field default handling.
+    """
+    if model.model_config.get("extra") == "allow" or model.__private_attributes__:
+        return _validating_codec(model)
+
+    names = tuple(model.model_fields)
+    children: Dict[str, Any] = {}
+    encoded: List[str] = ["_mask(o.__pydantic_fields_set__)"]
+    decoded: List[str] = []
+    layout: List[str] = []
+    for position, (name, field) in enumerate(model.model_fields.items(), start=1):
+        annotation = _unwrap_optional(field.annotation)
+        item = typing.get_args(annotation)[0] if typing.get_origin(annotation) in (list, List) else None
+        value, stored = f"o.{name}", f"t[{position}]"
+        if _is_model(annotation):
+            encode, decode, fingerprint = _codec(annotation)
+            children[f"_e{position}"], children[f"_d{position}"] = encode, decode
+            encoder = f"_e{position}({value})"
+            decoder = f"_d{position}({stored})"
+            layout.append(f"{name}:{fingerprint}")
+        elif item is not None and _is_model(item):
+            encode, decode, fingerprint = _codec(item)
+            children[f"_e{position}"], children[f"_d{position}"] = encode, decode
+            encoder = f"[_e{position}(x) for x in {value}]"
+            decoder = f"[_d{position}(x) for x in {stored}]"
+            layout.append(f"{name}:[{fingerprint}]")
+        elif _mentions_model(annotation):
+            return _validating_codec(model)
+        else:
+            encoder, decoder = value, stored
+            layout.append(name)
+        if encoder != value:
+            # Optional fields, and required ones a caller filled with None via model_construct
+            encoder = f"(None if {value} is None else {encoder})"
+            decoder = f"(None if {stored} is None else {decoder})"
+        encoded.append(encoder)
+        decoded.append(f"{name!r}: {decoder}")
+
+    bits = {name: 1 << bit for bit, name in enumerate(names)}
+    namespace: Dict[str, Any] = {
+        **children,
+        "_M": model,
+        "_new": object.__new__,
+        "_set_dict": object.__setattr__,
+        "_set_fields_set": _set_fields_set,
+        "_set_extra": _set_extra,
+        "_set_private": _set_private,
+        "_sets": _FieldSets(names),
+        "_mask": lambda fields_set: sum(bits[name] for name in fields_set if name in bits),
+    }
+    source = (
+        f"def encode(o):\n"
+        f"    return ({', '.join(encoded)},)\n"
+        f"def decode(t):\n"
+        f"    o = _new(_M)\n"
+        f"    _set_dict(o, '__dict__', {{{', '.join(decoded)}}})\n"
+        f"    _set_fields_set(o, set(_sets[t[0]]))\n"
+        f"    _set_extra(o, None)\n"
+        f"    _set_private(o, None)\n"
+        f"    return o\n"
+    )
+    exec(compile(source, f"<binary codec {model.__qualname__}>", "exec"), namespace)
+    return namespace["encode"], namespace["decode"], zlib.crc32(f"{model.__qualname__}({','.join(layout)})".encode())
+
+
+def _fingerprint(model: Type[BaseModel]) -> int:
+    """Fingerprint of the field layout of a model, on this Python version."""
+    return zlib.crc32(_PYTHON_VERSION, _codec(model)[2])
+
+
+def _model_path(model: Type[BaseModel]) -> str:
+    return f"{model.__module__}:{model.__qualname__}"
+
+
+def _resolve(path: str) -> Type[BaseModel]:
+    """Response model recorded in serialized data.
+
+    Raises:
+        ValueError: If the path names anything but a model of ``soccer_info.responses``
+    """
+    module, _, qualname = path.partition(":")
+    if module != _MODEL_PACKAGE and not module.startswith(_MODEL_PACKAGE + "."):
+        raise ValueError(f"Data holds {path}, which is not a soccer_info response model; pass the model to load it")
+    target: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        target = getattr(target, part, None)
+    if not _is_model(target):
+        raise ValueError(f"Data holds {path}, which is not a soccer_info response model; pass the model to load it")
+    return target
+
+
+def dumps_binary(value: BaseModel, compress: bool = True) -> bytes:
+    """Serialize a model, including ``response_headers`` and other excluded fields, to bytes.
+
+    Args:
+        value: Any response or response component
+        compress: zlib-compress the payload (level 1, about 3x smaller)
+
+    Returns:
+        Bytes for ``loads_binary``
+    """
+    model = type(value)
+    encode = _codec(model)[0]
+    payload = marshal.dumps(encode(value), _MARSHAL_VERSION)
+    if compress:
+        payload = zlib.compress(payload, 1)
+    path = _model_path(model).encode("utf-8")
+    flags = _COMPRESSED if compress else 0
+    return _HEADER.pack(_MAGIC, _VERSION, flags, _fingerprint(model), len(path)) + path + payload
+
+
+def _split(data: bytes) -> Tuple[str, int, bytes]:
+    """Model path, fingerprint and decompressed payload of serialized bytes."""
+    if len(data) < _HEADER.size:
+        raise ValueError("Not a binary response file")
+    magic, version, flags, fingerprint, path_length = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError("Not a binary response file")
+    if version != _VERSION:
+        raise ValueError(f"Unsupported binary format version {version}")
+    start = _HEADER.size + path_length
+    path = data[_HEADER.size:start].decode("utf-8")
+    payload = data[start:]
+    if flags & _COMPRESSED:
+        payload = zlib.decompress(payload)
+    return path, fingerprint, payload
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause cyclic garbage collection while models are rebuilt.
+
+    Rebuilding allocates one object per nested model and creates no
+    garbage, so the collections those allocations trigger would only
+    rescan live objects; they cost more than the decoding itself.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _decode(path: str, fingerprint: int, payload: bytes, model: Optional[Type[M]]) -> M:
+    if model is None:
+        model = _resolve(path)
+    elif _model_path(model) != path:
+        raise ValueError(f"Data holds {path}, not {_model_path(model)}")
+    if fingerprint != _fingerprint(model):
+        raise ValueError(f"Data was saved with a different version of {path} or of Python; re-save it from JSON")
+    decode = _codec(model)[1]
+    with _gc_paused():
+        return decode(marshal.loads(payload))
+
+
+def loads_binary(data: bytes, model: Optional[Type[M]] = None) -> M:
+    """Rebuild a model serialized by ``dumps_binary`` without re-validating it.
+
+    The data is trusted: values are restored as saved, which is what makes
+    loading several times faster than ``model_validate_json``. Only load
+    data written by ``dumps_binary``.
+
+    Args:
+        data: Serialized bytes
+        model: Expected model class; defaults to the one recorded in the
+            data, which must be a model of ``soccer_info.responses``
+
+    Raises:
+        ValueError: If the data is not in this format, holds another model,
+            names a model outside ``soccer_info.responses`` and ``model``
+            is not given, or was saved with a different field layout of the
+            model or by a different Python version
+    """
+    return _decode(*_split(data), model)
+
+
+def save_binary(value: BaseModel, target_file_path: Union[str, Path], compress: bool = True) -> None:
+    """Save a model with ``dumps_binary``.
+
+    Args:
+        value: Any response or response component
+        target_file_path: File to write, conventionally ending in ``.sib``
+        compress: zlib-compress the payload
+    """
+    with open(target_file_path, "wb") as f:
+        f.write(dumps_binary(value, compress))
+
+
+def load_binary(source_file_path: Union[str, Path], model: Optional[Type[M]] = None) -> M:
+    """Load a model saved by ``save_binary``; see ``loads_binary``."""
+    with open(source_file_path, "rb") as f:
+        return loads_binary(f.read(), model)
+
+
+# =============================================================================
+# Bulk loading
+# =============================================================================
+
+def _read_payload(path: Path) -> Tuple[str, int, bytes]:
+    """Worker: read and decompress one file."""
+    with open(path, "rb") as f:
+        return _split(f.read())
+
+
+def load_directory(
+    directory: Union[str, Path],
+    pattern: str = f"*{BINARY_SUFFIX}",
+    model: Optional[Type[M]] = None,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Dict[Path, M]:
+    """Load every binary response file in a directory.
+
+    Worker processes read and decompress the files in parallel and hand
+    the payloads back as bytes; the models are rebuilt in the calling
+    process as the payloads arrive. Rebuilt models are not sent between
+    processes, because unpickling a model costs several times more than
+    decoding its payload.
+
+    Args:
+        directory: Directory holding the files
+        pattern: Glob pattern of the files to load
+        model: Expected model of every file; defaults to the one recorded in each file
+        workers: Reading processes (default: CPU count); 1 reads in the calling process
+        executor: Executor to read with instead of a new process pool
+
+    Returns:
+        Loaded models by file path, in path order
+    """
+    paths = sorted(Path(directory).glob(pattern))
+    if executor is not None:
+        return _decode_all(paths, executor.map(_read_payload, paths), model)
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        return _decode_all(paths, map(_read_payload, paths), model)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(paths) // (4 * workers))
+        return _decode_all(paths, pool.map(_read_payload, paths, chunksize=chunksize), model)
+
+
+def _decode_all(paths: List[Path], payloads: Iterable[Tuple[str, int, bytes]], model: Optional[Type[M]]) -> Dict[Path, M]:
+    with _gc_paused():
+        return {path: _decode(*payload, model) for path, payload in zip(paths, payloads)}
@@ -0,0 +1,266 @@
+import importlib
+import typing
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Type, Union
+
+from .base import ResponseComponent
+from .matches.models import (
+    MatchAttacks,
+    MatchBasic,
+    MatchCorners,
+    MatchFouls,
+    MatchFull,
+    MatchScore,
+    MatchShoots,
+    MatchStats,
+    Odds1X2,
+    OddsHandicap,
+    OddsOverUnder,
+)
+
+ColumnKind = Literal["string", "int", "float", "bool", "datetime"]
+
+# String fields the API fills with numbers, by model; handicap and line values ("0.5,1.0") stay strings
+NUMERIC_STRING_FIELDS: Dict[Type[ResponseComponent], Dict[str, ColumnKind]] = {
+    MatchScore: {"f": "int", "first_half": "int", "second_half": "int", "overtime": "int", "penalties": "int"},
+    MatchAttacks: {"n": "int", "d": "int", "o_s": "int"},
+    MatchShoots: {"t": "int", "off": "int", "on": "int", "g_a": "int"},
+    MatchCorners: {"t": "int", "f": "int", "h": "int"},
+    MatchFouls: {"t": "int", "y_c": "int", "y_t_r_c": "int", "r_c": "int"},
+    MatchStats: {
+        "possession": "int",
+        "penalties": "int",
+        "substitutions": "int",
+        "throwins": "int",
+        "injuries": "int",
+    },
+    Odds1X2: {"home": "float", "draw": "float", "away": "float"},
+    OddsHandicap: {"home": "float", "away": "float"},
+    OddsOverUnder: {"o": "float", "u": "float"},
+}
+
+# String fields holding ``YYYY-MM-DD HH:MM:SS`` timestamps, by model
+DATETIME_FIELDS: Dict[Type[ResponseComponent], Tuple[str, ...]] = {
+    MatchBasic: ("date",),
+    MatchFull: ("date",),
+}
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Integer fields are parsed as numbers too, so a stray "1.5" is kept rather than nulled
+_NUMBER_PATTERN = r"^-?\d+(\.\d+)?$"
+
+_SCALAR_KINDS: Dict[type, ColumnKind] = {str: "string", int: "int", float: "float", bool: "bool"}
+
+
+@dataclass(frozen=True)
+class FrameColumn:
+    """One flattened column of a model.
+
+    Attributes:
+        name: Dotted field path, e.g. ``teamA.score.f``
+        kind: Target type of the column
+        parsed: Whether the API sends the value as a string that is parsed
+    """
+    name: str
+    kind: ColumnKind
+    parsed: bool = False
+
+
+@dataclass(frozen=True)
+class _Leaf:
+    kind: ColumnKind
+    parsed: bool
+
+
+# Flattening tree of a model: (field name, leaf or nested tree)
+_Node = Tuple[Tuple[str, Union[_Leaf, "_Node"]], ...]
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if typing.get_origin(annotation) is Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+@lru_cache(maxsize=None)
+def _tree(model: Type[ResponseComponent]) -> _Node:
+    """Scalar and nested model fields of a model; list fields (events, lineups) are not flattened."""
+    numeric = NUMERIC_STRING_FIELDS.get(model, {})
+    dates = DATETIME_FIELDS.get(model, ())
+    nodes = []
+    for name, field in model.model_fields.items():
+        annotation = _unwrap_optional(field.annotation)
+        if isinstance(annotation, type) and issubclass(annotation, ResponseComponent):
+            nodes.append((name, _tree(annotation)))
+        elif annotation in _SCALAR_KINDS:
+            if name in dates:
+                nodes.append((name, _Leaf("datetime", parsed=True)))
+            elif name in numeric:
+                nodes.append((name, _Leaf(numeric[name], parsed=True)))
+            else:
+                nodes.append((name, _Leaf(_SCALAR_KINDS[annotation], parsed=False)))
+    return tuple(nodes)
+
+
+def frame_columns(model: Type[ResponseComponent]) -> List[FrameColumn]:
+    """Flattened columns produced for a model, in order.
+
+    Args:
+        model: Item model, e.g. ``MatchBasic``, ``MatchFull`` or ``TableEntry``
+    """
+    columns: List[FrameColumn] = []
+
+    def walk(node: _Node, prefix: str) -> None:
+        for name, child in node:
+            if isinstance(child, _Leaf):
+                columns.append(FrameColumn(f"{prefix}{name}", child.kind, child.parsed))
+            else:
+                walk(child, f"{prefix}{name}.")
+
+    walk(_tree(model), "")
+    return columns
+
+
+@lru_cache(maxsize=None)
+def _row_reader(model: Type[ResponseComponent]) -> Tuple[Tuple[Tuple[str, _Leaf], ...], Callable[[Any], tuple]]:
+    """Compile a function returning every flattened value of one item as a tuple.
+
+    Reading row by row touches each (nested) object once while it is in the
+    CPU cache, instead of once per column; the generated code does one
+    attribute access per field with no per-field function calls.
+    """
+    leaves: List[Tuple[str, _Leaf]] = []
+    lines: List[str] = []
+    values: List[str] = []
+
+    def walk(node: _Node, variable: str, prefix: str) -> None:
+        for name, child in node:
+            access = f"{variable}.{name}" if variable == "o" else f"({variable}.{name} if {variable} is not None else None)"
+            if isinstance(child, _Leaf):
+                leaves.append((f"{prefix}{name}", child))
+                values.append(access)
+            else:
+                nested = f"n{len(lines)}"
+                lines.append(f"    {nested} = {access}")
+                walk(child, nested, f"{prefix}{name}.")
+
+    walk(_tree(model), "o", "")
+    source = "def read(o):\n" + "\n".join(lines) + ("\n" if lines else "") + f"    return ({', '.join(values)},)\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<row reader {model.__name__}>", "exec"), namespace)
+    return tuple(leaves), namespace["read"]
+
+
+def _extract(items: Sequence[ResponseComponent], model: Type[ResponseComponent]) -> Dict[str, Tuple[_Leaf, Sequence[Any]]]:
+    """Column-wise values of the flattened fields."""
+    leaves, read = _row_reader(model)
+    if not items:
+        return {name: (leaf, ()) for name, leaf in leaves}
+    columns = zip(*map(read, items))
+    return {name: (leaf, values) for (name, leaf), values in zip(leaves, columns)}
+
+
+def _item_model(items: Sequence[ResponseComponent], model: Optional[Type[ResponseComponent]]) -> Type[ResponseComponent]:
+    if model is not None:
+        return model
+    if items:
+        return type(items[0])
+    raise ValueError("model is required to convert an empty sequence")
+
+
+def _require(module: str, extra: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError as error:
+        raise ImportError(
+            f"{module} is required for this conversion; install it with `pip install soccer-info[{extra}]`"
+        ) from error
+
+
+def _parse_numbers(pd: Any, values: Sequence[Any]) -> Any:
+    """Parse numeric strings to a float64 Series; unparsable values become NaN."""
+    try:
+        # Direct construction parses clean columns in C, twice as fast as to_numeric
+        return pd.Series(values, dtype="float64")
+    except (ValueError, TypeError):
+        return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").astype("float64")
+
+
+def to_frame(items: Sequence[ResponseComponent], model: Optional[Type[ResponseComponent]] = None):
+    """Convert models to a pandas DataFrame with one flattened column per scalar field.
+
+    Nested fields become dotted columns (``teamA.score.f``), numeric string
+    fields become nullable ``Int64`` or ``float64`` columns, ``date`` fields
+    become ``datetime64`` and values that do not parse become missing.
+
+    Args:
+        items: Models of one type, e.g. ``response.result`` or ``group.table``
+        model: Item model; required when ``items`` may be empty
+
+    Returns:
+        pandas.DataFrame
+
+    Raises:
+        ImportError: If pandas is not installed
+    """
+    pd = _require("pandas", "pandas")
+    data = {}
+    for name, (leaf, values) in _extract(items, _item_model(items, model)).items():
+        if leaf.kind == "datetime":
+            data[name] = pd.to_datetime(pd.Series(values, dtype=object), format=DATETIME_FORMAT, errors="coerce")
+        elif leaf.kind == "float":
+            data[name] = _parse_numbers(pd, values)
+        elif leaf.kind == "int" and leaf.parsed:
+            series = _parse_numbers(pd, values)
+            # A non-integral value must not be truncated, so such columns stay float
+            data[name] = series.astype("Int64") if (series.dropna() % 1 == 0).all() else series
+        elif leaf.kind == "int":
+            data[name] = pd.array(values, dtype="Int64")
+        elif leaf.kind == "bool":
+            data[name] = pd.array(values, dtype="boolean")
+        else:
+            data[name] = pd.Series(values, dtype=object)
+    return pd.DataFrame(data, index=pd.RangeIndex(len(items)))
+
+
+def to_arrow(items: Sequence[ResponseComponent], model: Optional[Type[ResponseComponent]] = None):
+    """Convert models to a pyarrow Table with one flattened column per scalar field.
+
+    Columns match ``to_frame``: numeric string fields become ``int64`` or
+    ``float64`` (integer fields holding a non-integral value stay
+    ``float64``), ``date`` fields ``timestamp[s]`` and values that do not
+    parse become null. Parsing runs in Arrow compute kernels.
+
+    Args:
+        items: Models of one type, e.g. ``response.result`` or ``group.table``
+        model: Item model; required when ``items`` may be empty
+
+    Returns:
+        pyarrow.Table
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    pa = _require("pyarrow", "arrow")
+    pc = _require("pyarrow.compute", "arrow")
+    arrays = {}
+    types = {"int": pa.int64(), "float": pa.float64(), "bool": pa.bool_(), "string": pa.string()}
+    for name, (leaf, values) in _extract(items, _item_model(items, model)).items():
+        if leaf.kind == "datetime":
+            strings = pa.array(values, type=pa.string())
+            arrays[name] = pc.strptime(strings, format=DATETIME_FORMAT, unit="s", error_is_null=True)
+        elif leaf.parsed:
+            strings = pc.utf8_trim_whitespace(pa.array(values, type=pa.string()))
+            valid = pc.match_substring_regex(strings, _NUMBER_PATTERN)
+            numbers = pc.cast(pc.if_else(valid, strings, pa.scalar(None, pa.string())), pa.float64())
+            # As in to_frame, a non-integral value must not be truncated, so such columns stay float
+            if leaf.kind == "int" and pc.all(pc.equal(numbers, pc.floor(numbers)), min_count=0).as_py():
+                numbers = pc.cast(numbers, pa.int64())
+            arrays[name] = numbers
+        else:
+            arrays[name] = pa.array(values, type=types[leaf.kind])
+    return pa.table(arrays)
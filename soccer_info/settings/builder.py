@@ -1,5 +1,5 @@
 import os
-from typing import Optional, Callable
+from typing import Iterable, List, Optional, Callable
 from .settings import Settings
 
 DEFAULT_API_KEY_ENV = "RAPIDAPI_SOCCER_INFO_KEY"
@@ -16,8 +16,25 @@ class SettingsBuilder:
         """Initialize empty settings builder."""
         self._api_key: Optional[str] = None
         self._api_key_provider: Optional[Callable[[], str]] = None
+        self._api_keys: List[str] = []
         self._api_host: str = "soccer-football-info.p.rapidapi.com"
         self._base_url: str = "https://soccer-football-info.p.rapidapi.com"
+        self._collect_timings: bool = False
+        self._request_throttle_seconds: float = 0.3
+        self._bulk_deadline_seconds: Optional[float] = None
+        self._quota_reserve: Optional[int] = None
+        self._quota_auto_resume: bool = False
+        self._request_timeout: float = 30
+        self._connect_timeout: Optional[float] = None
+        self._read_timeout: Optional[float] = None
+        self._write_timeout: Optional[float] = None
+        self._pool_timeout: Optional[float] = None
+        self._max_connections: Optional[int] = 100
+        self._max_keepalive_connections: Optional[int] = 20
+        self._keepalive_expiry: Optional[float] = 5.0
+        self._http2: bool = False
+        self._compression: bool = True
+        self._parse_cache_entries: Optional[int] = None
 
     def with_api_key(
             self,
@@ -54,6 +71,37 @@ class SettingsBuilder:
                 )
         return self
 
+    def with_api_keys(
+            self,
+            keys: Optional[Iterable[str]] = None,
+            environment: Optional[str] = None,
+    ) -> 'SettingsBuilder':
+        """Pool several API keys; requests are routed across all of them.
+
+        Each key gets its own rate limiter and quota tracking, so aggregate
+        throughput scales with the number of keys. The first key also becomes
+        the primary ``api_key`` unless one was set with ``with_api_key``.
+
+        Args:
+            keys: API key values
+            environment: Name of an environment variable holding
+                comma-separated API keys
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If no keys were found
+        """
+        if keys is not None:
+            found = [key.strip() for key in keys if key.strip()]
+        else:
+            found = [key.strip() for key in os.environ.get(environment or "", "").split(",") if key.strip()]
+        if not found:
+            raise ValueError("At least one API key must be provided for the key pool")
+        self._api_keys = found
+        return self
+
     def with_host(self, host: str) -> 'SettingsBuilder':
         """Set custom API host (for testing or alternative endpoints).
         
@@ -78,6 +126,170 @@ class SettingsBuilder:
         self._base_url = base_url
         return self
 
+    def with_request_timings(self, enabled: bool = True) -> 'SettingsBuilder':
+        """Attach a network timing breakdown to every response.
+
+        When enabled, responses carry ``response_timings`` with connection
+        pool wait, connect, TLS, time to first byte, download and
+        validation durations collected from httpx trace events.
+
+        Args:
+            enabled: Whether to collect timings
+
+        Returns:
+            Self for method chaining
+        """
+        self._collect_timings = enabled
+        return self
+
+    def with_request_throttle(self, seconds: float) -> 'SettingsBuilder':
+        """Set the minimum spacing between request sends of the async client.
+
+        Args:
+            seconds: Minimum seconds between requests (0 disables throttling)
+
+        Returns:
+            Self for method chaining
+        """
+        self._request_throttle_seconds = seconds
+        return self
+
+    def with_bulk_deadline(self, seconds: Optional[float]) -> 'SettingsBuilder':
+        """Shed queued bulk requests of the async client that wait longer than this.
+
+        Shed requests raise ``RequestShedError`` instead of being sent.
+
+        Args:
+            seconds: Maximum wait for a send slot, or None to never shed
+
+        Returns:
+            Self for method chaining
+        """
+        self._bulk_deadline_seconds = seconds
+        return self
+
+    def with_quota_guard(self, reserve: int, auto_resume: bool = False) -> 'SettingsBuilder':
+        """Keep a quota reserve for live requests of the async client.
+
+        Once the remaining quota reported by the API drops to ``reserve``,
+        interactive and bulk requests are stopped with ``QuotaReserveError``,
+        or paused until the quota resets when ``auto_resume`` is set.
+
+        Args:
+            reserve: Remaining-quota floor kept for live traffic
+            auto_resume: Pause instead of cancel, resuming after the reset
+
+        Returns:
+            Self for method chaining
+        """
+        self._quota_reserve = reserve
+        self._quota_auto_resume = auto_resume
+        return self
+
+    def with_parse_cache(self, entries: Optional[int] = 1024) -> 'SettingsBuilder':
+        """Skip parsing response bodies identical to the previous response of the same request.
+
+        Clients hash every raw body per request (endpoint and parameters).
+        When it matches the previous body, the earlier parsed response is
+        reused as a shallow copy with fresh ``response_headers`` and
+        ``response_unchanged=True``, so pollers can skip downstream work.
+        All responses of a request then share their nested models; do not
+        mutate them in place (see ``ParseCache``).
+
+        Args:
+            entries: Requests whose last response is kept; None disables the cache
+
+        Returns:
+            Self for method chaining
+        """
+        self._parse_cache_entries = entries
+        return self
+
+    def with_timeouts(
+            self,
+            total: Optional[float] = None,
+            connect: Optional[float] = None,
+            read: Optional[float] = None,
+            write: Optional[float] = None,
+            pool: Optional[float] = None,
+    ) -> 'SettingsBuilder':
+        """Set request timeouts in seconds.
+
+        Per-phase timeouts that are not set fall back to the total timeout.
+
+        Args:
+            total: Default timeout for every phase
+            connect: Timeout for establishing a connection (including TLS)
+            read: Timeout for receiving a chunk of the response
+            write: Timeout for sending a chunk of the request
+            pool: Timeout for acquiring a connection from the pool
+
+        Returns:
+            Self for method chaining
+        """
+        if total is not None:
+            self._request_timeout = total
+        self._connect_timeout = connect
+        self._read_timeout = read
+        self._write_timeout = write
+        self._pool_timeout = pool
+        return self
+
+    def with_connection_pool(
+            self,
+            max_connections: Optional[int] = 100,
+            max_keepalive_connections: Optional[int] = 20,
+            keepalive_expiry: Optional[float] = 5.0,
+    ) -> 'SettingsBuilder':
+        """Set connection pool limits.
+
+        Args:
+            max_connections: Maximum number of concurrent connections, None for no limit
+            max_keepalive_connections: Maximum number of idle connections kept
+                open for reuse, None for no limit
+            keepalive_expiry: Seconds an idle connection stays open, None to
+                keep idle connections indefinitely
+
+        Returns:
+            Self for method chaining
+        """
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._keepalive_expiry = keepalive_expiry
+        return self
+
+    def with_http2(self, enabled: bool = True) -> 'SettingsBuilder':
+        """Multiplex concurrent requests over a single HTTP/2 connection.
+
+        Requires the optional ``h2`` dependency (``pip install soccer-info[http2]``).
+        Servers without HTTP/2 support are still reached over HTTP/1.1.
+
+        Args:
+            enabled: Whether to negotiate HTTP/2
+
+        Returns:
+            Self for method chaining
+        """
+        self._http2 = enabled
+        return self
+
+    def with_compression(self, enabled: bool = True) -> 'SettingsBuilder':
+        """Negotiate compressed response bodies.
+
+        Compression is enabled by default with gzip and deflate; Brotli and
+        Zstandard are negotiated when installed (``pip install soccer-info[compression]``).
+        Disabling it requests uncompressed bodies, which saves CPU when the
+        API is reached over a fast local link.
+
+        Args:
+            enabled: Whether to accept compressed responses
+
+        Returns:
+            Self for method chaining
+        """
+        self._compression = enabled
+        return self
+
     def build(self) -> Settings:
         """Build and return a Settings instance with configured values."""
         api_key = self._api_key
@@ -85,11 +297,31 @@ class SettingsBuilder:
         if api_key is None and self._api_key_provider is not None:
             api_key = self._api_key_provider()
 
+        if api_key is None and self._api_keys:
+            api_key = self._api_keys[0]
+
         if api_key is None:
             raise ValueError("API key must be provided")
 
         return Settings(
             api_key=api_key,
+            api_keys=tuple(self._api_keys),
             api_host=self._api_host,
-            base_url=self._base_url
+            base_url=self._base_url,
+            request_throttle_seconds=self._request_throttle_seconds,
+            bulk_deadline_seconds=self._bulk_deadline_seconds,
+            quota_reserve=self._quota_reserve,
+            quota_auto_resume=self._quota_auto_resume,
+            request_timeout=self._request_timeout,
+            connect_timeout=self._connect_timeout,
+            read_timeout=self._read_timeout,
+            write_timeout=self._write_timeout,
+            pool_timeout=self._pool_timeout,
+            max_connections=self._max_connections,
+            max_keepalive_connections=self._max_keepalive_connections,
+            keepalive_expiry=self._keepalive_expiry,
+            http2=self._http2,
+            compression=self._compression,
+            collect_timings=self._collect_timings,
+            parse_cache_entries=self._parse_cache_entries,
         )
@@ -1,3 +1,5 @@
+from typing import Optional, Tuple
+
 from pydantic import BaseModel
 
 
@@ -8,7 +10,22 @@ class Settings(BaseModel):
     used by all API client operations.
     """
     api_key: str
+    api_keys: Tuple[str, ...] = ()  # Pooled keys; when set, requests are spread across all of them
     api_host: str = "soccer-football-info.p.rapidapi.com"
     base_url: str = "https://soccer-football-info.p.rapidapi.com"
     request_throttle_seconds: float = 0.3  # Minimum seconds between API requests
+    bulk_deadline_seconds: Optional[float] = None  # Shed queued bulk requests of the async client after this wait
+    quota_reserve: Optional[int] = None  # Remaining-quota floor kept for live requests of the async client
+    quota_auto_resume: bool = False  # Pause (instead of cancel) non-live requests until the quota resets
     request_timeout: float = 30
+    connect_timeout: Optional[float] = None  # Per-phase timeouts; None falls back to request_timeout
+    read_timeout: Optional[float] = None
+    write_timeout: Optional[float] = None
+    pool_timeout: Optional[float] = None  # Maximum wait for a free connection from the pool
+    max_connections: Optional[int] = 100  # None for no limit
+    max_keepalive_connections: Optional[int] = 20  # Idle connections kept open for reuse
+    keepalive_expiry: Optional[float] = 5.0  # Seconds an idle connection stays open
+    http2: bool = False  # Multiplex requests over HTTP/2 (requires the "http2" extra)
+    compression: bool = True  # Negotiate compressed response bodies (Accept-Encoding)
+    collect_timings: bool = False  # Attach per-request network timing breakdown to responses
+    parse_cache_entries: Optional[int] = None  # Reuse parsed responses of unchanged bodies for this many requests
@@ -0,0 +1,6 @@
+"""Local stores built from API responses: in-memory indexes and an on-disk match archive."""
+from .archive import ArchivedMatches, AsyncArchivedMatches, MatchArchive
+from .matches import MatchStore
+from .standings import Standings
+
+__all__ = ['ArchivedMatches', 'AsyncArchivedMatches', 'MatchArchive', 'MatchStore', 'Standings']
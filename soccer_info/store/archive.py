@@ -0,0 +1,477 @@
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Type, Union
+
+from soccer_info.responses import MatchBasic, MatchFull, MatchViewBasicResponse, MatchViewFullResponse
+from .matches import DateBound, Match, _normalize_date_bound
+from .standings import DEFAULT_FINISHED_STATUSES
+
+ID_SIZE = 24
+DATE_SIZE = 19
+
+_BASIC, _FULL = 0, 1
+_MODELS: Dict[int, Type[Match]] = {_BASIC: MatchBasic, _FULL: MatchFull}
+
+# Segment record header: magic, kind, match ID, date, payload length; the JSON payload follows
+_RECORD = struct.Struct(f"<4sB{ID_SIZE}s{DATE_SIZE}sI")
+_MAGIC = b"SIM1"
+# Index entry; its first bytes (ID + kind) are the ID index key, the date bytes the date index key
+_ENTRY = struct.Struct(f"<{ID_SIZE}sB{DATE_SIZE}sQI")
+_ID_KEY = slice(0, ID_SIZE + 1)
+_DATE_KEY = slice(ID_SIZE + 1, ID_SIZE + 1 + DATE_SIZE)
+_NO_DATE = bytes(DATE_SIZE)
+
+# (ID, kind, date, payload offset, payload length)
+_Entry = Tuple[bytes, int, bytes, int, int]
+
+
+class _SortedKeys:
+    """Sequence view of one key of every entry in a sorted index file, for bisect."""
+
+    def __init__(self, index: mmap.mmap, key: slice):
+        self._index = index
+        self._start = key.start
+        self._stop = key.stop
+        self._count = len(index) // _ENTRY.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position: int) -> bytes:
+        offset = position * _ENTRY.size
+        return self._index[offset + self._start:offset + self._stop]
+
+
+class _Segment:
+    """A sealed segment: its data file and ID/date index files, mapped on first use."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._maps: Optional[Tuple[mmap.mmap, mmap.mmap, mmap.mmap]] = None
+
+    def _mapped(self) -> Tuple[mmap.mmap, mmap.mmap, mmap.mmap]:
+        if self._maps is None:
+            maps = []
+            for path in (self.path, self.path.with_suffix(".ids"), self.path.with_suffix(".dates")):
+                with open(path, "rb") as f:
+                    maps.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else b"")
+            self._maps = tuple(maps)
+        return self._maps
+
+    def find(self, key: bytes) -> Optional[_Entry]:
+        """Newest entry of an ID + kind key in this segment."""
+        _, ids, _ = self._mapped()
+        position = bisect_right(_SortedKeys(ids, _ID_KEY), key) - 1
+        if position < 0 or ids[position * _ENTRY.size:position * _ENTRY.size + len(key)] != key:
+            return None
+        return _ENTRY.unpack_from(ids, position * _ENTRY.size)
+
+    def between(self, lower: bytes, upper: Optional[bytes]) -> Iterable[_Entry]:
+        """Entries whose date key is within ``[lower, upper]``, in date order."""
+        _, _, dates = self._mapped()
+        keys = _SortedKeys(dates, _DATE_KEY)
+        start = bisect_right(keys, lower) if lower == _NO_DATE else bisect_left(keys, lower)
+        end = bisect_right(keys, upper) if upper is not None else len(keys)
+        for position in range(start, end):
+            yield _ENTRY.unpack_from(dates, position * _ENTRY.size)
+
+    def read(self, offset: int, length: int) -> bytes:
+        return self._mapped()[0][offset:offset + length]
+
+    def close(self) -> None:
+        if self._maps is not None:
+            for mapped in self._maps:
+                if isinstance(mapped, mmap.mmap):
+                    mapped.close()
+            self._maps = None
+
+
+def _scan(path: Path, truncate: bool) -> List[_Entry]:
+    """Index entries of a segment, read from its record headers only.
+
+    A torn record at the end (from an interrupted write) is cut off when
+    ``truncate`` is set, otherwise ignored.
+    """
+    entries: List[_Entry] = []
+    size = path.stat().st_size
+    with open(path, "r+b" if truncate else "rb") as f:
+        offset = 0
+        while offset + _RECORD.size <= size:
+            magic, kind, match_id, match_date, length = _RECORD.unpack(f.read(_RECORD.size))
+            if magic != _MAGIC or offset + _RECORD.size + length > size:
+                break
+            entries.append((match_id, kind, match_date, offset + _RECORD.size, length))
+            offset += _RECORD.size + length
+            f.seek(offset)
+        if truncate and offset < size:
+            f.truncate(offset)
+    return entries
+
+
+def _encode(value: Optional[str], size: int, name: str) -> bytes:
+    encoded = (value or "").encode("utf-8")
+    if len(encoded) > size:
+        raise ValueError(f"Match {name} {value!r} is longer than {size} bytes")
+    return encoded.ljust(size, b"\0")
+
+
+class MatchArchive:
+    """Append-only on-disk archive of ``MatchBasic``/``MatchFull`` records.
+
+    Records are appended to segment files (``segment-00000.dat``, ...).
+    Once a segment reaches ``segment_bytes`` it is sealed: two index files
+    of fixed-width entries are written next to it, one sorted by match ID
+    and one by date. Sealed segments are read through ``mmap`` and looked
+    up by binary search, so fetching one match or a date range touches
+    only the index pages on the search path and the records themselves;
+    no file is ever parsed in full. The segment still being written is
+    indexed in memory, rebuilt from its record headers when reopened.
+
+    Appending a match again stores a new version; lookups return the
+    newest. Basic lookups are answered from the newer of a match's basic
+    and full records.
+
+    Example:
+        >>> with MatchArchive("archive/") as archive:
+        ...     archive.append_many(client.matches.get_by_day_full("20240120").result)
+        ...     archive.get("5c3c0f0d7e2b4a11", full=True)
+        ...     archive.query(date_from="20240101", date_to="20240131")
+    """
+
+    def __init__(self, directory: Union[str, Path], segment_bytes: int = 64 * 1024 * 1024):
+        """Open or create an archive.
+
+        Args:
+            directory: Directory holding the segment and index files
+            segment_bytes: Size after which the current segment is sealed
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self._sealed: List[_Segment] = []
+        self._active_path: Optional[Path] = None
+        self._active_file = None
+        self._active_entries: List[_Entry] = []
+        self._active_ids: Dict[bytes, _Entry] = {}
+        # Reads of the active segment move its file position, so they and appends take turns
+        self._active_lock = threading.Lock()
+        self._dirty = False
+
+        paths = sorted(self.directory.glob("segment-*.dat"))
+        for number, path in enumerate(paths):
+            last = number == len(paths) - 1
+            if path.with_suffix(".ids").exists() and path.with_suffix(".dates").exists():
+                self._sealed.append(_Segment(path))
+            elif last:
+                self._open_active(path, _scan(path, truncate=True))
+            else:
+                # A crash interrupted sealing; finish it
+                self._seal(path, _scan(path, truncate=False))
+
+    def __enter__(self) -> 'MatchArchive':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # =========================================================================
+    # Writing
+    # =========================================================================
+
+    def append(self, match: Match) -> None:
+        """Append one match as its newest version.
+
+        Raises:
+            ValueError: If the match has no ID, or its ID or date do not fit the index
+        """
+        self.append_many((match,))
+
+    def append_many(self, matches: Iterable[Match]) -> int:
+        """Append several matches.
+
+        Args:
+            matches: ``MatchBasic`` or ``MatchFull`` models
+
+        Returns:
+            Number of matches appended
+
+        Raises:
+            ValueError: If a match has no ID, or its ID or date do not fit the index
+        """
+        count = 0
+        for match in matches:
+            if not match.id:
+                raise ValueError("Cannot archive a match without an id")
+            kind = _FULL if isinstance(match, MatchFull) else _BASIC
+            match_id = _encode(match.id, ID_SIZE, "id")
+            match_date = _encode(match.date, DATE_SIZE, "date")
+            payload = match.model_dump_json().encode("utf-8")
+
+            if self._active_file is None:
+                self._open_active(self._segment_path(len(self._sealed)), [])
+            with self._active_lock:
+                offset = self._active_file.tell() + _RECORD.size
+                self._active_file.write(_RECORD.pack(_MAGIC, kind, match_id, match_date, len(payload)))
+                self._active_file.write(payload)
+            self._add_active((match_id, kind, match_date, offset, len(payload)))
+            self._dirty = True
+            count += 1
+
+            if offset + len(payload) >= self.segment_bytes:
+                self._seal_active()
+        return count
+
+    def flush(self) -> None:
+        """Flush appended records to the operating system."""
+        if self._active_file is not None and self._dirty:
+            self._active_file.flush()
+            self._dirty = False
+
+    def close(self) -> None:
+        """Flush pending records and release every file and mapping."""
+        self.flush()
+        if self._active_file is not None:
+            self._active_file.close()
+            self._active_file = None
+        for segment in self._sealed:
+            segment.close()
+
+    # =========================================================================
+    # Reading
+    # =========================================================================
+
+    def get(self, match_id: str, full: bool = False) -> Optional[Match]:
+        """Newest archived version of a match.
+
+        Args:
+            match_id: Match ID
+            full: Return a ``MatchFull``; otherwise a ``MatchBasic``, taken
+                from whichever of the basic and full records was archived last
+
+        Returns:
+            The match, or None if it is not archived
+        """
+        encoded = _encode(match_id, ID_SIZE, "id")
+        if full:
+            located = self._locate(encoded + bytes((_FULL,)))
+            return self._load(*located, model=MatchFull) if located is not None else None
+
+        candidates = [
+            located for located in (self._locate(encoded + bytes((kind,))) for kind in (_BASIC, _FULL))
+            if located is not None
+        ]
+        if not candidates:
+            return None
+        return self._load(*max(candidates, key=self._write_position), model=MatchBasic)
+
+    def query(
+        self,
+        date_from: Optional[DateBound] = None,
+        date_to: Optional[DateBound] = None,
+        full: bool = False,
+    ) -> List[Match]:
+        """Newest versions of the archived matches in an inclusive date range.
+
+        A bound given as a day (``date``, ``YYYYMMDD`` or ``YYYY-MM-DD``)
+        covers the whole day. Matches without a date are never returned.
+
+        Args:
+            date_from: Earliest match date
+            date_to: Latest match date
+            full: Return ``MatchFull`` records only; otherwise ``MatchBasic`` records only
+
+        Returns:
+            Matches ordered by date
+        """
+        kind = _FULL if full else _BASIC
+        lower = _normalize_date_bound(date_from).encode("utf-8") if date_from is not None else _NO_DATE
+        # b'\xff' sorts after any suffix, making day-only upper bounds inclusive
+        upper = _normalize_date_bound(date_to).encode("utf-8") + b"\xff" if date_to is not None else None
+
+        found: List[Tuple[bytes, bytes, Optional[_Segment], int, int]] = []
+        seen = set()
+        self.flush()
+        for segment in [None, *reversed(self._sealed)]:
+            entries = self._active_between(lower, upper) if segment is None else segment.between(lower, upper)
+            for match_id, entry_kind, match_date, offset, length in entries:
+                key = match_id + bytes((entry_kind,))
+                if entry_kind != kind or key in seen:
+                    continue
+                # Older versions, and versions whose newer one moved out of the range, are skipped
+                if self._locate(key) == (segment, offset, length):
+                    seen.add(key)
+                    found.append((match_date, match_id, segment, offset, length))
+        found.sort(key=lambda item: (item[0], item[1]))
+        model = _MODELS[kind]
+        return [self._load(segment, offset, length, model) for _, _, segment, offset, length in found]
+
+    # =========================================================================
+    # Segments
+    # =========================================================================
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / f"segment-{number:05d}.dat"
+
+    def _open_active(self, path: Path, entries: List[_Entry]) -> None:
+        self._active_path = path
+        self._active_file = open(path, "a+b")
+        self._active_entries = []
+        self._active_ids = {}
+        for entry in entries:
+            self._add_active(entry)
+
+    def _add_active(self, entry: _Entry) -> None:
+        self._active_entries.append(entry)
+        self._active_ids[entry[0] + bytes((entry[1],))] = entry
+
+    def _active_between(self, lower: bytes, upper: Optional[bytes]) -> List[_Entry]:
+        entries = [
+            entry for entry in self._active_entries
+            if entry[2] != _NO_DATE and entry[2] >= lower and (upper is None or entry[2] <= upper)
+        ]
+        entries.reverse()  # newest first, so the latest version of a match is seen first
+        return entries
+
+    def _seal_active(self) -> None:
+        self._active_file.close()
+        self._active_file = None
+        self._dirty = False
+        self._seal(self._active_path, self._active_entries)
+        self._active_entries = []
+        self._active_ids = {}
+
+    def _seal(self, path: Path, entries: List[_Entry]) -> None:
+        """Write the ID and date index files of a segment and add it to the sealed ones."""
+        orders = (
+            (".ids", lambda entry: (entry[0], entry[1], entry[3])),
+            (".dates", lambda entry: (entry[2], -entry[3])),
+        )
+        for suffix, order in orders:
+            target = path.with_suffix(suffix)
+            temporary = target.with_suffix(suffix + ".tmp")
+            with open(temporary, "wb") as f:
+                f.write(b"".join(_ENTRY.pack(*entry) for entry in sorted(entries, key=order)))
+            os.replace(temporary, target)
+        self._sealed.append(_Segment(path))
+
+    def _locate(self, key: bytes) -> Optional[Tuple[Optional[_Segment], int, int]]:
+        """Segment (None for the active one), offset and length of the newest record of a key."""
+        entry = self._active_ids.get(key)
+        if entry is not None:
+            return None, entry[3], entry[4]
+        for segment in reversed(self._sealed):
+            entry = segment.find(key)
+            if entry is not None:
+                return segment, entry[3], entry[4]
+        return None
+
+    def _write_position(self, located: Tuple[Optional[_Segment], int, int]) -> Tuple[int, int]:
+        """Order of located records by when they were appended: segment number, then offset."""
+        segment, offset, _ = located
+        return (len(self._sealed) if segment is None else self._sealed.index(segment)), offset
+
+    def _load(self, segment: Optional[_Segment], offset: int, length: int, model: Type[Match]) -> Match:
+        if segment is not None:
+            payload = segment.read(offset, length)
+        else:
+            self.flush()
+            with self._active_lock:
+                # Appends go to the end regardless, but their offsets are taken from the file position
+                end = self._active_file.tell()
+                self._active_file.seek(offset)
+                payload = self._active_file.read(length)
+                self._active_file.seek(end)
+        return model.model_validate_json(payload)
+
+
+# =============================================================================
+# Read-through sources
+# =============================================================================
+
+class _ArchivedMatches:
+    def __init__(
+        self,
+        matches,
+        archive: MatchArchive,
+        archive_statuses: Optional[FrozenSet[str]] = DEFAULT_FINISHED_STATUSES,
+    ):
+        """Put an archive in front of a matches domain client.
+
+        Args:
+            matches: ``client.matches`` of a sync or async client
+            archive: Archive answering lookups before the API
+            archive_statuses: Statuses of fetched matches to archive; None
+                archives every match. Matches that can still change (e.g.
+                live ones) should not be archived, or lookups return stale data.
+        """
+        self.matches = matches
+        self.archive = archive
+        self.archive_statuses = archive_statuses
+
+    @staticmethod
+    def _response(match: Match, full: bool):
+        response_model = MatchViewFullResponse if full else MatchViewBasicResponse
+        return response_model(status=200, errors=[], pagination=[], result=[match])
+
+    def _store(self, response) -> None:
+        match = response.first_result
+        if match is not None and match.id and (
+            self.archive_statuses is None or match.status in self.archive_statuses
+        ):
+            self.archive.append(match)
+
+
+class ArchivedMatches(_ArchivedMatches):
+    """Read-through ``get_view_basic``/``get_view_full`` backed by a ``MatchArchive``.
+
+    Archived matches are answered without a request; others are fetched
+    from the API and archived if their status is final. The archive has no
+    notion of language, so use one archive per response language.
+
+    Example:
+        >>> matches = ArchivedMatches(client.matches, MatchArchive("archive/"))
+        >>> matches.get_view_full("5c3c0f0d7e2b4a11").first_result
+    """
+
+    def get_view_basic(self, match_id: str, language: Optional[str] = None) -> MatchViewBasicResponse:
+        match = self.archive.get(match_id)
+        if match is not None:
+            return self._response(match, full=False)
+        response = self.matches.get_view_basic(match_id, language=language)
+        self._store(response)
+        return response
+
+    def get_view_full(self, match_id: str, language: Optional[str] = None) -> MatchViewFullResponse:
+        match = self.archive.get(match_id, full=True)
+        if match is not None:
+            return self._response(match, full=True)
+        response = self.matches.get_view_full(match_id, language=language)
+        self._store(response)
+        return response
+
+
+class AsyncArchivedMatches(_ArchivedMatches):
+    """Async counterpart of ``ArchivedMatches`` for ``AsyncHTTPXClient.matches``.
+
+    Archive reads are memory-mapped and served inline without a thread hop.
+    """
+
+    async def get_view_basic(self, match_id: str, language: Optional[str] = None) -> MatchViewBasicResponse:
+        match = self.archive.get(match_id)
+        if match is not None:
+            return self._response(match, full=False)
+        response = await self.matches.get_view_basic(match_id, language=language)
+        self._store(response)
+        return response
+
+    async def get_view_full(self, match_id: str, language: Optional[str] = None) -> MatchViewFullResponse:
+        match = self.archive.get(match_id, full=True)
+        if match is not None:
+            return self._response(match, full=True)
+        response = await self.matches.get_view_full(match_id, language=language)
+        self._store(response)
+        return response
@@ -0,0 +1,308 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from soccer_info.responses import APIResponse, MatchBasic, MatchFull
+
+Match = Union[MatchBasic, MatchFull]
+DateBound = Union[str, date, datetime]
+
+
+def _normalize_date_bound(value: DateBound) -> str:
+    """Convert a date bound to the API's sortable ``YYYY-MM-DD HH:MM:SS`` prefix form.
+
+    Accepts ``date``/``datetime`` objects and strings in ``YYYYMMDD``,
+    ``YYYY-MM-DD`` or full ``YYYY-MM-DD HH:MM:SS`` format.
+    """
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, date):
+        return value.isoformat()
+    if len(value) == 8 and value.isdigit():
+        return f'{value[:4]}-{value[4:6]}-{value[6:]}'
+    return value
+
+
+class MatchStore:
+    """In-memory match collection with secondary indexes for fast lookups.
+
+    Matches are keyed by ID and indexed by team, championship, referee,
+    stadium, status and date. Equality filters are answered by intersecting
+    index sets (smallest first) and date ranges by bisecting a sorted index,
+    so compound queries never scan the whole collection.
+
+    Re-ingesting a match that is already stored replaces it and updates
+    every index entry that changed.
+
+    Example:
+        >>> store = MatchStore()
+        >>> store.ingest(client.matches.get_by_day_basic("20240120"))
+        >>> store.query(team_id="5fda6013de647f33", date_from="2024-01-01")
+    """
+
+    def __init__(self, matches: Iterable[Match] = ()):
+        """Initialize the store, optionally seeding it with matches.
+
+        Args:
+            matches: Initial matches to upsert
+        """
+        self._matches: Dict[str, Match] = {}
+        self._by_team: Dict[str, Set[str]] = defaultdict(set)
+        self._by_championship: Dict[str, Set[str]] = defaultdict(set)
+        self._by_referee: Dict[str, Set[str]] = defaultdict(set)
+        self._by_stadium: Dict[str, Set[str]] = defaultdict(set)
+        self._by_status: Dict[str, Set[str]] = defaultdict(set)
+        # Sorted (date, match_id) pairs; matches without a date are not range-queryable
+        self._by_date: List[Tuple[str, str]] = []
+        self.upsert_many(matches)
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def __contains__(self, match_id: object) -> bool:
+        return match_id in self._matches
+
+    def __iter__(self) -> Iterator[Match]:
+        return iter(self._matches.values())
+
+    # =========================================================================
+    # Ingestion
+    # =========================================================================
+
+    def ingest(self, response: APIResponse) -> int:
+        """Upsert every match contained in an API response.
+
+        Args:
+            response: Any match response (view, day or filter, basic or full)
+
+        Returns:
+            Number of matches upserted
+        """
+        return self.upsert_many(response.result)
+
+    def upsert_many(self, matches: Iterable[Match]) -> int:
+        """Insert or replace several matches.
+
+        The date index is rebuilt once for the whole batch, which is much
+        cheaper than sorted inserts when ingesting large pages.
+
+        Args:
+            matches: Matches to upsert; later duplicates win
+
+        Returns:
+            Number of distinct matches upserted
+
+        Raises:
+            ValueError: If a match has no ID
+        """
+        pending: Dict[str, Match] = {}
+        for match in matches:
+            if not match.id:
+                raise ValueError("Cannot store a match without an id")
+            pending[match.id] = match
+        if not pending:
+            return 0
+
+        stale: Set[Tuple[str, str]] = set()
+        for match in pending.values():
+            previous = self._matches.get(match.id)
+            if previous is not None:
+                self._unindex_keys(previous)
+                if previous.date:
+                    stale.add((previous.date, previous.id))
+            self._matches[match.id] = match
+            self._index_keys(match)
+
+        if stale:
+            self._by_date = [entry for entry in self._by_date if entry not in stale]
+        self._by_date.extend((match.date, match.id) for match in pending.values() if match.date)
+        self._by_date.sort()
+        return len(pending)
+
+    def upsert(self, match: Match) -> None:
+        """Insert a match, or replace the stored version when re-fetched.
+
+        Args:
+            match: Match to store; must have an ID
+
+        Raises:
+            ValueError: If the match has no ID
+        """
+        if not match.id:
+            raise ValueError("Cannot store a match without an id")
+        previous = self._matches.get(match.id)
+        if previous is not None:
+            self._unindex(previous)
+        self._matches[match.id] = match
+        self._index(match)
+
+    def remove(self, match_id: str) -> Optional[Match]:
+        """Remove a match from the store.
+
+        Args:
+            match_id: ID of the match to remove
+
+        Returns:
+            The removed match, or None if it was not stored
+        """
+        match = self._matches.pop(match_id, None)
+        if match is not None:
+            self._unindex(match)
+        return match
+
+    def clear(self) -> None:
+        """Remove all matches and index entries."""
+        self._matches.clear()
+        for index in self._equality_indexes():
+            index.clear()
+        self._by_date.clear()
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def get(self, match_id: str) -> Optional[Match]:
+        """Get a stored match by ID."""
+        return self._matches.get(match_id)
+
+    def query(
+        self,
+        team_id: Optional[str] = None,
+        championship_id: Optional[str] = None,
+        referee_id: Optional[str] = None,
+        stadium_id: Optional[str] = None,
+        status: Optional[str] = None,
+        date_from: Optional[DateBound] = None,
+        date_to: Optional[DateBound] = None,
+    ) -> List[Match]:
+        """Find matches satisfying all given filters (AND logic).
+
+        Date bounds are inclusive. A bound given as a day (``date``,
+        ``YYYYMMDD`` or ``YYYY-MM-DD``) covers the whole day.
+
+        Args:
+            team_id: Team playing either side of the match
+            championship_id: Championship ID
+            referee_id: Referee ID
+            stadium_id: Stadium ID
+            status: Match status as reported by the API (e.g. "ENDED")
+            date_from: Earliest match date
+            date_to: Latest match date
+
+        Returns:
+            Matching matches ordered by date (undated matches last)
+        """
+        candidates: List[Set[str]] = []
+        for index, key in (
+            (self._by_team, team_id),
+            (self._by_championship, championship_id),
+            (self._by_referee, referee_id),
+            (self._by_stadium, stadium_id),
+            (self._by_status, status),
+        ):
+            if key is not None:
+                ids = index.get(key)
+                if not ids:
+                    return []
+                candidates.append(ids)
+
+        has_date_range = date_from is not None or date_to is not None
+        lower = _normalize_date_bound(date_from) if date_from is not None else None
+        upper = _normalize_date_bound(date_to) if date_to is not None else None
+
+        if not has_date_range:
+            if not candidates:
+                return self._sorted(self._matches)
+            candidates.sort(key=len)
+            return self._sorted(candidates[0].intersection(*candidates[1:]))
+
+        # Drive the query from whichever is smaller: the date range or the narrowest index set
+        start, end = self._date_bounds(lower, upper)
+        candidates.sort(key=len)
+        if not candidates or end - start <= len(candidates[0]):
+            return [
+                self._matches[match_id]
+                for _, match_id in self._by_date[start:end]
+                if all(match_id in ids for ids in candidates)
+            ]
+        ids = candidates[0].intersection(*candidates[1:])
+        return self._sorted(
+            match_id for match_id in ids if self._in_range(self._matches[match_id].date, lower, upper)
+        )
+
+    def dates(self) -> List[str]:
+        """Distinct match days (``YYYY-MM-DD``) present in the store, ascending."""
+        days: List[str] = []
+        for match_date, _ in self._by_date:
+            day = match_date[:10]
+            if not days or days[-1] != day:
+                days.append(day)
+        return days
+
+    # =========================================================================
+    # Index maintenance
+    # =========================================================================
+
+    def _equality_indexes(self) -> Tuple[Dict[str, Set[str]], ...]:
+        return self._by_team, self._by_championship, self._by_referee, self._by_stadium, self._by_status
+
+    @staticmethod
+    def _keys(match: Match) -> Iterable[Tuple[str, Optional[str]]]:
+        """Yield (index attribute name, key) pairs for a match."""
+        for team in (match.teamA, match.teamB):
+            yield '_by_team', team.id if team is not None else None
+        yield '_by_championship', match.championship.id if match.championship is not None else None
+        yield '_by_referee', match.referee.id if match.referee is not None else None
+        yield '_by_stadium', match.stadium.id if match.stadium is not None else None
+        yield '_by_status', match.status
+
+    def _index_keys(self, match: Match) -> None:
+        for index_name, key in self._keys(match):
+            if key:
+                getattr(self, index_name)[key].add(match.id)
+
+    def _unindex_keys(self, match: Match) -> None:
+        for index_name, key in self._keys(match):
+            if key:
+                index = getattr(self, index_name)
+                ids = index.get(key)
+                if ids is not None:
+                    ids.discard(match.id)
+                    if not ids:
+                        del index[key]
+
+    def _index(self, match: Match) -> None:
+        self._index_keys(match)
+        if match.date:
+            insort(self._by_date, (match.date, match.id))
+
+    def _unindex(self, match: Match) -> None:
+        self._unindex_keys(match)
+        if match.date:
+            entry = (match.date, match.id)
+            position = bisect_left(self._by_date, entry)
+            if position < len(self._by_date) and self._by_date[position] == entry:
+                del self._by_date[position]
+
+    def _date_bounds(self, lower: Optional[str], upper: Optional[str]) -> Tuple[int, int]:
+        """Positions in the sorted date index delimiting an inclusive date range."""
+        start = bisect_left(self._by_date, (lower,)) if lower is not None else 0
+        # '\uffff' sorts after any suffix, making day-only upper bounds inclusive
+        end = bisect_right(self._by_date, (upper + '\uffff',)) if upper is not None else len(self._by_date)
+        return start, end
+
+    @staticmethod
+    def _in_range(match_date: Optional[str], lower: Optional[str], upper: Optional[str]) -> bool:
+        if not match_date:
+            return False
+        if lower is not None and match_date < lower:
+            return False
+        if upper is not None and match_date[:len(upper)] > upper:
+            return False
+        return True
+
+    def _sorted(self, ids: Iterable[str]) -> List[Match]:
+        matches = [self._matches[match_id] for match_id in ids]
+        matches.sort(key=lambda match: (match.date is None, match.date or '', match.id))
+        return matches
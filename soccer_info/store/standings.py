@@ -0,0 +1,348 @@
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+from soccer_info.responses import (
+    ChampionshipDetail,
+    ChampionshipViewResponse,
+    MatchBasic,
+    MatchFull,
+    Season,
+    TableEntry,
+)
+
+Match = Union[MatchBasic, MatchFull]
+
+DEFAULT_FINISHED_STATUSES = frozenset({"ENDED"})
+
+
+@dataclass
+class _AppliedResult:
+    """Result of a match already folded into the table."""
+    home_id: str
+    away_id: str
+    home_goals: int
+    away_goals: int
+
+
+def _parse_goals(value: Optional[str]) -> Optional[int]:
+    """Parse a final score string, returning None when it is missing or not numeric."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class Standings:
+    """Standings tables maintained locally from finished match results.
+
+    Seeds from a championship view response and then applies finished
+    matches incrementally: only the two teams involved are updated, and
+    each of them is moved up or down its group table by swapping with
+    neighbours, so a re-rank costs O(positions moved) rather than a full
+    sort. Applying the same match twice is a no-op, and applying a match
+    again with a corrected score replaces its previous contribution.
+
+    Teams are ranked by points, then goal difference, then goals scored;
+    remaining ties keep the order the API reported when the table was seeded.
+    Seeding applies the same rules, so where the API ordered teams by other
+    tiebreaks (head-to-head records) the local positions can differ from
+    the reported ones. Call ``reconcile()`` periodically with a fresh API
+    response to pick up anything local results can't express (point
+    deductions made after seeding, corrected results).
+
+    Example:
+        >>> standings = Standings(client.championships.get_by_id("5778d8e65b65c7f9"))
+        >>> standings.apply_many(client.matches.get_by_day_basic("20240120").result)
+        >>> for row in standings.table():
+        ...     print(row.position, row.team.name, row.points)
+    """
+
+    def __init__(
+        self,
+        championship: Union[ChampionshipViewResponse, ChampionshipDetail],
+        season_name: Optional[str] = None,
+        points_for_win: int = 3,
+        points_for_draw: int = 1,
+        finished_statuses: FrozenSet[str] = DEFAULT_FINISHED_STATUSES,
+    ):
+        """Initialize standings from a championship view.
+
+        Args:
+            championship: Championship view response or detail to seed from
+            season_name: Season to track (default: the last season listed)
+            points_for_win: Points awarded for a win
+            points_for_draw: Points awarded for a draw
+            finished_statuses: Match statuses treated as final results
+
+        Raises:
+            ValueError: If the championship has no matching season
+        """
+        self.points_for_win = points_for_win
+        self.points_for_draw = points_for_draw
+        self.finished_statuses = finished_statuses
+        self._groups: Dict[Optional[str], List[TableEntry]] = {}
+        self._team_group: Dict[str, Optional[str]] = {}
+        self._team_index: Dict[str, int] = {}
+        self._seed_order: Dict[str, int] = {}
+        self._applied: Dict[str, _AppliedResult] = {}
+        self.championship_id: Optional[str] = None
+        self.season_name: Optional[str] = None
+        self._seed(championship, season_name)
+
+    # =========================================================================
+    # Table access
+    # =========================================================================
+
+    @property
+    def groups(self) -> List[Optional[str]]:
+        """Names of the groups in the tracked season."""
+        return list(self._groups)
+
+    @property
+    def applied_match_ids(self) -> Set[str]:
+        """IDs of the matches applied since the table was last seeded."""
+        return set(self._applied)
+
+    def table(self, group: Optional[str] = None) -> List[TableEntry]:
+        """Get a group's table in rank order.
+
+        Args:
+            group: Group name (default: the first group)
+
+        Returns:
+            Table entries ordered by position. Entries are live views of the
+            engine state and change as results are applied.
+
+        Raises:
+            KeyError: If the group does not exist
+        """
+        if group is None:
+            group = next(iter(self._groups), None)
+        return list(self._groups[group])
+
+    def entry(self, team_id: str) -> Optional[TableEntry]:
+        """Get the current table entry for a team, if it is tracked."""
+        group = self._team_group.get(team_id, False)
+        if group is False:
+            return None
+        return self._groups[group][self._team_index[team_id]]
+
+    # =========================================================================
+    # Incremental updates
+    # =========================================================================
+
+    def apply(self, match: Match) -> bool:
+        """Fold a match result into the table.
+
+        Matches that are not finished, have no numeric final score, belong
+        to another championship or season, or involve teams outside a single
+        group of this table are ignored.
+
+        Args:
+            match: Match to apply
+
+        Returns:
+            True if the table changed
+        """
+        result = self._result_of(match)
+        if result is None:
+            return False
+        previous = self._applied.get(match.id)
+        if previous == result:
+            return False
+        if previous is not None:
+            self._record(previous, sign=-1)
+        self._record(result, sign=1)
+        self._applied[match.id] = result
+        return True
+
+    def apply_many(self, matches: Iterable[Match]) -> Set[str]:
+        """Fold several match results into the table.
+
+        Args:
+            matches: Matches to apply
+
+        Returns:
+            IDs of the teams whose rows changed
+        """
+        changed: Set[str] = set()
+        for match in matches:
+            if self.apply(match):
+                result = self._applied[match.id]
+                changed.update((result.home_id, result.away_id))
+        return changed
+
+    def revert(self, match_id: str) -> bool:
+        """Remove a previously applied match result from the table.
+
+        Args:
+            match_id: ID of the applied match
+
+        Returns:
+            True if the match had been applied
+        """
+        previous = self._applied.pop(match_id, None)
+        if previous is None:
+            return False
+        self._record(previous, sign=-1)
+        return True
+
+    def reconcile(
+        self,
+        championship: Union[ChampionshipViewResponse, ChampionshipDetail],
+    ) -> Set[str]:
+        """Replace local state with a fresh API table.
+
+        The API table already includes every result applied locally, so the
+        applied-match history is cleared.
+
+        Args:
+            championship: Fresh championship view response or detail
+
+        Returns:
+            IDs of the teams whose local rows disagreed with the API
+        """
+        local = {
+            team_id: self._row_signature(self.entry(team_id))
+            for team_id in self._team_group
+        }
+        self._seed(championship, self.season_name)
+        self._applied.clear()
+        drifted = {
+            team_id
+            for team_id in self._team_group
+            if local.get(team_id) != self._row_signature(self.entry(team_id))
+        }
+        drifted.update(set(local) - set(self._team_group))
+        return drifted
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _seed(
+        self,
+        championship: Union[ChampionshipViewResponse, ChampionshipDetail],
+        season_name: Optional[str],
+    ) -> None:
+        detail = championship.first_result if isinstance(championship, ChampionshipViewResponse) else championship
+        if detail is None:
+            raise ValueError("Championship response contains no result")
+        season = self._select_season(detail.seasons, season_name)
+
+        self.championship_id = detail.id
+        self.season_name = season.name
+        self._groups.clear()
+        self._team_group.clear()
+        self._team_index.clear()
+        self._seed_order.clear()
+        for group in season.groups:
+            entries = [entry.model_copy(deep=True) for entry in group.table]
+            for entry in entries:
+                for field in ('win', 'draw', 'loss', 'points', 'goals_scored', 'goals_conceded'):
+                    if getattr(entry, field) is None:
+                        setattr(entry, field, 0)
+            # Rank by the same rules as _rerank, which relies on the table being sorted by
+            # _rank_key; the API position only breaks the remaining ties
+            api_order = {
+                entry.team.id: (entry.position if entry.position is not None else len(entries), index)
+                for index, entry in enumerate(entries)
+            }
+            table = sorted(entries, key=lambda entry: (*self._stats_key(entry), api_order[entry.team.id]))
+            for index, entry in enumerate(table):
+                entry.position = index + 1
+                self._team_group[entry.team.id] = group.name
+                self._team_index[entry.team.id] = index
+                self._seed_order[entry.team.id] = index
+            self._groups[group.name] = table
+
+    @staticmethod
+    def _select_season(seasons: List[Season], season_name: Optional[str]) -> Season:
+        if not seasons:
+            raise ValueError("Championship has no seasons")
+        if season_name is None:
+            return seasons[-1]
+        for season in seasons:
+            if season.name == season_name:
+                return season
+        raise ValueError(f"Season {season_name!r} not found")
+
+    def _result_of(self, match: Match) -> Optional[_AppliedResult]:
+        if not match.id or match.status not in self.finished_statuses:
+            return None
+        if match.teamA is None or match.teamB is None or match.teamA.score is None or match.teamB.score is None:
+            return None
+        championship = match.championship
+        if championship is not None:
+            if championship.id and self.championship_id and championship.id != self.championship_id:
+                return None
+            if championship.s_name and self.season_name and championship.s_name != self.season_name:
+                return None
+
+        home_id, away_id = match.teamA.id, match.teamB.id
+        if home_id not in self._team_group or away_id not in self._team_group:
+            return None
+        if self._team_group[home_id] != self._team_group[away_id]:
+            return None
+
+        home_goals = _parse_goals(match.teamA.score.f)
+        away_goals = _parse_goals(match.teamB.score.f)
+        if home_goals is None or away_goals is None:
+            return None
+        return _AppliedResult(home_id, away_id, home_goals, away_goals)
+
+    def _record(self, result: _AppliedResult, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a result and re-rank both teams."""
+        for team_id, scored, conceded in (
+            (result.home_id, result.home_goals, result.away_goals),
+            (result.away_id, result.away_goals, result.home_goals),
+        ):
+            entry = self.entry(team_id)
+            entry.goals_scored += sign * scored
+            entry.goals_conceded += sign * conceded
+            if scored > conceded:
+                entry.win += sign
+                entry.points += sign * self.points_for_win
+            elif scored == conceded:
+                entry.draw += sign
+                entry.points += sign * self.points_for_draw
+            else:
+                entry.loss += sign
+            self._rerank(team_id)
+
+    @staticmethod
+    def _stats_key(entry: TableEntry) -> Tuple[int, int, int]:
+        return -entry.points, -(entry.goals_scored - entry.goals_conceded), -entry.goals_scored
+
+    def _rank_key(self, entry: TableEntry) -> Tuple[int, int, int, int]:
+        return (*self._stats_key(entry), self._seed_order[entry.team.id])
+
+    def _rerank(self, team_id: str) -> None:
+        """Move a team to its correct position by swapping with its neighbours."""
+        table = self._groups[self._team_group[team_id]]
+        index = self._team_index[team_id]
+        key = self._rank_key(table[index])
+
+        while index > 0 and key < self._rank_key(table[index - 1]):
+            self._swap(table, index, index - 1)
+            index -= 1
+        while index < len(table) - 1 and self._rank_key(table[index + 1]) < key:
+            self._swap(table, index, index + 1)
+            index += 1
+
+    def _swap(self, table: List[TableEntry], i: int, j: int) -> None:
+        table[i], table[j] = table[j], table[i]
+        for index in (i, j):
+            table[index].position = index + 1
+            self._team_index[table[index].team.id] = index
+
+    @staticmethod
+    def _row_signature(entry: Optional[TableEntry]) -> Optional[Tuple]:
+        if entry is None:
+            return None
+        return (
+            entry.position, entry.win, entry.draw, entry.loss,
+            entry.points, entry.goals_scored, entry.goals_conceded,
+        )
@@ -0,0 +1,24 @@
+"""httpx transports for offline load testing, deterministic benchmarks and alternative HTTP stacks.
+
+``Urllib3Transport`` and ``AiohttpTransport`` import their HTTP library
+when created, so it is only required by code that uses them.
+"""
+from .aiohttp_ import AiohttpTransport
+from .cassette import Cassette, CassetteMissError, Interaction, RecordedRequest, RecordedResponse
+from .memory import InMemoryTransport
+from .recording import RecordingTransport
+from .replay import ReplayTransport
+from .urllib3_ import Urllib3Transport
+
+__all__ = [
+    'AiohttpTransport',
+    'Cassette',
+    'CassetteMissError',
+    'InMemoryTransport',
+    'Interaction',
+    'RecordedRequest',
+    'RecordedResponse',
+    'RecordingTransport',
+    'ReplayTransport',
+    'Urllib3Transport',
+]
@@ -0,0 +1,130 @@
+import asyncio
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+import httpx
+
+from soccer_info.settings import Settings
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class AiohttpTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport sending requests through an aiohttp session.
+
+    Drop-in replacement for httpx's own transport in ``AsyncHTTPXClient``:
+    httpx still builds requests and decodes compressed bodies, while
+    aiohttp does the connection handling and HTTP/1.1 exchange. The session
+    is created on the first request, inside the running event loop, and
+    closed with the client. Pass pool limits to the transport itself; httpx
+    ignores the client's limits once a transport is given.
+
+    Connect and read timeouts are applied per request; aiohttp has no
+    separate write or pool timeout. No httpcore trace events are emitted, so
+    ``response_timings`` carry the total duration but no per-phase breakdown.
+
+    Example:
+        >>> client = AsyncHTTPXClient(settings, transport=AiohttpTransport.from_settings(settings))
+
+    Raises:
+        ImportError: If aiohttp is not installed
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = 100,
+        keepalive_expiry: Optional[float] = 5.0,
+        verify: bool = True,
+    ):
+        """Initialize the transport.
+
+        Args:
+            max_connections: Connections open at once; requests wait for a
+                free one beyond that. None for no limit
+            keepalive_expiry: Seconds an idle connection stays open
+            verify: Verify TLS certificates
+        """
+        try:
+            import aiohttp
+            import yarl
+        except ImportError as error:
+            raise ImportError(
+                "AiohttpTransport requires the aiohttp package; "
+                "install it with `pip install soccer-info[aiohttp]`"
+            ) from error
+        self._aiohttp = aiohttp
+        self._url = yarl.URL
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.verify = verify
+        self._session: Optional['aiohttp.ClientSession'] = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> 'AiohttpTransport':
+        """Create a transport with the connection limits of ``settings``."""
+        return cls(max_connections=settings.max_connections, keepalive_expiry=settings.keepalive_expiry)
+
+    @property
+    def session(self) -> 'aiohttp.ClientSession':
+        """The aiohttp session, created on first access."""
+        if self._session is None:
+            connector = self._aiohttp.TCPConnector(
+                limit=self.max_connections or 0,
+                keepalive_timeout=self.keepalive_expiry,
+                ssl=None if self.verify else False,
+            )
+            # Bodies are passed on compressed; httpx decodes them
+            self._session = self._aiohttp.ClientSession(connector=connector, auto_decompress=False)
+        return self._session
+
+    @contextmanager
+    def _map_errors(self, request: httpx.Request) -> Iterator[None]:
+        """Re-raise aiohttp errors as the httpx errors callers handle."""
+        aiohttp = self._aiohttp
+        try:
+            yield
+        except aiohttp.ConnectionTimeoutError as error:
+            raise httpx.ConnectTimeout(str(error), request=request) from error
+        except (aiohttp.ServerTimeoutError, asyncio.TimeoutError) as error:
+            raise httpx.ReadTimeout(str(error), request=request) from error
+        except aiohttp.ClientConnectorError as error:
+            raise httpx.ConnectError(str(error), request=request) from error
+        except (aiohttp.ServerDisconnectedError, aiohttp.ClientPayloadError, aiohttp.ClientResponseError) as error:
+            raise httpx.RemoteProtocolError(str(error), request=request) from error
+        except aiohttp.ClientError as error:
+            raise httpx.NetworkError(str(error), request=request) from error
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        timeout: Dict[str, Optional[float]] = request.extensions.get("timeout", {})
+        with self._map_errors(request):
+            async with self.session.request(
+                request.method,
+                # Already encoded by httpx; keep yarl from re-quoting it
+                self._url(str(request.url), encoded=True),
+                headers=dict(request.headers),
+                data=await request.aread() or None,
+                allow_redirects=False,
+                timeout=self._aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=timeout.get("connect"),
+                    sock_read=timeout.get("read"),
+                ),
+            ) as response:
+                content = await response.read()
+
+        extensions: Dict[str, Any] = {
+            "http_version": f"HTTP/{response.version.major}.{response.version.minor}".encode("ascii"),
+            "reason_phrase": (response.reason or "").encode("ascii", "replace"),
+        }
+        return httpx.Response(
+            response.status,
+            headers=list(response.raw_headers),
+            stream=httpx.ByteStream(content),
+            extensions=extensions,
+        )
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -0,0 +1,177 @@
+import base64
+import hashlib
+import json
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import httpx
+from pydantic import BaseModel, Field
+
+from soccer_info.requests_.headers import API_KEY_HEADER, mask_api_key
+
+# Headers describing the wire encoding; recorded bodies are stored decoded
+WIRE_ENCODING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class CassetteMissError(LookupError):
+    """Raised when a replayed request has no recorded response."""
+
+
+class RecordedRequest(BaseModel):
+    """Request part of a recorded interaction, with the API key masked."""
+    method: str
+    url: str
+    headers: Dict[str, str] = Field(default_factory=dict)
+
+
+class RecordedResponse(BaseModel):
+    """Single recorded response with its timing."""
+    status_code: int
+    headers: Dict[str, str] = Field(default_factory=dict)
+    body: Optional[str] = None
+    body_base64: Optional[str] = None
+    elapsed: float = Field(default=0.0, description="Seconds from sending the request to reading the body")
+    recorded_at: Optional[str] = None
+
+    @property
+    def content(self) -> bytes:
+        """Decoded response body bytes."""
+        if self.body_base64 is not None:
+            return base64.b64decode(self.body_base64)
+        return (self.body or "").encode("utf-8")
+
+    def to_httpx(self, request: httpx.Request) -> httpx.Response:
+        """Build an httpx response for a request from this recording."""
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+
+class Interaction(BaseModel):
+    """All responses recorded for one request key, in recording order."""
+    request: RecordedRequest
+    responses: List[RecordedResponse] = Field(default_factory=list)
+
+
+def request_key(request: httpx.Request) -> str:
+    """Stable identifier of a request: method, path and sorted query parameters.
+
+    The host is not part of the key, so cassettes recorded against the real
+    API replay for any base URL.
+    """
+    query = sorted(request.url.params.multi_items())
+    raw = json.dumps([request.method, request.url.path, query], separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+
+
+def masked_request_headers(request: httpx.Request) -> Dict[str, str]:
+    """Request headers with the RapidAPI key masked."""
+    api_key_header = API_KEY_HEADER.lower()
+    return {
+        name: mask_api_key(value) if name.lower() == api_key_header else value
+        for name, value in request.headers.items()
+    }
+
+
+class Cassette:
+    """Directory of recorded API interactions, one JSON file per request key.
+
+    Example:
+        >>> cassette = Cassette(Path("cassettes/championships"))
+        >>> len(cassette)
+        12
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """Open (and lazily create) a cassette directory.
+
+        Args:
+            directory: Directory holding the interaction files
+        """
+        self.directory = Path(directory)
+        self._interactions: Optional[Dict[str, Interaction]] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    @property
+    def interactions(self) -> Dict[str, Interaction]:
+        """Recorded interactions by request key, loaded from disk on first access."""
+        if self._interactions is None:
+            with self._lock:
+                if self._interactions is None:
+                    interactions = {}
+                    if self.directory.is_dir():
+                        for path in sorted(self.directory.glob("*.json")):
+                            interactions[path.stem] = Interaction.model_validate_json(path.read_bytes())
+                    self._interactions = interactions
+        return self._interactions
+
+    def responses(self, request: httpx.Request) -> List[RecordedResponse]:
+        """Get the responses recorded for a request.
+
+        Raises:
+            CassetteMissError: If nothing was recorded for the request
+        """
+        interaction = self.interactions.get(request_key(request))
+        if interaction is None or not interaction.responses:
+            raise CassetteMissError(f"No recorded response for {request.method} {request.url}")
+        return interaction.responses
+
+    def record(self, request: httpx.Request, response: httpx.Response, elapsed: float) -> RecordedResponse:
+        """Append a response to the cassette and persist its interaction file.
+
+        The response body must already have been read.
+
+        Args:
+            request: Request that was sent
+            response: Response received (already read)
+            elapsed: Seconds from sending the request to reading the body
+
+        Returns:
+            The recorded response
+        """
+        content = response.content
+        try:
+            body, body_base64 = content.decode("utf-8"), None
+        except UnicodeDecodeError:
+            body, body_base64 = None, base64.b64encode(content).decode("ascii")
+        recorded = RecordedResponse(
+            status_code=response.status_code,
+            headers={
+                name: value for name, value in response.headers.items()
+                if name.lower() not in WIRE_ENCODING_HEADERS
+            },
+            body=body,
+            body_base64=body_base64,
+            elapsed=elapsed,
+            recorded_at=datetime.now(timezone.utc).isoformat(),
+        )
+
+        key = request_key(request)
+        with self._lock:
+            interaction = self.interactions.get(key)
+            if interaction is None:
+                interaction = Interaction(
+                    request=RecordedRequest(
+                        method=request.method,
+                        url=str(request.url),
+                        headers=masked_request_headers(request),
+                    )
+                )
+                self.interactions[key] = interaction
+            interaction.responses.append(recorded)
+
+            # Write through a temporary file so an interrupted recording never leaves a torn file
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{key}.json"
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(interaction.model_dump_json(indent=2), encoding="utf-8")
+            tmp_path.replace(path)
+        return recorded
@@ -0,0 +1,71 @@
+import threading
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+import httpx
+
+Route = Union[bytes, str, Callable[[httpx.Request], httpx.Response]]
+
+
+class InMemoryTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport answering requests from memory by URL path.
+
+    Each route maps an endpoint path (e.g. ``"/matches/day/basic/"``) to a
+    fixed JSON body or to a handler building the response. Nothing is
+    copied, parsed or slept per request, so the transport also serves as
+    the zero-network baseline when comparing HTTP stacks.
+
+    Works with both ``HTTPXClient`` and ``AsyncHTTPXClient``.
+
+    Example:
+        >>> transport = InMemoryTransport({"/countries/list/": b'{"status": 200, "errors": [], "result": []}'})
+        >>> client = HTTPXClient(settings, transport=transport)
+
+    Attributes:
+        requests: Requests answered so far, per path
+    """
+
+    def __init__(
+        self,
+        routes: Optional[Mapping[str, Route]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            routes: Body (bytes or str) or handler per URL path; unknown paths get a 404
+            headers: Headers sent with every fixed body, besides content type and length
+        """
+        self._headers: List[Tuple[str, str]] = [("content-type", "application/json"), *(headers or {}).items()]
+        self._routes: Dict[str, Callable[[httpx.Request], httpx.Response]] = {}
+        self._lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        for path, route in (routes or {}).items():
+            self.add(path, route)
+
+    def add(self, path: str, route: Route) -> None:
+        """Serve ``route`` for requests to ``path``, replacing an earlier route."""
+        if callable(route):
+            self._routes[path] = route
+            return
+        body = route.encode("utf-8") if isinstance(route, str) else route
+        headers = [*self._headers, ("content-length", str(len(body)))]
+        self._routes[path] = lambda request: httpx.Response(200, headers=headers, content=body)
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        with self._lock:
+            self.requests[path] = self.requests.get(path, 0) + 1
+        route = self._routes.get(path)
+        if route is None:
+            return httpx.Response(404, json={"status": 404, "errors": [f"No route for {path}"], "result": []})
+        return route(request)
+
+    # =========================================================================
+    # httpx transport interface
+    # =========================================================================
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request)
@@ -0,0 +1,82 @@
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+import httpx
+
+from .cassette import Cassette, WIRE_ENCODING_HEADERS
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport that records every real response into a cassette.
+
+    Wraps a network transport, reads each response in full, stores its
+    status, headers, body and timing (with the request's API key masked)
+    and hands the caller an equivalent in-memory response. Works with both
+    ``HTTPXClient`` and ``AsyncHTTPXClient``.
+
+    Example:
+        >>> from soccer_info.client import HTTPXClient
+        >>> transport = RecordingTransport("cassettes/backfill")
+        >>> with HTTPXClient(settings, transport=transport) as client:
+        ...     client.championships.get_list()
+    """
+
+    def __init__(
+        self,
+        cassette: Union[Cassette, str, Path],
+        transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = None,
+    ):
+        """Initialize the recording transport.
+
+        Args:
+            cassette: Cassette, or directory to record into
+            transport: Transport performing the real requests. Defaults to
+                httpx's network transport of the matching (sync/async) kind.
+        """
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.HTTPTransport()
+        start = time.perf_counter()
+        response = self._transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return self._record(request, response, time.perf_counter() - start)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport()
+        start = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return self._record(request, response, time.perf_counter() - start)
+
+    def _record(self, request: httpx.Request, response: httpx.Response, elapsed: float) -> httpx.Response:
+        self.cassette.record(request, response, elapsed)
+        # The body is already decoded, so drop headers describing the wire encoding
+        return httpx.Response(
+            response.status_code,
+            headers=[
+                (name, value) for name, value in response.headers.multi_items()
+                if name.lower() not in WIRE_ENCODING_HEADERS
+            ],
+            content=response.content,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        if isinstance(self._transport, httpx.BaseTransport):
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        if isinstance(self._transport, httpx.AsyncBaseTransport):
+            await self._transport.aclose()
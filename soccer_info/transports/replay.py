@@ -0,0 +1,160 @@
+import asyncio
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Literal, Optional, Tuple, Union
+
+import httpx
+
+from .cassette import Cassette, RecordedResponse, request_key
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport that serves recorded responses without network access.
+
+    Requests are matched to a cassette by method, path and query parameters.
+    When several responses were recorded for the same request they are
+    served in turn, cycling back to the first. On top of the recordings the
+    transport can simulate production conditions:
+
+    - latency: a fixed delay, or the recorded timing, plus random jitter
+    - 429 injection: a fraction of requests answered with ``429 Too Many Requests``
+    - rate-limit headers: an ``x-ratelimit-request-*`` quota that counts down
+      per request, resets every period, and answers 429 once exhausted, with
+      a ``Retry-After`` of the time left until the reset
+
+    Works with both ``HTTPXClient`` and ``AsyncHTTPXClient``; the async path
+    sleeps with ``asyncio.sleep`` so concurrent requests overlap as they
+    would against the real API.
+
+    Example:
+        >>> from soccer_info.client import AsyncHTTPXClient
+        >>> transport = ReplayTransport("cassettes/backfill", latency=0.12, jitter=0.03, rate_limit=500)
+        >>> client = AsyncHTTPXClient(settings, transport=transport)
+    """
+
+    def __init__(
+        self,
+        cassette: Union[Cassette, str, Path],
+        latency: Union[float, Literal["recorded"]] = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        rate_limit: Optional[int] = None,
+        rate_limit_period: float = 86400.0,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the replay transport.
+
+        Args:
+            cassette: Cassette, or directory holding the recordings
+            latency: Seconds added to every response, or "recorded" to replay
+                each response with its recorded timing
+            jitter: Maximum random deviation (+/- seconds) added to the latency
+            throttle_rate: Fraction of requests (0-1) answered with a 429
+            rate_limit: Simulated request quota per period; None disables
+                rate-limit headers
+            rate_limit_period: Length of a rate-limit period in seconds
+            seed: Random seed for reproducible jitter and 429 injection
+        """
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.rate_limit = rate_limit
+        self.rate_limit_period = rate_limit_period
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._positions: Dict[str, int] = defaultdict(int)
+        self._period_start = time.monotonic()
+        self._remaining = rate_limit
+
+    # =========================================================================
+    # httpx transport interface
+    # =========================================================================
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response, delay = self._prepare(request)
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response, delay = self._prepare(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return response
+
+    # =========================================================================
+    # Simulation
+    # =========================================================================
+
+    def reset_rate_limit(self) -> None:
+        """Start a new rate-limit period with a full quota."""
+        with self._lock:
+            self._period_start = time.monotonic()
+            self._remaining = self.rate_limit
+
+    def _prepare(self, request: httpx.Request) -> Tuple[httpx.Response, float]:
+        """Pick the response for a request and the delay before serving it."""
+        with self._lock:
+            recorded = self._next_recording(request)
+            delay = self._delay(recorded)
+            rate_headers, reset_after = self._consume_quota()
+            injected = self.throttle_rate > 0 and self._random.random() < self.throttle_rate
+
+        if reset_after is not None or injected:
+            # An exhausted quota only frees up at the reset; an injected 429 is a momentary throttle
+            retry_after = reset_after if reset_after is not None else 1
+            response = httpx.Response(
+                429,
+                json={"message": "Too many requests"},
+                headers={"retry-after": str(retry_after), **rate_headers},
+                request=request,
+            )
+        else:
+            response = recorded.to_httpx(request)
+            response.headers.update(rate_headers)
+        return response, delay
+
+    def _next_recording(self, request: httpx.Request) -> RecordedResponse:
+        responses = self.cassette.responses(request)
+        key = request_key(request)
+        position = self._positions[key]
+        self._positions[key] = (position + 1) % len(responses)
+        return responses[position]
+
+    def _delay(self, recorded: RecordedResponse) -> float:
+        base = recorded.elapsed if self.latency == "recorded" else self.latency
+        if self.jitter:
+            base += self._random.uniform(-self.jitter, self.jitter)
+        return max(base, 0.0)
+
+    def _consume_quota(self) -> Tuple[Dict[str, str], Optional[int]]:
+        """Count a request against the simulated quota.
+
+        Returns:
+            Rate-limit headers to attach, and the whole seconds until the
+            quota resets if it was already exhausted, otherwise None
+        """
+        if self.rate_limit is None:
+            return {}, None
+        elapsed = time.monotonic() - self._period_start
+        if elapsed >= self.rate_limit_period:
+            periods = int(elapsed // self.rate_limit_period)
+            self._period_start += periods * self.rate_limit_period
+            self._remaining = self.rate_limit
+            elapsed -= periods * self.rate_limit_period
+
+        exhausted = self._remaining <= 0
+        if not exhausted:
+            self._remaining -= 1
+        headers = {
+            "x-ratelimit-request-limit": str(self.rate_limit),
+            "x-ratelimit-request-remaining": str(self._remaining),
+            "x-ratelimit-request-reset": str(int(self.rate_limit_period - elapsed)),
+        }
+        # Rounded up, so a client waiting this long finds the quota reset
+        return headers, max(1, math.ceil(self.rate_limit_period - elapsed)) if exhausted else None
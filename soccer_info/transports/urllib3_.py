@@ -0,0 +1,123 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+import httpx
+
+from soccer_info.settings import Settings
+
+_HTTP_VERSIONS = {10: b"HTTP/1.0", 11: b"HTTP/1.1", 20: b"HTTP/2"}
+
+
+class Urllib3Transport(httpx.BaseTransport):
+    """Sync httpx transport sending requests through a urllib3 connection pool.
+
+    Drop-in replacement for httpx's own transport in ``HTTPXClient``:
+    httpx still builds requests, applies timeouts and decodes compressed
+    bodies, while urllib3 does the connection handling and HTTP/1.1
+    exchange. Pass pool limits to the transport itself; httpx ignores the
+    client's limits once a transport is given.
+
+    Only HTTP/1.1 is supported and no httpcore trace events are emitted, so
+    ``response_timings`` carry the total duration but no per-phase breakdown.
+
+    Example:
+        >>> client = HTTPXClient(settings, transport=Urllib3Transport.from_settings(settings))
+
+    Raises:
+        ImportError: If urllib3 is not installed
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        verify: bool = True,
+    ):
+        """Initialize the transport.
+
+        Args:
+            max_connections: Connections open at once per host; requests wait
+                for a free one beyond that. None for no limit
+            max_keepalive_connections: Idle connections kept per host when
+                ``max_connections`` is None
+            verify: Verify TLS certificates
+        """
+        try:
+            import urllib3
+        except ImportError as error:
+            raise ImportError(
+                "Urllib3Transport requires the urllib3 package; "
+                "install it with `pip install soccer-info[urllib3]`"
+            ) from error
+        self._urllib3 = urllib3
+        limited = max_connections is not None
+        self._pool = urllib3.PoolManager(
+            maxsize=max_connections if limited else (max_keepalive_connections or 1),
+            block=limited,
+            cert_reqs="CERT_REQUIRED" if verify else "CERT_NONE",
+            retries=False,
+        )
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> 'Urllib3Transport':
+        """Create a transport with the connection limits of ``settings``."""
+        return cls(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+        )
+
+    @contextmanager
+    def _map_errors(self, request: httpx.Request) -> Iterator[None]:
+        """Re-raise urllib3 errors as the httpx errors callers handle."""
+        exceptions = self._urllib3.exceptions
+        try:
+            yield
+        except exceptions.EmptyPoolError as error:
+            raise httpx.PoolTimeout(str(error), request=request) from error
+        except exceptions.NewConnectionError as error:
+            raise httpx.ConnectError(str(error), request=request) from error
+        except exceptions.ConnectTimeoutError as error:
+            raise httpx.ConnectTimeout(str(error), request=request) from error
+        except exceptions.ReadTimeoutError as error:
+            raise httpx.ReadTimeout(str(error), request=request) from error
+        except exceptions.SSLError as error:
+            raise httpx.ConnectError(str(error), request=request) from error
+        except exceptions.ProtocolError as error:
+            raise httpx.RemoteProtocolError(str(error), request=request) from error
+        except exceptions.HTTPError as error:
+            raise httpx.NetworkError(str(error), request=request) from error
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        timeout: Dict[str, Optional[float]] = request.extensions.get("timeout", {})
+        with self._map_errors(request):
+            response = self._pool.urlopen(
+                request.method,
+                str(request.url),
+                body=request.read() or None,
+                headers=dict(request.headers),
+                redirect=False,
+                retries=False,
+                preload_content=False,
+                decode_content=False,
+                timeout=self._urllib3.Timeout(connect=timeout.get("connect"), read=timeout.get("read")),
+                pool_timeout=timeout.get("pool"),
+            )
+            try:
+                content = response.read(decode_content=False)
+            finally:
+                response.release_conn()
+
+        extensions: Dict[str, Any] = {
+            "http_version": _HTTP_VERSIONS.get(response.version, b"HTTP/1.1"),
+            "reason_phrase": (response.reason or "").encode("ascii", "replace"),
+        }
+        # The raw body goes into a stream so httpx decodes it according to Content-Encoding
+        return httpx.Response(
+            response.status,
+            headers=list(response.headers.items()),
+            stream=httpx.ByteStream(content),
+            extensions=extensions,
+        )
+
+    def close(self) -> None:
+        self._pool.clear()
@@ -0,0 +1,33 @@
+import json
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+
+from soccer_info.settings import Settings
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def countries_payload(codes: Optional[List[str]] = None) -> Dict[str, Any]:
+    """A /countries/list/ response body listing ``codes``."""
+    codes = ["IT", "ES"] if codes is None else codes
+    return {
+        "status": 200,
+        "errors": [],
+        "pagination": [{"page": 1, "per_page": 100, "items": len(codes)}],
+        "result": [{"code": code, "name": f"Country {code}", "timezones": []} for code in codes],
+    }
+
+
+def countries_body(codes: Optional[List[str]] = None) -> bytes:
+    return json.dumps(countries_payload(codes)).encode("utf-8")
+
+
+def json_response(body: bytes, status: int = 200, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+    return httpx.Response(status, headers={**JSON_HEADERS, **(headers or {})}, content=body)
+
+
+@pytest.fixture
+def settings() -> Settings:
+    return Settings(api_key="test-key", base_url="http://api.test", request_throttle_seconds=0)
@@ -0,0 +1,184 @@
+import pytest
+
+from soccer_info.responses import MatchBasic, MatchFull
+from soccer_info.store import MatchArchive
+from soccer_info.store.archive import _RECORD
+
+
+def basic(match_id: str, date: str, status: str = "finished") -> MatchBasic:
+    return MatchBasic.model_validate({"id": match_id, "date": date, "status": status})
+
+
+def full(match_id: str, date: str, status: str = "finished") -> MatchFull:
+    return MatchFull.model_validate({"id": match_id, "date": date, "status": status})
+
+
+def ids(matches) -> list:
+    return [match.id for match in matches]
+
+
+def test_get_and_query(tmp_path):
+    with MatchArchive(tmp_path) as archive:
+        archive.append_many([
+            basic("b", "2024-01-21 18:00:00"),
+            basic("a", "2024-01-20 15:00:00"),
+            basic("c", "2024-02-01 12:00:00"),
+        ])
+        archive.append(full("a", "2024-01-20 15:00:00"))
+
+        assert archive.get("b").date == "2024-01-21 18:00:00"
+        assert archive.get("missing") is None
+        assert isinstance(archive.get("a", full=True), MatchFull)
+        assert archive.get("b", full=True) is None
+        assert ids(archive.query("20240120", "20240121")) == ["a", "b"]
+        assert ids(archive.query(date_from="2024-01-21")) == ["b", "c"]
+        assert ids(archive.query(full=True)) == ["a"]
+
+
+def test_full_record_answers_basic_lookup(tmp_path):
+    with MatchArchive(tmp_path) as archive:
+        archive.append(full("a", "2024-01-20 15:00:00"))
+        match = archive.get("a")
+
+    assert type(match) is MatchBasic
+    assert match.id == "a"
+
+
+def test_reopen_reads_sealed_and_active_segments(tmp_path):
+    with MatchArchive(tmp_path, segment_bytes=1) as archive:
+        archive.append_many([basic("a", "2024-01-20 15:00:00"), basic("b", "2024-01-21 15:00:00")])
+    with MatchArchive(tmp_path) as archive:
+        archive.append(basic("c", "2024-01-22 15:00:00"))
+    with MatchArchive(tmp_path) as archive:
+        assert ids(archive.query()) == ["a", "b", "c"]
+    assert sorted(path.name for path in tmp_path.glob("*.ids")) == ["segment-00000.ids", "segment-00001.ids"]
+
+
+# =============================================================================
+# Crash recovery
+# =============================================================================
+
+@pytest.mark.parametrize("torn", [b"SIM", _RECORD.pack(b"SIM1", 0, b"x" * 24, b"2024" + bytes(15), 500) + b"{}"])
+def test_torn_record_is_cut_on_reopen(tmp_path, torn):
+    with MatchArchive(tmp_path) as archive:
+        archive.append_many([basic("a", "2024-01-20 15:00:00"), basic("b", "2024-01-21 15:00:00")])
+    segment = tmp_path / "segment-00000.dat"
+    intact = segment.stat().st_size
+    with open(segment, "ab") as f:
+        f.write(torn)
+
+    with MatchArchive(tmp_path) as archive:
+        assert segment.stat().st_size == intact
+        assert ids(archive.query()) == ["a", "b"]
+        archive.append(basic("c", "2024-01-22 15:00:00"))
+
+    with MatchArchive(tmp_path) as archive:
+        assert ids(archive.query()) == ["a", "b", "c"]
+        assert archive.get("c").date == "2024-01-22 15:00:00"
+
+
+@pytest.mark.parametrize("removed", [(".ids", ".dates"), (".ids",), (".dates",)])
+def test_interrupted_seal_is_finished_on_reopen(tmp_path, removed):
+    with MatchArchive(tmp_path, segment_bytes=1) as archive:
+        archive.append_many([basic("a", "2024-01-20 15:00:00"), basic("b", "2024-01-21 15:00:00")])
+        archive.segment_bytes = 1024 * 1024
+        archive.append(basic("c", "2024-01-22 15:00:00"))
+    for suffix in removed:
+        (tmp_path / "segment-00000.dat").with_suffix(suffix).unlink()
+
+    with MatchArchive(tmp_path) as archive:
+        assert (tmp_path / "segment-00000.ids").exists()
+        assert (tmp_path / "segment-00000.dates").exists()
+        assert archive.get("a").id == "a"
+        assert ids(archive.query()) == ["a", "b", "c"]
+
+
+def test_unsealed_last_segment_is_reopened_as_active(tmp_path):
+    with MatchArchive(tmp_path, segment_bytes=1) as archive:
+        archive.append_many([basic("a", "2024-01-20 15:00:00"), basic("b", "2024-01-21 15:00:00")])
+    (tmp_path / "segment-00001.ids").unlink()
+
+    with MatchArchive(tmp_path, segment_bytes=1024 * 1024) as archive:
+        archive.append(basic("c", "2024-01-22 15:00:00"))
+        assert ids(archive.query()) == ["a", "b", "c"]
+    assert not (tmp_path / "segment-00002.dat").exists()
+
+
+# =============================================================================
+# Versions
+# =============================================================================
+
+@pytest.mark.parametrize("segment_bytes", [1, 1024 * 1024])
+def test_newest_version_wins(tmp_path, segment_bytes):
+    with MatchArchive(tmp_path, segment_bytes=segment_bytes) as archive:
+        archive.append(basic("a", "2024-01-20 15:00:00", status="scheduled"))
+        archive.append(basic("b", "2024-01-20 18:00:00"))
+        # Postponed: the newer version moves to another day
+        archive.append(basic("a", "2024-01-27 15:00:00", status="postponed"))
+
+        for reopened in (archive, None):
+            if reopened is None:
+                archive.close()
+                archive = MatchArchive(tmp_path, segment_bytes=segment_bytes)
+            assert archive.get("a").status == "postponed"
+            assert ids(archive.query("20240120", "20240120")) == ["b"]
+            assert [(match.id, match.status) for match in archive.query("20240127", "20240127")] == [("a", "postponed")]
+            assert ids(archive.query()) == ["b", "a"]
+
+
+def test_newest_version_across_sealed_segments_after_same_date_rewrite(tmp_path):
+    with MatchArchive(tmp_path, segment_bytes=1) as archive:
+        archive.append(basic("a", "2024-01-20 15:00:00", status="scheduled"))
+        archive.append(basic("a", "2024-01-20 15:00:00", status="finished"))
+        archive.append(basic("a", "2024-01-25 15:00:00", status="replayed"))
+        archive.append(basic("a", "2024-01-20 15:00:00", status="annulled"))
+
+    with MatchArchive(tmp_path) as archive:
+        assert [match.status for match in archive.query()] == ["annulled"]
+        assert archive.query("20240125", "20240125") == []
+
+
+@pytest.mark.parametrize("segment_bytes", [1, 1024 * 1024])
+def test_basic_lookup_uses_newer_of_basic_and_full_records(tmp_path, segment_bytes):
+    with MatchArchive(tmp_path, segment_bytes=segment_bytes) as archive:
+        archive.append(basic("a", "2024-01-20 15:00:00", status="scheduled"))
+        archive.append(full("a", "2024-01-20 15:00:00", status="finished"))
+        archive.append(full("b", "2024-01-20 18:00:00", status="scheduled"))
+        archive.append(basic("b", "2024-01-20 18:00:00", status="finished"))
+
+        for reopened in (archive, None):
+            if reopened is None:
+                archive.close()
+                archive = MatchArchive(tmp_path, segment_bytes=segment_bytes)
+            assert type(archive.get("a")) is MatchBasic
+            assert archive.get("a").status == "finished"
+            assert archive.get("b").status == "finished"
+            assert archive.get("b", full=True).status == "scheduled"
+
+
+def test_newer_active_full_record_beats_sealed_basic_one(tmp_path):
+    with MatchArchive(tmp_path, segment_bytes=1) as archive:
+        archive.append(basic("a", "2024-01-20 15:00:00", status="scheduled"))
+    with MatchArchive(tmp_path) as archive:
+        archive.append(full("a", "2024-01-20 15:00:00", status="finished"))
+        assert archive.get("a").status == "finished"
+
+
+def test_reads_between_appends_keep_offsets(tmp_path):
+    with MatchArchive(tmp_path) as archive:
+        for number in range(5):
+            archive.append(basic(f"m{number}", f"2024-01-2{number} 15:00:00"))
+            # Reading the first record moves the file position; the next append must still land at the end
+            assert archive.get("m0").id == "m0"
+            assert archive.get(f"m{number}").id == f"m{number}"
+
+    with MatchArchive(tmp_path) as archive:
+        assert ids(archive.query()) == [f"m{number}" for number in range(5)]
+
+
+def test_rejects_unarchivable_matches(tmp_path):
+    with MatchArchive(tmp_path) as archive:
+        with pytest.raises(ValueError):
+            archive.append(MatchBasic.model_validate({"date": "2024-01-20 15:00:00"}))
+        with pytest.raises(ValueError):
+            archive.append(basic("x" * 25, "2024-01-20 15:00:00"))
@@ -0,0 +1,239 @@
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Union
+
+import pytest
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+from benchmarks.payloads import ALL_RESPONSE_MODELS, PayloadFactory
+from soccer_info.responses import CountryListResponse, MatchDayBasicResponse, MatchFull
+from soccer_info.responses.base import RequestTimings, ResponseHeaders
+from soccer_info.responses import binary
+from soccer_info.responses.binary import (
+    _HEADER,
+    _codec,
+    _validating_codec,
+    dumps_binary,
+    load_binary,
+    load_directory,
+    loads_binary,
+    save_binary,
+)
+
+
+def response(model, items: int = 3):
+    parsed = model.model_validate_json(PayloadFactory(seed=1).response_bytes(model, items))
+    parsed.response_headers = ResponseHeaders.model_validate({
+        "X-RateLimit-Request-Limit": "1000",
+        "X-RateLimit-Request-Remaining": "998",
+        "X-RateLimit-Request-Reset": "3600",
+    })
+    parsed.response_timings = RequestTimings(connect=0.01, time_to_first_byte=0.2, connection_reused=False, http_version="HTTP/1.1")
+    return parsed
+
+
+def assert_identical(loaded: BaseModel, original: BaseModel) -> None:
+    assert type(loaded) is type(original)
+    assert loaded == original
+    assert loaded.model_fields_set == original.model_fields_set
+    assert loaded.model_dump_json() == original.model_dump_json()
+
+
+# =============================================================================
+# Round trips
+# =============================================================================
+
+@pytest.mark.parametrize("model", ALL_RESPONSE_MODELS, ids=lambda model: model.__name__)
+@pytest.mark.parametrize("compress", [True, False])
+def test_round_trip_of_every_response(model, compress):
+    original = response(model)
+    loaded = loads_binary(dumps_binary(original, compress=compress), model)
+
+    assert_identical(loaded, original)
+    assert loaded.response_headers == original.response_headers
+    assert loaded.response_headers.rate_limit_remaining == 998
+    assert loaded.response_timings == original.response_timings
+    assert loaded.result[0] is not original.result[0]
+
+
+def test_round_trip_of_component_and_default_model():
+    match = response(MatchDayBasicResponse).result[0]
+    full = MatchFull.model_validate(match.model_dump())
+
+    assert_identical(loads_binary(dumps_binary(match)), match)
+    assert_identical(loads_binary(dumps_binary(full)), full)
+
+
+def test_round_trip_keeps_unset_fields_unset():
+    original = CountryListResponse.model_validate({"status": 200, "errors": [], "pagination": [], "result": [{"code": "IT"}]})
+    loaded = loads_binary(dumps_binary(original))
+
+    assert loaded.result[0].model_fields_set == {"code"}
+    assert loaded.result[0].model_dump(exclude_unset=True) == {"code": "IT"}
+
+
+def test_save_and_load_file(tmp_path):
+    original = response(CountryListResponse)
+    save_binary(original, tmp_path / "countries.sib")
+
+    assert_identical(load_binary(tmp_path / "countries.sib"), original)
+
+
+# =============================================================================
+# Validating fallback
+# =============================================================================
+
+class Leaf(BaseModel):
+    value: int
+
+
+class OtherLeaf(BaseModel):
+    name: str
+
+
+class WithExtra(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    value: int
+
+
+class WithPrivate(BaseModel):
+    value: int
+    _cache: Optional[str] = PrivateAttr(default=None)
+
+
+class WithUnion(BaseModel):
+    item: Union[Leaf, OtherLeaf]
+    items: List[Union[Leaf, OtherLeaf]] = []
+
+
+class Container(BaseModel):
+    extra: WithExtra
+    leaves: List[Leaf]
+
+
+@pytest.mark.parametrize("value", [
+    WithExtra(value=1, unknown="kept"),
+    WithPrivate(value=2),
+    WithUnion(item=OtherLeaf(name="x"), items=[Leaf(value=3), OtherLeaf(name="y")]),
+    Container(extra=WithExtra(value=4, more=[1, 2]), leaves=[Leaf(value=5)]),
+], ids=lambda value: type(value).__name__)
+def test_validating_fallback_round_trip(value):
+    loaded = loads_binary(dumps_binary(value), type(value))
+
+    assert_identical(loaded, value)
+
+
+@pytest.mark.parametrize("model", [WithExtra, WithPrivate, WithUnion])
+def test_fallback_is_used_for_models_the_fast_path_cannot_rebuild(model):
+    assert _codec(model)[2] == _validating_codec(model)[2]
+    assert _codec(Leaf)[2] != _validating_codec(Leaf)[2]
+
+
+# =============================================================================
+# Rejected data
+# =============================================================================
+
+def test_rejects_other_model():
+    data = dumps_binary(response(CountryListResponse))
+
+    with pytest.raises(ValueError, match="not soccer_info"):
+        loads_binary(data, MatchDayBasicResponse)
+
+
+def test_rejects_changed_field_layout():
+    data = bytearray(dumps_binary(response(CountryListResponse)))
+    magic, version, flags, fingerprint, length = _HEADER.unpack_from(data)
+    _HEADER.pack_into(data, 0, magic, version, flags, fingerprint ^ 1, length)
+
+    with pytest.raises(ValueError, match="different version"):
+        loads_binary(bytes(data))
+
+
+def test_rejects_data_saved_by_another_python(monkeypatch):
+    data = dumps_binary(response(CountryListResponse))
+    monkeypatch.setattr(binary, "_PYTHON_VERSION", f"{sys.version_info.major}.{sys.version_info.minor + 1}".encode())
+
+    with pytest.raises(ValueError, match="re-save it from JSON"):
+        loads_binary(data, CountryListResponse)
+
+
+def with_model_path(data: bytes, path: str) -> bytes:
+    magic, version, flags, fingerprint, length = _HEADER.unpack_from(data)
+    encoded = path.encode("utf-8")
+    return _HEADER.pack(magic, version, flags, fingerprint, len(encoded)) + encoded + data[_HEADER.size + length:]
+
+
+@pytest.mark.parametrize("path", [
+    "tests.test_binary:Leaf",
+    "soccer_info.client:HTTPXClient",
+    # Would fail with ModuleNotFoundError if it were imported
+    "soccer_info.responses_unknown:Model",
+    "soccer_info.responses:dumps_binary",
+    "soccer_info.responses:Missing",
+])
+def test_resolves_only_response_models(path):
+    data = with_model_path(dumps_binary(Leaf(value=1)), path)
+
+    with pytest.raises(ValueError, match="not a soccer_info response model"):
+        loads_binary(data)
+
+
+def test_model_outside_responses_loads_when_given():
+    assert loads_binary(dumps_binary(Leaf(value=1)), Leaf) == Leaf(value=1)
+
+
+@pytest.mark.parametrize("data", [b"", b"SIB", b"JSON" + bytes(16)])
+def test_rejects_foreign_data(data):
+    with pytest.raises(ValueError, match="Not a binary response file"):
+        loads_binary(data)
+
+
+def test_rejects_unsupported_format_version():
+    data = bytearray(dumps_binary(Leaf(value=1)))
+    struct.pack_into("<B", data, 4, 99)
+
+    with pytest.raises(ValueError, match="Unsupported binary format version 99"):
+        loads_binary(bytes(data))
+
+
+# =============================================================================
+# Bulk loading
+# =============================================================================
+
+def test_load_directory_in_process(tmp_path):
+    originals = {
+        tmp_path / "a.sib": response(CountryListResponse),
+        tmp_path / "b.sib": response(MatchDayBasicResponse),
+    }
+    for path, value in originals.items():
+        save_binary(value, path, compress=path.stem == "a")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    loaded = load_directory(tmp_path, workers=1)
+
+    assert list(loaded) == sorted(originals)
+    for path, value in originals.items():
+        assert_identical(loaded[path], value)
+
+
+def test_load_directory_with_pattern_model_and_executor(tmp_path):
+    for day in range(3):
+        save_binary(response(MatchDayBasicResponse, items=day + 1), tmp_path / f"day-{day}.sib")
+    save_binary(response(CountryListResponse), tmp_path / "countries.sib")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        loaded = load_directory(tmp_path, pattern="day-*.sib", model=MatchDayBasicResponse, executor=executor)
+
+    assert [len(value.result) for value in loaded.values()] == [1, 2, 3]
+
+
+def test_load_directory_rejects_other_model(tmp_path):
+    save_binary(response(CountryListResponse), tmp_path / "countries.sib")
+
+    with pytest.raises(ValueError):
+        load_directory(tmp_path, model=MatchDayBasicResponse, workers=1)
+
+
+def test_load_empty_directory(tmp_path):
+    assert load_directory(tmp_path, workers=1) == {}
@@ -0,0 +1,284 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from soccer_info.client import AsyncHTTPXClient, CoalescingMiddleware, HTTPXClient, request_priority
+from soccer_info.client.timing import TimingCollector
+from tests.conftest import countries_body, json_response
+
+
+async def _until(predicate) -> None:
+    while not predicate():
+        await asyncio.sleep(0)
+
+
+async def _settle() -> None:
+    """Let other tasks run until they block."""
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_first_caller_keeps_waiters(settings):
+    release = asyncio.Event()
+    sent = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        await release.wait()
+        return json_response(countries_body(["IT"]))
+
+    async with AsyncHTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(CoalescingMiddleware())
+        first = asyncio.create_task(client.countries.get_list())
+        await _until(lambda: sent == 1)
+        follower = asyncio.create_task(client.countries.get_list())
+        await _settle()
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        response = await follower
+        assert response.result[0].code == "IT"
+        assert first.cancelled()
+        assert not follower.cancelled()
+        assert sent == 1
+        assert client._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_flow_is_cancelled_once_every_caller_is(settings):
+    sent = 0
+    cancelled = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        if sent == 1:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return json_response(countries_body(["ES"]))
+
+    async with AsyncHTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(CoalescingMiddleware())
+        callers = [asyncio.create_task(client.countries.get_list()) for _ in range(2)]
+        await _until(lambda: sent == 1)
+        await _settle()
+
+        callers[0].cancel()
+        await asyncio.sleep(0)
+        assert not cancelled.is_set()
+        callers[1].cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert client._in_flight == {}
+
+        # A later call starts a new flow instead of joining the cancelled one
+        response = await client.countries.get_list()
+        assert response.result[0].code == "ES"
+        assert sent == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_share_one_request(settings):
+    release = asyncio.Event()
+    sent = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        await release.wait()
+        return json_response(countries_body(["IT"]))
+
+    async with AsyncHTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(CoalescingMiddleware())
+        callers = [asyncio.create_task(client.countries.get_list()) for _ in range(3)]
+        await _until(lambda: sent == 1)
+        await _settle()
+        release.set()
+        first, second, third = await asyncio.gather(*callers)
+
+    assert sent == 1
+    assert first is second is third
+    assert first.result[0].code == "IT"
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_share_one_error(settings):
+    release = asyncio.Event()
+    sent = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        await release.wait()
+        return json_response(b'{"status": 500, "errors": ["down"], "result": []}', status=500)
+
+    async with AsyncHTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(CoalescingMiddleware())
+        callers = [asyncio.create_task(client.countries.get_list()) for _ in range(2)]
+        await _until(lambda: sent == 1)
+        await _settle()
+        release.set()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        assert client._in_flight == {}
+
+    assert sent == 1
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_different_requests_are_not_coalesced(settings):
+    sent = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        return json_response(countries_body())
+
+    async with AsyncHTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(CoalescingMiddleware())
+        await asyncio.gather(client.countries.get_list(), client.countries.get_list(format="csv"))
+
+    assert sent == 2
+
+
+class _Gate:
+    """Mock transport holding every request until the callers given to ``run`` have all joined."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.sent = 0
+        self.transport = httpx.MockTransport(self._handle)
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.sent += 1
+        await self.release.wait()
+        return json_response(countries_body(["IT"]))
+
+    async def run(self, client, *priorities):
+        async def call(priority):
+            with request_priority(priority):
+                return await client.countries.get_list()
+
+        callers = [asyncio.create_task(call(priority)) for priority in priorities]
+        await _until(lambda: self.sent >= 1)
+        await _settle()
+        self.release.set()
+        return await asyncio.gather(*callers)
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_traced_as_coalesced(settings):
+    gate = _Gate()
+    async with AsyncHTTPXClient(settings, transport=gate.transport) as client:
+        client.pipeline.use(CoalescingMiddleware())
+        client.instrumentation.enable_histograms()
+        finished = []
+        client.instrumentation.add_hook("parse_end", finished.append)
+        await gate.run(client, "interactive", "interactive", "interactive")
+
+        report = client.instrumentation.report()["/countries/list/"]
+
+    assert gate.sent == 1
+    assert {phase: summary["count"] for phase, summary in report.items()} == {
+        "coalesced": 2, "network": 1, "parse": 1, "throttle": 1, "total": 1,
+    }
+    assert len(finished) == 3
+
+
+@pytest.mark.asyncio
+async def test_waiters_leave_response_timings_alone(settings, monkeypatch):
+    builds = []
+    build = TimingCollector.build
+
+    def counting_build(self, *args, **kwargs):
+        timings = build(self, *args, **kwargs)
+        builds.append(timings)
+        return timings
+
+    monkeypatch.setattr(TimingCollector, "build", counting_build)
+    gate = _Gate()
+    async with AsyncHTTPXClient(settings.model_copy(update={"collect_timings": True}), transport=gate.transport) as client:
+        client.pipeline.use(CoalescingMiddleware())
+        responses = await gate.run(client, "interactive", "interactive")
+
+    assert gate.sent == 1
+    assert responses[0] is responses[1]
+    assert len(builds) == 1
+    assert responses[0].response_timings is builds[0]
+
+
+@pytest.mark.asyncio
+async def test_calls_of_different_priorities_are_not_coalesced(settings):
+    gate = _Gate()
+    async with AsyncHTTPXClient(settings, transport=gate.transport) as client:
+        client.pipeline.use(CoalescingMiddleware())
+        live, bulk, other_live = await gate.run(client, "live", "bulk", "live")
+
+    assert gate.sent == 2
+    assert live is other_live
+    assert live is not bulk
+
+
+def test_sync_threads_share_one_request(settings):
+    release = threading.Event()
+    sent = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        release.wait(5)
+        return json_response(countries_body(["ES"]))
+
+    with HTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(CoalescingMiddleware())
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(client.countries.get_list)
+            while sent == 0:
+                time.sleep(0.001)
+            second = executor.submit(client.countries.get_list)
+            # Give the second thread time to join the in-flight request
+            time.sleep(0.05)
+            release.set()
+            responses = [first.result(5), second.result(5)]
+
+    assert sent == 1
+    assert responses[0] is responses[1]
+
+
+def test_sync_waiter_is_traced_as_coalesced(settings):
+    release = threading.Event()
+    sent = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        release.wait(5)
+        return json_response(countries_body(["ES"]))
+
+    with HTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(CoalescingMiddleware())
+        client.instrumentation.enable_histograms()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(client.countries.get_list)
+            while sent == 0:
+                time.sleep(0.001)
+            second = executor.submit(client.countries.get_list)
+            time.sleep(0.05)
+            release.set()
+            first.result(5)
+            second.result(5)
+
+        report = client.instrumentation.report()["/countries/list/"]
+
+    assert report["coalesced"]["count"] == 1
+    assert report["network"]["count"] == report["total"]["count"] == 1
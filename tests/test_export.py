@@ -0,0 +1,195 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from soccer_info.export import CSVSink, NDJSONSink, ParquetSink, open_text, part_path, read_csv_header
+from soccer_info.responses import MatchBasic
+
+
+def match(number: int) -> MatchBasic:
+    return MatchBasic.model_validate({
+        "id": f"m{number}",
+        "date": "2024-01-20 15:00:00",
+        "teamA": {"id": "t1", "score": {"f": str(number % 4)}},
+    })
+
+
+def matches(count: int, start: int = 0) -> list:
+    return [match(number) for number in range(start, start + count)]
+
+
+def read_ndjson(path, compression=None) -> list:
+    with open_text(path, "r", compression) as f:
+        return [json.loads(line)["id"] for line in f]
+
+
+def read_csv(path, compression=None) -> list:
+    with open_text(path, "r", compression) as f:
+        return list(csv.DictReader(f))
+
+
+# =============================================================================
+# Buffering
+# =============================================================================
+
+def test_items_are_written_in_batches_of_buffer_items(tmp_path):
+    flushes = []
+    sink = NDJSONSink(tmp_path / "out.ndjson", buffer_items=3, flush_seconds=None, on_flush=lambda: flushes.append(sink.items_written))
+    with sink:
+        for item in matches(7):
+            sink.write(item)
+        assert flushes == [3, 6]
+        assert read_ndjson(tmp_path / "out.ndjson") == ["m0", "m1", "m2", "m3", "m4", "m5"]
+
+    assert flushes == [3, 6, 7]
+    assert len(read_ndjson(tmp_path / "out.ndjson")) == 7
+
+
+def test_write_many_never_splits_a_batch(tmp_path):
+    flushes = []
+    sink = NDJSONSink(tmp_path / "out.ndjson", buffer_items=3, flush_seconds=None, on_flush=lambda: flushes.append(sink.items_written))
+    with sink:
+        sink.write_many(matches(2))
+        sink.write_many(matches(5, start=2))
+
+    assert flushes == [7]
+
+
+def test_flush_interval_flushes_a_partial_buffer(tmp_path, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("soccer_info.export.base.time.monotonic", lambda: now[0])
+    with NDJSONSink(tmp_path / "out.ndjson", buffer_items=100, flush_seconds=5.0) as sink:
+        sink.write(match(0))
+        now[0] = 5.0
+        sink.write(match(1))
+        assert sink.items_written == 2
+
+
+def test_closed_sink_cannot_flush(tmp_path):
+    sink = NDJSONSink(tmp_path / "out.ndjson")
+    sink.close()
+    sink.close()
+    with pytest.raises(ValueError, match="closed"):
+        sink.flush()
+
+
+@pytest.mark.parametrize("options", [{"buffer_items": 0}, {"max_file_items": 0}])
+def test_rejects_invalid_sizes(tmp_path, options):
+    with pytest.raises(ValueError):
+        NDJSONSink(tmp_path / "out.ndjson", **options)
+
+
+# =============================================================================
+# Rolling and compression
+# =============================================================================
+
+def test_part_path_keeps_every_suffix(tmp_path):
+    assert part_path(tmp_path / "matches.ndjson.gz", 3).name == "matches-00003.ndjson.gz"
+
+
+def test_output_rolls_over_to_numbered_parts(tmp_path):
+    with NDJSONSink(tmp_path / "out.ndjson", max_file_items=4, buffer_items=3, flush_seconds=None) as sink:
+        sink.write_many(matches(10))
+
+    assert [path.name for path in sink.paths] == ["out-00000.ndjson", "out-00001.ndjson", "out-00002.ndjson"]
+    assert [len(read_ndjson(path)) for path in sink.paths] == [4, 4, 2]
+    assert [item for path in sink.paths for item in read_ndjson(path)] == [f"m{number}" for number in range(10)]
+
+
+def test_appending_to_rolled_output_starts_a_new_part(tmp_path):
+    with NDJSONSink(tmp_path / "out.ndjson", max_file_items=5) as sink:
+        sink.write_many(matches(7))
+    with NDJSONSink(tmp_path / "out.ndjson", max_file_items=5, append=True) as sink:
+        sink.write_many(matches(2, start=7))
+
+    assert [path.name for path in sink.paths] == ["out-00002.ndjson"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["out-00000.ndjson", "out-00001.ndjson", "out-00002.ndjson"]
+
+
+@pytest.mark.parametrize("suffix, compression", [(".gz", "gzip"), (".zst", "zstd")])
+def test_compression_follows_the_suffix(tmp_path, suffix, compression):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    path = tmp_path / f"out.ndjson{suffix}"
+    with NDJSONSink(path, buffer_items=2) as sink:
+        sink.write_many(matches(3))
+    # Appending adds a compressed frame that reads back as one stream
+    with NDJSONSink(path, append=True) as sink:
+        sink.write_many(matches(2, start=3))
+
+    assert sink.compression == compression
+    assert read_ndjson(path, compression) == ["m0", "m1", "m2", "m3", "m4"]
+
+
+def test_gzip_parts_are_each_complete_files(tmp_path):
+    with NDJSONSink(tmp_path / "out.ndjson.gz", max_file_items=2) as sink:
+        sink.write_many(matches(3))
+
+    with gzip.open(sink.paths[0], "rt") as f:
+        assert len(f.readlines()) == 2
+    assert [path.name for path in sink.paths] == ["out-00000.ndjson.gz", "out-00001.ndjson.gz"]
+
+
+def test_stream_target_is_flushed_but_not_closed():
+    stream = io.StringIO()
+    with NDJSONSink(stream) as sink:
+        sink.write_many(matches(2))
+
+    assert not stream.closed
+    assert [json.loads(line)["id"] for line in stream.getvalue().splitlines()] == ["m0", "m1"]
+    with pytest.raises(ValueError):
+        NDJSONSink(io.StringIO(), max_file_items=10)
+
+
+# =============================================================================
+# CSV
+# =============================================================================
+
+def test_csv_columns_come_from_the_model(tmp_path):
+    with CSVSink(tmp_path / "out.csv", max_file_items=2) as sink:
+        sink.write_many(matches(3))
+
+    headers = [read_csv_header(path) for path in sink.paths]
+    assert headers[0] == headers[1]
+    assert "teamA.score.f" in headers[0] and "odds" not in headers[0]
+    rows = read_csv(sink.paths[0])
+    assert [(row["id"], row["teamA.score.f"], row["teamB.id"]) for row in rows] == [("m0", "0", ""), ("m1", "1", "")]
+    assert rows[0]["events"] == "[]"
+
+
+def test_csv_append_keeps_the_existing_header(tmp_path):
+    path = tmp_path / "out.csv.gz"
+    with CSVSink(path, fieldnames=["id", "date"]) as sink:
+        sink.write_many(matches(2))
+    with CSVSink(path, append=True) as sink:
+        sink.write_many(matches(1, start=2))
+
+    assert sink.fieldnames == ["id", "date"]
+    assert [row["id"] for row in read_csv(path, "gzip")] == ["m0", "m1", "m2"]
+
+
+# =============================================================================
+# Parquet
+# =============================================================================
+
+def test_parquet_writes_one_row_group_per_flush(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    with ParquetSink(tmp_path / "out.parquet", buffer_items=4, max_file_items=6) as sink:
+        sink.write_many(matches(4))
+        sink.write_many(matches(4, start=4))
+
+    files = [pq.ParquetFile(path) for path in sink.paths]
+    assert [file.metadata.num_rows for file in files] == [6, 2]
+    assert [file.metadata.num_row_groups for file in files] == [2, 1]
+    assert pq.read_table(sink.paths[0])["teamA.score.f"].to_pylist() == [0, 1, 2, 3, 0, 1]
+
+
+def test_parquet_rejects_streams_and_plain_appends(tmp_path):
+    pytest.importorskip("pyarrow")
+    with pytest.raises(ValueError):
+        ParquetSink(io.BytesIO())
+    with pytest.raises(ValueError):
+        ParquetSink(tmp_path / "out.parquet", append=True)
@@ -0,0 +1,84 @@
+import math
+
+import pytest
+
+from soccer_info.responses import MatchBasic, MatchFull
+from soccer_info.responses.frames import to_arrow, to_frame
+
+pa = pytest.importorskip("pyarrow")
+pd = pytest.importorskip("pandas")
+
+
+def match(match_id: str, score=None, home_odds=None, date=None) -> MatchFull:
+    return MatchFull.model_validate({
+        "id": match_id,
+        "date": date,
+        "teamA": {"score": {"f": score}},
+        "odds": {"kickoff": {"1X2": {"bet365": {"1": home_odds}}}},
+    })
+
+
+def values(column) -> list:
+    return [None if isinstance(value, float) and math.isnan(value) else value for value in column]
+
+
+def assert_same_columns(table, frame, *names) -> None:
+    for name in names:
+        assert values(table[name].to_pylist()) == values(frame[name].astype(object).where(frame[name].notna(), None))
+
+
+def test_integral_int_columns_become_int64():
+    items = [match("a", score="2"), match("b", score=" 0 "), match("c", score="x"), match("d")]
+    table, frame = to_arrow(items), to_frame(items)
+
+    assert table.schema.field("teamA.score.f").type == pa.int64()
+    assert str(frame["teamA.score.f"].dtype) == "Int64"
+    assert table["teamA.score.f"].to_pylist() == [2, 0, None, None]
+    assert_same_columns(table, frame, "teamA.score.f")
+
+
+def test_int_column_with_fraction_stays_float_like_to_frame():
+    items = [match("a", score="1.5"), match("b", score="2"), match("c")]
+    table, frame = to_arrow(items), to_frame(items)
+
+    assert table.schema.field("teamA.score.f").type == pa.float64()
+    assert str(frame["teamA.score.f"].dtype) == "float64"
+    assert table["teamA.score.f"].to_pylist() == [1.5, 2.0, None]
+    assert_same_columns(table, frame, "teamA.score.f")
+
+
+def test_float_and_date_columns():
+    items = [match("a", home_odds="1.85", date="2024-01-20 15:00:00"), match("b", home_odds="-", date="soon")]
+    table = to_arrow(items)
+    odds = "odds.kickoff.one_x_two.bet365.home"
+
+    assert table[odds].to_pylist() == [1.85, None]
+    assert table.schema.field("date").type == pa.timestamp("s")
+    assert table["date"].to_pylist()[1] is None
+    assert_same_columns(table, to_frame(items), odds)
+
+
+def test_empty_sequence_keeps_column_types():
+    table, frame = to_arrow([], MatchBasic), to_frame([], MatchBasic)
+
+    assert table.num_rows == 0 and len(frame) == 0
+    assert table.schema.field("teamA.score.f").type == pa.int64()
+    assert list(table.column_names) == list(frame.columns)
+
+
+def test_parquet_row_groups_keep_the_file_schema(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    from soccer_info.export import ParquetSink
+
+    # One row group per item, typed int64 or float64 by to_arrow
+    with ParquetSink(tmp_path / "int.parquet", buffer_items=1) as sink:
+        for item in (match("a", score="1"), match("b", score="1.5"), match("c", score="2")):
+            sink.write(item)
+    with ParquetSink(tmp_path / "float.parquet", buffer_items=1) as sink:
+        for item in (match("a", score="1.5"), match("b", score="2")):
+            sink.write(item)
+
+    ints, floats = pq.read_table(tmp_path / "int.parquet"), pq.read_table(tmp_path / "float.parquet")
+    assert ints.schema.field("teamA.score.f").type == pa.int64()
+    assert ints["teamA.score.f"].to_pylist() == [1, None, 2]
+    assert floats["teamA.score.f"].to_pylist() == [1.5, 2.0]
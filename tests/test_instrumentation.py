@@ -0,0 +1,106 @@
+import time
+
+import httpx
+import pytest
+
+from soccer_info.client import AsyncHTTPXClient, HTTPXClient, RetryMiddleware
+from soccer_info.client.instrumentation import LatencyHistogram
+from tests.conftest import countries_body, json_response
+
+# Bound before any test patches ``time.sleep`` for the client's backoff
+real_sleep = time.sleep
+
+
+def counts(client, endpoint="/countries/list/"):
+    return {phase: summary["count"] for phase, summary in client.instrumentation.report()[endpoint].items()}
+
+
+def failing_then_ok(failures: int, delay: float = 0.0):
+    def handler(request: httpx.Request) -> httpx.Response:
+        handler.sent += 1
+        real_sleep(delay)
+        if handler.sent <= failures:
+            return json_response(b'{}', 503)
+        return json_response(countries_body())
+    handler.sent = 0
+    return handler
+
+
+def test_phases_are_recorded_once_per_request(settings):
+    with HTTPXClient(settings, transport=httpx.MockTransport(failing_then_ok(0))) as client:
+        client.instrumentation.enable_histograms()
+        client.countries.get_list()
+        client.countries.get_list()
+
+        assert counts(client) == {"network": 2, "parse": 2, "throttle": 2, "total": 2}
+
+
+def test_retries_record_final_attempt_and_retry_phase(settings, monkeypatch):
+    backoffs = []
+
+    def sleep(seconds):
+        backoffs.append(seconds)
+        real_sleep(0.05)
+
+    monkeypatch.setattr("soccer_info.client.sync.httpclient.time.sleep", sleep)
+    with HTTPXClient(settings, transport=httpx.MockTransport(failing_then_ok(2, delay=0.02))) as client:
+        client.instrumentation.enable_histograms()
+        events = []
+        client.instrumentation.add_hook("response", events.append)
+        client.pipeline.use(RetryMiddleware(attempts=3, backoff=0.5))
+        client.countries.get_list()
+
+        report = client.instrumentation.report()["/countries/list/"]
+
+    assert counts(client) == {"network": 1, "parse": 1, "retry": 1, "throttle": 1, "total": 1}
+    assert len(events) == 3
+    assert backoffs == [0.5, 1.0]
+    # The final attempt's network time excludes the two failed attempts and the backoff
+    assert report["network"]["max"] < 0.05
+    assert report["throttle"]["max"] < 0.02
+    assert report["retry"]["min"] >= 0.13
+    assert report["total"]["min"] >= report["retry"]["max"] + report["network"]["min"] * 0.5
+
+
+def test_failed_requests_record_no_phases(settings):
+    with HTTPXClient(settings, transport=httpx.MockTransport(failing_then_ok(5))) as client:
+        client.instrumentation.enable_histograms()
+        errors = []
+        client.instrumentation.add_hook("error", errors.append)
+        with pytest.raises(httpx.HTTPStatusError):
+            client.countries.get_list()
+
+        assert client.instrumentation.report() == {}
+        assert [event.status for event in errors] == [503]
+
+
+@pytest.mark.asyncio
+async def test_async_retries_record_one_sample_per_phase(settings):
+    async with AsyncHTTPXClient(settings, transport=httpx.MockTransport(failing_then_ok(1))) as client:
+        client.instrumentation.enable_histograms()
+        client.pipeline.use(RetryMiddleware(attempts=2, backoff=0.01))
+        await client.countries.get_list()
+
+        assert counts(client) == {"network": 1, "parse": 1, "retry": 1, "throttle": 1, "total": 1}
+        assert client.instrumentation.report()["/countries/list/"]["retry"]["min"] >= 0.01
+
+
+def test_hooks_see_lifecycle_in_order(settings):
+    with HTTPXClient(settings, transport=httpx.MockTransport(failing_then_ok(0))) as client:
+        seen = []
+        for name in ("request_start", "throttle_end", "response", "parse_end"):
+            client.instrumentation.add_hook(name, lambda event: seen.append((event.name, event.status)))
+        client.countries.get_list()
+
+    assert seen == [("request_start", None), ("throttle_end", None), ("response", 200), ("parse_end", 200)]
+
+
+def test_histogram_quantiles():
+    histogram = LatencyHistogram()
+    for value in (0.001, 0.002, 0.004, 0.1):
+        histogram.record(value)
+
+    summary = histogram.summary()
+    assert summary["count"] == 4
+    assert summary["min"] == 0.001 and summary["max"] == 0.1
+    assert summary["p50"] <= summary["p90"] <= summary["p99"] <= 0.1 * 1.2
@@ -0,0 +1,149 @@
+import httpx
+import pytest
+
+from soccer_info.client import HTTPXClient, QuotaExhaustedError
+from soccer_info.client.key_pool import KeyPool
+from tests.conftest import countries_body, json_response
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Manually advanced ``time.monotonic`` of the key pool."""
+    now = [100.0]
+    monkeypatch.setattr("soccer_info.client.key_pool.time.monotonic", lambda: now[0])
+    return now
+
+
+def quota(remaining: int, reset: int = 3600, limit: int = 100) -> dict:
+    return {
+        "x-ratelimit-request-limit": str(limit),
+        "x-ratelimit-request-remaining": str(remaining),
+        "x-ratelimit-request-reset": str(reset),
+    }
+
+
+def keys_of(reservations) -> list:
+    return [state.key for state, _ in reservations]
+
+
+# =============================================================================
+# Routing
+# =============================================================================
+
+def test_keys_are_throttled_independently(clock):
+    pool = KeyPool(["a", "b"], api_host="host", throttle_seconds=1.0)
+    reservations = [pool.reserve() for _ in range(4)]
+
+    assert keys_of(reservations) == ["a", "b", "a", "b"]
+    assert [wait for _, wait in reservations] == [0.0, 0.0, 1.0, 1.0]
+
+
+def test_duplicate_keys_are_pooled_once():
+    assert len(KeyPool(["a", "b", "a"], api_host="host")) == 2
+    with pytest.raises(ValueError):
+        KeyPool([], api_host="host")
+
+
+def test_ties_go_to_the_key_with_most_headroom(clock):
+    pool = KeyPool(["a", "b"], api_host="host", throttle_seconds=1.0)
+    for state in (pool.reserve()[0], pool.reserve()[0]):
+        pool.release(state, 200, quota(remaining=5 if state.key == "a" else 50))
+    clock[0] += 10
+
+    # Both keys can send now; "b" reports more quota left
+    assert keys_of([pool.reserve()]) == ["b"]
+
+
+# =============================================================================
+# Draining
+# =============================================================================
+
+def test_exhausted_key_is_drained_until_its_reset(clock):
+    pool = KeyPool(["a", "b"], api_host="host", throttle_seconds=1.0)
+    state = pool.reserve()[0]
+    pool.release(state, 200, quota(remaining=0, reset=30))
+
+    assert pool.is_drained(state)
+    reservations = [pool.reserve() for _ in range(3)]
+    assert keys_of(reservations) == ["b", "b", "b"]
+    assert [wait for _, wait in reservations] == [0.0, 1.0, 2.0]
+    assert pool.status()[0]["drained_seconds"] == 30
+
+    clock[0] += 30
+    assert not pool.is_drained(state)
+    # The quota reset, so the key is back with its full limit
+    assert pool.status()[0]["remaining"] == 100
+
+
+@pytest.mark.parametrize("headers, drained", [
+    ({"retry-after": "12"}, 12.0),
+    ({}, 60.0),
+])
+def test_429_drains_for_retry_after_or_the_cooldown(clock, headers, drained):
+    pool = KeyPool(["a"], api_host="host", cooldown_seconds=60.0)
+    pool.release(pool.reserve()[0], 429, headers)
+
+    with pytest.raises(QuotaExhaustedError) as error:
+        pool.reserve()
+    assert error.value.reset_seconds == drained
+    assert error.value.hours_to_reset == round(drained / 3600, 2)
+
+
+def test_quota_sums_keys_once_every_key_reported(clock):
+    pool = KeyPool(["a", "b"], api_host="host", throttle_seconds=1.0)
+    first, second = pool.reserve()[0], pool.reserve()[0]
+    pool.release(first, 200, quota(remaining=10, reset=100))
+    assert pool.quota() == (None, None)
+
+    pool.release(second, 200, quota(remaining=20, reset=50))
+    assert pool.quota() == (30, 50.0)
+
+
+def test_status_masks_keys():
+    pool = KeyPool(["secret-key-123456", "other-key-654321"], api_host="host")
+
+    status = pool.status()
+
+    assert "secret-key-123456" not in repr(status) and "other-key-654321" not in repr(status)
+    assert [entry["index"] for entry in status] == [0, 1]
+
+
+# =============================================================================
+# Clients
+# =============================================================================
+
+def pooled_client(settings, handler) -> HTTPXClient:
+    return HTTPXClient(
+        settings.model_copy(update={"api_keys": ("key-a", "key-b")}),
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_client_retries_a_429_on_another_key(settings):
+    used = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        used.append(request.headers["x-rapidapi-key"])
+        if request.headers["x-rapidapi-key"] == "key-a":
+            return json_response(b"{}", 429, headers=quota(remaining=0, reset=600))
+        return json_response(countries_body(["IT"]), headers=quota(remaining=99))
+
+    with pooled_client(settings, handler) as client:
+        first = client.countries.get_list()
+        second = client.countries.get_list()
+        status = client.key_pool.status()
+
+    assert used == ["key-a", "key-b", "key-b"]
+    assert first.result[0].code == second.result[0].code == "IT"
+    assert [entry["requests"] for entry in status] == [1, 2]
+
+
+def test_client_raises_once_every_key_is_exhausted(settings):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return json_response(b"{}", 429, headers={"retry-after": "120"})
+
+    with pooled_client(settings, handler) as client:
+        with pytest.raises(QuotaExhaustedError) as error:
+            client.countries.get_list()
+
+    assert 0 < error.value.reset_seconds <= 120
@@ -0,0 +1,191 @@
+import asyncio
+import json
+from datetime import date
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from soccer_info.client import AsyncHTTPXClient
+from soccer_info.client.async_.loader import MatchLoader, normalize_date_hint
+from soccer_info.responses import MatchBasic
+from tests.conftest import json_response
+
+
+class FakeAPI:
+    """Serves day, championship and single-match endpoints from in-memory matches."""
+
+    def __init__(self, days=None, championships=None, per_page: int = 3):
+        self.days = days or {}
+        self.championships = championships or {}
+        self.per_page = per_page
+        self.requests = []
+        self.failing = set()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path, params = request.url.path, request.url.params
+        self.requests.append((path, dict(params)))
+        if path in self.failing:
+            return json_response(b'{"status": 500, "errors": ["down"], "result": []}', status=500)
+        if path == "/matches/view/basic/":
+            known = [match_id for ids in (*self.days.values(), *self.championships.values()) for match_id in ids]
+            return self.page([params["i"]] if params["i"] in known else [], paginated=False)
+        ids = self.days.get(params.get("d")) if path == "/matches/day/basic/" else self.championships.get(params.get("c"))
+        page = int(params.get("p", 1))
+        return self.page(ids or [], page=page)
+
+    def page(self, ids, page: int = 1, paginated: bool = True) -> httpx.Response:
+        chunk = ids[(page - 1) * self.per_page:page * self.per_page] if paginated else ids
+        body = {
+            "status": 200,
+            "errors": [],
+            "pagination": [{"page": page, "per_page": self.per_page, "items": len(ids)}] if paginated else [],
+            "result": [{"id": match_id, "date": "2024-01-20 15:00:00"} for match_id in chunk],
+        }
+        return json_response(json.dumps(body).encode())
+
+    def count(self, path: str) -> int:
+        return sum(1 for request_path, _ in self.requests if request_path == path)
+
+
+@pytest.fixture
+def api():
+    return FakeAPI(
+        days={"20240120": ["a", "b", "c", "d", "e"], "20240121": ["x"]},
+        championships={"c1": ["a", "b", "k"]},
+    )
+
+
+@pytest_asyncio.fixture
+async def client(settings, api):
+    async with AsyncHTTPXClient(settings, transport=httpx.MockTransport(api.handle)) as client:
+        yield client
+
+
+def ids(matches) -> list:
+    return [match.id if match is not None else None for match in matches]
+
+
+@pytest.mark.parametrize("hint", ["20240120", "2024-01-20", "2024-01-20 15:00:00", date(2024, 1, 20)])
+def test_date_hints_are_normalized(hint):
+    assert normalize_date_hint(hint) == "20240120"
+
+
+# =============================================================================
+# Batching
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_loads_sharing_a_date_are_served_from_day_pages(client, api):
+    loader = MatchLoader(client)
+    matches = await asyncio.gather(*(loader.load(match_id, date="2024-01-20") for match_id in "abcde"))
+
+    assert ids(matches) == list("abcde")
+    # 5 matches at 3 per page: two day pages instead of five single-match calls
+    assert api.count("/matches/day/basic/") == 2
+    assert api.count("/matches/view/basic/") == 0
+    assert (loader.stats.batched, loader.stats.individual, loader.stats.api_calls) == (5, 0, 2)
+
+
+@pytest.mark.asyncio
+async def test_further_pages_are_skipped_when_single_calls_are_cheaper(client, api):
+    api.per_page = 1
+    loader = MatchLoader(client)
+    matches = await asyncio.gather(loader.load("a", date="20240120"), loader.load("b", date="20240120"))
+
+    assert ids(matches) == ["a", "b"]
+    # Page 1 holds "a"; four more pages would cost more than one call for "b"
+    assert api.count("/matches/day/basic/") == 1
+    assert api.count("/matches/view/basic/") == 1
+    assert (loader.stats.batched, loader.stats.individual) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_championship_hints_are_batched_and_dates_preferred_on_ties(client, api):
+    loader = MatchLoader(client)
+    matches = await asyncio.gather(
+        loader.load("a", date="20240120", championship_id="c1"),
+        loader.load("b", date="20240120", championship_id="c1"),
+        loader.load("k", championship_id="c1"),
+    )
+
+    assert ids(matches) == ["a", "b", "k"]
+    # The championship group is the largest, so all three come from its page
+    assert [path for path, _ in api.requests] == ["/matches/by/basic/"]
+
+    api.requests.clear()
+    loader.clear()
+    await asyncio.gather(*(loader.load(match_id, date="20240120", championship_id="c1") for match_id in "ab"))
+    assert [path for path, _ in api.requests] == ["/matches/day/basic/"]
+
+
+@pytest.mark.asyncio
+async def test_small_and_unhinted_groups_use_single_calls(client, api):
+    loader = MatchLoader(client, min_batch=2)
+    matches = await asyncio.gather(loader.load("x", date="20240121"), loader.load("a"))
+
+    assert ids(matches) == ["x", "a"]
+    assert api.count("/matches/view/basic/") == 2
+    assert api.count("/matches/day/basic/") == 0
+
+
+@pytest.mark.asyncio
+async def test_wrong_hints_fall_back_to_single_calls(client, api):
+    loader = MatchLoader(client)
+    matches = await asyncio.gather(loader.load("a", date="20240121"), loader.load("zzz", date="20240121"))
+
+    assert ids(matches) == ["a", None]
+    assert api.count("/matches/day/basic/") == 1
+    assert api.count("/matches/view/basic/") == 2
+
+
+# =============================================================================
+# Caching and errors
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_matches_seen_on_pages_are_cached(client, api):
+    loader = MatchLoader(client)
+    await asyncio.gather(*(loader.load(match_id, date="20240120") for match_id in "ab"))
+    sent = len(api.requests)
+
+    # "c" was on the day page fetched for "a" and "b"
+    assert (await loader.load("c")).id == "c"
+    loader.prime(MatchBasic(id="primed"))
+    assert (await loader.get_view_basic("primed")).first_result.id == "primed"
+    assert len(api.requests) == sent
+    assert loader.stats.cache_hits == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_of_one_match_share_a_request(client, api):
+    loader = MatchLoader(client)
+    first, second = await asyncio.gather(loader.load("x"), loader.load("x"))
+
+    assert first is second
+    assert api.count("/matches/view/basic/") == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_page_fails_every_load_of_its_batch(client, api):
+    api.failing.add("/matches/day/basic/")
+    loader = MatchLoader(client)
+    results = await asyncio.gather(
+        *(loader.load(match_id, date="20240120") for match_id in "ab"), return_exceptions=True,
+    )
+
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_unknown_match_gives_an_empty_view(client, api):
+    loader = MatchLoader(client)
+    response = await loader.get_view_basic("zzz")
+
+    assert response.result == []
+    assert response.first_result is None
+
+
+def test_min_batch_must_be_positive():
+    with pytest.raises(ValueError):
+        MatchLoader(client=None, min_batch=0)
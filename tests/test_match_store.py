@@ -0,0 +1,208 @@
+import random
+from datetime import date, datetime
+from typing import Optional
+
+import pytest
+
+from soccer_info.responses import MatchBasic, MatchDayBasicResponse
+from soccer_info.store import MatchStore
+
+TEAMS = ["t1", "t2", "t3", "t4", "t5"]
+CHAMPIONSHIPS = ["c1", "c2"]
+REFEREES = ["r1", "r2", None]
+STADIUMS = ["s1", "s2", None]
+STATUSES = ["ENDED", "NOT STARTED", "POSTPONED"]
+
+
+def match(
+    match_id: str,
+    match_date: Optional[str] = "2024-01-20 15:00:00",
+    home: str = "t1",
+    away: str = "t2",
+    championship: str = "c1",
+    referee: Optional[str] = None,
+    stadium: Optional[str] = None,
+    status: str = "ENDED",
+) -> MatchBasic:
+    return MatchBasic.model_validate({
+        "id": match_id,
+        "date": match_date,
+        "status": status,
+        "championship": {"id": championship},
+        "teamA": {"id": home},
+        "teamB": {"id": away},
+        "referee": {"id": referee} if referee else None,
+        "stadium": {"id": stadium} if stadium else None,
+    })
+
+
+def random_match(rng: random.Random, match_id: str) -> MatchBasic:
+    home, away = rng.sample(TEAMS, 2)
+    day = rng.randint(1, 28)
+    match_date = None if rng.random() < 0.1 else f"2024-02-{day:02d} {rng.choice(['12', '15', '18'])}:00:00"
+    return match(
+        match_id, match_date, home, away,
+        championship=rng.choice(CHAMPIONSHIPS),
+        referee=rng.choice(REFEREES),
+        stadium=rng.choice(STADIUMS),
+        status=rng.choice(STATUSES),
+    )
+
+
+def scan(matches, team_id=None, championship_id=None, referee_id=None, stadium_id=None, status=None, date_from=None, date_to=None):
+    """Reference answer of ``MatchStore.query`` by a full scan."""
+    found = []
+    for candidate in matches:
+        if team_id is not None and team_id not in (candidate.teamA.id, candidate.teamB.id):
+            continue
+        if championship_id is not None and candidate.championship.id != championship_id:
+            continue
+        if referee_id is not None and (candidate.referee is None or candidate.referee.id != referee_id):
+            continue
+        if stadium_id is not None and (candidate.stadium is None or candidate.stadium.id != stadium_id):
+            continue
+        if status is not None and candidate.status != status:
+            continue
+        if (date_from is not None or date_to is not None) and candidate.date is None:
+            continue
+        if date_from is not None and candidate.date < date_from:
+            continue
+        if date_to is not None and candidate.date[:10] > date_to:
+            continue
+        found.append(candidate)
+    return sorted(found, key=lambda item: (item.date is None, item.date or "", item.id))
+
+
+def ids(matches) -> list:
+    return [item.id for item in matches]
+
+
+# =============================================================================
+# Queries
+# =============================================================================
+
+def test_filters_combine_with_and():
+    store = MatchStore([
+        match("a", "2024-01-20 15:00:00", "t1", "t2", referee="r1"),
+        match("b", "2024-01-21 18:00:00", "t3", "t1", referee="r2"),
+        match("c", "2024-01-22 12:00:00", "t2", "t3", championship="c2", referee="r1"),
+    ])
+
+    assert ids(store.query(team_id="t1")) == ["a", "b"]
+    assert ids(store.query(team_id="t2", referee_id="r1")) == ["a", "c"]
+    assert ids(store.query(team_id="t3", championship_id="c2")) == ["c"]
+    assert store.query(team_id="t1", championship_id="c2") == []
+    assert store.query(stadium_id="unknown") == []
+
+
+@pytest.mark.parametrize("date_from, date_to, expected", [
+    ("20240121", None, ["b", "c"]),
+    (None, "2024-01-21", ["a", "b"]),
+    (date(2024, 1, 21), date(2024, 1, 21), ["b"]),
+    (datetime(2024, 1, 20, 16, 0), "2024-01-21 18:00:00", ["b"]),
+    ("2024-01-23", None, []),
+])
+def test_date_bounds_are_inclusive_whole_days(date_from, date_to, expected):
+    store = MatchStore([
+        match("c", "2024-01-22 12:00:00"),
+        match("a", "2024-01-20 15:00:00"),
+        match("b", "2024-01-21 18:00:00"),
+        match("undated", None),
+    ])
+
+    assert ids(store.query(date_from=date_from, date_to=date_to)) == expected
+
+
+def test_undated_matches_sort_last_and_are_never_in_a_range():
+    store = MatchStore([match("undated", None), match("a", "2024-01-20 15:00:00")])
+
+    assert ids(store.query()) == ["a", "undated"]
+    assert ids(store.query(team_id="t1", date_from="2024-01-01")) == ["a"]
+    assert store.dates() == ["2024-01-20"]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_queries_match_a_full_scan(seed):
+    rng = random.Random(seed)
+    matches = {f"m{number:03d}": random_match(rng, f"m{number:03d}") for number in range(150)}
+    store = MatchStore()
+    # Mixed single and batch ingestion, with re-fetched versions replacing earlier ones
+    for number, item in enumerate(matches.values()):
+        if number % 3:
+            store.upsert(item)
+        else:
+            store.upsert_many([item])
+    for match_id in rng.sample(sorted(matches), 40):
+        matches[match_id] = random_match(rng, match_id)
+    store.upsert_many(matches[match_id] for match_id in sorted(matches)[:75])
+    for match_id in sorted(matches)[75:]:
+        store.upsert(matches[match_id])
+    for match_id in rng.sample(sorted(matches), 10):
+        assert store.remove(match_id) is not None
+        del matches[match_id]
+
+    assert len(store) == len(matches)
+    for _ in range(200):
+        filters = {
+            "team_id": rng.choice([None, *TEAMS]),
+            "championship_id": rng.choice([None, *CHAMPIONSHIPS]),
+            "referee_id": rng.choice([None, None, "r1"]),
+            "stadium_id": rng.choice([None, None, "s2"]),
+            "status": rng.choice([None, *STATUSES]),
+            "date_from": rng.choice([None, "2024-02-05", "2024-02-10 15:00:00"]),
+            "date_to": rng.choice([None, "2024-02-06", "2024-02-20"]),
+        }
+        assert ids(store.query(**filters)) == ids(scan(matches.values(), **filters)), filters
+
+
+# =============================================================================
+# Ingestion and index maintenance
+# =============================================================================
+
+def test_reingesting_a_match_moves_its_index_entries():
+    store = MatchStore([match("a", "2024-01-20 15:00:00", status="NOT STARTED", referee="r1")])
+    store.upsert(match("a", "2024-01-27 15:00:00", status="POSTPONED", referee="r2"))
+
+    assert len(store) == 1
+    assert store.query(status="NOT STARTED") == []
+    assert store.query(referee_id="r1") == []
+    assert ids(store.query(status="POSTPONED", referee_id="r2")) == ["a"]
+    assert store.query(date_to="2024-01-20") == []
+    assert store.dates() == ["2024-01-27"]
+
+
+def test_batch_upsert_later_duplicates_win():
+    store = MatchStore()
+    count = store.upsert_many([match("a", status="NOT STARTED"), match("b"), match("a", status="ENDED")])
+
+    assert count == 2
+    assert store.get("a").status == "ENDED"
+    assert ids(store.query(status="ENDED")) == ["a", "b"]
+
+
+def test_ingest_response_remove_and_clear():
+    response = MatchDayBasicResponse.model_validate({
+        "status": 200, "errors": [], "pagination": [],
+        "result": [match("a").model_dump(), match("b", "2024-01-21 15:00:00").model_dump()],
+    })
+    store = MatchStore()
+
+    assert store.ingest(response) == 2
+    assert "a" in store and [item.id for item in store] == ["a", "b"]
+    assert store.remove("a").id == "a"
+    assert store.remove("a") is None
+    assert ids(store.query(team_id="t1")) == ["b"]
+
+    store.clear()
+    assert len(store) == 0
+    assert store.query(team_id="t1") == []
+    assert store.dates() == []
+
+
+def test_rejects_matches_without_id():
+    store = MatchStore()
+    with pytest.raises(ValueError):
+        store.upsert(match(""))
+    with pytest.raises(ValueError):
+        store.upsert_many([match("a"), MatchBasic()])
+    assert len(store) == 0
@@ -0,0 +1,308 @@
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from soccer_info.client import (
+    AsyncHTTPXClient,
+    HTTPXClient,
+    MetricsMiddleware,
+    Middleware,
+    RetryMiddleware,
+    ThrottleMiddleware,
+)
+from soccer_info.client.pipeline import parse_body
+from soccer_info.responses import CountryListResponse
+from tests.conftest import countries_body, json_response
+
+
+def flaky(*statuses: int, headers=None):
+    """Handler answering with ``statuses`` in turn, then with a country list; records request count."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        handler.sent += 1
+        if handler.sent <= len(statuses):
+            return json_response(b'{"status": 0, "errors": ["x"], "result": []}', statuses[handler.sent - 1], headers)
+        return json_response(countries_body())
+    handler.sent = 0
+    return handler
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> List[float]:
+    """Seconds the sync driver was asked to sleep, without sleeping."""
+    recorded: List[float] = []
+    monkeypatch.setattr("soccer_info.client.sync.httpclient.time.sleep", recorded.append)
+    return recorded
+
+
+# =============================================================================
+# RetryMiddleware
+# =============================================================================
+
+def test_retry_backs_off_exponentially(settings, sleeps):
+    handler = flaky(503, 502)
+    with HTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(RetryMiddleware(attempts=3, backoff=0.5))
+        response = client.countries.get_list()
+
+    assert response.is_success
+    assert handler.sent == 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_retry_backoff_is_capped(settings, sleeps):
+    handler = flaky(503, 503, 503, 503)
+    with HTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(RetryMiddleware(attempts=5, backoff=1.0, max_backoff=3.0))
+        client.countries.get_list()
+
+    assert sleeps == [1.0, 2.0, 3.0, 3.0]
+
+
+def test_retry_after_takes_precedence_over_backoff(settings, sleeps):
+    handler = flaky(429, headers={"Retry-After": "7"})
+    with HTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(RetryMiddleware(attempts=2, backoff=0.5, max_backoff=10.0))
+        client.countries.get_list()
+
+    assert sleeps == [7.0]
+
+
+def test_retry_after_is_capped_by_max_backoff(settings, sleeps):
+    handler = flaky(429, headers={"Retry-After": "120"})
+    with HTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(RetryMiddleware(attempts=2, backoff=0.5, max_backoff=10.0))
+        client.countries.get_list()
+
+    assert sleeps == [10.0]
+
+
+def test_retry_gives_up_after_last_attempt(settings, sleeps):
+    handler = flaky(503, 503, 503)
+    with HTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(RetryMiddleware(attempts=3, backoff=0.5))
+        with pytest.raises(httpx.HTTPStatusError):
+            client.countries.get_list()
+
+    assert handler.sent == 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_retry_ignores_other_statuses(settings, sleeps):
+    handler = flaky(404)
+    with HTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(RetryMiddleware(attempts=3))
+        with pytest.raises(httpx.HTTPStatusError):
+            client.countries.get_list()
+
+    assert handler.sent == 1
+    assert sleeps == []
+
+
+def test_retry_on_transport_error(settings, sleeps):
+    sent = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        if sent == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return json_response(countries_body())
+
+    with HTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(RetryMiddleware(attempts=2, backoff=0.25))
+        assert client.countries.get_list().is_success
+
+    assert sent == 2
+    assert sleeps == [0.25]
+
+
+def test_retry_rejects_zero_attempts():
+    with pytest.raises(ValueError):
+        RetryMiddleware(attempts=0)
+
+
+@pytest.mark.asyncio
+async def test_async_retry(settings):
+    handler = flaky(503)
+    async with AsyncHTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(RetryMiddleware(attempts=2, backoff=0))
+        response = await client.countries.get_list()
+
+    assert response.is_success
+    assert handler.sent == 2
+
+
+# =============================================================================
+# ParseCacheMiddleware
+# =============================================================================
+
+def test_parse_cache_hits_on_unchanged_body(settings):
+    cached_settings = settings.model_copy(update={"parse_cache_entries": 8})
+    bodies = [countries_body(["IT"]), countries_body(["IT"]), countries_body(["ES"])]
+    transport = httpx.MockTransport(lambda request: json_response(bodies.pop(0)))
+
+    with HTTPXClient(cached_settings, transport=transport) as client:
+        first = client.countries.get_list()
+        second = client.countries.get_list()
+        changed = client.countries.get_list()
+        stats = client.parse_cache.stats
+
+    assert not first.response_unchanged
+    assert second.response_unchanged
+    assert second.result == first.result
+    assert not changed.response_unchanged
+    assert changed.result[0].code == "ES"
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_parse_cache_keys_on_parameters(settings):
+    cached_settings = settings.model_copy(update={"parse_cache_entries": 8})
+    transport = httpx.MockTransport(lambda request: json_response(countries_body()))
+
+    with HTTPXClient(cached_settings, transport=transport) as client:
+        client.countries.get_list()
+        other = client.countries.get_list(format_="csv")
+        stats = client.parse_cache.stats
+
+    assert not other.response_unchanged
+    assert (stats.hits, stats.misses) == (0, 2)
+
+
+def test_parse_cache_leaves_custom_parsers_alone(settings):
+    cached_settings = settings.model_copy(update={"parse_cache_entries": 8})
+    transport = httpx.MockTransport(lambda request: json_response(countries_body()))
+    parsed_by = []
+
+    def parser(spec, raw):
+        parsed_by.append("custom")
+        return parse_body(spec, raw)
+
+    with HTTPXClient(cached_settings, transport=transport) as client:
+        spec = client.countries._get_list_spec()
+        client.execute(spec, parser=parser)
+        client.execute(spec, parser=parser)
+        stats = client.parse_cache.stats
+
+    assert parsed_by == ["custom", "custom"]
+    assert (stats.hits, stats.misses) == (0, 0)
+
+
+def test_parse_cache_isolates_responses_from_rebinding(settings):
+    cached_settings = settings.model_copy(update={"parse_cache_entries": 8})
+    transport = httpx.MockTransport(lambda request: json_response(countries_body(["IT", "ES"])))
+
+    with HTTPXClient(cached_settings, transport=transport) as client:
+        first = client.countries.get_list()
+        first.result = sorted(first.result, key=lambda country: country.code)
+        first.status = 0
+        second = client.countries.get_list()
+
+    assert second.response_unchanged
+    assert not first.response_unchanged
+    assert second.status == 200
+    assert [country.code for country in second.result] == ["IT", "ES"]
+
+
+# =============================================================================
+# MetricsMiddleware and ThrottleMiddleware
+# =============================================================================
+
+def test_metrics_count_calls_failures_and_retries(settings, sleeps):
+    handler = flaky(503, 404)
+    metrics = MetricsMiddleware()
+    with HTTPXClient(settings, transport=httpx.MockTransport(handler)) as client:
+        client.pipeline.use(metrics, outermost=True)
+        client.pipeline.use(RetryMiddleware(attempts=2, backoff=0))
+        with pytest.raises(httpx.HTTPStatusError):
+            client.countries.get_list()
+        client.countries.get_list()
+
+    report = metrics.report()["/countries/list/"]
+    assert (report["calls"], report["failures"], report["retries"]) == (2, 1, 1)
+
+
+def test_throttle_spaces_requests(settings, sleeps):
+    transport = httpx.MockTransport(lambda request: json_response(countries_body()))
+    with HTTPXClient(settings, transport=transport) as client:
+        client.pipeline.use(ThrottleMiddleware(interval=60))
+        client.countries.get_list()
+        client.countries.get_list()
+
+    assert len(sleeps) == 1
+    assert 59 < sleeps[0] <= 60
+
+
+# =============================================================================
+# Pipeline
+# =============================================================================
+
+class Recorder(Middleware):
+    def __init__(self, name: str, log: List[str]):
+        self.name = name
+        self.log = log
+
+    def handle(self, call, forward):
+        self.log.append(f"{self.name} in")
+        result = yield from forward(call)
+        self.log.append(f"{self.name} out")
+        return result
+
+
+def test_pipeline_runs_middleware_outermost_first(settings):
+    log: List[str] = []
+    transport = httpx.MockTransport(lambda request: json_response(countries_body()))
+    with HTTPXClient(settings, transport=transport) as client:
+        inner = Recorder("inner", log)
+        client.pipeline.use(Recorder("middle", log))
+        client.pipeline.use(inner)
+        client.pipeline.use(Recorder("outer", log), outermost=True)
+        client.countries.get_list()
+        client.pipeline.remove(inner)
+        log.clear()
+        client.countries.get_list()
+
+    assert log == ["outer in", "middle in", "middle out", "outer out"]
+
+
+def test_drive_rejects_unknown_effects(settings):
+    class Unknown(Middleware):
+        def handle(self, call, forward):
+            yield "not an effect"
+            return (yield from forward(call))
+
+    transport = httpx.MockTransport(lambda request: json_response(countries_body()))
+    with HTTPXClient(settings, transport=transport) as client:
+        client.pipeline.use(Unknown())
+        with pytest.raises(TypeError):
+            client.countries.get_list()
+
+
+# =============================================================================
+# Sync and async drivers
+# =============================================================================
+
+def test_sync_and_async_drivers_agree(settings):
+    body = countries_body(["IT", "ES", "FR"])
+    handler_headers = {"x-ratelimit-requests-remaining": "41"}
+
+    def transport():
+        return httpx.MockTransport(lambda request: json_response(body, headers=handler_headers))
+
+    with HTTPXClient(settings, transport=transport()) as client:
+        client.pipeline.use(RetryMiddleware())
+        sync_response = client.countries.get_list()
+
+    async def fetch() -> CountryListResponse:
+        async with AsyncHTTPXClient(settings, transport=transport()) as async_client:
+            async_client.pipeline.use(RetryMiddleware())
+            return await async_client.countries.get_list()
+
+    async_response = asyncio.run(fetch())
+
+    expected = CountryListResponse.model_validate_json(body).model_dump()
+    assert sync_response.model_dump() == async_response.model_dump() == expected
+    assert sync_response.response_headers == async_response.response_headers
+    assert type(sync_response) is type(async_response) is CountryListResponse
+
@@ -0,0 +1,158 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from soccer_info.client import AsyncHTTPXClient, QuotaExhaustedError, QuotaReserveError, request_priority
+from soccer_info.client.async_.quota import QuotaGuard
+from soccer_info.client.async_.scheduler import PriorityScheduler
+from tests.conftest import countries_body, json_response
+
+
+def quota(remaining: int, reset: int = 3600) -> dict:
+    return {
+        "x-ratelimit-request-limit": "100",
+        "x-ratelimit-request-remaining": str(remaining),
+        "x-ratelimit-request-reset": str(reset),
+    }
+
+
+# =============================================================================
+# Cancel mode
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_reserve_fails_queued_and_rejects_new_unprotected_requests():
+    scheduler = PriorityScheduler(interval=60)
+    guard = QuotaGuard(scheduler, reserve=10)
+    await scheduler.acquire("live")
+    queued = [asyncio.create_task(scheduler.acquire(priority)) for priority in ("bulk", "interactive", "live")]
+    await asyncio.sleep(0)
+
+    guard.observe(remaining=10, reset_seconds=7200)
+
+    for task in queued[:2]:
+        with pytest.raises(QuotaReserveError) as error:
+            await task
+        assert isinstance(error.value, QuotaExhaustedError)
+        assert error.value.remaining == 10 and error.value.reserve == 10
+        assert error.value.hours_to_reset == 2.0
+    assert not queued[2].done()
+    assert guard.tripped
+    with pytest.raises(QuotaReserveError):
+        await scheduler.acquire("bulk")
+    queued[2].cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued[2]
+
+
+@pytest.mark.asyncio
+async def test_quota_above_reserve_leaves_requests_alone():
+    scheduler = PriorityScheduler(interval=0)
+    guard = QuotaGuard(scheduler, reserve=10)
+    guard.observe(remaining=11, reset_seconds=60)
+    guard.observe(remaining=None, reset_seconds=None)
+
+    assert not guard.tripped
+    assert guard.remaining == 11
+    assert await scheduler.acquire("bulk") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_guard_recovers_at_the_reset():
+    scheduler = PriorityScheduler(interval=0)
+    guard = QuotaGuard(scheduler, reserve=5)
+    guard.observe(remaining=3, reset_seconds=0.05)
+    with pytest.raises(QuotaReserveError):
+        await scheduler.acquire("bulk")
+
+    await asyncio.sleep(0.06)
+    assert not guard.tripped
+    await scheduler.acquire("bulk")
+
+
+@pytest.mark.asyncio
+async def test_unknown_reset_recovers_once_the_quota_is_reported_again():
+    scheduler = PriorityScheduler(interval=0)
+    guard = QuotaGuard(scheduler, reserve=5, retry_seconds=3600)
+    guard.observe(remaining=2, reset_seconds=None)
+    with pytest.raises(QuotaReserveError) as error:
+        await scheduler.acquire("interactive")
+    assert error.value.reset_seconds is None
+
+    guard.observe(remaining=80, reset_seconds=None)
+    assert not guard.tripped
+
+
+@pytest.mark.asyncio
+async def test_protected_classes_are_configurable():
+    scheduler = PriorityScheduler(interval=0)
+    guard = QuotaGuard(scheduler, reserve=5, protected=("live", "interactive"))
+    guard.observe(remaining=1, reset_seconds=600)
+
+    assert guard.unprotected == ("bulk",)
+    await scheduler.acquire("interactive")
+    with pytest.raises(QuotaReserveError):
+        await scheduler.acquire("bulk")
+
+
+# =============================================================================
+# Auto resume
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_auto_resume_holds_unprotected_requests_until_the_reset():
+    scheduler = PriorityScheduler(interval=0)
+    guard = QuotaGuard(scheduler, reserve=5, auto_resume=True)
+    guard.observe(remaining=5, reset_seconds=0.1)
+
+    started = time.monotonic()
+    bulk = asyncio.create_task(scheduler.acquire("bulk"))
+    await asyncio.sleep(0)
+    assert await asyncio.wait_for(scheduler.acquire("live"), 0.05) < 0.05
+    assert not bulk.done()
+
+    await bulk
+    assert time.monotonic() - started >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_reset_releases_paused_requests():
+    scheduler = PriorityScheduler(interval=0)
+    guard = QuotaGuard(scheduler, reserve=5, auto_resume=True)
+    guard.observe(remaining=0, reset_seconds=3600)
+    bulk = asyncio.create_task(scheduler.acquire("bulk"))
+    await asyncio.sleep(0.01)
+    assert not bulk.done()
+
+    guard.reset()
+    await asyncio.wait_for(bulk, 1)
+    assert not guard.tripped
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_client_stops_bulk_requests_at_the_reserve(settings):
+    remaining = [12]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        remaining[0] -= 1
+        return json_response(countries_body(), headers=quota(remaining[0], reset=1800))
+
+    guarded = settings.model_copy(update={"quota_reserve": 10})
+    async with AsyncHTTPXClient(guarded, transport=httpx.MockTransport(handler)) as client:
+        with request_priority("bulk"):
+            await client.countries.get_list()
+            await client.countries.get_list()
+            with pytest.raises(QuotaReserveError) as error:
+                await client.countries.get_list()
+        with request_priority("live"):
+            await client.countries.get_list()
+
+    assert error.value.remaining == 10
+    assert 0.49 < error.value.hours_to_reset <= 0.5
+    assert remaining[0] == 9
@@ -0,0 +1,74 @@
+import httpx
+import pytest
+
+from soccer_info.transports import Cassette, ReplayTransport
+from tests.conftest import countries_body, json_response
+
+URL = "http://api.test/countries/list/"
+
+
+@pytest.fixture
+def cassette(tmp_path):
+    cassette = Cassette(tmp_path)
+    request = httpx.Request("GET", URL)
+    response = json_response(countries_body())
+    response.read()
+    cassette.record(request, response, elapsed=0.0)
+    return cassette
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Manually advanced ``time.monotonic`` of the replay transport."""
+    now = [1000.0]
+    monkeypatch.setattr("soccer_info.transports.replay.time.monotonic", lambda: now[0])
+    return now
+
+
+def fetch(transport: ReplayTransport, count: int) -> list:
+    with httpx.Client(transport=transport) as client:
+        return [client.get(URL) for _ in range(count)]
+
+
+def test_exhausted_quota_retries_after_the_reset(cassette, clock):
+    transport = ReplayTransport(cassette, rate_limit=2, rate_limit_period=60)
+    first, second = fetch(transport, 2)
+    clock[0] += 20.5
+    exhausted, = fetch(transport, 1)
+
+    assert [first.status_code, second.status_code] == [200, 200]
+    assert second.headers["x-ratelimit-request-remaining"] == "0"
+    assert exhausted.status_code == 429
+    assert exhausted.headers["x-ratelimit-request-reset"] == "39"
+    assert exhausted.headers["retry-after"] == "40"
+
+    clock[0] += 40
+    assert fetch(transport, 1)[0].status_code == 200
+
+
+def test_retry_after_is_at_least_one_second(cassette, clock):
+    transport = ReplayTransport(cassette, rate_limit=1, rate_limit_period=60)
+    fetch(transport, 1)
+    clock[0] += 59.75
+
+    exhausted, = fetch(transport, 1)
+    assert exhausted.headers["x-ratelimit-request-reset"] == "0"
+    assert exhausted.headers["retry-after"] == "1"
+
+
+def test_injected_throttling_retries_after_one_second(cassette, clock):
+    transport = ReplayTransport(cassette, throttle_rate=1.0, rate_limit=100, rate_limit_period=60, seed=0)
+    clock[0] += 30
+
+    throttled, = fetch(transport, 1)
+    assert throttled.status_code == 429
+    assert throttled.headers["retry-after"] == "1"
+    assert throttled.headers["x-ratelimit-request-remaining"] == "99"
+
+
+def test_reset_rate_limit_restores_the_quota(cassette, clock):
+    transport = ReplayTransport(cassette, rate_limit=1, rate_limit_period=60)
+    assert [response.status_code for response in fetch(transport, 2)] == [200, 429]
+
+    transport.reset_rate_limit()
+    assert fetch(transport, 1)[0].status_code == 200
@@ -0,0 +1,226 @@
+import asyncio
+import time
+from collections import Counter
+
+import httpx
+import pytest
+
+from soccer_info.client import AsyncHTTPXClient, RequestShedError, request_priority
+from soccer_info.client.async_.scheduler import PRIORITIES, PriorityScheduler, current_request_options
+from tests.conftest import countries_body, json_response
+
+
+async def queue_all(scheduler: PriorityScheduler, requests) -> list:
+    """Queue ``(priority, label)`` requests behind a hold, then release them; returns labels in grant order."""
+    granted = []
+
+    async def request(priority, label):
+        await scheduler.acquire(priority)
+        granted.append(label)
+
+    scheduler.hold(PRIORITIES, until=time.monotonic() + 60)
+    tasks = [asyncio.create_task(request(priority, label)) for priority, label in requests]
+    await asyncio.sleep(0)
+    scheduler.release_holds()
+    await asyncio.gather(*tasks)
+    return granted
+
+
+# =============================================================================
+# Slot sharing
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_slots_are_shared_by_weight_while_classes_wait():
+    scheduler = PriorityScheduler(interval=0)
+    granted = await queue_all(scheduler, [(priority, priority) for priority in PRIORITIES for _ in range(26)])
+
+    assert Counter(granted[:13]) == {"live": 8, "interactive": 4, "bulk": 1}
+    assert Counter(granted[:26]) == {"live": 16, "interactive": 8, "bulk": 2}
+
+
+@pytest.mark.asyncio
+async def test_custom_weights():
+    scheduler = PriorityScheduler(interval=0, weights={"live": 1.0, "bulk": 1.0})
+    granted = await queue_all(scheduler, [(priority, priority) for priority in ("live", "bulk") for _ in range(4)])
+
+    assert granted == ["live", "bulk"] * 4
+
+
+@pytest.mark.asyncio
+async def test_first_in_first_out_within_a_class():
+    scheduler = PriorityScheduler(interval=0)
+    granted = await queue_all(scheduler, [("bulk", number) for number in range(5)])
+
+    assert granted == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_idle_class_does_not_bank_credit():
+    scheduler = PriorityScheduler(interval=0)
+    # Only bulk waits for a while, then live joins: live must not be owed the slots bulk used
+    await queue_all(scheduler, [("bulk", "bulk")] * 20)
+    granted = await queue_all(scheduler, [("bulk", "bulk")] * 13 + [("live", "live")] * 13)
+
+    # Live rejoins at the current virtual time, one slot ahead of bulk's next turn
+    assert Counter(granted[:10]) == {"live": 9, "bulk": 1}
+
+
+@pytest.mark.asyncio
+async def test_slots_are_spaced_by_the_interval():
+    scheduler = PriorityScheduler(interval=0.02)
+    started = time.monotonic()
+    for _ in range(4):
+        await scheduler.acquire("interactive")
+
+    assert time.monotonic() - started >= 0.06
+
+
+# =============================================================================
+# Deadlines and shedding
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_request_past_its_deadline_is_shed():
+    scheduler = PriorityScheduler(interval=0.5)
+    assert await scheduler.acquire("live") == 0.0
+
+    started = time.monotonic()
+    with pytest.raises(RequestShedError) as error:
+        await scheduler.acquire("live", deadline=0.05)
+
+    assert error.value.priority == "live"
+    assert 0.05 <= error.value.waited < 0.4
+    assert time.monotonic() - started < 0.4
+    assert scheduler.pending() == {"live": 0, "interactive": 0, "bulk": 0}
+
+
+@pytest.mark.asyncio
+async def test_bulk_deadline_applies_to_bulk_requests_only():
+    scheduler = PriorityScheduler(interval=0.3, bulk_deadline=0.05)
+    await scheduler.acquire("interactive")
+    bulk = asyncio.create_task(scheduler.acquire("bulk"))
+    interactive = asyncio.create_task(scheduler.acquire("interactive"))
+
+    with pytest.raises(RequestShedError):
+        await bulk
+    assert await interactive >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_deadline_comes_from_request_priority():
+    scheduler = PriorityScheduler(interval=0.5)
+    await scheduler.acquire("live")
+
+    with request_priority("bulk", deadline=0.05):
+        assert current_request_options().priority == "bulk"
+        with pytest.raises(RequestShedError) as error:
+            await scheduler.acquire()
+    assert error.value.priority == "bulk"
+    assert current_request_options().priority == "interactive"
+
+
+def test_unknown_priority_is_rejected():
+    with pytest.raises(ValueError):
+        with request_priority("urgent"):
+            pass
+
+
+# =============================================================================
+# Holds, failing and admission
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_held_class_waits_while_others_are_served():
+    scheduler = PriorityScheduler(interval=0)
+    scheduler.hold(["bulk"], until=time.monotonic() + 0.1)
+    bulk = asyncio.create_task(scheduler.acquire("bulk"))
+    await asyncio.sleep(0)
+
+    assert await asyncio.wait_for(scheduler.acquire("live"), 0.05) < 0.05
+    assert not bulk.done()
+    assert await bulk >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_release_holds_dispatches_queued_requests():
+    scheduler = PriorityScheduler(interval=0)
+    scheduler.hold(["bulk"], until=time.monotonic() + 60)
+    bulk = asyncio.create_task(scheduler.acquire("bulk"))
+    await asyncio.sleep(0.01)
+    assert scheduler.pending()["bulk"] == 1
+
+    scheduler.release_holds()
+    assert await asyncio.wait_for(bulk, 1) < 1
+
+
+@pytest.mark.asyncio
+async def test_fail_pending_fails_queued_requests_of_given_classes():
+    scheduler = PriorityScheduler(interval=0)
+    scheduler.hold(["bulk", "interactive"], until=time.monotonic() + 60)
+    bulk = [asyncio.create_task(scheduler.acquire("bulk")) for _ in range(2)]
+    interactive = asyncio.create_task(scheduler.acquire("interactive"))
+    await asyncio.sleep(0)
+
+    assert scheduler.fail_pending(["bulk"], lambda: RuntimeError("cancelled")) == 2
+    for task in bulk:
+        with pytest.raises(RuntimeError, match="cancelled"):
+            await task
+    assert scheduler.pending() == {"live": 0, "interactive": 1, "bulk": 0}
+
+    scheduler.release_holds()
+    await interactive
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_leaves_the_queue():
+    scheduler = PriorityScheduler(interval=60)
+    await scheduler.acquire("live")
+    waiting = asyncio.create_task(scheduler.acquire("bulk"))
+    await asyncio.sleep(0)
+    assert scheduler.pending()["bulk"] == 1
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert scheduler.pending()["bulk"] == 0
+
+
+@pytest.mark.asyncio
+async def test_admission_can_reject_requests():
+    scheduler = PriorityScheduler(interval=0)
+
+    def admission(priority):
+        if priority == "bulk":
+            raise RuntimeError("no bulk now")
+
+    scheduler.admission = admission
+    await scheduler.acquire("live")
+    with pytest.raises(RuntimeError, match="no bulk now"):
+        await scheduler.acquire("bulk")
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_live_request_overtakes_queued_bulk_requests(settings):
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.params.get("f", "live"))
+        return json_response(countries_body())
+
+    async def call(priority, format=None):
+        with request_priority(priority):
+            await client.countries.get_list(format=format)
+
+    throttled = settings.model_copy(update={"request_throttle_seconds": 0.02})
+    async with AsyncHTTPXClient(throttled, transport=httpx.MockTransport(handler)) as client:
+        bulk = [asyncio.create_task(call("bulk", f"b{number}")) for number in range(4)]
+        await asyncio.sleep(0)
+        await asyncio.gather(call("live"), *bulk)
+
+    assert sent[:2] == ["b0", "live"]
+    assert sorted(sent[2:]) == ["b1", "b2", "b3"]
@@ -0,0 +1,190 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from soccer_info.client import AsyncHTTPXClient, RequestSpec, StagedPipeline
+from soccer_info.client.async_.stages import _SpecFeed
+from soccer_info.export import NDJSONSink
+from soccer_info.requests_ import MATCH_DAY_BASIC
+from soccer_info.responses import MatchDayBasicResponse
+from tests.conftest import json_response
+
+PER_PAGE = 2
+
+
+class DayAPI:
+    """Serves day listings of ``PER_PAGE`` matches per page."""
+
+    def __init__(self, days):
+        self.days = days
+        self.requests = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        day, page = request.url.params["d"], int(request.url.params.get("p", 1))
+        self.requests.append((day, page))
+        ids = self.days.get(day, [])
+        body = {
+            "status": 200,
+            "errors": [],
+            "pagination": [{"page": page, "per_page": PER_PAGE, "items": len(ids)}],
+            "result": [{"id": match_id, "date": "2024-01-20 15:00:00"} for match_id in ids[(page - 1) * PER_PAGE:page * PER_PAGE]],
+        }
+        return json_response(json.dumps(body).encode())
+
+
+@pytest.fixture
+def api():
+    return DayAPI({"20240120": ["a", "b", "c", "d", "e"], "20240121": ["x"], "20240122": []})
+
+
+@pytest_asyncio.fixture
+async def client(settings, api):
+    async with AsyncHTTPXClient(settings, transport=httpx.MockTransport(api.handle)) as client:
+        yield client
+
+
+def day_spec(client, day: str, **params) -> RequestSpec:
+    return RequestSpec(
+        endpoint=MATCH_DAY_BASIC.endpoint,
+        params=MATCH_DAY_BASIC.build(date=day, **params),
+        headers=client.auth_headers(),
+        response_model=MatchDayBasicResponse,
+    )
+
+
+async def run(pipeline: StagedPipeline, specs) -> None:
+    # A pipeline that never notices the end of its input hangs instead of failing
+    await asyncio.wait_for(pipeline.run(specs), timeout=5)
+
+
+# =============================================================================
+# Pages
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_first_pages_queue_the_remaining_pages(client, api):
+    written = []
+    pipeline = StagedPipeline(client, written.extend, fetch_concurrency=3)
+    await run(pipeline, [day_spec(client, day) for day in ("20240120", "20240121", "20240122")])
+
+    assert sorted(match.id for match in written) == ["a", "b", "c", "d", "e", "x"]
+    assert sorted(api.requests) == [("20240120", 1), ("20240120", 2), ("20240120", 3), ("20240121", 1), ("20240122", 1)]
+    report = pipeline.report()
+    assert report["fetch"]["items_out"] == report["parse"]["items_out"] == 5
+    assert report["sink"]["items_out"] == 6
+
+
+@pytest.mark.asyncio
+async def test_only_first_pages_are_followed(client, api):
+    written = []
+    pipeline = StagedPipeline(client, written.extend)
+    await run(pipeline, [day_spec(client, "20240120", page=2)])
+
+    assert api.requests == [("20240120", 2)]
+    assert [match.id for match in written] == ["c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_follow_pages_can_be_turned_off(client, api):
+    written = []
+    await run(StagedPipeline(client, written.extend, follow_pages=False), [day_spec(client, "20240120")])
+
+    assert api.requests == [("20240120", 1)]
+    assert [match.id for match in written] == ["a", "b"]
+
+
+# =============================================================================
+# Termination
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_empty_source_finishes_without_requests(client, api):
+    pipeline = StagedPipeline(client, lambda items: None)
+    metrics = await asyncio.wait_for(pipeline.run([]), timeout=5)
+
+    assert api.requests == []
+    assert all(stage.items_in == 0 for stage in metrics.values())
+
+
+@pytest.mark.asyncio
+async def test_async_source_is_read_lazily(client, api):
+    pulled = []
+
+    async def specs():
+        for day in ("20240120", "20240121"):
+            pulled.append(day)
+            yield day_spec(client, day)
+
+    written = []
+    # One fetch worker only asks for the second day once the first page was handed on
+    await run(StagedPipeline(client, written.extend, fetch_concurrency=1, queue_size=1), specs())
+
+    assert pulled == ["20240120", "20240121"]
+    assert api.requests[0] == ("20240120", 1)
+    assert len(written) == 6
+
+
+@pytest.mark.asyncio
+async def test_feed_waits_for_open_requests_before_ending():
+    first, follow_up = object(), object()
+    feed = _SpecFeed([first])
+
+    assert await feed.next() is first
+    waiting = asyncio.create_task(feed.next())
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    await feed.done([follow_up])
+    assert await asyncio.wait_for(waiting, timeout=1) is follow_up
+    ending = asyncio.create_task(feed.next())
+    await asyncio.sleep(0)
+    assert not ending.done()
+
+    await feed.done()
+    assert await asyncio.wait_for(ending, timeout=1) is None
+
+
+@pytest.mark.asyncio
+async def test_stage_error_stops_the_pipeline(client, api):
+    def sink(items):
+        raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError, match="disk full"):
+        await run(StagedPipeline(client, sink), [day_spec(client, "20240120")])
+
+
+# =============================================================================
+# Sinks and transforms
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_writes_to_an_export_sink(client, tmp_path):
+    path = tmp_path / "matches.ndjson"
+    with NDJSONSink(path, buffer_items=100) as sink:
+        await run(StagedPipeline(client, sink), [day_spec(client, "20240120")])
+
+    assert sorted(json.loads(line)["id"] for line in path.read_text().splitlines()) == ["a", "b", "c", "d", "e"]
+
+
+@pytest.mark.asyncio
+async def test_async_transform_and_sink(client):
+    written = []
+
+    async def ids(response):
+        return [match.id for match in response.result]
+
+    async def sink(items):
+        written.extend(items)
+
+    await run(StagedPipeline(client, sink, transform=ids, offload_sink=False), [day_spec(client, "20240121")])
+
+    assert written == ["x"]
+
+
+@pytest.mark.parametrize("option", ["queue_size", "fetch_concurrency", "parse_concurrency", "transform_concurrency"])
+def test_rejects_sizes_below_one(option):
+    with pytest.raises(ValueError, match=option):
+        StagedPipeline(None, lambda items: None, **{option: 0})
@@ -0,0 +1,191 @@
+from typing import List, Optional
+
+import pytest
+
+from soccer_info.responses import ChampionshipDetail, MatchBasic
+from soccer_info.store import Standings
+
+
+def row(team: str, position: Optional[int], points: int, scored: int, conceded: int) -> dict:
+    return {
+        "team": {"id": team, "name": team.upper()},
+        "position": position,
+        "win": 0, "draw": 0, "loss": 0,
+        "points": points,
+        "goals_scored": scored,
+        "goals_conceded": conceded,
+    }
+
+
+def championship(*groups: List[dict], names=None) -> ChampionshipDetail:
+    names = names or [None] * len(groups)
+    return ChampionshipDetail.model_validate({
+        "id": "c1",
+        "seasons": [{"name": "2024", "groups": [{"name": name, "table": table} for name, table in zip(names, groups)]}],
+    })
+
+
+def match(match_id: str, home: str, away: str, home_goals, away_goals, status: str = "ENDED", championship_id: str = "c1") -> MatchBasic:
+    return MatchBasic.model_validate({
+        "id": match_id,
+        "status": status,
+        "championship": {"id": championship_id, "s_name": "2024"},
+        "teamA": {"id": home, "name": home, "score": {"f": None if home_goals is None else str(home_goals)}},
+        "teamB": {"id": away, "name": away, "score": {"f": None if away_goals is None else str(away_goals)}},
+    })
+
+
+def order(standings: Standings, group=None) -> List[str]:
+    return [entry.team.id for entry in standings.table(group)]
+
+
+def snapshot(standings: Standings, group=None) -> list:
+    return [
+        (entry.team.id, entry.position, entry.win, entry.draw, entry.loss, entry.points, entry.goals_scored, entry.goals_conceded)
+        for entry in standings.table(group)
+    ]
+
+
+def assert_sorted(standings: Standings, group=None) -> None:
+    table = standings.table(group)
+    keys = [standings._rank_key(entry) for entry in table]
+    assert keys == sorted(keys)
+    assert [entry.position for entry in table] == list(range(1, len(table) + 1))
+    assert all(standings.entry(entry.team.id) is entry for entry in table)
+
+
+# A table the API ordered by head-to-head and with a deduction, not by points/goal difference
+OUT_OF_ORDER = [
+    row("a", 1, 10, 8, 6),
+    row("b", 2, 10, 9, 3),
+    row("c", 3, 12, 5, 5),
+    row("d", 4, 7, 4, 4),
+    row("e", 5, 7, 4, 4),
+    row("f", None, 0, 0, 0),
+]
+
+
+def test_seed_ranks_out_of_order_tables():
+    standings = Standings(championship(OUT_OF_ORDER))
+
+    assert order(standings) == ["c", "b", "a", "d", "e", "f"]
+    assert_sorted(standings)
+
+
+def test_seed_fills_missing_counters():
+    standings = Standings(championship([{"team": {"id": "x", "name": "X"}, "position": 1}]))
+
+    entry = standings.entry("x")
+    assert (entry.points, entry.win, entry.goals_scored) == (0, 0, 0)
+
+
+@pytest.mark.parametrize("result", [(3, 0), (0, 3), (1, 1), (4, 4), (0, 1)])
+@pytest.mark.parametrize("home,away", [("f", "c"), ("d", "e"), ("e", "a"), ("c", "b")])
+def test_apply_then_revert_restores_seeded_table(home, away, result):
+    standings = Standings(championship(OUT_OF_ORDER))
+    seeded = snapshot(standings)
+
+    assert standings.apply(match("m1", home, away, *result))
+    assert_sorted(standings)
+    assert standings.revert("m1")
+    assert snapshot(standings) == seeded
+    assert_sorted(standings)
+
+
+def test_apply_moves_teams_and_counts_points():
+    standings = Standings(championship(OUT_OF_ORDER))
+
+    standings.apply(match("m1", "f", "c", 5, 0))
+    standings.apply(match("m2", "f", "d", 2, 0))
+
+    f = standings.entry("f")
+    assert (f.win, f.points, f.goals_scored, f.goals_conceded) == (2, 6, 7, 0)
+    # e (7 points, goal difference 0) now ranks above d (7 points, -2)
+    assert order(standings) == ["c", "b", "a", "e", "d", "f"]
+    assert standings.entry("c").loss == 1
+    assert_sorted(standings)
+
+
+def test_apply_is_idempotent_and_replaces_corrected_scores():
+    standings = Standings(championship(OUT_OF_ORDER))
+    standings.apply(match("m1", "d", "e", 2, 0))
+    after_first = snapshot(standings)
+
+    assert not standings.apply(match("m1", "d", "e", 2, 0))
+    assert snapshot(standings) == after_first
+
+    assert standings.apply(match("m1", "d", "e", 0, 1))
+    d, e = standings.entry("d"), standings.entry("e")
+    assert (d.win, d.loss, d.points) == (0, 1, 7)
+    assert (e.win, e.loss, e.points) == (1, 0, 10)
+    assert_sorted(standings)
+
+
+def test_many_results_keep_table_sorted_and_revert_fully():
+    standings = Standings(championship(OUT_OF_ORDER))
+    seeded = snapshot(standings)
+    teams = "abcdef"
+    matches = [
+        match(f"m{index}", home, away, (index * 7) % 4, (index * 3) % 3)
+        for index, (home, away) in enumerate((h, a) for h in teams for a in teams if h != a)
+    ]
+
+    changed = standings.apply_many(matches)
+    assert changed == set(teams)
+    assert_sorted(standings)
+
+    for played in reversed(matches):
+        standings.revert(played.id)
+        assert_sorted(standings)
+    assert snapshot(standings) == seeded
+
+
+@pytest.mark.parametrize("ignored", [
+    match("m1", "a", "b", 1, 0, status="LIVE"),
+    match("m1", "a", "b", None, 0),
+    match("m1", "a", "b", 1, 0, championship_id="other"),
+    match("m1", "a", "zz", 1, 0),
+])
+def test_apply_ignores_matches_outside_the_table(ignored):
+    standings = Standings(championship(OUT_OF_ORDER))
+    seeded = snapshot(standings)
+
+    assert not standings.apply(ignored)
+    assert snapshot(standings) == seeded
+    assert not standings.revert("m1")
+
+
+def test_groups_are_ranked_separately():
+    standings = Standings(championship(
+        [row("a", 1, 3, 1, 0), row("b", 2, 0, 0, 1)],
+        [row("c", 1, 3, 1, 0), row("d", 2, 0, 0, 1)],
+        names=["A", "B"],
+    ))
+
+    assert standings.groups == ["A", "B"]
+    assert not standings.apply(match("x", "a", "c", 0, 5))
+    assert standings.apply(match("m1", "d", "c", 2, 0))
+    assert order(standings, "A") == ["a", "b"]
+    assert order(standings, "B") == ["d", "c"]
+
+
+def test_reconcile_reports_drift_and_clears_history():
+    standings = Standings(championship(OUT_OF_ORDER))
+    standings.apply(match("m1", "d", "e", 1, 0))
+
+    fresh = [dict(entry) for entry in OUT_OF_ORDER]
+    fresh[3] = {**row("d", 4, 10, 5, 4), "win": 1}
+    fresh[4] = {**row("e", 5, 7, 4, 5), "loss": 1}
+    drifted = standings.reconcile(championship(fresh))
+
+    assert drifted == set()
+    assert standings.applied_match_ids == set()
+
+    fresh[5] = row("f", 6, 1, 0, 0)
+    assert standings.reconcile(championship(fresh)) == {"f"}
+    assert_sorted(standings)
+
+
+def test_unknown_season_is_rejected():
+    with pytest.raises(ValueError):
+        Standings(championship(OUT_OF_ORDER), season_name="1999")